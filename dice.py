@@ -11,9 +11,17 @@ Types of dice:
  -  For testing functions that use dice, deterministic test dice always cycle
     through a fixed sequence of values that are passed as arguments to the
     make_test_dice function.
+
+ -  Recording dice write every outcome of another die to a binary log, and
+    replay dice return the outcomes in a log in the same order, so that a
+    run can be repeated exactly.
+
+ -  Weighted dice produce each outcome with a chance proportional to its
+    weight, and describe their outcomes exactly in their distribution
+    attribute. Example: make_weighted_dice([1, 1, 1, 1, 1, 3])
 """
 
-from random import randint
+from random import randint, random
 
 def make_fair_dice(sides):
     """Return a die that returns 1 to SIDES with equal chance."""
@@ -52,3 +60,110 @@ def make_test_dice(*outcomes):
         index = (index + 1) % len(outcomes)
         return outcomes[index]
     return dice
+
+def make_weighted_dice(weights):
+    """Return a die that returns each outcome from 1 to len(WEIGHTS) with a
+    chance proportional to its weight in WEIGHTS.
+
+    The die samples in constant time with Walker's alias method, using one
+    number from the random module per roll, so seeding random makes its
+    rolls reproducible, as it does for fair dice. Its distribution attribute
+    is a tuple of (outcome, probability) pairs, for computing with the die
+    exactly (see exact.roll_distribution and exact.solve).
+
+    >>> loaded = make_weighted_dice([1, 1, 1, 1, 1, 3])
+    >>> loaded.distribution
+    ((1, 0.125), (2, 0.125), (3, 0.125), (4, 0.125), (5, 0.125), (6, 0.375))
+    >>> rolls = [loaded() for _ in range(8000)]
+    >>> 0.35 < rolls.count(6) / 8000 < 0.40
+    True
+    >>> make_weighted_dice([0, 2])()
+    2
+    >>> import random
+    >>> random.seed(1); first = [loaded() for _ in range(5)]
+    >>> random.seed(1); first == [loaded() for _ in range(5)]
+    True
+    """
+    assert len(weights) > 0, 'You must supply weights to make_weighted_dice'
+    for w in weights:
+        assert w >= 0, 'Weight is negative'
+    total = sum(weights)
+    assert total > 0, 'No outcome has a positive weight'
+    n = len(weights)
+    distribution = tuple((outcome, w / total)
+                         for outcome, w in enumerate(weights, 1))
+
+    # Vose's construction: column i keeps outcome i + 1 with chance
+    # keep[i], and returns alias[i] otherwise.
+    scaled = [w * n / total for w in weights]
+    keep, alias = [1.0] * n, list(range(1, n + 1))
+    small = [i for i in range(n) if scaled[i] < 1]
+    large = [i for i in range(n) if scaled[i] >= 1]
+    while small and large:
+        i, j = small.pop(), large[-1]
+        keep[i], alias[i] = scaled[i], j + 1
+        scaled[j] -= 1 - scaled[i]
+        if scaled[j] < 1:
+            small.append(large.pop())
+    columns = [(i + 1, keep[i], alias[i]) for i in range(n)]
+
+    def dice():
+        u = random() * n
+        outcome, threshold, other = columns[int(u)]
+        return outcome if u % 1 < threshold else other
+    dice.distribution = distribution
+    return dice
+
+_OUTCOME_BYTES = [bytes((outcome,)) for outcome in range(256)]
+
+def make_recording_dice(dice, log):
+    """Return a die that rolls DICE and also writes each outcome to LOG, a
+    binary file, as one byte, so outcomes must be at most 255. Several
+    recording dice may share a log, which then holds their outcomes in the
+    order they were rolled.
+
+    >>> import io
+    >>> log = io.BytesIO()
+    >>> dice = make_recording_dice(make_test_dice(3, 1, 6), log)
+    >>> dice(), dice(), dice(), dice()
+    (3, 1, 6, 3)
+    >>> log.getvalue()
+    b'\\x03\\x01\\x06\\x03'
+    """
+    write = log.write
+    def recording_dice():
+        outcome = dice()
+        write(_OUTCOME_BYTES[outcome])
+        return outcome
+    return recording_dice
+
+def make_replay_dice(path):
+    """Return a die that returns the outcomes recorded in the log at PATH,
+    in order, reading the log through mmap rather than into memory. Rolling
+    past the end of the log raises IndexError.
+
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'rolls')
+    >>> with open(path, 'wb') as log:
+    ...     dice = make_recording_dice(make_test_dice(4, 2), log)
+    ...     rolls = [dice() for _ in range(3)]
+    >>> replay = make_replay_dice(path)
+    >>> [replay() for _ in range(3)] == rolls
+    True
+    """
+    import mmap
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            rolls = b''
+        else:
+            rolls = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    position = -1
+    def replay_dice():
+        nonlocal position
+        position += 1
+        try:
+            return rolls[position]
+        except IndexError:
+            raise IndexError('All {0} rolls in {1} have been replayed'.format(
+                len(rolls), path)) from None
+    return replay_dice
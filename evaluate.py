@@ -0,0 +1,467 @@
+"""Exact evaluation of one Hog strategy against another.
+
+Where exact.solve finds optimal play, an Evaluator finds the exact chance
+that a fixed strategy beats a fixed opponent, given both as decision tables
+(see registry.decision_table). It keeps the value of every state between
+calls, so that after a strategy changes in a few states, only those states
+and the states that can lead to them are evaluated again.
+
+A state is (player, score, opponent_score), where PLAYER is 0 if the
+strategy is about to move and 1 if the opponent is, and SCORE belongs to the
+player about to move. Its value is the chance that the strategy wins.
+
+Evaluator.advantages measures how much each decision of the strategy costs
+it, and running this file lists the decisions that cost the most:
+
+    python3 evaluate.py final_strategy [opponent] [count] [--weighted]
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+import exact
+import hog
+import registry
+from rules import MAX_TURN_POINTS
+from ucb import main
+
+# Share of all states that may be marked for re-evaluation before an update
+# gives up tracking changes and evaluates every remaining state instead
+FULL_PASS_FRACTION = 0.25
+
+
+def as_table(table, goal=hog.GOAL_SCORE):
+    """Return TABLE, a decision table as bytes, a TableStrategy, an array, or
+    a strategy function, as a (GOAL, GOAL) array of int8.
+
+    >>> as_table(hog.always_roll(3), goal=2)
+    array([[3, 3],
+           [3, 3]], dtype=int8)
+    """
+    if isinstance(table, registry.TableStrategy):
+        table = table.table
+    elif callable(table):
+        table = registry.decision_table(table, goal)
+    if isinstance(table, (bytes, bytearray)):
+        table = np.frombuffer(table, dtype=np.int8)
+    return np.array(table, dtype=np.int8).reshape(goal, goal)
+
+
+class Evaluator(object):
+    """Exact win probabilities of STRATEGY against OPPONENT, both given in any
+    form accepted by as_table.
+
+    values[player][score, opponent_score] is the value of state (PLAYER,
+    SCORE, OPPONENT_SCORE), padded like the band of exact.solve_layers, so
+    that it can be indexed by any scores reached in one turn.
+
+    >>> round(Evaluator(hog.final_strategy, hog.always_roll(5)).win_rate(), 6)
+    0.804871
+    >>> evaluator = Evaluator(hog.always_roll(4), hog.always_roll(4), goal=30)
+    >>> round(evaluator.win_rate(), 10)
+    0.5
+    >>> table = as_table(hog.always_roll(4), goal=30)
+    >>> table[20:, :] = 2
+    >>> win_rate = evaluator.update(table)
+    >>> fresh = Evaluator(table, hog.always_roll(4), goal=30)
+    >>> abs(win_rate - fresh.win_rate()) < 1e-12
+    True
+    >>> evaluator.evaluated < 2 * 30 * 30
+    True
+    """
+    def __init__(self, strategy, opponent, goal=hog.GOAL_SCORE, rules=None,
+                 tolerance=1e-14):
+        if rules is not None:
+            goal = rules.goal
+            assert rules.pig_out_bonus, 'Every turn must add to the scores'
+        self.goal = goal
+        self.tolerance = tolerance
+        self.turns = exact.TurnArrays(goal, rules)
+        self.tables = [as_table(strategy, goal), as_table(opponent, goal)]
+        width = self.turns.width
+        self.values = [np.zeros((width, width)), np.zeros((width, width))]
+        # States in which the strategy has already reached the goal
+        self.values[0][goal:, :] = 1.0
+        self.values[1][:, goal:] = 1.0
+        self.evaluated = 0  # States evaluated by the last call
+        dirty = np.zeros((2, goal, goal), dtype=bool)
+        dirty[:] = True
+        self._evaluate(dirty)
+
+    def win_rate(self):
+        """Return the chance that the strategy wins, averaged over going
+        first and going second."""
+        return float(self.values[0][0, 0] + self.values[1][0, 0]) / 2
+
+    def update(self, strategy=None, opponent=None):
+        """Replace the decision table of the strategy, the opponent, or both,
+        re-evaluate the states whose values can change, and return the new
+        win rate."""
+        dirty = np.zeros((2, self.goal, self.goal), dtype=bool)
+        for player, table in enumerate((strategy, opponent)):
+            if table is not None:
+                table = as_table(table, self.goal)
+                dirty[player] = table != self.tables[player]
+                self.tables[player] = table
+        self._evaluate(dirty)
+        return self.win_rate()
+
+    def _evaluate(self, dirty):
+        """Evaluate the states marked in DIRTY, in decreasing order of score
+        sum, marking the possible predecessors of every state whose value
+        changes.
+
+        Once more than FULL_PASS_FRACTION of all states are marked, which a
+        change spread over the whole table soon causes, tracking changes
+        costs more than it saves. The remaining layers are then evaluated in
+        full, which is correct because every move increases the score sum.
+        """
+        goal = self.goal
+        self.evaluated = 0
+        marked = np.flatnonzero(dirty.any(axis=0))
+        if not len(marked):
+            return
+        top = int(max(marked // goal + marked % goal))
+        limit = FULL_PASS_FRACTION * dirty.size
+        full = False
+        for total in range(top, -1, -1):
+            scores = np.arange(max(0, total - goal + 1),
+                               min(total, goal - 1) + 1)
+            full = full or np.count_nonzero(dirty) > limit
+            for player in (0, 1):
+                if full:
+                    layer = scores
+                else:
+                    layer = scores[dirty[player, scores, total - scores]]
+                if not len(layer):
+                    continue
+                self.evaluated += len(layer)
+                opponent_scores = total - layer
+                values = self.values[player]
+                new = self.move_values(player, layer, opponent_scores)
+                if full:
+                    values[layer, opponent_scores] = new
+                    continue
+                changed = np.abs(new - values[layer, opponent_scores]) > \
+                    self.tolerance
+                values[layer, opponent_scores] = new
+                if changed.any():
+                    self._mark_predecessors(dirty, player, layer[changed],
+                                            opponent_scores[changed])
+
+    def move_values(self, player, scores, opponent_scores, actions=None):
+        """Return the values of states (PLAYER, SCORES, OPPONENT_SCORES) when
+        the player rolls ACTIONS dice, which default to the player's
+        decision table, given the values of all later states."""
+        if actions is None:
+            actions = self.tables[player][scores, opponent_scores]
+        turns = self.turns
+        following = self.values[1 - player]
+        sides = turns.dice_sides(scores + opponent_scores)
+        result = np.empty(len(scores))
+        for four in (True, False):
+            for num_rolls in range(exact.MAX_ROLLS + 1):
+                group = np.flatnonzero(((sides == 4) == four) &
+                                       (actions == num_rolls))
+                if not len(group):
+                    continue
+                s, o = scores[group], opponent_scores[group]
+                if num_rolls == 0:
+                    result[group] = self._next_value(
+                        following, s + turns.free_bacon[o % 100], o)
+                    continue
+                points, chances, pig_out = turns.turns[4 if four else 6,
+                                                       num_rolls]
+                value = self._next_value(following, s[:, None] + points,
+                                         o[:, None]) @ chances
+                if pig_out:
+                    value += pig_out * self._next_value(
+                        following, s, o + num_rolls * turns.bonus)
+                result[group] = value
+        return result
+
+    def q_values(self):
+        """Return an array of shape (goal, goal, MAX_ROLLS + 1) in which entry
+        [score, opponent_score, num_rolls] is the chance that the strategy
+        wins by rolling NUM_ROLLS dice in state (0, SCORE, OPPONENT_SCORE)
+        and following its decision table afterwards."""
+        goal = self.goal
+        scores, opponent_scores = np.divmod(np.arange(goal * goal), goal)
+        q = np.empty((goal * goal, exact.MAX_ROLLS + 1))
+        for num_rolls in range(exact.MAX_ROLLS + 1):
+            q[:, num_rolls] = self.move_values(
+                0, scores, opponent_scores,
+                np.full(goal * goal, num_rolls, dtype=np.int8))
+        return q.reshape(goal, goal, exact.MAX_ROLLS + 1)
+
+    def advantages(self, q_values=None):
+        """Return a (goal, goal) array of how much win probability the
+        strategy loses in each state by rolling the number of dice in its
+        table instead of the best number, given how both players continue.
+        Q_VALUES, the result of q_values, is computed if not given.
+
+        >>> four = hog.always_roll(4)
+        >>> evaluator = Evaluator(four, four, goal=30)
+        >>> advantages = evaluator.advantages()
+        >>> float(advantages.min()), round(float(advantages[29, 1]), 4)
+        (0.0, 0.0745)
+        """
+        q = self.q_values() if q_values is None else q_values
+        chosen = np.take_along_axis(q, self.tables[0][:, :, None].astype(int),
+                                    axis=2)[:, :, 0]
+        return q.max(axis=2) - chosen
+
+    def reach_probabilities(self):
+        """Return a (goal, goal) array of the chance that the game reaches
+        each state (0, score, opponent_score), averaged over going first and
+        going second, as the values of the states are.
+
+        >>> four = hog.always_roll(4)
+        >>> evaluator = Evaluator(four, four, goal=30)
+        >>> reach = evaluator.reach_probabilities()
+        >>> float(reach[0, 0])
+        0.5
+        """
+        goal, turns = self.goal, self.turns
+        reach = np.zeros((2, goal, goal))
+        reach[:, 0, 0] = 0.5
+        for total in range(2 * goal - 1):
+            scores = np.arange(max(0, total - goal + 1),
+                               min(total, goal - 1) + 1)
+            for player in (0, 1):
+                chances = reach[player, scores, total - scores]
+                layer = np.flatnonzero(chances)
+                s, o, chances = scores[layer], total - scores[layer], \
+                    chances[layer]
+                actions = self.tables[player][s, o]
+                sides = turns.dice_sides(s + o)
+                following = reach[1 - player]
+                for four in (True, False):
+                    for num_rolls in range(exact.MAX_ROLLS + 1):
+                        group = np.flatnonzero(((sides == 4) == four) &
+                                               (actions == num_rolls))
+                        if not len(group):
+                            continue
+                        gs, go, chance = s[group], o[group], chances[group]
+                        if num_rolls == 0:
+                            self._spread(following,
+                                         gs + turns.free_bacon[go % 100], go,
+                                         chance)
+                            continue
+                        points, turn_chances, pig_out = turns.turns[
+                            4 if four else 6, num_rolls]
+                        self._spread(following, gs[:, None] + points,
+                                     go[:, None],
+                                     chance[:, None] * turn_chances)
+                        if pig_out:
+                            self._spread(following, gs,
+                                         go + num_rolls * turns.bonus,
+                                         chance * pig_out)
+        return reach[0]
+
+    def _spread(self, reach, score, opponent_score, chance):
+        """Add CHANCE to the entries of REACH for the other player after a
+        move to (SCORE, OPPONENT_SCORE), before Swine Swap, unless the game
+        is over."""
+        score, opponent_score, chance = np.broadcast_arrays(
+            score, opponent_score, chance)
+        swapped = self.turns.swap[opponent_score % 100, score]
+        following = np.where(swapped, score, opponent_score)
+        other = np.where(swapped, opponent_score, score)
+        going = (following < self.goal) & (other < self.goal)
+        np.add.at(reach, (following[going], other[going]), chance[going])
+
+    def _next_value(self, following, score, opponent_score):
+        """Return the values in FOLLOWING after a move to (SCORE,
+        OPPONENT_SCORE), before Swine Swap, when the other player moves
+        next."""
+        width = len(following)
+        index = opponent_score * width + score
+        value = following.take(index)
+        swapped = np.flatnonzero(self.turns.swap.take(
+            opponent_score % 100 * width + score))
+        if len(swapped):
+            index = (score * width + opponent_score).take(swapped)
+            value.flat[swapped] = following.take(index)
+        return value
+
+    def _mark_predecessors(self, dirty, player, scores, opponent_scores):
+        """Mark in DIRTY every state of the other player that could move to
+        one of the states (PLAYER, SCORES, OPPONENT_SCORES)."""
+        goal = self.goal
+        # The mover reached (mover, other) before Swine Swap ...
+        movers, others = [opponent_scores], [scores]
+        swaps = self.turns.swap[opponent_scores % 100, scores]
+        movers.append(scores[swaps])  # ... or the reverse, if they swapped
+        others.append(opponent_scores[swaps])
+        mover, other = np.concatenate(movers), np.concatenate(others)
+        # ... by scoring some points, or by pigging out.
+        gains = np.arange(1, MAX_TURN_POINTS + 1)
+        before = mover[:, None] - gains
+        fits = (before >= 0) & (before < goal) & (other[:, None] < goal)
+        dirty[1 - player, before[fits],
+              np.broadcast_to(other[:, None], before.shape)[fits]] = True
+        if self.turns.bonus:
+            gains = np.arange(1, exact.MAX_ROLLS + 1)
+            before = other[:, None] - gains
+            fits = (before >= 0) & (before < goal) & (mover[:, None] < goal)
+            dirty[1 - player,
+                  np.broadcast_to(mover[:, None], before.shape)[fits],
+                  before[fits]] = True
+
+
+#############
+# Decisions #
+#############
+
+Decision = namedtuple('Decision', 'score opponent_score num_rolls '
+                      'best_num_rolls loss reach')
+
+
+def worst_decisions(strategy, opponent=hog.always_roll(5), count=20,
+                    weighted=False, goal=hog.GOAL_SCORE, rules=None):
+    """Return the COUNT decisions of STRATEGY against OPPONENT that lose the
+    most win probability, as Decisions, worst first.
+
+    A Decision records the state, the number of dice STRATEGY rolls and the
+    best number, the loss (see Evaluator.advantages) and the chance that a
+    game reaches the state. If WEIGHTED is true, decisions are ranked by
+    loss times reach, which is exactly how much fixing that decision alone
+    would add to the win rate; otherwise they are ranked by loss.
+
+    >>> worst = worst_decisions(hog.always_roll(4), hog.always_roll(4), 1,
+    ...                         weighted=True, goal=30)
+    >>> worst[0][:4], round(worst[0].loss, 4), round(worst[0].reach, 4)
+    ((4, 0, 4, 3), 0.0362, 0.3418)
+    """
+    evaluator = Evaluator(strategy, opponent, goal, rules)
+    q = evaluator.q_values()
+    losses = evaluator.advantages(q)
+    reach = evaluator.reach_probabilities()
+    ranking = losses * reach if weighted else losses
+    worst = np.argsort(ranking, axis=None, kind='stable')[::-1][:count]
+    decisions = []
+    for score, opponent_score in zip(*np.unravel_index(worst, losses.shape)):
+        decisions.append(Decision(
+            int(score), int(opponent_score),
+            int(evaluator.tables[0][score, opponent_score]),
+            int(q[score, opponent_score].argmax()),
+            float(losses[score, opponent_score]),
+            float(reach[score, opponent_score])))
+    return decisions
+
+
+##############
+# Candidates #
+##############
+
+BLOCK_SIZE = 64  # Candidates evaluated together by win_rates
+
+
+def win_rates(candidates, opponent, goal=hog.GOAL_SCORE, rules=None,
+              block_size=BLOCK_SIZE):
+    """Return an array of the exact win rate of each of CANDIDATES against
+    OPPONENT, averaged over going first and going second, as
+    Evaluator.win_rate would.
+
+    CANDIDATES is a (K, goal, goal) array of decision tables, or a sequence
+    of anything as_table accepts. They are evaluated BLOCK_SIZE at a time in
+    one pass over the states, which works out where each move can lead once
+    per state and number of dice. The opponent's moves are the same for
+    every candidate, so each is worked out once for the whole block.
+
+    >>> rates = win_rates([hog.always_roll(n) for n in range(3, 7)],
+    ...                   hog.always_roll(4), goal=30)
+    >>> all(abs(rate - Evaluator(hog.always_roll(n), hog.always_roll(4),
+    ...                          goal=30).win_rate()) < 1e-12
+    ...     for n, rate in zip(range(3, 7), rates))
+    True
+    """
+    if rules is not None:
+        goal = rules.goal
+        assert rules.pig_out_bonus, 'Every turn must add to the scores'
+    if not (isinstance(candidates, np.ndarray) and candidates.ndim == 3):
+        candidates = np.stack([as_table(c, goal) for c in candidates])
+    turns = exact.TurnArrays(goal, rules)
+    opponent = as_table(opponent, goal)
+    return np.concatenate([
+        _block_win_rates(turns, candidates[start:start + block_size],
+                         opponent)
+        for start in range(0, len(candidates), block_size)])
+
+
+def _block_win_rates(turns, candidates, opponent):
+    """Return the win rates of a block of CANDIDATES, a (K, goal, goal)
+    array, against the table OPPONENT."""
+    goal, width = turns.goal, turns.width
+    count = len(candidates)
+    # values[player] holds the value of each state for each candidate, as in
+    # Evaluator, flattened to (K, width * width).
+    values = np.zeros((2, count, width, width))
+    values[0][:, goal:, :] = 1.0
+    values[1][:, :, goal:] = 1.0
+    values = values.reshape(2, count, width * width)
+    for total in range(2 * goal - 2, -1, -1):
+        scores = np.arange(max(0, total - goal + 1), min(total, goal - 1) + 1)
+        opponent_scores = total - scores
+        sides = turns.dice_sides(np.array(total))
+        states = scores * width + opponent_scores
+        for player in (0, 1):
+            following = values[1 - player]
+            if player == 0:
+                actions = candidates[:, scores, opponent_scores]
+            else:
+                actions = opponent[scores, opponent_scores]
+            new = np.empty((count, len(scores)))
+            for num_rolls in np.unique(actions):
+                index, chances = _successors(turns, scores, opponent_scores,
+                                             int(num_rolls), int(sides))
+                if player == 0:
+                    k, group = np.nonzero(actions == num_rolls)
+                    new[k, group] = (following[k[:, None], index[group]] *
+                                     chances).sum(axis=1)
+                else:
+                    group = np.flatnonzero(actions == num_rolls)
+                    new[:, group] = following[:, index[group]] @ chances
+            values[player][:, states] = new
+    return (values[0][:, 0] + values[1][:, 0]) / 2
+
+
+def _successors(turns, scores, opponent_scores, num_rolls, sides):
+    """Return the states that the player in each state (SCORES,
+    OPPONENT_SCORES) can move to by rolling NUM_ROLLS dice with SIDES sides,
+    and their chances. States are flat indices into the other player's
+    values, in which that player's score comes first, after Swine Swap."""
+    width = turns.width
+    scores, opponent_scores = scores[:, None], opponent_scores[:, None]
+    if num_rolls == 0:
+        score = scores + turns.free_bacon[opponent_scores % 100]
+        opponent_score, chances = opponent_scores, np.ones(1)
+    else:
+        points, chances, pig_out = turns.turns[sides, num_rolls]
+        score, opponent_score = scores + points, opponent_scores
+        if pig_out:
+            score = np.concatenate([score, scores], axis=1)
+            opponent_score = np.broadcast_to(opponent_scores, score.shape) \
+                .copy()
+            opponent_score[:, -1] += num_rolls * turns.bonus
+            chances = np.append(chances, pig_out)
+    score, opponent_score = np.broadcast_arrays(score, opponent_score)
+    swapped = turns.swap[opponent_score % 100, score]
+    index = np.where(swapped, score * width + opponent_score,
+                     opponent_score * width + score)
+    return index, chances
+
+
+@main
+def run(*args):
+    weighted = '--weighted' in args
+    args = [arg for arg in args if arg != '--weighted']
+    strategy = registry.strategy_named(args[0] if args else 'final_strategy')
+    opponent = registry.strategy_named(args[1] if len(args) > 1 else '5')
+    count = int(args[2]) if len(args) > 2 else 20
+    print('score  opponent  rolls  best    loss   reach')
+    for decision in worst_decisions(strategy, opponent, count, weighted):
+        print('{0:5}  {1:8}  {2:5}  {3:4}  {4:6.4f}  {5:6.4f}'.format(
+            *decision))
@@ -0,0 +1,448 @@
+"""Exact analysis of Hog.
+
+Instead of sampling games, the functions in this file enumerate every
+outcome of a turn together with its probability. The win probability of
+each state under optimal play follows from these distributions.
+
+A state is a pair (score, opponent_score) seen by the player about to move.
+Because every turn adds at least one point to the sum of the two scores
+(Free Bacon scores at least 1, rolling without pigging out scores at least
+2 per die, and a pig-out gives the opponent NUM_ROLLS points) and Swine
+Swap leaves that sum unchanged, states can be solved in decreasing order of
+score + opponent_score without any iteration.
+
+Every function also takes an optional Ruleset (see rules.py) describing a
+variant of the game, read through the same precomputed rule tables as
+hog.play. Without the pig-out bonus, a pig-out leaves the sum unchanged, and
+solve iterates within each sum instead.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+import hog
+from rules import MAX_ROLLS, MAX_TURN_POINTS
+
+
+def dice_sides(score, opponent_score, rules=None):
+    """Return the number of sides of the dice rolled in state (SCORE,
+    OPPONENT_SCORE).
+
+    >>> dice_sides(4, 24), dice_sides(4, 23)
+    (4, 6)
+    """
+    if rules is not None:
+        return hog.rule_tables(rules=rules).dice_sides(score, opponent_score)
+    if hog.select_dice(score, opponent_score) is hog.four_sided:
+        return 4
+    return 6
+
+
+@lru_cache(maxsize=None)
+def roll_distribution(num_rolls, sides):
+    """Return a dictionary from each result of roll_dice(NUM_ROLLS, dice) to
+    its probability, for fair dice with SIDES sides. A result of 0 is a
+    pig-out. SIDES may instead be the distribution of weighted dice (see
+    dice.make_weighted_dice).
+
+    >>> roll_distribution(1, 4)
+    {0: 0.25, 2: 0.25, 3: 0.25, 4: 0.25}
+    >>> round(sum(roll_distribution(10, 6).values()), 10)
+    1.0
+    >>> roll_distribution(2, ((1, 0.5), (2, 0.25), (8, 0.25)))
+    {0: 0.75, 4: 0.0625, 10: 0.125, 16: 0.0625}
+    """
+    if not isinstance(sides, int):
+        return _weighted_roll_distribution(num_rolls, sides)
+    # counts[total] is the number of ways to roll TOTAL with no ones.
+    counts = {0: 1}
+    for _ in range(num_rolls):
+        next_counts = {}
+        for total, count in counts.items():
+            for face in range(2, sides + 1):
+                next_counts[total + face] = \
+                    next_counts.get(total + face, 0) + count
+        counts = next_counts
+    outcomes = sides ** num_rolls
+    distribution = {0: 1 - (sides - 1) ** num_rolls / outcomes}
+    for total in sorted(counts):
+        distribution[total] = counts[total] / outcomes
+    return distribution
+
+
+def _weighted_roll_distribution(num_rolls, faces):
+    """roll_distribution for FACES, a tuple of (outcome, probability)."""
+    # chances[total] is the chance of rolling TOTAL with no ones.
+    chances = {0: 1.0}
+    for _ in range(num_rolls):
+        next_chances = {}
+        for total, chance in chances.items():
+            for face, p in faces:
+                if face != 1 and p > 0:
+                    next_chances[total + face] = \
+                        next_chances.get(total + face, 0) + chance * p
+        chances = next_chances
+    distribution = {0: 1 - sum(chances.values())}
+    for total in sorted(chances):
+        distribution[total] = chances[total]
+    return distribution
+
+
+@lru_cache(maxsize=None)
+def turn_distribution(num_rolls, opponent_score, sides, rules=None):
+    """Return a tuple of (points, probability) pairs for take_turn, including
+    Free Bacon and Hogtimus Prime. SIDES is as in roll_distribution.
+
+    >>> turn_distribution(0, 35, 6)
+    ((6, 1.0),)
+    >>> turn_distribution(1, 0, 4)
+    ((0, 0.25), (3, 0.25), (5, 0.25), (4, 0.25))
+    """
+    tables = hog.rule_tables(rules=rules)
+    if num_rolls == 0:
+        return ((tables.free_bacon_bytes[opponent_score % 100], 1.0),)
+    distribution = {}
+    for total, chance in roll_distribution(num_rolls, sides).items():
+        points = tables.points(num_rolls, opponent_score, total)
+        distribution[points] = distribution.get(points, 0) + chance
+    return tuple(distribution.items())
+
+
+DICE = (4, 6)  # Sides of the dice used in Hog, in TurnTable order
+
+
+class TurnTable(object):
+    """Expected points and pig-out probability of every turn.
+
+    expected[d, num_rolls, opponent_score] is the expected value of
+    take_turn(num_rolls, opponent_score, dice) for dice with DICE[d] sides,
+    and pig_out[d, num_rolls, opponent_score] is the chance that the turn
+    scores 0. Both are NumPy arrays covering opponent scores below GOAL, or
+    below the goal of RULES if it is given.
+
+    >>> table = turn_table()
+    >>> table.expected_points(0, 35, 6), table.pig_out_chance(0, 35, 6)
+    (6.0, 0.0)
+    >>> round(table.expected_points(1, 0, 4), 4), table.pig_out_chance(1, 0, 4)
+    (3.0, 0.25)
+    >>> table.best_num_rolls(0, 6)
+    5
+    """
+    def __init__(self, goal=hog.GOAL_SCORE, rules=None):
+        if rules is not None:
+            goal = rules.goal
+        self.goal = goal
+        shape = (len(DICE), MAX_ROLLS + 1, goal)
+        self.expected = np.empty(shape)
+        self.pig_out = np.zeros(shape)
+        self.expected[:, 0, :] = \
+            hog.rule_tables(goal, rules).free_bacon[np.arange(goal) % 100]
+        for d, sides in enumerate(DICE):
+            for num_rolls in range(1, MAX_ROLLS + 1):
+                distribution = turn_distribution(num_rolls, 0, sides, rules)
+                self.expected[d, num_rolls, :] = sum(
+                    points * chance for points, chance in distribution)
+                self.pig_out[d, num_rolls, :] = dict(distribution)[0]
+
+    def expected_points(self, num_rolls, opponent_score, sides=6):
+        return float(self.expected[DICE.index(sides), num_rolls,
+                                   opponent_score])
+
+    def pig_out_chance(self, num_rolls, opponent_score, sides=6):
+        return float(self.pig_out[DICE.index(sides), num_rolls,
+                                  opponent_score])
+
+    def best_num_rolls(self, opponent_score, sides=6):
+        """Return the number of dice with the highest expected points."""
+        expected = self.expected[DICE.index(sides), :, opponent_score]
+        return int(expected.argmax())
+
+
+@lru_cache(maxsize=None)
+def turn_table(goal=hog.GOAL_SCORE, rules=None):
+    """Return the shared TurnTable for GOAL, or for RULES."""
+    return TurnTable(goal, rules)
+
+
+def successor(score, opponent_score, num_rolls, points, rules=None):
+    """Return the scores (score, opponent_score) after the player in state
+    (SCORE, OPPONENT_SCORE) rolls NUM_ROLLS dice and scores POINTS.
+
+    >>> successor(10, 20, 3, 0)   # Pig-out: the opponent gains 3
+    (10, 23)
+    >>> successor(19, 13, 5, 12)  # Swine Swap: 31 and 13
+    (13, 31)
+    """
+    if rules is None:
+        if points == 0:
+            opponent_score += num_rolls
+        score += points
+        if hog.is_swap(score, opponent_score):
+            score, opponent_score = opponent_score, score
+        return score, opponent_score
+    tables = hog.rule_tables(rules=rules)
+    if points == 0 and tables.pig_out_bonus:
+        opponent_score += num_rolls
+    score += points
+    if tables.is_swap(score, opponent_score):
+        score, opponent_score = opponent_score, score
+    return score, opponent_score
+
+
+def solve(goal=hog.GOAL_SCORE, rules=None, tolerance=1e-12, dice=None):
+    """Return two lists describing optimal play to GOAL, or under RULES.
+
+    values[score * goal + opponent_score] is the probability that the player
+    about to move wins when both players play optimally, and
+    q_values[(score * goal + opponent_score) * (MAX_ROLLS + 1) + num_rolls]
+    is that probability when the player first rolls NUM_ROLLS dice.
+
+    Without the pig-out bonus, the states with each sum depend on each other,
+    and are updated until no value changes by more than TOLERANCE.
+
+    DICE maps a number of sides (4 or 6) to the dice rolled in its place,
+    given as weighted dice (see dice.make_weighted_dice) or their
+    distribution, as when hog.four_sided or hog.six_sided is replaced.
+
+    >>> values, q_values = solve(goal=5)
+    >>> round(values[0], 4), round(q_values[0], 4)
+    (0.5729, 0.3657)
+    >>> fair = ((1, 0.25), (2, 0.25), (3, 0.25), (4, 0.25))
+    >>> solve(goal=5, dice={4: fair}) == (values, q_values)
+    True
+    >>> import rules
+    >>> values, _ = solve(rules=rules.Ruleset(goal=5, pig_out_bonus=False))
+    >>> round(values[0], 4)
+    0.6522
+    """
+    if rules is not None:
+        goal = rules.goal
+    iterate = rules is not None and not rules.pig_out_bonus
+    actions = MAX_ROLLS + 1
+    values = [0.0] * (goal * goal)
+    q_values = [0.0] * (goal * goal * actions)
+    faces = {}
+    for sides, die in (dice or {}).items():
+        faces[sides] = getattr(die, 'distribution', die)
+    for total in range(2 * goal - 2, -1, -1):
+        scores = range(max(0, total - goal + 1), min(total, goal - 1) + 1)
+        change = 1.0
+        while change > tolerance:
+            change = 0.0
+            for score in scores:
+                opponent_score = total - score
+                sides = dice_sides(score, opponent_score, rules)
+                sides = faces.get(sides, sides)
+                index = score * goal + opponent_score
+                best = 0.0
+                for num_rolls in range(actions):
+                    win = 0.0
+                    for points, chance in turn_distribution(
+                            num_rolls, opponent_score, sides, rules):
+                        s, o = successor(score, opponent_score, num_rolls,
+                                         points, rules)
+                        if s >= goal or o >= goal:
+                            win += chance * (s > o)
+                        else:
+                            win += chance * (1 - values[o * goal + s])
+                    q_values[index * actions + num_rolls] = win
+                    best = max(best, win)
+                change = max(change, abs(best - values[index]))
+                values[index] = best
+            if not iterate:
+                break
+    return values, q_values
+
+
+###################
+# Layered solving #
+###################
+
+SPLIT_SIZE = 1024  # Layers with more states are split among worker processes
+
+# One turn adds at most MAX_TURN_POINTS to the sum of the scores, so a layer
+# only depends on the BAND - 1 layers after it.
+BAND = MAX_TURN_POINTS + 1
+
+Solution = namedtuple('Solution', 'values policy q_values')
+
+
+class TurnArrays(object):
+    """The outcomes of every turn in a game to GOAL, or under RULES, as
+    arrays for evaluating many states at once.
+
+    turns[sides, num_rolls] is a tuple (points, chances, pig_out) of the
+    positive points a roll can score, their chances, and the chance of a
+    pig-out. free_bacon[opponent_score % 100] is the score of rolling zero
+    dice, and swap[opponent_score % 100, score] whether Swine Swap applies,
+    for every score below WIDTH, the most reachable in one turn.
+    """
+    def __init__(self, goal=hog.GOAL_SCORE, rules=None):
+        if rules is not None:
+            goal = rules.goal
+        self.goal = goal
+        self.width = goal + MAX_TURN_POINTS
+        self.tables = tables = hog.rule_tables(goal, rules)
+        self.swap = np.frombuffer(tables.swap_bytes, dtype=bool) \
+                      .reshape(100, 100).take(np.arange(self.width) % 100,
+                                              axis=1)
+        self.free_bacon = tables.free_bacon.astype(np.int64)
+        self.bonus = tables.pig_out_bonus
+        self.turns = {}
+        for sides in DICE:
+            for num_rolls in range(1, MAX_ROLLS + 1):
+                distribution = dict(turn_distribution(num_rolls, 0, sides,
+                                                      rules))
+                pig_out = distribution.pop(0, 0.0)
+                self.turns[sides, num_rolls] = (
+                    np.array(list(distribution), dtype=np.int64),
+                    np.array(list(distribution.values())), pig_out)
+
+    def dice_sides(self, totals):
+        """Return the sides of the dice rolled when the scores sum to each of
+        TOTALS, an array."""
+        tables = self.tables
+        return tables.hog_wild[totals % tables.hog_wild_period]
+
+
+class _Layers(TurnArrays):
+    """The layer kernel of solve_layers.
+
+    The band holds the values of the layers that later states can reach.
+    Row total % BAND holds the layer of states whose scores sum to TOTAL,
+    indexed by the score of the player to move, and is padded out to WIDTH
+    so that it can be indexed by any score reached in one turn.
+    """
+    def band(self):
+        """Return an empty band: every state in it is over, won by the player
+        to move if that player has reached the goal."""
+        band = np.zeros((BAND, self.width))
+        band[:, self.goal:] = 1.0
+        return band
+
+    def outcome(self, score, opponent_score, total, band):
+        """Return the chance of winning for the player who just moved to
+        (SCORE, OPPONENT_SCORE), before Swine Swap, where TOTAL is the sum of
+        the two. The arguments are arrays that broadcast together."""
+        rows = total % BAND * self.width
+        index = rows + opponent_score
+        win = band.take(index)
+        # After Swine Swap, the opponent moves next with SCORE instead
+        swapped = np.flatnonzero(self.swap.take(
+            opponent_score % 100 * self.width + score))
+        if len(swapped):
+            np.add(rows, score, out=index)
+            win.flat[swapped] = band.take(index.take(swapped))
+        return np.subtract(1, win, out=win)
+
+    def q_values(self, total, scores, band):
+        """Return the q-values, an array of shape (len(SCORES), MAX_ROLLS + 1),
+        of the states whose scores are SCORES and sum to TOTAL."""
+        opponent_scores = total - scores
+        sides = self.tables.dice_sides(total, 0)
+        q = np.empty((len(scores), MAX_ROLLS + 1))
+        bacon = self.free_bacon[opponent_scores % 100]
+        q[:, 0] = self.outcome(scores + bacon, opponent_scores, total + bacon,
+                               band)
+        rows = opponent_scores[:, None]
+        for num_rolls in range(1, MAX_ROLLS + 1):
+            points, chances, pig_out = self.turns[sides, num_rolls]
+            q[:, num_rolls] = self.outcome(
+                scores[:, None] + points, rows, total + points, band) @ chances
+            if pig_out:
+                gain = num_rolls * self.bonus
+                q[:, num_rolls] += pig_out * self.outcome(
+                    scores, opponent_scores + gain, total + gain, band)
+        return q
+
+
+_worker = {}  # The layers and shared band of a worker process
+
+
+def _init_worker(goal, rules, shared):
+    layers = _worker['layers'] = _Layers(goal, rules)
+    _worker['band'] = np.frombuffer(shared).reshape(BAND, layers.width)
+
+
+def _worker_q_values(task):
+    total, scores = task
+    return _worker['layers'].q_values(total, scores, _worker['band'])
+
+
+def solve_layers(goal=hog.GOAL_SCORE, rules=None, workers=1,
+                 q_values=False, dtype=np.float32, tolerance=1e-12):
+    """Solve Hog to GOAL, or under RULES, one layer of states with the same
+    score sum at a time, and return a Solution.
+
+    values[score, opponent_score] is the chance that the player about to
+    move wins under optimal play, stored as DTYPE, and policy[score,
+    opponent_score] is the number of dice that achieves it, as an int8. If
+    Q_VALUES is true, q_values[score, opponent_score, num_rolls] holds the
+    chance of winning after rolling NUM_ROLLS dice; otherwise it is None.
+    Q-values take 88 bytes per state, so only ask for them for small goals.
+
+    Every successor of a state lies in one of the next BAND - 1 layers, so
+    each layer is solved once, with NumPy operations over all of its states,
+    and only those layers are kept in double precision while solving. The
+    rest of the memory is the Solution itself: 5 bytes per state, or 500 MB
+    for a goal of 10,000. If WORKERS is more than 1, layers of more than
+    SPLIT_SIZE states are divided among that many worker processes, which
+    read the band from shared memory. Time grows with GOAL squared and does
+    not depend on the outcome of any iteration (except for rulesets without
+    the pig-out bonus, which are iterated within each layer as in solve).
+
+    >>> values, q_values = solve(goal=30)
+    >>> solution = solve_layers(goal=30, q_values=True, dtype=np.float64)
+    >>> np.allclose(solution.values.ravel(), values, rtol=0, atol=1e-12)
+    True
+    >>> np.allclose(solution.q_values.ravel(), q_values, rtol=0, atol=1e-12)
+    True
+    >>> int(solution.policy[0, 0]), int(solution.policy[0, 25])
+    (4, 8)
+    """
+    if rules is not None:
+        goal = rules.goal
+    iterate = rules is not None and not rules.pig_out_bonus
+    layers = _Layers(goal, rules)
+    band = layers.band()
+    pool = None
+    if workers > 1:
+        import multiprocessing
+        shared = multiprocessing.RawArray('d', band.size)
+        np.frombuffer(shared)[:] = band.ravel()
+        band = np.frombuffer(shared).reshape(band.shape)
+        pool = multiprocessing.Pool(workers, _init_worker,
+                                    (goal, rules, shared))
+    values = np.zeros((goal, goal), dtype=dtype)
+    policy = np.zeros((goal, goal), dtype=np.int8)
+    q = np.zeros((goal, goal, MAX_ROLLS + 1)) if q_values else None
+    try:
+        for total in range(2 * goal - 2, -1, -1):
+            scores = np.arange(max(0, total - goal + 1),
+                               min(total, goal - 1) + 1)
+            row = band[total % BAND]
+            row[:goal] = 0.0
+            while True:
+                if pool is not None and len(scores) > SPLIT_SIZE:
+                    chunks = np.array_split(scores, workers)
+                    layer = np.concatenate(pool.map(
+                        _worker_q_values,
+                        [(total, chunk) for chunk in chunks]))
+                else:
+                    layer = layers.q_values(total, scores, band)
+                best = layer.max(axis=1)
+                change = np.abs(best - row[scores]).max()
+                row[scores] = best
+                if not iterate or change <= tolerance:
+                    break
+            values[scores, total - scores] = best
+            policy[scores, total - scores] = layer.argmax(axis=1)
+            if q is not None:
+                q[scores, total - scores] = layer
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return Solution(values, policy, q)
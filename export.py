@@ -0,0 +1,159 @@
+"""Turn-level datasets exported from simulated Hog games.
+
+A TurnLog records every turn that simulate.play_game plays, and writes the
+turns to a NumPy .npz file once it holds CHUNK_TURNS of them. play_game only
+extends a local list with the fields of each turn, and when the game ends
+the log copies the list into a flat array.array in one call. The columns
+that follow from the rest, such as the dice and who won, are only computed
+with NumPy when a chunk is written, so that recording a turn costs little
+more than one list extend. Chunks only end between games, so that every row
+knows who eventually won. The columns of each chunk are:
+
+    game           -- index of the game in the export, counting from 0
+    player         -- 0 if the player who went first took the turn, else 1
+    score          -- score of the player taking the turn, before it
+    opponent_score -- score of the other player, before the turn
+    sides          -- sides of the dice rolled: 4 under Hog Wild, else 6
+    num_rolls      -- number of dice rolled
+    points         -- points scored by the turn (0 for a pig-out)
+    swap           -- 1 if Swine Swap applied after the turn
+    won            -- 1 if the player taking the turn won the game
+
+Export a dataset from the command line with
+
+    python3 export.py DIRECTORY [strategy0] [strategy1] [num_games] [seed]
+"""
+
+import os
+from array import array
+from collections import deque
+
+import numpy as np
+
+import simulate
+from ucb import main
+
+CHUNK_TURNS = 10 ** 6  # Turns written to each chunk file
+
+COLUMNS = (('game', 'I'), ('player', 'B'), ('score', 'I'),
+           ('opponent_score', 'I'), ('sides', 'B'), ('num_rolls', 'B'),
+           ('points', 'B'), ('swap', 'B'), ('won', 'B'))
+
+# The fields of each turn that play_game records, in order
+RECORDED = ('score', 'opponent_score', 'num_rolls', 'points', 'swap')
+
+
+class TurnLog(object):
+    """Records turns into chunk files turns-00000.npz, turns-00001.npz, ...
+    in DIRECTORY. Use it as a context manager, or call close, so that the
+    last chunk is written.
+
+    >>> import hog, random, tempfile
+    >>> directory = tempfile.mkdtemp()
+    >>> random.seed(3)
+    >>> with TurnLog(directory) as log:
+    ...     record = simulate.play_game(hog.always_roll(6), hog.always_roll(4),
+    ...                                 log=log)
+    >>> turns = np.load(log.paths[0])
+    >>> len(turns['score']) == record.turns
+    True
+    >>> int(turns['swap'].sum()) == record.swaps
+    True
+    >>> bool(np.all(turns['won'] == (turns['player'] == record.winner)))
+    True
+    """
+    def __init__(self, directory, chunk_turns=CHUNK_TURNS):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.chunk_turns = chunk_turns
+        self.games = 0
+        self.paths = []
+        self._tables = None
+        self._reset()
+
+    def _reset(self):
+        """Start a new chunk with empty arrays. The old arrays are left
+        alone, since arrays that NumPy still views cannot be resized."""
+        self._turns = array('I')  # RECORDED fields of each turn, in order
+        self._lengths = array('I')  # Turns in each game of the chunk
+        self._winners = array('B')
+
+    def add_game(self, game, winner, tables):
+        """Record a finished game, which WINNER (0 or 1) won, and write the
+        chunk if it is full. GAME is a flat list of the RECORDED fields of
+        each turn in turn, with swap as a bool, and TABLES are the rule
+        tables it was played by (see hog.rule_tables)."""
+        self._turns.fromlist(game)
+        self._lengths.append(len(game) // len(RECORDED))
+        self._winners.append(winner)
+        self._tables = tables
+        self.games += 1
+        if len(self._turns) >= self.chunk_turns * len(RECORDED):
+            self.flush()
+
+    def _columns(self):
+        """Return the columns of the games recorded since the last chunk was
+        written, as a dictionary of NumPy arrays."""
+        turns = np.frombuffer(self._turns, dtype='I').reshape(
+            -1, len(RECORDED))
+        columns = dict(zip(RECORDED, turns.T))
+        lengths = np.frombuffer(self._lengths, dtype='I')
+        starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        player = (np.arange(len(turns)) - starts) % 2
+        columns['game'] = np.repeat(
+            np.arange(self.games - len(lengths), self.games), lengths)
+        columns['player'] = player
+        columns['won'] = player == np.repeat(
+            np.frombuffer(self._winners, dtype='B'), lengths)
+        totals = columns['score'] + columns['opponent_score']
+        columns['sides'] = self._tables.hog_wild[
+            totals % self._tables.hog_wild_period]
+        return {name: columns[name].astype(code) for name, code in COLUMNS}
+
+    def flush(self):
+        """Write the turns of all finished games to a new chunk file."""
+        if self._lengths:
+            path = os.path.join(self.directory,
+                                'turns-{0:05}.npz'.format(len(self.paths)))
+            np.savez(path, **self._columns())
+            self.paths.append(path)
+            self._reset()
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def export_turns(strategy0, strategy1, num_games, directory, seed=None,
+                 chunk_turns=CHUNK_TURNS, compiled=None, rules=None):
+    """Play NUM_GAMES games as simulate.simulate_games does, record their
+    turns in chunk files in DIRECTORY, and return the paths of the files.
+
+    >>> import tempfile
+    >>> paths = export_turns('6', '4', 50, tempfile.mkdtemp(), seed=1,
+    ...                      chunk_turns=500)
+    >>> chunks = [np.load(path) for path in paths]
+    >>> len(chunks) > 1 and all(len(c['won']) >= 500 for c in chunks[:-1])
+    True
+    >>> turns = sum(len(c['won']) for c in chunks)
+    >>> turns == sum(r.turns for r in simulate.simulate_games('6', '4', 50, 1))
+    True
+    """
+    with TurnLog(directory, chunk_turns) as log:
+        deque(simulate.simulate_games(strategy0, strategy1, num_games, seed,
+                                      compiled=compiled, rules=rules,
+                                      log=log), maxlen=0)
+    return log.paths
+
+
+@main
+def run(directory, strategy0='final_strategy', strategy1='5',
+        num_games='100000', seed=None):
+    paths = export_turns(strategy0, strategy1, int(num_games), directory,
+                         seed)
+    print('Wrote {0} chunk files to {1}'.format(len(paths), directory))
@@ -1,6 +1,7 @@
 """The Game of Hog."""
 
 from dice import four_sided, six_sided, make_test_dice
+from dice import make_recording_dice, make_replay_dice
 from ucb import main, trace, log_current_line, interact
 
 GOAL_SCORE = 100  # The goal of Hog is to score 100 points.
@@ -55,29 +56,42 @@ def next_prime(x):
     else:
         print("This number is not prime")
 
-def take_turn(num_rolls, opponent_score, dice=six_sided):
+def take_turn(num_rolls, opponent_score, dice=six_sided, rules=None):
     """Simulate a turn rolling NUM_ROLLS dice, which may be 0 (Free Bacon).
 
     num_rolls:       The number of dice rolls that will be made.
     opponent_score:  The total score of the opponent.
     dice:            A function of no args that returns an integer outcome.
+    rules:           The Ruleset (see rules.py) to play by, standard if None.
     """
     assert type(num_rolls) == int, 'num_rolls must be an integer.'
     assert num_rolls >= 0, 'Cannot roll a negative number of dice.'
     assert num_rolls <= 10, 'Cannot roll more than 10 dice.'
-    assert opponent_score < 100, 'The game should be over.'
-    total = 0
-    opp_score_ones = opponent_score % 10
-    opp_score_tens = opponent_score // 10
+    assert opponent_score < (GOAL_SCORE if rules is None else rules.goal), \
+        'The game should be over.'
+    tables = rule_tables(rules=rules)
     if num_rolls == 0:
-        total = max(opp_score_ones, opp_score_tens) + 1
-    else:
-        total = roll_dice(num_rolls, dice)
-    if is_prime(total) == True:
-        return next_prime(total)
-    else:
-        return total
+        return tables.free_bacon_bytes[opponent_score % 100]
+    total = roll_dice(num_rolls, dice)
+    if total < len(tables.hogtimus_bytes):
+        return tables.hogtimus_bytes[total]
+    return tables.points(num_rolls, opponent_score, total)
+
+
+_RULE_TABLES = {}
 
+def rule_tables(goal=GOAL_SCORE, rules=None):
+    """Return the precomputed rule tables (see rules.py) for RULES, a Ruleset,
+    or for the standard rules with GOAL if RULES is None.
+
+    The rules module is only imported the first time the tables are needed,
+    so that importing hog stays fast.
+    """
+    key = goal if rules is None else rules
+    if key not in _RULE_TABLES:
+        import rules as rulesets
+        _RULE_TABLES[key] = rulesets.tables(rulesets.ruleset(goal, rules))
+    return _RULE_TABLES[key]
 
 
 def select_dice(score, opponent_score):
@@ -95,14 +109,10 @@ def is_swap(score0, score1):
     versions of each other, such as 19 and 91.
     """
     
-    score0_tens = score0 // 10 
+    score0_tens = score0 // 10 % 10
     score0_ones = score0 % 10
-    score1_tens = score1 // 10
+    score1_tens = score1 // 10 % 10
     score1_ones = score1 % 10
-    if score0_tens >= 10:
-        score0_tens = score0_tens - 10
-    if score1_tens >= 10:
-        score1_tens = score1_tens - 10
     if score0_tens == score1_ones and score0_ones == score1_tens:
         return True
     else:
@@ -120,7 +130,40 @@ def other(player):
     return 1 - player
 
 
-def play(strategy0, strategy1, score0=0, score1=0, goal=GOAL_SCORE):
+def play_turn(num_rolls, score, opponent_score, tables):
+    """Play one turn in which the player with SCORE rolls NUM_ROLLS dice
+    against OPPONENT_SCORE, by the rules of TABLES (see rule_tables).
+
+    Return the scores of the player and of the opponent after the turn, the
+    points that the turn scored, and whether Swine Swap applied. This is the
+    turn of play, and every other engine that plays games turn by turn uses
+    it, so that all of them follow the same rules.
+
+    >>> import hog
+    >>> fair_dice = hog.four_sided
+    >>> hog.four_sided = make_test_dice(1)
+    >>> play_turn(3, 10, 11, rule_tables())  # Hog Wild, and a pig-out
+    (10, 14, 0, False)
+    >>> hog.four_sided = fair_dice
+    >>> play_turn(0, 9, 31, rule_tables())  # Free Bacon scores 4, and swaps
+    (31, 13, 4, True)
+    """
+    if tables.hog_wild_bytes[(score + opponent_score) %
+                             tables.hog_wild_period] == 4:
+        dice = four_sided
+    else:
+        dice = six_sided
+    points = take_turn(num_rolls, opponent_score, dice, tables.rules)
+    if points == 0 and tables.pig_out_bonus:
+        opponent_score += num_rolls
+    score += points
+    if tables.swap_bytes[score % 100 * 100 + opponent_score % 100]:
+        return opponent_score, score, points, True
+    return score, opponent_score, points, False
+
+
+def play(strategy0, strategy1, score0=0, score1=0, goal=GOAL_SCORE,
+         rules=None):
     """Simulate a game and return the final scores of both players, with
     Player 0's score first, and Player 1's score second.
 
@@ -132,30 +175,26 @@ def play(strategy0, strategy1, score0=0, score1=0, goal=GOAL_SCORE):
     strategy1:  The strategy function for Player 1, who plays second
     score0   :  The starting score for Player 0
     score1   :  The starting score for Player 1
+    goal     :  The score that ends the game
+    rules    :  A Ruleset (see rules.py) to play by instead of the standard
+                rules; its goal replaces GOAL
     """
     player = 0  # Which player is about to take a turn, 0 (first) or 1 (second)
-    
+    # Hog Wild and Swine Swap are looked up in the precomputed rule tables,
+    # which agree with select_dice and is_swap.
+    if rules is not None:
+        goal = rules.goal
+    tables = rule_tables(goal, rules)
+
     while score0 < goal and score1 < goal:
         if player == 0:
             num_rolls = strategy0(score0, score1)
-            turn_result = take_turn(num_rolls, score1, select_dice(score0, score1))
-            if turn_result == 0:
-                score1 = score1 + num_rolls
-            score0 = score0 + turn_result
-            if is_swap(score0, score1):
-                score0, score1 = score1, score0
-            player = other(player)
-        elif player == 1:
+            score0, score1, _, _ = play_turn(num_rolls, score0, score1, tables)
+        else:
             num_rolls = strategy1(score1, score0)
-            turn_result = take_turn(num_rolls, score0, select_dice(score0, score1))
-            if turn_result == 0:
-                score0 = score0 + (num_rolls)
-            score1 = score1 + turn_result
-            if is_swap(score0, score1):
-                score0, score1 = score1, score0
-            player = other(player)
+            score1, score0, _, _ = play_turn(num_rolls, score1, score0, tables)
+        player = other(player)
     return score0, score1
-#select_dice and is_swap is repeated but we believe taking it out of both statements is harmful
 
 
 #######################
@@ -218,12 +257,24 @@ def make_averaged(fn, num_samples=1000):
 def max_scoring_num_rolls(dice=six_sided, num_samples=1000):
     """Return the number of dice (1 to 10) that gives the highest average turn
     score by calling roll_dice with the provided DICE over NUM_SAMPLES times.
-    Assume that the dice always return positive outcomes.
+    Assume that the dice always return positive outcomes. Dice that describe
+    their outcomes in a distribution attribute, such as weighted dice, are
+    averaged exactly instead of sampled.
 
     >>> dice = make_test_dice(3)
     >>> max_scoring_num_rolls(dice)
     10
+    >>> from dice import make_weighted_dice
+    >>> max_scoring_num_rolls(make_weighted_dice([1, 0, 0, 0, 0, 9]))
+    9
     """
+    distribution = getattr(dice, 'distribution', None)
+    if distribution is not None:
+        import exact
+        def expected(num_rolls):
+            totals = exact.roll_distribution(num_rolls, distribution)
+            return sum(total * chance for total, chance in totals.items())
+        return max(range(1, 11), key=expected)
     maximum_score = -.1
     best_dice = 0
     for i in range(1,11):
@@ -244,18 +295,95 @@ def winner(strategy0, strategy1):
         return 1
 
 
-def average_win_rate(strategy, baseline=always_roll(5)):
+class RecordedDice(object):
+    """Within a with statement, every roll of four_sided and six_sided is
+    also written to a log at PATH, which ReplayedDice can replay. This
+    covers play, average_win_rate, simulate.play_game in this process, and
+    the GUI.
+
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'rolls')
+    >>> with RecordedDice(path):
+    ...     rate = average_win_rate(always_roll(6))
+    >>> with ReplayedDice(path):
+    ...     average_win_rate(always_roll(6)) == rate
+    True
+    """
+    def __init__(self, path):
+        self.path = path
+        self.log = None
+
+    def dice(self):
+        self.log = open(self.path, 'wb')
+        return (make_recording_dice(four_sided, self.log),
+                make_recording_dice(six_sided, self.log))
+
+    def __enter__(self):
+        global four_sided, six_sided
+        self.saved = four_sided, six_sided
+        four_sided, six_sided = self.dice()
+        return self
+
+    def __exit__(self, *exc_info):
+        global four_sided, six_sided
+        four_sided, six_sided = self.saved
+        if self.log is not None:
+            self.log.close()
+
+
+class ReplayedDice(RecordedDice):
+    """Within a with statement, four_sided and six_sided return the rolls
+    recorded at PATH by RecordedDice, in order."""
+    def dice(self):
+        replay = make_replay_dice(self.path)
+        def replayed_four_sided():
+            return replay()
+        def replayed_six_sided():
+            return replay()
+        return replayed_four_sided, replayed_six_sided
+
+
+def average_win_rate(strategy, baseline=always_roll(5), precision=None):
     """Return the average win rate of STRATEGY against BASELINE. Averages the
     winrate when starting the game as player 0 and as player 1.
+
+    If PRECISION is given, games are played until the 95% confidence interval
+    of the win rate is within PRECISION of the estimate (see
+    simulate.estimate_win_rate), instead of 1000 games as each player.
     """
+    if precision is not None:
+        import simulate
+        return simulate.estimate_win_rate(strategy, baseline,
+                                          precision)['win_rate']
     win_rate_as_player_0 = 1 - make_averaged(winner)(strategy, baseline)
     win_rate_as_player_1 = make_averaged(winner)(baseline, strategy)
 
     return (win_rate_as_player_0 + win_rate_as_player_1) / 2
 
 
+def report_win_rate(store, name, strategy, baseline=always_roll(5),
+                    baseline_name='always_roll(5)'):
+    """Print the average win rate of STRATEGY against BASELINE and record it
+    in the results STORE."""
+    import time
+    import results
+    start = time.perf_counter()
+    win_rate = average_win_rate(strategy, baseline)
+    wall_time = time.perf_counter() - start
+    print(name, 'win rate:', win_rate)
+    # average_win_rate plays 1000 games in each seat.
+    results.record_win_rate(store, name, strategy, baseline_name, baseline,
+                            2000, win_rate, wall_time=wall_time)
+
+
 def run_experiments():
-    """Run a series of strategy experiments and report results."""
+    """Run a series of strategy experiments and report results.
+
+    Win rates are also recorded in the results store; see results.py.
+    """
+    import results
+    store = results.ResultsStore()
+
     if True:  # Change to False when done finding max_scoring_num_rolls
         six_sided_max = max_scoring_num_rolls(six_sided)
         print('Max scoring num rolls for six-sided dice:', six_sided_max)
@@ -263,15 +391,23 @@ def run_experiments():
         print('Max scoring num rolls for four-sided dice:', four_sided_max)
 
     if False:  # Change to True to test always_roll(8)
-        print('always_roll(8) win rate:', average_win_rate(always_roll(8)))
+        report_win_rate(store, 'always_roll(8)', always_roll(8))
 
     if False:  # Change to True to test bacon_strategy
-        print('bacon_strategy win rate:', average_win_rate(bacon_strategy))
+        report_win_rate(store, 'bacon_strategy', bacon_strategy)
 
     if False:  # Change to True to test swap_strategy
-        print('swap_strategy win rate:', average_win_rate(swap_strategy))
+        report_win_rate(store, 'swap_strategy', swap_strategy)
+
+    if False:  # Change to True to estimate a win rate to within 0.5%
+        import simulate
+        estimate = simulate.estimate_win_rate('swap_strategy', precision=0.005)
+        print('swap_strategy win rate: {0:.4f} +/- {1:.4f} ({2} games)'.format(
+            estimate['win_rate'], estimate['half_width'], estimate['games']))
+        results.record_batch(store, estimate)
 
     "*** You may add additional experiments as you wish ***"
+    store.close()
 
 
 # Strategies
@@ -280,14 +416,7 @@ def bacon_strategy(score, opponent_score, margin=8, num_rolls=5):
     """This strategy rolls 0 dice if that gives at least MARGIN points,
     and rolls NUM_ROLLS otherwise.
     """
-    opp_score_tens = opponent_score // 10
-    opp_score_ones = opponent_score % 10
-    max_bacon = max(opp_score_tens, opp_score_ones)
-    
-    if is_prime(max_bacon + 1) == True:
-        if next_prime(max_bacon + 1) >= margin:
-            return 0
-    elif (max_bacon + 1) >= margin:
+    if rule_tables().free_bacon_bytes[opponent_score % 100] >= margin:
         return 0
     else:
         return num_rolls
@@ -297,16 +426,9 @@ def swap_strategy(score, opponent_score, num_rolls=5):
     """This strategy rolls 0 dice when it results in a beneficial swap and
     rolls NUM_ROLLS otherwise.
     """
-    opp_score_tens = opponent_score // 10
-    opp_score_ones = opponent_score % 10
-    max_bacon = max(opp_score_tens, opp_score_ones)
-    
-    if is_prime(max_bacon + 1) == True:
-        added_number = next_prime(max_bacon + 1)
-    else:
-        added_number = max_bacon + 1
-    final_score = score + added_number
-    if is_swap(final_score, opponent_score) == True:
+    tables = rule_tables()
+    final_score = score + tables.free_bacon_bytes[opponent_score % 100]
+    if tables.is_swap(final_score, opponent_score):
         if final_score < opponent_score:
             return 0
         else:
@@ -334,58 +456,32 @@ def final_strategy(score, opponent_score):
     num_rolls = 4
     margin = 6
 
-    def four_side_the_opponent(score, opponent_score):
-        opp_score_tens = opponent_score // 10
-        opp_score_ones = opponent_score % 10
-        max_bacon = max(opp_score_tens, opp_score_ones)
+    tables = rule_tables()
+    free_bacon, swap = tables.free_bacon_bytes, tables.swap_bytes
 
-        if is_prime(max_bacon + 1) == True:
-            added_number = next_prime(max_bacon + 1)
-        else:
-            added_number = max_bacon + 1
-        final_score = score + added_number
-        if (final_score + opponent_score) % 7 == 0:
+    def four_side_the_opponent(score, opponent_score):
+        final_score = score + free_bacon[opponent_score % 100]
+        if tables.dice_sides(final_score, opponent_score) == 4:
             return 0
         else:
             return num_rolls
 
-    def pigging_out_to_swap_10(score, opponent_score):
-        if is_swap(score, (opponent_score + 10)) == True and ((opponent_score + 10) > score) == True:
-            return True
-    def pigging_out_to_swap_9(score, opponent_score):
-        if is_swap(score, (opponent_score + 9)) == True and ((opponent_score + 9) > score) == True:
-            return True
-    def pigging_out_to_swap_8(score, opponent_score):
-        if is_swap(score, (opponent_score + 8)) == True and ((opponent_score + 8) > score) == True:
-            return True
-    def pigging_out_to_swap_7(score, opponent_score):
-        if is_swap(score, (opponent_score + 7)) == True and ((opponent_score + 7) > score) == True:
-            return True
-    def pigging_out_to_swap_6(score, opponent_score):
-        if is_swap(score, (opponent_score + 6)) == True and ((opponent_score + 6) > score) == True:
-            return True
-    def pigging_out_to_swap_5(score, opponent_score):
-        if is_swap(score, (opponent_score + 5)) == True and ((opponent_score + 5) > score) == True:
-            return True
+    def pigging_out_to_swap(score, opponent_score, rolls):
+        """Return whether pigging out while rolling ROLLS dice causes a
+        beneficial swap."""
+        return swap[score % 100 * 100 + (opponent_score + rolls) % 100] and \
+            opponent_score + rolls > score
+
     if score >= 99:
         return 1
     elif swap_strategy(score, opponent_score, num_rolls) == 0:
         return 0
-    elif pigging_out_to_swap_10(score, opponent_score) == True:
-        return 10
-    elif pigging_out_to_swap_9(score, opponent_score) == True:
-        return 9
-    elif pigging_out_to_swap_8(score, opponent_score) == True:
-        return 8
-    elif pigging_out_to_swap_7(score, opponent_score) == True:
-        return 7
-    elif pigging_out_to_swap_6(score, opponent_score) == True:
-        return 6
-    elif pigging_out_to_swap_5(score, opponent_score) == True:
-        return 5
-    elif bacon_strategy(score,opponent_score, margin, num_rolls) == 0:
+    for rolls in range(10, 4, -1):
+        if pigging_out_to_swap(score, opponent_score, rolls):
+            return rolls
+    if bacon_strategy(score,opponent_score, margin, num_rolls) == 0:
         return 0
-    elif (score + opponent_score) % 7 == 0:
+    elif tables.dice_sides(score, opponent_score) == 4:
         return 1
     elif four_side_the_opponent(score,opponent_score) == 0:
         return 0
@@ -412,8 +508,80 @@ def run(*args):
     parser = argparse.ArgumentParser(description="Play Hog")
     parser.add_argument('--run_experiments', '-r', action='store_true',
                         help='Runs strategy experiments')
+    commands = parser.add_subparsers(dest='command')
+    simulate_parser = commands.add_parser(
+        'simulate', help='Simulate games and print the results as JSON',
+        description='Simulate games between two strategies, alternating who '
+                    'goes first, and print the results as JSON. A strategy '
+                    'is a number N for always_roll(N), or a function name '
+                    'such as final_strategy or mymodule.my_strategy, '
+                    'optionally followed by arguments, as in always_roll:8 '
+                    'or bacon_strategy:margin=6,num_rolls=4.')
+    simulate_parser.add_argument('strategy',
+                                 help='Strategy whose win rate is reported')
+    simulate_parser.add_argument('baseline', nargs='?', default='5',
+                                 help='Opponent strategy (default: 5)')
+    simulate_parser.add_argument('--games', '-n', type=int, default=10000,
+                                 help='Number of games (default: 10000)')
+    simulate_parser.add_argument('--precision', '-p', type=float,
+                                 help='Instead of a fixed number of games, '
+                                      'play until the 95%% confidence '
+                                      'interval has at most this half-width')
+    simulate_parser.add_argument('--workers', '-w', type=int, default=1,
+                                 help='Number of worker processes')
+    simulate_parser.add_argument('--seed', '-s', type=int,
+                                 help='Seed for the dice (default: random)')
+    simulate_parser.add_argument('--uncompiled', action='store_true',
+                                 help='Call the strategies on every turn '
+                                      'instead of using cached decision '
+                                      'tables (for impure strategies). '
+                                      'Tables are only used by default when '
+                                      'the goal is at most 200')
+    simulate_parser.add_argument('--rules', default='',
+                                 help='Play a variant, described as in '
+                                      'goal=50,swine_swap=False (fields: '
+                                      'goal, hogtimus, hog_wild_modulus, '
+                                      'pig_out_bonus, swine_swap)')
+    simulate_parser.add_argument('--store', metavar='PATH', nargs='?',
+                                 const='',
+                                 help='Also record the results in a results '
+                                      'database (default: results.sqlite)')
 
     args = parser.parse_args()
 
     if args.run_experiments:
         run_experiments()
+    if args.command == 'simulate':
+        import json
+        import rules
+        import simulate
+        try:
+            variant = rules.parse(args.rules) if args.rules else None
+        except ValueError as e:
+            simulate_parser.error(str(e))
+        for spec in (args.strategy, args.baseline):
+            try:
+                simulate.strategy_named(spec)
+            except ValueError as e:
+                simulate_parser.error(str(e))
+            except (TypeError, ImportError) as e:
+                simulate_parser.error('Invalid strategy: {0} ({1})'.format(
+                    spec, e))
+        # None compiles the strategies unless the goal is large
+        compiled = False if args.uncompiled else None
+        if args.precision is not None:
+            batch = simulate.estimate_win_rate(
+                args.strategy, args.baseline, args.precision,
+                workers=args.workers, seed=args.seed, compiled=compiled,
+                rules=variant)
+        else:
+            batch = simulate.simulate_batch(args.strategy, args.baseline,
+                                            args.games, args.workers,
+                                            args.seed, compiled=compiled,
+                                            rules=variant)
+        print(json.dumps(batch, indent=2))
+        if args.store is not None:
+            import results
+            with results.ResultsStore(args.store or
+                                      results.DEFAULT_PATH) as store:
+                results.record_batch(store, batch, batch['rules'])
@@ -5,12 +5,14 @@ later in the semester will review its implementation and let you extend it.
 """
 
 import hog
-import dice
 from ucb import main
 
+import contextlib
+import queue
+import threading
+import time
 import tkinter as tk
 from tkinter import *
-import argparse
 
 #############
 # Utilities #
@@ -76,14 +78,59 @@ def name(who):
 # GUI #
 #######
 
-class HogGUIException(BaseException):
-    """HogGUI-specific Exception. Used to exit a game prematurely."""
-    pass
+class HogGame(object):
+    """The state of a game of Hog, advanced one turn at a time.
+
+    HogGame plays each turn with hog.play_turn, as hog.play does, but
+    exposes each turn as a separate step so that the GUI can drive a game
+    from Tkinter callbacks instead of blocking inside hog.play. RULES is a
+    Ruleset (see rules.py) to play by instead of the standard rules.
+    """
+    def __init__(self, goal=hog.GOAL_SCORE, rules=None):
+        self.scores = [0, 0]
+        self.who = 0
+        self.tables = hog.rule_tables(goal, rules)
+        self.goal = self.tables.rules.goal
+
+    @property
+    def over(self):
+        """True if either player has reached the goal."""
+        return max(self.scores) >= self.goal
+
+    @property
+    def winner(self):
+        """The player who won a finished game."""
+        return 0 if self.scores[0] > self.scores[1] else 1
+
+    def current(self):
+        """Return (score, opponent_score) for the player about to move."""
+        return self.scores[self.who], self.scores[1 - self.who]
+
+    @property
+    def hog_wild(self):
+        """True if the player about to move rolls four-sided dice."""
+        return self.tables.dice_sides(*self.scores) == 4
+
+    def advance(self, num_rolls):
+        """Take a turn for the current player rolling NUM_ROLLS dice."""
+        score, opponent_score, _, _ = hog.play_turn(num_rolls, *self.current(),
+                                                    self.tables)
+        self.scores[self.who] = score
+        self.scores[1 - self.who] = opponent_score
+        self.who = hog.other(self.who)
+
 
 class HogGUI(Frame):
-    """Tkinter GUI for Hog."""
+    """Tkinter GUI for Hog.
+
+    Games are driven by a small state machine. Every transition is scheduled
+    with after(), so no Tkinter callback ever blocks, and the computer's moves
+    are evaluated on a worker thread whose result is polled for. Restarting
+    cancels the pending callbacks and bumps self.generation so that results
+    from an abandoned game are discarded.
+    """
 
-    KILL = -9   # kill signal to stop a game
+    POLL = 50   # milliseconds between checks for a computer move
 
     #########################
     # Widget Initialization #
@@ -99,15 +146,24 @@ class HogGUI(Frame):
         self.pack(fill=BOTH)
         self.parent = parent
         self.who = 0
+        self.generation = 0
+        self.pending = None
+        self.loading = None  # Callback that checks if the win table is ready
+        self.awaiting_roll = False
+        self.moves = queue.Queue()
+        self.win_table = None
+        self.game = None
 
         self.init_scores()
         self.init_rolls()
         self.init_dice()
         self.init_status()
+        self.init_advisor()
         self.init_restart()
+        self.load_win_table()
 
-        hog.six_sided = self.make_dice(6)
-        hog.four_sided = self.make_dice(4)
+        hog.six_sided = self.make_dice(hog.six_sided)
+        hog.four_sided = self.make_dice(hog.four_sided)
         self.computer, self.turn = computer, 0
         self.play()
 
@@ -131,10 +187,9 @@ class HogGUI(Frame):
     def init_rolls(self):
         """Creates child widgets associated with the number of rolls.
 
-        The primary widget is an Entry that accepts user input. An intermediate
-        Tkinter variable, self.roll_verified, is set to the final number of
-        rolls. Once it is updated, the player immediately takes a turn based on
-        its value.
+        The primary widget is an Entry that accepts user input. Pressing
+        Return or the Roll! button verifies the entry and, if a human player
+        is expected to move, takes a turn based on its value.
         """
         self.roll_frame = Frame(self).pack()
 
@@ -143,7 +198,6 @@ class HogGUI(Frame):
                                 justify=CENTER).pack()
         self.roll_entry.bind('<Return>',
                              lambda event: self.roll_button.invoke())
-        self.roll_verified = IntVar()
         self.roll_button = Button(self.roll_frame,
                                   text='Roll!',
                                   command=self.roll).pack()
@@ -169,6 +223,18 @@ class HogGUI(Frame):
         Hog Wild is displayed here."""
         self.status_label = Label(self).pack()
 
+    def init_advisor(self):
+        """Creates child widgets that show the current player's chance of
+        winning under optimal play, and that chance after rolling each
+        possible number of dice. The best choice is highlighted."""
+        self.win_label = Label(self).pack()
+        self.advice_frame = Frame(self).pack()
+        self.advice_labels = [
+            Label(self.advice_frame, padx=2).config(font=advice_font).
+                pack(side=LEFT)
+            for _ in range(11)
+        ]
+
     def init_restart(self):
         """Creates child widgets associated with restarting the game."""
         self.restart_button = Button(self, text='Restart',
@@ -178,16 +244,15 @@ class HogGUI(Frame):
     # Game Logic #
     ##############
 
-    def make_dice(self, sides):
-        """Creates a dice function that hooks to the GUI and wraps
-        dice.make_fair_dice.
+    def make_dice(self, source):
+        """Creates a dice function that hooks to the GUI and wraps SOURCE,
+        which is fair dice unless the rolls are being recorded or replayed.
 
-        sides -- number of sides for the die
+        source -- the die to roll
         """
-        fair_dice = dice.make_fair_dice(sides)
         def gui_dice():
-            """Roll fair_dice and add a corresponding image to self.dice."""
-            result = fair_dice()
+            """Roll source and add a corresponding image to self.dice."""
+            result = source()
             img = HogGUI.IMAGES[result]
             self.dice[self.dice_count].config(image=img).pack(side=LEFT)
             self.dice_count += 1
@@ -199,14 +264,68 @@ class HogGUI(Frame):
         for i in range(10):
             self.dice[i].pack_forget()
 
+    def load_win_table(self):
+        """Map the win probability table on a worker thread, building it
+        first if needed, and show advice as soon as it is ready."""
+        import tables  # Imports NumPy, so only once the window is up
+        table = tables.load()
+        ready = threading.Event()
+        def work():
+            table.win_probability(0, 0)
+            ready.set()
+        def poll():
+            if ready.is_set():
+                self.loading = None
+                self.win_table = table
+                self.show_advice()
+            else:
+                self.loading = self.after(HogGUI.POLL, poll)
+        self.win_label.text = 'Computing win probabilities...'
+        threading.Thread(target=work, daemon=True).start()
+        poll()
+
+    def show_advice(self):
+        """Display exact win probabilities for the player about to move."""
+        if self.win_table is None or self.game is None:
+            return
+        if self.game.over:
+            self.win_label.text = ''
+            for label in self.advice_labels:
+                label.text = ''
+            return
+        score, opp_score = self.game.current()
+        self.win_label.text = '{0} wins with probability {1:.1%}'.format(
+            name(self.who), self.win_table.win_probability(score, opp_score))
+        q_values = self.win_table.q_values(score, opp_score)
+        best = q_values.index(max(q_values))
+        for num_rolls, label in enumerate(self.advice_labels):
+            label.text = '{0}: {1:.1%}'.format(num_rolls, q_values[num_rolls])
+            label.config(bg=select_bg if num_rolls == best else bg)
+
+    def schedule(self, delay, callback):
+        """Run CALLBACK after DELAY milliseconds, replacing any callback that
+        is still pending. At most one game callback is pending at a time."""
+        self.cancel()
+        self.pending = self.after(delay, callback)
+
+    def cancel(self):
+        """Cancel the pending game callback, if any."""
+        if self.pending is not None:
+            self.after_cancel(self.pending)
+            self.pending = None
+
     def roll(self):
-        """Verify and set the number of rolls based on user input. As
+        """Verify the number of rolls based on user input and take a turn. As
         per game rules, a valid number of rolls must be an integer
         greater than or equal to 0.
         """
         result = self.roll_entry.text
+        if not self.awaiting_roll:
+            return
         if result.isnumeric() and 10 >= int(result) >= 0:
-            self.roll_verified.set(int(result))
+            self.roll_entry.text = ''
+            self.awaiting_roll = False
+            self.take_turn(int(result))
 
     def switch(self, who=None):
         """Switches players. self.who is either 0 or 1."""
@@ -218,80 +337,206 @@ class HogGUI(Frame):
         self.p_labels[self.who].config(bg=select_bg)
         self.s_labels[self.who].config(bg=select_bg)
 
-    def strategy(self, score, opp_score):
-        """A strategy with a hook to the GUI. This strategy gets
-        passed into the PLAY function from the HOG module. At its
-        core, the strategy waits until a number of rolls has been
-        verified, then returns that number. Game information is
-        updated as well.
+    def show_scores(self):
+        """Display the scores of the current game."""
+        self.s_labels[0].text = self.game.scores[0]
+        self.s_labels[1].text = self.game.scores[1]
+        self.show_advice()
+
+    def next_turn(self):
+        """Prepare the next turn of the current game.
 
-        score     -- player's score
-        opp_score -- opponent's score
+        Displays the game state, then either waits for a human player to
+        press Roll! or starts computing the computer's move in the
+        background. Ends the game if a player has reached the goal.
         """
-        s0 = score if self.who == 0 else opp_score
-        s1 = opp_score if self.who == 0 else score
-        self.s_labels[0].text = s0
-        self.s_labels[1].text = s1
-        self.roll_label.text = name(self.who) +' will roll:'
-        status = self.status_label.text
-        if hog.select_dice(score, opp_score) == hog.four_sided:
-            status += ' Hog Wild!'
-        self.status_label.text = status
+        self.pending = None
+        self.show_scores()
+        if self.game.over:
+            self.roll_label.text = ''
+            self.status_label.text = 'Game over! {} wins!'.format(
+                                        name(self.game.winner))
+            return
+        score, opp_score = self.game.current()
+        self.roll_label.text = name(self.who) + ' will roll:'
+        if self.game.hog_wild:
+            self.status_label.text += ' Hog Wild!'
 
         if self.computer and self.who == self.turn:
-            self.update()
-            self.after(DELAY)
-            result = hog.final_strategy(score, opp_score)
+            self.think(score, opp_score)
         else:
+            self.awaiting_roll = True
             self.roll_entry.focus_set()
-            self.wait_variable(self.roll_verified)
-            result = self.roll_verified.get()
-            self.roll_entry.text = ''
-        if result == HogGUI.KILL:
-            raise HogGUIException
 
+    def think(self, score, opp_score):
+        """Evaluate the computer's strategy on a worker thread.
+
+        The result is tagged with the current generation and picked up by
+        poll_computer, which waits at least DELAY milliseconds so that the
+        computer's moves can be followed.
+        """
+        generation = self.generation
+        def work():
+            self.moves.put((generation, hog.final_strategy(score, opp_score)))
+        threading.Thread(target=work, daemon=True).start()
+        self.poll_computer(time.monotonic() + DELAY / 1000)
+
+    def poll_computer(self, ready_at):
+        """Take the computer's turn once its move is known and the delay has
+        elapsed; otherwise, check again in POLL milliseconds."""
+        while not self.moves.empty():
+            generation, result = self.moves.get_nowait()
+            if generation == self.generation:
+                self.computer_move = result
+        if self.computer_move is not None and time.monotonic() >= ready_at:
+            result, self.computer_move = self.computer_move, None
+            self.take_turn(result)
+        else:
+            self.schedule(HogGUI.POLL, lambda: self.poll_computer(ready_at))
+
+    def take_turn(self, num_rolls):
+        """Roll NUM_ROLLS dice for the current player and schedule the next
+        turn."""
         self.clear_dice()
         self.dice_count = 0
         self.status_label.text = '{} chose to roll {}.'.format(name(self.who),
-                                                               result)
+                                                               num_rolls)
+        self.game.advance(num_rolls)
         self.switch()
-        return result
+        self.schedule(0, self.next_turn)
 
     def play(self):
-        """Simulates a game of Hog by calling hog.play with the GUI strategies.
+        """Starts a new game of Hog.
 
-        If the player destroys the window prematurely (i.e. in the
-        middle of a game), a HogGUIException is raised to exit out
-        of play's loop. Otherwise, the widget will be destroyed,
-        but the strategy will continue waiting.
+        Turns are taken by callbacks scheduled on the Tkinter event loop, so
+        this method returns immediately.
         """
+        self.generation += 1
+        self.game = HogGame()
+        self.computer_move = None
+        self.awaiting_roll = False
         self.turn = 1 - self.turn
         self.switch(0)
-        self.s_labels[0].text = '0'
-        self.s_labels[1].text = '0'
         self.status_label.text = ''
-        try:
-            score, opponent_score = hog.play(self.strategy,
-                                             self.strategy)
-        except HogGUIException:
-            pass
-        else:
-            self.s_labels[0].text = score
-            self.s_labels[1].text = opponent_score
-            winner = 0 if score > opponent_score else 1
-            self.status_label.text = 'Game over! {} wins!'.format(
-                                        name(winner))
+        self.schedule(0, self.next_turn)
 
     def restart(self):
-        """Kills the current game and begins another game."""
-        self.roll_verified.set(HogGUI.KILL)
-        self.status_label.text = ''
+        """Abandons the current game and begins another game."""
+        self.cancel()
+        self.roll_entry.text = ''
         self.clear_dice()
         self.play()
 
     def destroy(self):
         """Overrides the destroy method to end the current game."""
-        self.roll_verified.set(HogGUI.KILL)
+        self.cancel()
+        if self.loading is not None:
+            self.after_cancel(self.loading)
+            self.loading = None
+        self.generation += 1
+        super().destroy()
+
+class SimulationGUI(Frame):
+    """Live dashboard for a batch of games between two strategies.
+
+    Games are played on a worker thread that updates a simulate.Tally in
+    place. The window only reads the tally FRAME_RATE times per second, so
+    redrawing costs the same whether the worker plays ten games or a million.
+    """
+
+    FRAME_RATE = 4      # redraws per second
+    HISTORY = 200       # number of frames shown in the win rate chart
+    WIDTH, HEIGHT = 480, 200
+
+    def __init__(self, parent, strategy, baseline, num_games):
+        """Start simulating NUM_GAMES games in the background.
+
+        parent    -- parent widget (should be root)
+        strategy  -- name of the strategy whose win rate is reported
+        baseline  -- name of the strategy it plays against
+        num_games -- number of games to simulate
+        """
+        import simulate
+        super().__init__(parent)
+        self.pack(fill=BOTH)
+        self.num_games = num_games
+        self.tally = simulate.Tally()
+        self.history = []
+        self.stopped = False
+        self.pending = None  # The scheduled redraw
+
+        title = '{0} vs. {1}'.format(strategy, baseline)
+        Label(self, text=title).pack()
+        self.chart = tk.Canvas(self, width=SimulationGUI.WIDTH,
+                               height=SimulationGUI.HEIGHT, bg=bg,
+                               highlightthickness=0)
+        self.chart.pack()
+        self.stats_labels = {
+            key: Label(self).pack()
+            for key in ('games', 'win_rate', 'turns', 'swaps')
+        }
+
+        strategy, baseline = (simulate.strategy_named(strategy),
+                              simulate.strategy_named(baseline))
+        def work():
+            simulate.simulate(strategy, baseline, num_games, self.tally,
+                              stop=lambda: self.stopped)
+        self.worker = threading.Thread(target=work, daemon=True)
+        self.worker.start()
+        self.redraw()
+
+    def redraw(self):
+        """Display the current statistics and schedule the next frame."""
+        import simulate
+        running = self.worker.is_alive()
+        tally = self.tally
+        games, wins = tally.games, tally.wins
+        low, high = simulate.wilson_interval(wins, games)
+        rate = wins / games if games else 0.0
+        self.stats_labels['games'].text = 'Games: {0:,} of {1:,}'.format(
+            games, self.num_games)
+        self.stats_labels['win_rate'].text = \
+            'Win rate: {0:.4f} (95% CI {1:.4f} to {2:.4f})'.format(
+                rate, low, high)
+        self.stats_labels['turns'].text = \
+            'Average game length: {0:.2f} turns'.format(tally.average_turns)
+        self.stats_labels['swaps'].text = \
+            'Swine Swaps per game: {0:.3f}'.format(tally.swaps_per_game)
+        if games:
+            self.history.append((rate, low, high))
+            del self.history[:-SimulationGUI.HISTORY]
+            self.draw_chart()
+        if running:
+            self.pending = self.after(1000 // SimulationGUI.FRAME_RATE,
+                                      self.redraw)
+        else:
+            self.pending = None
+
+    def draw_chart(self):
+        """Plot the running win rate inside its confidence band."""
+        width, height = SimulationGUI.WIDTH, SimulationGUI.HEIGHT
+        step = width / (SimulationGUI.HISTORY - 1)
+        def y(p):
+            return height * (1 - p)
+        self.chart.delete('all')
+        self.chart.create_line(0, y(0.5), width, y(0.5), fill='#cccccc',
+                               dash=(2, 2))
+        band = [(i * step, y(high)) for i, (_, _, high) in
+                enumerate(self.history)]
+        band += [(i * step, y(low)) for i, (_, low, _) in
+                 reversed(list(enumerate(self.history)))]
+        if len(self.history) > 1:
+            self.chart.create_polygon(band, fill=select_bg, outline='')
+            rates = [(i * step, y(rate)) for i, (rate, _, _) in
+                     enumerate(self.history)]
+            self.chart.create_line(rates, fill=fg)
+
+    def destroy(self):
+        """Overrides the destroy method to stop the worker and the redraws."""
+        self.stopped = True
+        if self.pending is not None:
+            self.after_cancel(self.pending)
+            self.pending = None
         super().destroy()
 
 def run_GUI(computer=False):
@@ -317,6 +562,21 @@ def run_GUI(computer=False):
     app = HogGUI(root, computer)
     root.mainloop()
 
+def run_simulation_GUI(strategy, baseline, num_games):
+    """Start the simulation dashboard.
+
+    strategy  -- name of the strategy whose win rate is reported
+    baseline  -- name of the strategy it plays against
+    num_games -- number of games to simulate
+    """
+    root = Tk()
+    root.title('Hog Simulation')
+    root.minsize(520, 400)
+    root.geometry("520x400")
+
+    app = SimulationGUI(root, strategy, baseline, num_games)
+    root.mainloop()
+
 ##########
 # THEMES #
 ##########
@@ -325,6 +585,7 @@ select_bg = '#a6d785'
 bg='#ffffff'
 fg='#000000'
 font=('Arial', 14)
+advice_font=('Arial', 10)
 
 frame_theme = {
     'bg': bg,
@@ -358,6 +619,7 @@ DELAY=2000
 
 @main
 def run(*args):
+    import argparse
     parser = argparse.ArgumentParser(description='Hog GUI')
     parser.add_argument('-f', '--final',
                         help='play against the final strategy in hog.py. '
@@ -366,7 +628,30 @@ def run(*args):
     parser.add_argument('-d', '--delay',
                         help='time delay for computer, in seconds', type=int,
                         default=2)
+    parser.add_argument('-s', '--simulate',
+                        help='simulate games between two strategies instead '
+                             'of playing. A strategy is a function name in '
+                             'hog.py or a number N for always_roll(N).',
+                        nargs=2, metavar=('STRATEGY', 'BASELINE'))
+    parser.add_argument('-n', '--num_games',
+                        help='number of games to simulate', type=int,
+                        default=1000000)
+    logs = parser.add_mutually_exclusive_group()
+    logs.add_argument('--record', metavar='PATH',
+                       help='write every roll of the dice to a log')
+    logs.add_argument('--replay', metavar='PATH',
+                       help='roll the dice recorded in a log by --record')
     args = parser.parse_args()
     global DELAY
     DELAY = args.delay * 1000
-    run_GUI(computer=args.final)
+    if args.record:
+        rolls = hog.RecordedDice(args.record)
+    elif args.replay:
+        rolls = hog.ReplayedDice(args.replay)
+    else:
+        rolls = contextlib.nullcontext()
+    with rolls:
+        if args.simulate:
+            run_simulation_GUI(*args.simulate, num_games=args.num_games)
+        else:
+            run_GUI(computer=args.final)
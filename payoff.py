@@ -0,0 +1,152 @@
+"""Exact win rates between every pair of strategies in a pool.
+
+Entry [i, j] of a payoff matrix is the exact chance that strategy i beats
+strategy j, averaged over going first and going second, so entry [j, i] is
+one minus it. Each pair is evaluated with evaluate.win_rates, one column at
+a time: every strategy that still needs a result against a given opponent
+is evaluated against it in one pass, and columns can be spread over worker
+processes.
+
+Computed entries are saved in a JSON file, keyed by the fingerprints of the
+two strategies (see registry.fingerprint) and the ruleset, so that growing
+the pool, or changing one strategy, only computes the entries that are new.
+Print the matrix of DEFAULT_POOL, or of the given strategies, with
+
+    python3 payoff.py [--workers N] [strategy ...]
+"""
+
+import json
+import os
+from collections import namedtuple
+
+import numpy as np
+
+import evaluate
+import hog
+import registry
+from ucb import main
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            'payoff.json')
+
+DEFAULT_POOL = [str(n) for n in range(11)] + [
+    'bacon_strategy', 'bacon_strategy:margin=6,num_rolls=4',
+    'swap_strategy', 'swap_strategy:num_rolls=4', 'final_strategy']
+
+Payoff = namedtuple('Payoff', 'names fingerprints win_rates')
+
+
+def payoff_matrix(pool=DEFAULT_POOL, path=DEFAULT_PATH, workers=1,
+                  goal=hog.GOAL_SCORE, rules=None):
+    """Return the Payoff of the strategies in POOL, given by name (see
+    registry.strategy_named) or as strategy objects, reading saved entries
+    from PATH and saving new ones there. Pass path=None to save nothing.
+
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'payoff.json')
+    >>> payoff = payoff_matrix(['3', '4', '5'], path, goal=30)
+    >>> payoff.names
+    ['3', '4', '5']
+    >>> np.allclose(payoff.win_rates + payoff.win_rates.T, 1)
+    True
+    >>> rate = evaluate.Evaluator(hog.always_roll(3), hog.always_roll(4),
+    ...                           goal=30).win_rate()
+    >>> abs(float(payoff.win_rates[0, 1]) - rate) < 1e-12
+    True
+    >>> grown = payoff_matrix(['3', '4', '5', '6'], path, goal=30)
+    >>> np.array_equal(grown.win_rates[:3, :3], payoff.win_rates)
+    True
+    """
+    if rules is not None:
+        goal = rules.goal
+    ruleset = 'standard' if rules is None else rules.name
+    names, fingerprints, tables = [], [], []
+    for strategy in pool:
+        if isinstance(strategy, str):
+            names.append(strategy)
+            strategy = registry.strategy_named(strategy)
+        else:
+            names.append(getattr(strategy, '__name__', str(strategy)))
+        fingerprints.append(registry.fingerprint(strategy, goal))
+        tables.append(evaluate.as_table(strategy, goal))
+
+    saved = _load(path)
+    count = len(pool)
+    win_rates = np.full((count, count), 0.5)
+    missing = {}  # Strategies still to evaluate against each opponent
+    for j in range(count):
+        for i in range(j):
+            key = _key(fingerprints[i], fingerprints[j], ruleset)
+            reverse = _key(fingerprints[j], fingerprints[i], ruleset)
+            if key in saved:
+                win_rates[i, j] = saved[key]
+            elif reverse in saved:
+                win_rates[i, j] = 1 - saved[reverse]
+            elif fingerprints[i] != fingerprints[j]:
+                missing.setdefault(j, []).append(i)
+
+    tasks = [(np.stack([tables[i] for i in rows]), tables[j], goal, rules)
+             for j, rows in missing.items()]
+    if workers > 1 and len(tasks) > 1:
+        import multiprocessing
+        with multiprocessing.Pool(workers) as processes:
+            columns = processes.map(_column, tasks)
+    else:
+        columns = [_column(task) for task in tasks]
+    for (j, rows), column in zip(missing.items(), columns):
+        for i, rate in zip(rows, column):
+            win_rates[i, j] = float(rate)
+            saved[_key(fingerprints[i], fingerprints[j], ruleset)] = \
+                float(rate)
+
+    lower = np.tril_indices(count, -1)
+    win_rates[lower] = 1 - win_rates.T[lower]
+    if missing and path is not None:
+        _save(path, saved)
+    return Payoff(names, fingerprints, win_rates)
+
+
+def _column(task):
+    """Return the win rates of a stack of tables against one opponent. TASK
+    is a tuple (candidates, opponent, goal, rules)."""
+    candidates, opponent, goal, rules = task
+    return evaluate.win_rates(candidates, opponent, goal, rules)
+
+
+def _key(fingerprint, opponent_fingerprint, ruleset):
+    return ' '.join((fingerprint, opponent_fingerprint, ruleset))
+
+
+def _load(path):
+    """Return the saved entries at PATH, or none if there is no file."""
+    if path is None:
+        return {}
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _save(path, entries):
+    """Write ENTRIES to PATH, replacing the file in one step."""
+    partial = '{0}.{1}.partial'.format(path, os.getpid())
+    with open(partial, 'w') as f:
+        json.dump(entries, f, indent=0, sort_keys=True)
+    os.replace(partial, path)
+
+
+@main
+def run(*args):
+    args, workers = list(args), 1
+    if '--workers' in args:
+        at = args.index('--workers')
+        workers = int(args[at + 1])
+        del args[at:at + 2]
+    payoff = payoff_matrix(args or DEFAULT_POOL, workers=workers)
+    width = max(len(name) for name in payoff.names)
+    print(' ' * width, ' '.join('{0:>6}'.format(i)
+                                for i in range(len(payoff.names))))
+    for i, (name, row) in enumerate(zip(payoff.names, payoff.win_rates)):
+        print('{0:>{1}}'.format(name, width),
+              ' '.join('{0:6.4f}'.format(rate) for rate in row), i)
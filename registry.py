@@ -0,0 +1,227 @@
+"""A registry of Hog strategies compiled into decision tables.
+
+A pure strategy is completely described by its decision table: the number of
+dice it rolls in each state (score, opponent_score) with both scores below the
+goal. load compiles a strategy into its table the first time it is used and
+caches the table on disk, keyed by a fingerprint of the strategy's source code
+and parameters, so later processes read the table instead of calling the
+strategy. Editing the strategy, or any function in its module that it calls,
+changes the fingerprint and so invalidates the cached table.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import types
+
+import hog
+import simulate
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         '.hog_cache')
+
+STRATEGIES = {}  # Strategies registered by name
+
+
+def register(name):
+    """Return a decorator that registers a strategy under NAME.
+
+    >>> @register('roll_three')
+    ... def roll_three(score, opponent_score):
+    ...     return 3
+    >>> load('roll_three', cache_dir=None)(10, 20)
+    3
+    """
+    def decorator(strategy):
+        STRATEGIES[name] = strategy
+        return strategy
+    return decorator
+
+
+def strategy_named(spec):
+    """Return the registered strategy called SPEC, or else the strategy that
+    simulate.strategy_named builds from SPEC."""
+    if spec in STRATEGIES:
+        return STRATEGIES[spec]
+    return simulate.strategy_named(spec)
+
+
+class TableStrategy(object):
+    """A strategy that looks up the number of dice in a decision table.
+
+    >>> always_four = TableStrategy(bytes([4]) * 25, goal=5)
+    >>> always_four(3, 4)
+    4
+    """
+    def __init__(self, table, goal=hog.GOAL_SCORE):
+        assert len(table) == goal * goal, 'Table does not match goal'
+        self.table = table
+        self.goal = goal
+
+    def __call__(self, score, opponent_score):
+        return self.table[score * self.goal + opponent_score]
+
+
+def decision_table(strategy, goal=hog.GOAL_SCORE):
+    """Return the decision table of STRATEGY as bytes, in which entry
+    score * GOAL + opponent_score is STRATEGY(score, opponent_score).
+
+    >>> decision_table(hog.always_roll(2), goal=2)
+    b'\\x02\\x02\\x02\\x02'
+    """
+    table = bytearray(goal * goal)
+    for score in range(goal):
+        for opponent_score in range(goal):
+            num_rolls = strategy(score, opponent_score)
+            assert type(num_rolls) == int and 0 <= num_rolls <= 10, \
+                'Strategy returned {0} for ({1}, {2})'.format(
+                    num_rolls, score, opponent_score)
+            table[score * goal + opponent_score] = num_rolls
+    return bytes(table)
+
+
+def load(spec, goal=hog.GOAL_SCORE, cache_dir=CACHE_DIR):
+    """Return the strategy named SPEC compiled into a TableStrategy.
+
+    The table is read from CACHE_DIR if an entry with the strategy's
+    fingerprint exists, and is compiled and stored there otherwise. Pass
+    cache_dir=None to compile without caching.
+    """
+    strategy = strategy_named(spec)
+    if isinstance(strategy, TableStrategy) and strategy.goal == goal:
+        return strategy
+    if cache_dir is None:
+        return TableStrategy(decision_table(strategy, goal), goal)
+    path = os.path.join(cache_dir, fingerprint(strategy, goal) + '.table')
+    try:
+        with open(path, 'rb') as f:
+            table = f.read()
+        if len(table) == goal * goal:
+            return TableStrategy(table, goal)
+    except FileNotFoundError:
+        pass
+    table = decision_table(strategy, goal)
+    os.makedirs(cache_dir, exist_ok=True)
+    partial = '{0}.{1}.partial'.format(path, os.getpid())
+    with open(partial, 'wb') as f:
+        f.write(table)
+    os.replace(partial, path)
+    return TableStrategy(table, goal)
+
+
+################
+# Fingerprints #
+################
+
+_LITERALS = (type(None), bool, int, float, complex, str)
+
+
+def fingerprint(strategy, goal=hog.GOAL_SCORE):
+    """Return a hexadecimal digest that identifies STRATEGY and GOAL.
+
+    The digest covers the source of STRATEGY, the source of every function
+    it refers to by a global name (or as an attribute of a module it refers
+    to), recursively, the values of its closure variables, defaults and
+    bound arguments, and the source of rules.py.
+
+    >>> fingerprint(hog.always_roll(4)) == fingerprint(hog.always_roll(4))
+    True
+    >>> fingerprint(hog.always_roll(4)) == fingerprint(hog.always_roll(5))
+    False
+    >>> import numpy as np
+    >>> fingerprint(np.zeros((2, 2))) == fingerprint(np.ones((2, 2)))
+    False
+    """
+    digest = hashlib.sha256(repr(goal).encode())
+    digest.update(_rules_source().encode())
+    _update(digest, strategy, set())
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _rules_source():
+    """Return the source of rules.py. Strategies reach the rule tables
+    through method calls, which _update does not follow, so the rules are
+    part of every fingerprint."""
+    import rules
+    return _source(rules)
+
+
+def _update(digest, obj, seen):
+    """Add OBJ, and everything it depends on, to DIGEST."""
+    if isinstance(obj, _LITERALS):
+        digest.update(repr(obj).encode())
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        digest.update(obj)
+    elif isinstance(obj, (list, tuple)):
+        digest.update(type(obj).__name__.encode())
+        for item in obj:
+            _update(digest, item, seen)
+    elif hasattr(obj, 'dtype') and hasattr(obj, 'tobytes'):  # NumPy arrays
+        digest.update(repr((str(obj.dtype), obj.shape)).encode())
+        digest.update(obj.tobytes())
+    elif isinstance(obj, dict):
+        for key in sorted(obj, key=repr):
+            _update(digest, key, seen)
+            _update(digest, obj[key], seen)
+    elif id(obj) in seen:
+        digest.update(b'<seen>')
+    elif isinstance(obj, functools.partial):
+        seen.add(id(obj))
+        _update(digest, obj.func, seen)
+        _update(digest, obj.args, seen)
+        _update(digest, obj.keywords, seen)
+    elif isinstance(obj, types.FunctionType):
+        seen.add(id(obj))
+        _update_function(digest, obj, seen)
+    elif isinstance(obj, types.ModuleType):
+        digest.update(obj.__name__.encode())
+    else:
+        seen.add(id(obj))
+        digest.update(_source(type(obj)).encode())
+        _update(digest, getattr(obj, '__dict__', {}), seen)
+        call = getattr(type(obj), '__call__', None)
+        if isinstance(call, types.FunctionType):
+            _update(digest, call, seen)
+
+
+def _update_function(digest, fn, seen):
+    digest.update(fn.__qualname__.encode())
+    digest.update(_source(fn).encode())
+    _update(digest, fn.__defaults__, seen)
+    _update(digest, fn.__kwdefaults__, seen)
+    for cell in fn.__closure__ or ():
+        _update(digest, cell.cell_contents, seen)
+    names = _global_names(fn.__code__)
+    for name in sorted(names):
+        value = fn.__globals__.get(name)
+        if isinstance(value, types.FunctionType):
+            _update(digest, value, seen)
+        elif isinstance(value, types.ModuleType):
+            for attribute in sorted(names):
+                member = getattr(value, attribute, None)
+                if isinstance(member, types.FunctionType):
+                    _update(digest, member, seen)
+        elif isinstance(value, _LITERALS):
+            digest.update(name.encode())
+            _update(digest, value, seen)
+
+
+def _global_names(code):
+    """Return the names used by CODE and the code nested inside it."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def _source(obj):
+    try:
+        return inspect.getsource(obj)
+    except (OSError, TypeError):
+        code = getattr(obj, '__code__', None)
+        if code is None:
+            return getattr(obj, '__qualname__', repr(obj))
+        return repr((code.co_code, code.co_consts))
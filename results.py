@@ -0,0 +1,157 @@
+"""An append-only store of strategy evaluations, kept in a SQLite database.
+
+Every evaluation records what was compared (the strategies' names and
+fingerprints, and the ruleset), how (the number of games and the seed), and
+the outcome (win rate, 95% interval and wall time). Rows are only ever
+inserted; the database rejects updates and deletes. Writes are buffered and
+inserted in batches, so recording a result costs a list append.
+"""
+
+import os
+import sqlite3
+import time
+from collections import namedtuple
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            'results.sqlite')
+DEFAULT_RULESET = 'standard'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evaluations (
+    id INTEGER PRIMARY KEY,
+    recorded_at REAL NOT NULL,
+    strategy TEXT NOT NULL,
+    strategy_fingerprint TEXT NOT NULL,
+    baseline TEXT NOT NULL,
+    baseline_fingerprint TEXT NOT NULL,
+    ruleset TEXT NOT NULL,
+    samples INTEGER NOT NULL,
+    win_rate REAL NOT NULL,
+    ci_low REAL,
+    ci_high REAL,
+    seed TEXT,
+    wall_time REAL
+);
+CREATE INDEX IF NOT EXISTS evaluations_by_pair ON evaluations (
+    strategy_fingerprint, baseline_fingerprint, ruleset, recorded_at);
+CREATE INDEX IF NOT EXISTS evaluations_by_name ON evaluations (
+    strategy, recorded_at);
+CREATE TRIGGER IF NOT EXISTS evaluations_no_update
+    BEFORE UPDATE ON evaluations
+    BEGIN SELECT RAISE(ABORT, 'evaluations are append-only'); END;
+CREATE TRIGGER IF NOT EXISTS evaluations_no_delete
+    BEFORE DELETE ON evaluations
+    BEGIN SELECT RAISE(ABORT, 'evaluations are append-only'); END;
+"""
+
+_FIELDS = ('recorded_at strategy strategy_fingerprint baseline '
+           'baseline_fingerprint ruleset samples win_rate ci_low ci_high seed '
+           'wall_time').split()
+
+Evaluation = namedtuple('Evaluation', _FIELDS)
+
+
+class ResultsStore(object):
+    """A results database at PATH. Use it as a context manager, or call close,
+    so that buffered evaluations are written.
+
+    >>> store = ResultsStore(':memory:')
+    >>> store.record('always_roll(8)', 'a1', 'always_roll(5)', 'b2',
+    ...              samples=2000, win_rate=0.42, seed=1)
+    >>> [e.win_rate for e in store.history(strategy_fingerprint='a1')]
+    [0.42]
+    >>> store.close()
+    """
+    def __init__(self, path=DEFAULT_PATH, batch_size=100):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+        self.batch_size = batch_size
+        self.pending = []
+
+    def record(self, strategy, strategy_fingerprint, baseline,
+               baseline_fingerprint, samples, win_rate, ci_low=None,
+               ci_high=None, seed=None, wall_time=None,
+               ruleset=DEFAULT_RULESET):
+        """Buffer one evaluation, writing the buffer once it is full."""
+        self.pending.append(Evaluation(
+            time.time(), strategy, strategy_fingerprint, baseline,
+            baseline_fingerprint, ruleset, samples, win_rate, ci_low, ci_high,
+            None if seed is None else str(seed), wall_time))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered evaluations in a single transaction."""
+        if self.pending:
+            with self.connection:
+                self.connection.executemany(
+                    'INSERT INTO evaluations ({0}) VALUES ({1})'.format(
+                        ', '.join(_FIELDS), ', '.join('?' * len(_FIELDS))),
+                    self.pending)
+            self.pending = []
+
+    def history(self, strategy_fingerprint=None, baseline_fingerprint=None,
+                ruleset=None, strategy=None, limit=None):
+        """Return recorded Evaluations matching every given argument, oldest
+        first. Buffered evaluations are written first."""
+        self.flush()
+        conditions, values = [], []
+        for field, value in (('strategy_fingerprint', strategy_fingerprint),
+                             ('baseline_fingerprint', baseline_fingerprint),
+                             ('ruleset', ruleset), ('strategy', strategy)):
+            if value is not None:
+                conditions.append(field + ' = ?')
+                values.append(value)
+        query = 'SELECT {0} FROM evaluations'.format(', '.join(_FIELDS))
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY recorded_at'
+        if limit is not None:
+            query = 'SELECT * FROM ({0} DESC LIMIT {1}) ORDER BY recorded_at'\
+                .format(query, int(limit))
+        return [Evaluation(*row) for row in
+                self.connection.execute(query, values)]
+
+    def latest(self, strategy_fingerprint, baseline_fingerprint,
+               ruleset=DEFAULT_RULESET):
+        """Return the most recent Evaluation of a pair, or None."""
+        found = self.history(strategy_fingerprint, baseline_fingerprint,
+                             ruleset, limit=1)
+        return found[0] if found else None
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def record_win_rate(store, name, strategy, baseline_name, baseline, samples,
+                    win_rate, seed=None, wall_time=None,
+                    ruleset=DEFAULT_RULESET):
+    """Record an evaluation of the strategy objects STRATEGY and BASELINE in
+    STORE, computing their fingerprints and the 95% interval of WIN_RATE over
+    SAMPLES games."""
+    import registry
+    import simulate
+    low, high = simulate.wilson_interval(round(win_rate * samples), samples)
+    store.record(name, registry.fingerprint(strategy), baseline_name,
+                 registry.fingerprint(baseline), samples, win_rate, low, high,
+                 seed, wall_time, ruleset)
+
+
+def record_batch(store, batch, ruleset=DEFAULT_RULESET):
+    """Record the dictionary returned by simulate.simulate_batch in STORE."""
+    import registry
+    low, high = batch['ci95']
+    strategy, baseline = batch['strategy'], batch['baseline']
+    store.record(strategy,
+                 registry.fingerprint(registry.strategy_named(strategy)),
+                 baseline,
+                 registry.fingerprint(registry.strategy_named(baseline)),
+                 batch['games'], batch['win_rate'], low, high, batch['seed'],
+                 batch['wall_time'], ruleset)
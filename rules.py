@@ -0,0 +1,206 @@
+"""Rule sets for Hog, and precomputed tables for their rules.
+
+A Ruleset describes a variant of the game: its goal, and which of the
+special rules apply. The standard game is STANDARD.
+
+Swine Swap, Hog Wild and Free Bacon depend only on the scores, so instead of
+doing digit arithmetic on every turn, play and the strategies in hog.py look
+their outcomes up in tables built here once per ruleset. Each table is built
+as bytes, which are fast to index one entry at a time from Python, and is
+also available as a NumPy array for the vectorized engines in exact.py and
+evaluate.py. The arrays, and NumPy itself, are only loaded when first used,
+so that playing a game does not import NumPy. Because every engine reads the
+rules from these tables, playing or solving a variant costs the same as the
+standard game.
+
+>>> t = tables()
+>>> all(t.is_swap(s0, s1) == hog.is_swap(s0, s1)
+...     for s0 in range(250) for s1 in range(250))
+True
+>>> all((t.dice_sides(s0, s1) == 4) ==
+...     (hog.select_dice(s0, s1) is hog.four_sided)
+...     for s0 in range(250) for s1 in range(250))
+True
+>>> all(t.free_bacon_bytes[s % 100] == _hogtimus(max(s % 10, s // 10 % 10) + 1)
+...     for s in range(250))
+True
+>>> all(t.hogtimus[points] == _hogtimus(points)
+...     for points in range(len(t.hogtimus)))
+True
+"""
+
+from collections import namedtuple
+from functools import cached_property, lru_cache
+
+import hog
+
+MAX_ROLLS = 10  # The most dice a player may roll in one turn
+HOG_WILD_MODULUS = 7  # Four-sided dice when the score sum is a multiple
+
+
+def _hogtimus(points):
+    return hog.next_prime(points) if hog.is_prime(points) else points
+
+
+# The most points one turn can score: ten sixes, after Hogtimus Prime
+MAX_TURN_POINTS = max(_hogtimus(total) for total in range(6 * MAX_ROLLS + 1))
+
+
+class Ruleset(namedtuple('Ruleset', ['goal', 'hogtimus', 'hog_wild_modulus',
+                                     'pig_out_bonus', 'swine_swap'],
+                         defaults=(hog.GOAL_SCORE, True, HOG_WILD_MODULUS,
+                                   True, True))):
+    """A variant of Hog.
+
+    goal             -- the score that ends the game
+    hogtimus         -- whether prime turn scores are bumped to the next prime
+    hog_wild_modulus -- four-sided dice are rolled when the sum of the scores
+                        is a multiple of this; 0 turns Hog Wild off
+    pig_out_bonus    -- whether the opponent gains NUM_ROLLS points when the
+                        current player pigs out
+    swine_swap       -- whether Swine Swap applies
+
+    >>> Ruleset(goal=50, hogtimus=False).name
+    'goal=50,hogtimus=False'
+    >>> parse('goal=50,hogtimus=False') == Ruleset(goal=50, hogtimus=False)
+    True
+    """
+    __slots__ = ()
+
+    @property
+    def name(self):
+        """A short description listing the rules that differ from STANDARD,
+        or 'standard'."""
+        changes = ['{0}={1}'.format(field, value) for field, value, default
+                   in zip(self._fields, self, STANDARD) if value != default]
+        return ','.join(changes) or 'standard'
+
+
+STANDARD = Ruleset()
+
+
+def parse(text):
+    """Return the Ruleset described by TEXT, a comma-separated list of
+    field=value pairs such as 'goal=50,swine_swap=False'."""
+    changes = {}
+    for change in filter(None, text.split(',')):
+        field, _, value = change.partition('=')
+        field, value = field.strip(), value.strip()
+        if field not in Ruleset._fields:
+            raise ValueError('Unknown rule: ' + field)
+        if value in ('True', 'False'):
+            changes[field] = value == 'True'
+        else:
+            changes[field] = int(value)
+    return Ruleset(**changes)
+
+
+def ruleset(goal=hog.GOAL_SCORE, rules=None):
+    """Return RULES if it is given, and the standard rules with GOAL if not."""
+    if rules is not None:
+        return rules
+    return STANDARD if goal == hog.GOAL_SCORE else Ruleset(goal=goal)
+
+
+class RuleTables(object):
+    """Rule tables for RULES, a Ruleset.
+
+    Each rule depends on the scores only through their last two digits, or
+    through their sum modulo the Hog Wild modulus, so the tables are indexed
+    by those and cover every goal in constant space.
+
+    swap       -- packed bitmap: bit s1 % 100 of row s0 % 100 (np.packbits
+                  order) is set if is_swap(s0, s1)
+    hog_wild   -- hog_wild[(s0 + s1) % hog_wild_period] is 4 if Hog Wild
+                  applies, and 6 if not
+    free_bacon -- free_bacon[s % 100] is the score of rolling zero dice against
+                  an opponent with score s, including Hogtimus Prime
+    hogtimus   -- hogtimus[total] is the score of a turn that totals TOTAL,
+                  for every total that rolling dice can produce
+
+    swap_bytes[s0 % 100 * 100 + s1 % 100], hog_wild_bytes, free_bacon_bytes
+    and hogtimus_bytes hold the same values as unpacked bytes, indexed in the
+    same way. They are built without NumPy, and the arrays above are made
+    from them the first time they are used. pig_out_bonus is copied from
+    RULES.
+
+    >>> variant = RuleTables(Ruleset(hogtimus=False, hog_wild_modulus=0))
+    >>> variant.free_bacon_bytes[4], variant.dice_sides(3, 4)
+    (5, 6)
+    """
+    def __init__(self, rules):
+        self.rules = rules
+        self.pig_out_bonus = rules.pig_out_bonus
+        digits = [(s % 10, s // 10 % 10) for s in range(100)]
+        if rules.swine_swap:
+            self.swap_bytes = bytes(ones0 == tens1 and tens0 == ones1
+                                    for ones0, tens0 in digits
+                                    for ones1, tens1 in digits)
+        else:
+            self.swap_bytes = bytes(100 * 100)
+
+        self.hog_wild_period = rules.hog_wild_modulus or 1
+        self.hog_wild_bytes = bytes([4 if rules.hog_wild_modulus else 6]) + \
+            bytes([6]) * (self.hog_wild_period - 1)
+
+        totals = range(6 * MAX_ROLLS + 1)
+        if rules.hogtimus:
+            self.hogtimus_bytes = bytes(_hogtimus(total) for total in totals)
+        else:
+            self.hogtimus_bytes = bytes(totals)
+        self.free_bacon_bytes = bytes(self.hogtimus_bytes[max(digit) + 1]
+                                      for digit in digits)
+
+    @cached_property
+    def swap(self):
+        import numpy as np
+        swapped = np.frombuffer(self.swap_bytes, dtype=bool).reshape(100, 100)
+        return np.packbits(swapped, axis=1)
+
+    @cached_property
+    def hog_wild(self):
+        return _array(self.hog_wild_bytes)
+
+    @cached_property
+    def hogtimus(self):
+        return _array(self.hogtimus_bytes)
+
+    @cached_property
+    def free_bacon(self):
+        return _array(self.free_bacon_bytes)
+
+    def is_swap(self, score0, score1):
+        """Return whether Swine Swap applies to SCORE0 and SCORE1.
+
+        >>> tables().is_swap(19, 91), tables().is_swap(13, 32)
+        (True, False)
+        >>> tables().is_swap(4519, 1091)
+        True
+        """
+        return self.swap_bytes[score0 % 100 * 100 + score1 % 100] == 1
+
+    def dice_sides(self, score0, score1):
+        """Return the number of sides of the dice for scores SCORE0 and
+        SCORE1."""
+        return self.hog_wild_bytes[(score0 + score1) % self.hog_wild_period]
+
+    def points(self, num_rolls, opponent_score, total):
+        """Return the points scored by rolling NUM_ROLLS dice that total
+        TOTAL (as returned by roll_dice) against OPPONENT_SCORE."""
+        if num_rolls == 0:
+            return self.free_bacon_bytes[opponent_score % 100]
+        if total < len(self.hogtimus_bytes):
+            return self.hogtimus_bytes[total]
+        return _hogtimus(total) if self.rules.hogtimus else total
+
+
+def _array(table):
+    """Return the bytes TABLE as a read-only NumPy array of uint8."""
+    import numpy as np
+    return np.frombuffer(table, dtype=np.uint8)
+
+
+@lru_cache(maxsize=None)
+def tables(rules=STANDARD):
+    """Return the shared rule tables for RULES."""
+    return RuleTables(rules)
@@ -0,0 +1,460 @@
+"""Batch simulation of Hog games.
+
+The functions in this file play many games between two strategies and keep
+aggregate statistics, such as win rates and how often Swine Swap occurs,
+that hog.play does not report.
+"""
+
+import ast
+import importlib
+import inspect
+import random
+import time
+from collections import namedtuple
+from math import sqrt
+from statistics import NormalDist
+
+import hog
+
+Z_95 = 1.959964  # Two-sided 95% quantile of the standard normal distribution
+
+
+class GameRecord(namedtuple('GameRecord',
+                            'score0 score1 turns swaps pig_outs')):
+    """The outcome of one game: final scores and how many turns, swaps and
+    pig-outs it took to get there."""
+    __slots__ = ()
+
+    @property
+    def winner(self):
+        """0 if Player 0 won the game, and 1 otherwise."""
+        return 0 if self.score0 > self.score1 else 1
+
+
+def play_game(strategy0, strategy1, goal=hog.GOAL_SCORE, rules=None,
+              log=None):
+    """Simulate a game exactly as hog.play does and return a GameRecord.
+    RULES is a Ruleset (see rules.py) that replaces the standard rules.
+    LOG, if given, is an export.TurnLog that records every turn.
+
+    >>> fair_dice = hog.four_sided, hog.six_sided
+    >>> hog.four_sided = hog.make_test_dice(1)
+    >>> hog.six_sided = hog.make_test_dice(3)
+    >>> play_game(hog.always_roll(5), hog.always_roll(3), goal=30)
+    GameRecord(score0=0, score1=33, turns=5, swaps=0, pig_outs=3)
+    >>> hog.four_sided, hog.six_sided = fair_dice
+    """
+    score, opponent_score = 0, 0
+    strategy, opponent_strategy = strategy0, strategy1
+    turns = swaps = pig_outs = 0
+    if rules is not None:
+        goal = rules.goal
+    tables = hog.rule_tables(goal, rules)
+    play_turn = hog.play_turn
+    if log is not None:
+        game = []  # Turns for the log, added to it when the game ends
+        record_turn = game.extend
+    while score < goal and opponent_score < goal:
+        num_rolls = strategy(score, opponent_score)
+        new_score, new_opponent_score, points, swapped = play_turn(
+            num_rolls, score, opponent_score, tables)
+        if log is not None:
+            record_turn((score, opponent_score, num_rolls, points, swapped))
+        if points == 0:
+            pig_outs += 1
+        if swapped:
+            swaps += 1
+        turns += 1
+        score, opponent_score = new_opponent_score, new_score
+        strategy, opponent_strategy = opponent_strategy, strategy
+    if turns % 2:
+        score, opponent_score = opponent_score, score
+    if log is not None:
+        log.add_game(game, 0 if score > opponent_score else 1, tables)
+    return GameRecord(score, opponent_score, turns, swaps, pig_outs)
+
+
+def strategy_named(spec):
+    """Return the strategy described by SPEC.
+
+    SPEC is a name, optionally followed by a colon and comma-separated
+    arguments, each a value or a key=value pair:
+
+      - a number N stands for always_roll(N);
+      - a name without dots refers to hog, and a dotted name such as
+        mymodule.my_strategy to an attribute of an importable module;
+      - a function that can be called with the two scores followed by the
+        arguments is a strategy, and the arguments are passed after the two
+        scores on every call;
+      - any other function is a strategy factory, such as always_roll, and
+        is called with the arguments to make the strategy.
+
+    >>> strategy_named('6')(0, 0)
+    6
+    >>> strategy_named('final_strategy') is hog.final_strategy
+    True
+    >>> strategy_named('always_roll:8')(0, 0)
+    8
+    >>> strategy_named('bacon_strategy:margin=6,num_rolls=4')(0, 33)
+    4
+    """
+    name, _, arguments = spec.partition(':')
+    if name.isdigit() and not arguments:
+        return hog.always_roll(int(name))
+    module_name, _, attribute = name.rpartition('.')
+    module = importlib.import_module(module_name) if module_name else hog
+    fn = getattr(module, attribute, None)
+    if not callable(fn):
+        raise ValueError('Unknown strategy: {0}'.format(spec))
+    args, kwargs = [], {}
+    for argument in filter(None, arguments.split(',')):
+        key, equals, value = argument.rpartition('=')
+        if equals:
+            kwargs[key.strip()] = _literal(value)
+        else:
+            args.append(_literal(value))
+
+    if not _is_strategy(fn, args, kwargs):
+        return fn(*args, **kwargs)
+    if not args and not kwargs:
+        return fn
+    def strategy(score, opponent_score):
+        return fn(score, opponent_score, *args, **kwargs)
+    return strategy
+
+
+def _is_strategy(fn, args, kwargs):
+    """Return whether FN is a strategy that takes ARGS and KWARGS after the
+    two scores, rather than a strategy factory."""
+    try:
+        signature = inspect.signature(fn)
+    except (TypeError, ValueError):
+        return True
+    if list(signature.parameters)[:1] == ['score']:
+        return True
+    try:
+        signature.bind(0, 0, *args, **kwargs)
+    except TypeError:
+        return False
+    return True
+
+
+def _literal(text):
+    """Return TEXT as a Python literal if it is one, and as a string if not."""
+    try:
+        return ast.literal_eval(text.strip())
+    except (ValueError, SyntaxError):
+        return text.strip()
+
+
+class Tally(object):
+    """Running statistics for games between STRATEGY and BASELINE, where
+    STRATEGY alternates between playing first and second.
+
+    >>> tally = Tally()
+    >>> tally.add(GameRecord(100, 40, 20, 1, 3), as_player=0)
+    >>> tally.add(GameRecord(100, 40, 30, 0, 2), as_player=1)
+    >>> tally.games, tally.wins, tally.win_rate
+    (2, 1, 0.5)
+    >>> tally.average_turns, tally.swaps_per_game
+    (25.0, 0.5)
+    >>> tally.seat_wins, tally.seat_games
+    ([1, 0], [1, 1])
+    """
+    def __init__(self):
+        self.games = 0
+        self.wins = 0
+        self.turns = 0
+        self.swaps = 0
+        self.pig_outs = 0
+        self.seat_games = [0, 0]
+        self.seat_wins = [0, 0]
+
+    def add(self, record, as_player):
+        """Count RECORD, a game in which STRATEGY was Player AS_PLAYER."""
+        won = record.winner == as_player
+        self.games += 1
+        self.wins += won
+        self.turns += record.turns
+        self.swaps += record.swaps
+        self.pig_outs += record.pig_outs
+        self.seat_games[as_player] += 1
+        self.seat_wins[as_player] += won
+
+    def merge(self, other):
+        """Add the games counted by the Tally OTHER to this one."""
+        self.games += other.games
+        self.wins += other.wins
+        self.turns += other.turns
+        self.swaps += other.swaps
+        self.pig_outs += other.pig_outs
+        for seat in (0, 1):
+            self.seat_games[seat] += other.seat_games[seat]
+            self.seat_wins[seat] += other.seat_wins[seat]
+
+    @property
+    def win_rate(self):
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def average_turns(self):
+        return self.turns / self.games if self.games else 0.0
+
+    @property
+    def swaps_per_game(self):
+        return self.swaps / self.games if self.games else 0.0
+
+    def confidence_interval(self, z=Z_95):
+        """Return the Wilson score interval (low, high) for the win rate."""
+        return wilson_interval(self.wins, self.games, z)
+
+
+def wilson_interval(wins, games, z=Z_95):
+    """Return the Wilson score interval for WINS successes in GAMES trials.
+
+    >>> low, high = wilson_interval(50, 100)
+    >>> round(low, 3), round(high, 3)
+    (0.404, 0.596)
+    """
+    if games == 0:
+        return 0.0, 1.0
+    p = wins / games
+    denominator = 1 + z * z / games
+    center = (p + z * z / (2 * games)) / denominator
+    spread = z * sqrt(p * (1 - p) / games + z * z / (4 * games * games))
+    return center - spread / denominator, center + spread / denominator
+
+
+def simulate(strategy, baseline, num_games, tally=None, stop=None,
+             rules=None):
+    """Play NUM_GAMES games between STRATEGY and BASELINE, alternating who
+    goes first, and return a Tally of the results.
+
+    tally -- an existing Tally to update in place, so that another thread can
+             watch the statistics as they accumulate
+    stop  -- a function of no arguments; simulation ends early once it
+             returns a true value
+    rules -- a Ruleset to play by instead of the standard rules
+    """
+    if tally is None:
+        tally = Tally()
+    for i in range(num_games):
+        if stop is not None and stop():
+            break
+        if i % 2 == 0:
+            tally.add(play_game(strategy, baseline, rules=rules), as_player=0)
+        else:
+            tally.add(play_game(baseline, strategy, rules=rules), as_player=1)
+    return tally
+
+
+CHUNK_SIZE = 1000  # Games simulated with each seed in simulate_batch
+
+# Largest goal for which strategies are compiled by default. A decision table
+# has GOAL * GOAL entries, each computed by calling the strategy, so for a
+# much larger goal compiling costs far more than the games save.
+COMPILED_MAX_GOAL = 200
+
+
+def _compile(strategy, compiled, goal=hog.GOAL_SCORE):
+    """Return the decision table of STRATEGY from registry.load if STRATEGY
+    is a name and COMPILED is true, and STRATEGY unchanged otherwise. If
+    COMPILED is None, names are compiled if GOAL is at most
+    COMPILED_MAX_GOAL. A batch compiles its strategies once, before it is
+    split into chunks, and the tables pickle with the chunks."""
+    if not isinstance(strategy, str):
+        return strategy
+    if compiled is None:
+        compiled = goal <= COMPILED_MAX_GOAL
+    if compiled:
+        import registry
+        return registry.load(strategy, goal)
+    return strategy
+
+
+def _chunk_strategy(strategy, compiled, goal=hog.GOAL_SCORE):
+    """Return the strategy STRATEGY, which is either a strategy or the name
+    of one, for use in a chunk of games to GOAL, compiled as by _compile."""
+    strategy = _compile(strategy, compiled, goal)
+    if isinstance(strategy, str):
+        return strategy_named(strategy)
+    return strategy
+
+
+def _simulate_chunk(task):
+    """Simulate one chunk of a batch. TASK is a tuple (strategy, baseline,
+    num_games, seed, compiled, rules). Strategies may be given by name, or
+    as compiled tables, so that TASK can be sent to a worker process."""
+    strategy, baseline, num_games, seed, compiled, rules = task
+    goal = hog.GOAL_SCORE if rules is None else rules.goal
+    strategy = _chunk_strategy(strategy, compiled, goal)
+    baseline = _chunk_strategy(baseline, compiled, goal)
+    random.seed(seed)
+    return simulate(strategy, baseline, num_games, rules=rules)
+
+
+def _run_chunks(tasks, pool=None):
+    """Return the Tally of each task, using POOL if one is given. Without a
+    pool, the global random state is restored afterwards."""
+    if pool is not None:
+        return pool.map(_simulate_chunk, tasks)
+    state = random.getstate()
+    chunks = [_simulate_chunk(task) for task in tasks]
+    random.setstate(state)
+    return chunks
+
+
+def simulate_games(strategy0, strategy1, n, seed=None, chunk_size=CHUNK_SIZE,
+                   compiled=None, rules=None, log=None):
+    """Generate a GameRecord for each of N games in which STRATEGY0 plays
+    first against STRATEGY1. Strategies are given as in simulate_batch.
+
+    Games are played CHUNK_SIZE at a time, with the dice seeded from SEED and
+    the position of the chunk as in simulate_batch, and each chunk is only
+    played once the records of the previous one have all been consumed. So
+    at most one chunk of records is held in memory, and a consumer that stops
+    early wastes less than one chunk of games. The global random state is
+    the same before and after each chunk. LOG is passed to play_game.
+
+    >>> games = simulate_games('6', '4', 10 ** 7, seed=1, chunk_size=100)
+    >>> first = [next(games) for _ in range(3)]
+    >>> first == list(simulate_games('6', '4', 3, seed=1, chunk_size=100))
+    True
+    >>> games.close()  # Only the first 100 games were played
+    """
+    if rules is not None:
+        goal = rules.goal
+    else:
+        goal = hog.GOAL_SCORE
+    strategy0 = _chunk_strategy(strategy0, compiled, goal)
+    strategy1 = _chunk_strategy(strategy1, compiled, goal)
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    for start in range(0, n, chunk_size):
+        state = random.getstate()
+        random.seed('{0}:{1}'.format(seed, start))
+        records = [play_game(strategy0, strategy1, rules=rules, log=log)
+                   for _ in range(min(chunk_size, n - start))]
+        random.setstate(state)
+        yield from records
+
+
+def _summary(strategy, baseline, tally, seed, workers, wall_time, rules):
+    """Return the results of a batch as a dictionary that can be written as
+    JSON."""
+    return {
+        'strategy': getattr(strategy, '__name__', str(strategy)),
+        'baseline': getattr(baseline, '__name__', str(baseline)),
+        'rules': 'standard' if rules is None else rules.name,
+        'games': tally.games,
+        'seed': seed,
+        'workers': workers,
+        'win_rate': tally.win_rate,
+        'ci95': list(tally.confidence_interval()),
+        'win_rate_by_seat': [wins / games if games else None for wins, games
+                             in zip(tally.seat_wins, tally.seat_games)],
+        'average_turns': tally.average_turns,
+        'swaps_per_game': tally.swaps_per_game,
+        'wall_time': wall_time,
+        'games_per_sec': tally.games / wall_time if wall_time else None,
+    }
+
+
+def simulate_batch(strategy, baseline, num_games, workers=1, seed=None,
+                   compiled=None, rules=None):
+    """Simulate NUM_GAMES games between the strategies named STRATEGY and
+    BASELINE (see strategy_named) and return a dictionary of results that
+    can be written as JSON.
+
+    Games are split into chunks of CHUNK_SIZE, and each chunk seeds the dice
+    from SEED and its position, so the results for a given SEED do not depend
+    on the number of WORKERS. If COMPILED is true, strategies are replaced by
+    their cached decision tables from registry.load, which is only correct
+    for strategies that are pure functions of the two scores. By default,
+    they are only compiled when the goal is at most COMPILED_MAX_GOAL. RULES
+    is a Ruleset (see rules.py) to play by instead of the standard rules.
+
+    >>> results = simulate_batch('6', '6', 10, seed=1)
+    >>> low, high = results['ci95']
+    >>> results['games'], results['seed'], low < results['win_rate']
+    (10, 1, True)
+    """
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    start_time = time.perf_counter()
+    goal = hog.GOAL_SCORE if rules is None else rules.goal
+    players = (_compile(strategy, compiled, goal),
+               _compile(baseline, compiled, goal))
+    tasks = []
+    for start in range(0, num_games, CHUNK_SIZE):
+        size = min(CHUNK_SIZE, num_games - start)
+        tasks.append(players + (size, '{0}:{1}'.format(seed, start),
+                                compiled, rules))
+
+    if workers > 1:
+        import multiprocessing
+        with multiprocessing.Pool(workers) as pool:
+            chunks = _run_chunks(tasks, pool)
+    else:
+        chunks = _run_chunks(tasks)
+    wall_time = time.perf_counter() - start_time
+
+    tally = Tally()
+    for chunk in chunks:
+        tally.merge(chunk)
+    return _summary(strategy, baseline, tally, seed, workers, wall_time,
+                    rules)
+
+
+def estimate_win_rate(strategy, baseline='5', precision=0.005,
+                      confidence=0.95, workers=1, seed=None,
+                      max_games=10 ** 7, compiled=None, rules=None):
+    """Simulate games between STRATEGY and BASELINE until the win rate is
+    known to within PRECISION at the given CONFIDENCE, and return a
+    dictionary of results like simulate_batch, which also reports the
+    interval at CONFIDENCE as 'ci' and its 'half_width'.
+
+    Games are played in rounds of one CHUNK_SIZE chunk per worker, seeded as
+    in simulate_batch, until the half-width of the confidence interval is at
+    most PRECISION or MAX_GAMES games have been played. Strategies are given
+    by name, or as strategy objects that can be pickled if WORKERS > 1.
+
+    >>> results = estimate_win_rate('6', '6', precision=0.05, seed=1)
+    >>> results['games'], results['half_width'] <= 0.05
+    (1000, True)
+    """
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    tally = Tally()
+    pool = None
+    if workers > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(workers)
+    start_time = time.perf_counter()
+    goal = hog.GOAL_SCORE if rules is None else rules.goal
+    players = (_compile(strategy, compiled, goal),
+               _compile(baseline, compiled, goal))
+    try:
+        while True:
+            tasks = [players + (CHUNK_SIZE,
+                                '{0}:{1}'.format(seed,
+                                                 tally.games + i * CHUNK_SIZE),
+                                compiled, rules)
+                     for i in range(workers)]
+            for chunk in _run_chunks(tasks, pool):
+                tally.merge(chunk)
+            low, high = tally.confidence_interval(z)
+            if (high - low) / 2 <= precision or tally.games >= max_games:
+                break
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    wall_time = time.perf_counter() - start_time
+    summary = _summary(strategy, baseline, tally, seed, workers, wall_time,
+                       rules)
+    summary['confidence'] = confidence
+    summary['ci'] = [low, high]
+    summary['half_width'] = (high - low) / 2
+    return summary
@@ -0,0 +1,169 @@
+"""Hog strategies as objects that can be pickled.
+
+The strategies in hog.py are functions, and the ones with parameters are
+closures (always_roll) or need a wrapper to fix their arguments, so they
+cannot be sent to a multiprocessing pool. The classes here have the same
+call signature, strategy(score, opponent_score), and pickle as their
+parameters. The str of each is a name that simulate.strategy_named accepts,
+so they can be passed to simulate_batch and recorded in results.py.
+
+A Table keeps its decision table in multiprocessing.shared_memory. Pickling
+it sends only the name of the shared block, so a pool reads the one copy
+made when the Table was built, however many tasks use it.
+
+    >>> import multiprocessing
+    >>> with Table.compile(hog.final_strategy) as final:
+    ...     with multiprocessing.Pool(2) as pool:
+    ...         moves = pool.starmap(final, [(0, 0), (97, 30)])
+    >>> moves == [hog.final_strategy(0, 0), hog.final_strategy(97, 30)]
+    True
+"""
+
+from multiprocessing import shared_memory
+
+import hog
+import registry
+
+
+class AlwaysRoll(object):
+    """hog.always_roll(N) as an object.
+
+    >>> AlwaysRoll(6)(10, 20), str(AlwaysRoll(6))
+    (6, '6')
+    """
+    def __init__(self, n):
+        assert n >= 0 and n <= 10
+        self.n = n
+
+    def __call__(self, score, opponent_score):
+        return self.n
+
+    def __str__(self):
+        return str(self.n)
+
+    def __repr__(self):
+        return 'AlwaysRoll({0})'.format(self.n)
+
+
+class Bacon(object):
+    """hog.bacon_strategy with fixed MARGIN and NUM_ROLLS.
+
+    >>> Bacon(margin=6, num_rolls=4)(0, 33)
+    4
+    >>> import simulate
+    >>> simulate.strategy_named(str(Bacon(6, 4)))(0, 33)
+    4
+    """
+    def __init__(self, margin=8, num_rolls=5):
+        self.margin = margin
+        self.num_rolls = num_rolls
+
+    def __call__(self, score, opponent_score):
+        return hog.bacon_strategy(score, opponent_score, self.margin,
+                                  self.num_rolls)
+
+    def __str__(self):
+        return 'bacon_strategy:margin={0},num_rolls={1}'.format(
+            self.margin, self.num_rolls)
+
+    def __repr__(self):
+        return 'Bacon(margin={0}, num_rolls={1})'.format(self.margin,
+                                                          self.num_rolls)
+
+
+class Swap(object):
+    """hog.swap_strategy with a fixed NUM_ROLLS.
+
+    >>> Swap(num_rolls=3)(10, 20), Swap(num_rolls=3)(9, 31)
+    (3, 0)
+    """
+    def __init__(self, num_rolls=5):
+        self.num_rolls = num_rolls
+
+    def __call__(self, score, opponent_score):
+        return hog.swap_strategy(score, opponent_score, self.num_rolls)
+
+    def __str__(self):
+        return 'swap_strategy:num_rolls={0}'.format(self.num_rolls)
+
+    def __repr__(self):
+        return 'Swap(num_rolls={0})'.format(self.num_rolls)
+
+
+class Final(object):
+    """hog.final_strategy as an object."""
+    def __call__(self, score, opponent_score):
+        return hog.final_strategy(score, opponent_score)
+
+    def __str__(self):
+        return 'final_strategy'
+
+    def __repr__(self):
+        return 'Final()'
+
+
+# Tables built or attached by this process, by the name of their shared memory
+_ATTACHED = {}
+
+
+class Table(registry.TableStrategy):
+    """A decision table, as in registry.TableStrategy, held in shared memory.
+
+    The process that builds a Table owns its shared memory and should close
+    it, directly or with a with statement, once no process needs the table.
+    Other processes attach to the shared memory when they unpickle the Table,
+    once per process.
+
+    >>> import pickle
+    >>> with Table(bytes([4]) * 25, goal=5) as always_four:
+    ...     copy = pickle.loads(pickle.dumps(always_four))
+    ...     always_four(3, 4), copy(3, 4), len(pickle.dumps(always_four)) < 200
+    (4, 4, True)
+    """
+    def __init__(self, table, goal=hog.GOAL_SCORE):
+        memory = shared_memory.SharedMemory(create=True, size=len(table))
+        memory.buf[:len(table)] = table
+        self._attach(memory, goal, owner=True)
+        _ATTACHED[memory.name] = self
+
+    def _attach(self, memory, goal, owner):
+        self._memory, self._owner = memory, owner
+        super().__init__(memory.buf[:goal * goal], goal)
+
+    @classmethod
+    def compile(cls, strategy, goal=hog.GOAL_SCORE):
+        """Return a Table of the decisions of STRATEGY in every state."""
+        return cls(registry.decision_table(strategy, goal), goal)
+
+    def __reduce__(self):
+        return _attach, (self._memory.name, self.goal)
+
+    def close(self):
+        """Release the shared memory, and free it if this Table owns it."""
+        if self._memory is not None:
+            _ATTACHED.pop(self._memory.name, None)
+            self.table.release()
+            self._memory.close()
+            if self._owner:
+                self._memory.unlink()
+            self._memory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return 'Table(goal={0})'.format(self.goal)
+
+
+def _attach(name, goal):
+    """Return the Table in the shared memory called NAME."""
+    if name not in _ATTACHED:
+        memory = shared_memory.SharedMemory(name=name)
+        table = Table.__new__(Table)
+        table._attach(memory, goal, owner=False)
+        _ATTACHED[name] = table
+    return _ATTACHED[name]
+
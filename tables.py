@@ -0,0 +1,178 @@
+"""Precomputed win probabilities for Hog, stored in a memory-mapped file.
+
+Running this file builds the table:
+
+    python3 tables.py [path]
+
+The file starts with a 32-byte header (the magic string b'HOGWIN02', the goal
+and the number of actions as unsigned 32-bit integers, and a 16-byte digest of
+the solver and rules source), followed by the values and then the q-values of
+exact.solve_layers as native doubles. WinTable maps the file read-only on
+first use, so lookups do not read the whole file and every process that opens
+the same file shares the same physical pages. A table written by an older
+format, solver or set of rules is rebuilt before it is used.
+"""
+
+import hashlib
+import inspect
+import mmap
+import os
+import struct
+from functools import lru_cache
+
+import exact
+import hog
+import rules
+from ucb import main
+
+MAGIC = b'HOGWIN02'
+HEADER = struct.Struct('=8sII16s')
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            'win_probability.dat')
+
+
+def build(path=DEFAULT_PATH, goal=hog.GOAL_SCORE):
+    """Solve Hog to GOAL and write the table to PATH.
+
+    The table is written to a temporary file that then replaces PATH, so
+    processes that already mapped an older table keep a consistent view.
+    """
+    solution = exact.solve_layers(goal, q_values=True, dtype=float)
+    actions = exact.MAX_ROLLS + 1
+    partial = '{0}.{1}.partial'.format(path, os.getpid())
+    with open(partial, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, goal, actions, solver_digest()))
+        f.write(solution.values.astype('=f8').tobytes())
+        f.write(solution.q_values.astype('=f8').tobytes())
+    os.replace(partial, path)
+    return path
+
+
+@lru_cache(maxsize=None)
+def solver_digest():
+    """Return a digest of the source of the solver and the rules, which
+    identifies the tables that build writes."""
+    digest = hashlib.sha256(inspect.getsource(exact).encode())
+    digest.update(inspect.getsource(rules).encode())
+    return digest.digest()[:16]
+
+
+def _stale_goal(path):
+    """Return None if PATH holds a table written by the current solver, and
+    otherwise the goal of the table to build there."""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(HEADER.size)
+    except FileNotFoundError:
+        return hog.GOAL_SCORE
+    if len(header) < HEADER.size or not header.startswith(MAGIC):
+        if not header.startswith(MAGIC[:6]):
+            raise ValueError('Not a win probability table: ' + path)
+        return hog.GOAL_SCORE
+    _, goal, _, digest = HEADER.unpack(header)
+    return None if digest == solver_digest() else goal
+
+
+class WinTable(object):
+    """Read-only view of a table written by build.
+
+    The file is opened and mapped the first time a probability is looked up.
+    If the file does not exist yet, or was built by other solver or rules
+    code, it is built first.
+
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'table.dat')
+    >>> table = WinTable(build(path, goal=5))
+    >>> round(table.win_probability(0, 0), 4)
+    0.5729
+    >>> round(table.q_value(0, 0, 0), 4)
+    0.3657
+    >>> q_values = table.q_values(0, 0)
+    >>> table.best_num_rolls(0, 0) == max(range(11), key=q_values.__getitem__)
+    True
+    >>> table.close()
+    """
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._map = None
+
+    def _load(self):
+        goal = _stale_goal(self.path)
+        if goal is not None:
+            build(self.path, goal)
+        with open(self.path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._goal, self._actions, _ = HEADER.unpack_from(self._map)
+        size = self._goal * self._goal
+        if magic != MAGIC:
+            error = 'Not a win probability table: '
+        elif len(self._map) != HEADER.size + 8 * size * (1 + self._actions):
+            error = 'Truncated win probability table: '
+        else:
+            error = None
+        if error is not None:
+            self._map.close()
+            self._map = None
+            raise ValueError(error + self.path)
+        self._views = [memoryview(self._map)]
+        self._views.append(self._views[0][HEADER.size:].cast('d'))
+        self._values = self._views[1][:size]
+        self._q_values = self._views[1][size:size * (1 + self._actions)]
+        self._views += [self._values, self._q_values]
+
+    @property
+    def goal(self):
+        if self._map is None:
+            self._load()
+        return self._goal
+
+    def win_probability(self, score, opponent_score):
+        """Return the chance that the player about to move wins from state
+        (SCORE, OPPONENT_SCORE) under optimal play."""
+        if self._map is None:
+            self._load()
+        return self._values[score * self._goal + opponent_score]
+
+    def q_value(self, score, opponent_score, num_rolls):
+        """Return the chance of winning from (SCORE, OPPONENT_SCORE) by rolling
+        NUM_ROLLS dice and playing optimally afterwards."""
+        if self._map is None:
+            self._load()
+        index = (score * self._goal + opponent_score) * self._actions
+        return self._q_values[index + num_rolls]
+
+    def q_values(self, score, opponent_score):
+        """Return the q-values of every num_rolls from 0 to 10 as a list."""
+        if self._map is None:
+            self._load()
+        index = (score * self._goal + opponent_score) * self._actions
+        return self._q_values[index:index + self._actions].tolist()
+
+    def best_num_rolls(self, score, opponent_score):
+        """Return the number of dice that maximizes the chance of winning."""
+        q_values = self.q_values(score, opponent_score)
+        return q_values.index(max(q_values))
+
+    def close(self):
+        """Unmap the file. It is mapped again on the next lookup."""
+        if self._map is not None:
+            for view in reversed(self._views):
+                view.release()
+            self._map.close()
+            self._map = None
+
+
+_tables = {}
+
+def load(path=DEFAULT_PATH):
+    """Return the shared WinTable for PATH. Nothing is read until the first
+    lookup."""
+    if path not in _tables:
+        _tables[path] = WinTable(path)
+    return _tables[path]
+
+
+@main
+def run(*args):
+    path = args[0] if args else DEFAULT_PATH
+    print('Wrote', build(path))
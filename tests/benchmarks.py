@@ -0,0 +1,117 @@
+"""Performance budgets for the Hog project.
+
+Run from the project directory:
+
+    python3 -m tests.benchmarks
+
+Each check prints its measurement, and the run exits with a non-zero status
+if any measurement is over budget.
+"""
+
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import deque
+
+from ucb import main
+
+IMPORT_BUDGET_MS = 25   # Cold import of hog in a fresh interpreter
+FIRST_GAME_BUDGET_MS = 60  # Cold import of hog and one game, as in a worker
+IMPORT_RUNS = 5
+LOG_OVERHEAD_BUDGET = 0.20  # Extra time to record every turn with a TurnLog
+LOG_GAMES = 3000
+LOG_RUNS = 7
+
+_COLD_TIMER = """
+import time
+start = time.perf_counter()
+{0}
+print((time.perf_counter() - start) * 1000)
+"""
+
+_FIRST_GAME = """
+import hog
+hog.play(hog.always_roll(5), hog.always_roll(5))
+"""
+
+
+def cold_time(statements, runs=IMPORT_RUNS):
+    """Return the fastest of RUNS cold runs of STATEMENTS, in milliseconds.
+
+    Each run happens in a new interpreter, so nothing is cached in
+    sys.modules, and the fastest run filters out noise from the machine.
+    """
+    times = []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, '-c', _COLD_TIMER.format(statements.strip())])
+        times.append(float(output))
+    return min(times)
+
+
+def import_time(module, runs=IMPORT_RUNS):
+    """Return the fastest of RUNS cold imports of MODULE, in milliseconds."""
+    return cold_time('import ' + module, runs)
+
+
+def check_import_time(module='hog', budget=IMPORT_BUDGET_MS):
+    """Print the cold import time of MODULE and return whether it is within
+    BUDGET milliseconds."""
+    elapsed = import_time(module)
+    within = elapsed <= budget
+    print('import {0}: {1:.1f} ms (budget {2} ms){3}'.format(
+        module, elapsed, budget, '' if within else ' OVER BUDGET'))
+    return within
+
+
+def check_first_game_time(budget=FIRST_GAME_BUDGET_MS):
+    """Print the time to import hog and play one game in a fresh
+    interpreter, which includes building the rule tables, and return whether
+    it is within BUDGET milliseconds."""
+    elapsed = cold_time(_FIRST_GAME)
+    within = elapsed <= budget
+    print('import hog and play one game: {0:.1f} ms (budget {1} ms){2}'.format(
+        elapsed, budget, '' if within else ' OVER BUDGET'))
+    return within
+
+
+def log_overhead(num_games=LOG_GAMES, runs=LOG_RUNS):
+    """Return the fraction of extra time that simulating NUM_GAMES seeded
+    games takes when every turn is recorded by an export.TurnLog, including
+    writing the chunk file. RUNS runs with and without the log alternate,
+    and the median ratio of the times of each pair is reported, so that the
+    speed of the machine drifting between runs adds little noise."""
+    import export
+    import simulate
+    def play(log):
+        start = time.process_time()
+        deque(simulate.simulate_games('final_strategy', '5', num_games, seed=1,
+                                      log=log), maxlen=0)
+        if log is not None:
+            log.close()
+        return time.process_time() - start
+    play(None)  # Compile and cache the strategies
+    ratios = []
+    for _ in range(runs):
+        plain = play(None)
+        ratios.append(play(export.TurnLog(tempfile.mkdtemp())) / plain)
+    return statistics.median(ratios) - 1
+
+
+def check_log_overhead(budget=LOG_OVERHEAD_BUDGET):
+    """Print the overhead of recording turns and return whether it is within
+    BUDGET, a fraction of the time taken without recording."""
+    overhead = log_overhead()
+    within = overhead <= budget
+    print('turn log overhead: {0:.1%} (budget {1:.0%}){2}'.format(
+        overhead, budget, '' if within else ' OVER BUDGET'))
+    return within
+
+
+@main
+def run(*args):
+    checks = [check_import_time(), check_first_game_time(),
+              check_log_overhead()]
+    sys.exit(0 if all(checks) else 1)
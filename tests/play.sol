@@ -1 +1 @@
-[[8688463370597746726, -1516603598611049766, -6875304400778901545, -7881306926264801848, -4972096837653265073, -6580661753735131719, -2899862255010593211, -3853400526777649576, 7973216258268824220, -1950174710131134037, 5523767029966678231, 2376233360322257819], [8688443457652335786, -5567371452059956269, 6106124013845496044, 349259118554720865, -7270266165272936400, -7284439999813499349, -6330941553910662804, -3836884594614537442, 8069375091371283191, 5980485921164794828, 6216943959165953403, 3667780867004190967, -36478701593244304, -4329087000376542737], [8688460051764644216, -536854772325251979, 7520681775941148008, -7621242046433385598, 4715482831542468498, -5998446875839748165, 4640158783281081790, -9150926224058875157, 1487666159772108054, 3096250988778103992, -6273358879612296595, 7696335664734090649, 2694021361021583488, 5188088276793074526, 6384082203920633989, -5938433991884129867], [8688441798251745767, 7079876882172539327, -6216400479015422027, 3421460442862978912, 6689695590267492785, 7737535449174738304, -8437404339909839413, 5818410569805112848, 5991601192473794540, 4063228244214183423, -1824541595684125350, 6984318324381812907, 6317415007314750161, -7676945135798934361, 8987264642551489707, 3025401174446676768, 1868582788680180917, -625450938877334085, 8408638744704199546, 1607002641949434113, 2560534276066246694, 1512702714215155390, 3530568435312017695, -586253825183570544, 902248953266457397, -8767564582544760206, -5672038524947168489], [8688441798251745767, 7079885179228693542, 6126336951007553149, -8616149213523774657, -7081651375092660543, 90416361719372736, 5804228438213716096, 2973391004635724826, 965992024882089501, 9023531891965630762, 5319262366911451257, 5040683227523491588, -8329689421300826217, -272142916559060554, 2409260246398828322, -4762767664543664725, -9122085406269296294, -5774228930247494689, -4818350352008106540, 8314793799225384811, 6424527991168877491, -1010218294638421461, -2875939037562404597, 2525182779263459403, -4791503776194212872], [8688443457652335786, -5567379749110790072, -8798728219897037426, -7244020763123667687, 323015375819343201, 2573343115018721829, -8701354794224797467, 7251357211349110814, 7424519624016227351, 5777835951865942037, 701454570500022138, -420485554269291743, -2202985001973950146, -7678205425247991459, -8951231902992131464, 5611434217396692383, -5250669471129967516, -1049871923812800476], [8688458392364054197, -6359180436963977243, -5405635527575939360, 8451383484912252581, -7987954971388099514, 5950066959388514137, 5392123915673123686, 4022165587501995850, -7400678092895042351, 2501854858895971017, 3164927362044789366, -3195736981539097864, -6798127318177691909, -8352831456133920374, -5784717375657087744, -4579592594459834646], [8688441798251745767, 7079880200989680601, -5330938305195337867, -3545783703038078348, 1322993733376846317, 4383013044629375680, -8913269294797598615, -3438057168579711517, -8398198929165242069, 6743098067315205292, 4883871409273500712], [8688460051764644216, -1140015778850982296, 2564237152093548985, 7965340715393213506, 1471176011580103974, -2307180504064918591, 4468680113505100322, -5567983343247644515, 6179600772625299023, -7677428196314316740, 4482743502617261793, 291815998039213693, 5442289348195086503, -9101700625449995490, -999728189825578181, -4325399820111316678, -8499910353817684985, 2806700211731502743], [8688445117074207453, 7965347353048777702, -2748595629623285705, -929197889424405088, -7854456270543505995, 442305394498166892, 3790178464605674867, -2983061846147590633, 321776658716287062, -5530646794343932889, 9027078625687915671, -688098165971288919, -2578368952264148974, 8622250263457982507, 4357229130649488387, 7101932897204374096, 3842201909706473553, 1348136653354193976, -8367048435361164829, -9090149518201075648, -4449165732131330696, -9182132371214933977, -165056615004991828, 2491376369959083432], [8688460051764644216, -1140010800617289767, 7877081549699640400, -4057130513097116847, -6158209232341188434, -6320583598611208519, 1246454199751013830, -1362759044471783889, 2169874770137863538, 2892975852999056005, 1526881526989410868, 8298896395924146561, -1373244171064235670, 7352904196621760691], [8688465029998336745, -5168580533053587448, 5052271602872508003, -5036298976971369521, 6465590647886385476, 1875868905463545633, 5391517002697846321, -5883197500650000787, -3597356377489898699, -8673714527090606178, 904096242745380920, -5382481110245003044, 7518209319963407847, 2515899994487253421, -5823907851695287089, 5048700744611627531, -4270912347806636956, 7815165722913116999, -566174565207146719, 3212153740438970897, -6992916547568345427, 3721026435103717980, -4034592965206182748, 6354609581981994704, 1941447656258994620], [8688455073544252717, -5379371871900471168, 7708687993750876893, -6148327699901552332, 8123859376576526549, 7400751656078391328, 2811018297787576408, -969168913229381662, -8553794363700554968, 2743736789521774846, 1586910106685823750, 5249501765017665750, -8194946258502917978, -8590531530081878422], [8688465029998336745, -5168563938946599430, 2564235492695619172, 5473477110107240934, 7011198849489302698, -819134367294886511, -8626032405379962014, 3551884752977606610, 9101154000373540770, -3089707465243091404], [8688461711175875059, -6054024453350132335, 6843428800622804574, 4665312552523139504, -8403139629500935708, -3326776501682496936, 3108003042453895419, 1499396641109879140, 129448269408796568, -7042589598006401949, 683695835808127157, -8082739750785317811, -8245102501182042407], [8688456732942182530, -2025486249727220671, 887599456903133056, -1493786948739227266, -6968984140271998013, -6015445868499621236, -7874677504780338757, 856898074347444132, 3319284079479706332, -7129358387982408176, 3259860753334038942, -6643917553220915173, -2444848679068234084, -6149121522963496717, -847843928365741170, 5039912636221439211, -7931622630084706375, 1159526841407610648, -6343740568137399645, -3524968064517870355, 4133737738872620579, -8848289291662919542], [8688445117074207453, 7965345693626906035, 7802986262065944155, 1029754248371493076, 8218170920184100761, 5755781596237357493, -5915123432248176169, 370850326610673764, 19882742501058369, -4002796630928801757, -7891818603423646087, 3707586553065841274, -8797493714403127146, 2477169347204544447, 2169272835401599114, -2712466142836465874], [8688463370597746726, -254546967375333940, -1789049784045460995, -4283085170998245604, 6843415525332957830, -9109264951440865464, 4261096081502176234, -8089668953807325883, 8748493609713371069, -835499896426390789, 778002401179348634, -6468125775627872981, -2837956516417140396, -3493773533229786612, 697130739585709274], [8688441798251745767, 7079878541573129346, 6991601122350696555, 1139179328712348271, -3051731581758711811, 6586152571882241342, -7534186750191059692, -2436214160811750190, 6033886738790635668, 6756984502813405213, 795145925863753889, 5681199036457851362, -2524498217665805323, 2344277559329907881, 3297827446972919941, -2351304276182642563, -6793801827841507378, -5908339654021423218], [8688465029998336745, -5168560620108176508, -7893026558337862879, 8945117751659294800, 8594160124022384875, 787277020643707371, -9175347568475811325, 3739887651970194221, -3651835684474750558, -2928731282796416817, -6382319152961308684, -8389734726843213675, -1613860833980687812, -5318103808476455477, 7240853831249080996], [8688466689420208412, 630925162898834248, 5428864400874248620, -5661682995667530481, -8081634710862574540, 7472228296306565003, -2031500461188232800, -9203563219761253138, 2450312946638310425, 2464539882340920556, -9210227488884224138, 1178998290066505528, -8472901129766235061, -2997730488810497596, -7172265913701289784, -7260536695268158379, -3556280445503825618, -6375049630282271780, 7450301746853877861, 588635404964866643, -8613207733370856682, -1963593019799067930, -2678228109201315632, 6825525539477906052, 5073700792023557557, 5236058564165307976, 2391523850674820764, -4766346819855379000], [8688466689420208412, -3962213715914855289, 1114166006031853149, -4079346887627944530, -8270254479281863338, 4139312034504931835, 2923705445553649878, -780554123049105805, -1503666821762312113, 5705745761004266595, -7738688987226470389, 8213986511316320582, -6041843333105029678, -8954934017969075934, -6087211567186709194, -4768202406406417974], [8688463370597746726, -254551945614346881, -4445459537265605483, -2660333145112571325, -3768199924294358059, -8844579646241066497, 8554341162673548030, 5661460096154417605, 3543400637752730572, 7981109288022145889, 8880766868723473545, 837430705556048347], [8688441798251745767, 7079891816862976090, -7196174196464362047, -7919300170467415099, 6614991730249948538, 1898088598816835002, -6555646771630104724, 2948075348227750325, -8722791513802134154, 3363273281630433263, -1861283740283180097, -4355339040181375646, 7597238670295854977, -1472337846664048420, -3070104759873452938, -6631595986392968276], [8688460051764644216, -1140000844144584297, -2822674323142013314, -402727586180661784, 8554339503251676363, 747441465187882508, -7008174616304876946, -2817275321707112353, 8782136472421977968, 3529198593215922880, 4622413323855091699, -740105016962439381, 2172962436157676103, -7330772958992685896, -3951253825873816168, 2896093388399742096, -7682364050179246262, -7567986521866473527, -1019961039909104372, 588633745569597036, -4487747635798983069, -1668973472778863760, 8497989675046630415], [8688441798251745767, 7079891816862976090, -7196172537042490380, -2119796133934204864, -7665844799198992854, -4361024547861314638, 2811016638386986389, 1202466656995556506, -4218891328736295371, -2433756639524446792, 60323551536890990, -8586342142956463860, -1340208987915549716, -1745045647201637095, -7152659889511849838, 4933411543576281775, -3651220474448639390, -2351314232655348033, 3935266439173458853], [8688466689420208412, 630926822312725297, 5146571530612107138, 2723385957990749753, 3676886063286195699, 6569770448643749046, 3750984669755654660, -8733887638792929802, -4407476249519736466, -4495768603448567256, 1093322924134626671, 2141176058331718934, -1488981584984436514, 4987895828778864927, -3556287083159389814, 6758845067582175480, 5199196910449170248, 5847604089762863732, -331561396210021973, 7948199616749906176, 5055343441393917984], [8688460051764644216, -1140017438251572315, -7987346399017552542, -8993353902726504550, -6084122241763646404, -3664177164205545099, -8251265324519124579, -3188806119103198743, -3425245903602099693, 927405909605291269], [8688443457652335786, -5567373111455225876, 2772441372358936976, -4643942584598330904, 3977551218865753311, -3829325246878641645, 7445375981203300573, -3117319522396999186, 7651107745472326961, -7091376759634468972, -3860029948270093285, -8714168611416285543, -7991067528571054312, 3283638677725958993, 6206584212724262335, -4182623312718889294, 8280960117888240, 7937097620730753208], [8688466689420208412, 630930141132526777, -8570921294262010969, 5473467153634535464, -4123969553336302520, -818522476085916617, 7500470498195642158, 8223588175145201201, -3447316853340332461, 7266631107568083681, -563700449815515509, 3136710051337475886, -7326601058792865997, 4476567272248686113, 2921844880763597963, -6581902130260059525, -3276448415370070662, 1136705213318056855, -471864680997502320, -5061584763998470496, -239113736183038890, 1703290940628380505], [8688455073544252717, -5379381828373176638, -6102504483559088416, 3475327858636200671, -5498713332316810168, -3890116887421557505, 3583834809125018379, -5034455006312247478, -33372782065853702, -8976386438858735848, -6741794084058352331, -3923003326931245004, -7553179223776260137, -4227517549960566904, -523276234884010700, 5809013889044377556, -7162521377264428236, 1381654897018262309, 5085911146782595070, 2267122049056077762, -4728370936370999407], [8688465029998336745, -5168558960712906901, -4445451240209451268, -6131361895455655297, 8989740417367652790, 8638127753835091465, 1246435946227474557, -2944471645426444251, -7608277059604364438, -1228019967118223800, 4807917216274284425, -8163603115325463162, -2449805973540178007, -8337562538127358388, 5519466430814917581, 7234060863174169245], [8688463370597746726, -254550286213756862, 5220645245897142218, 2253703739382823457, 5166797743082632429, -6993357361763239734, 1549573557782112124, -8278908910486418378, -7439283228317266320, 2949930934757507651, 1167418211765662710, 2722133965595186664, -6781604748374976815, -6619255273270759169, 5243956572157642586, 654241467390366939, 7430070556165621277, -2914667893700216582, -6220095058010511957, 1911491973799652544, -7803679839625859517, -4984897379554906405, -4336491859655103970, 5086515507538675771], [8688441798251745767, 7079885179228693542, 6126338610408143168, -6242632605877504202, 8029551151783433405, -4339430020990880671, 3620567763899856180, 3458213310553965387, 4411718394091084480, 2915830669305246040, -5537912998203168313, -3118569855394632462, 3167400584641755785], [8688443457652335786, -5567368133221533347, 2469928927300455841, -1814663382061630522, 679388598998142105, 5269112000816251555, -6855079847743548951, 2973394323474147748, 7164318509235054574, 1689106383017167476, -2575894836867197352, -6280154405448671387, 3300313178237846640, -3649488608610528226, -1859436450804256574, 1446003988811846781, 2588140456636229749, -8686540858497641323, -5381713969509719323, -8123178900420560413, 3151520668244830550, 5807927102629212322], [8688463370597746726, -254545307980064333, -7101874268724762912, 2934177296834973267, -8062051918435686808, -3797065633263040391, -4104982057990115016, 1687239180592833013, -2899857276792861918, -5718638077447263775, -1034626363762850679, -946320734544173145, 8631503310581660697, 7625459299820309731, -1451656651954020377, 5720406106618999961, 7333906744824149365, 1668396217249896045, -2179078378632749550], [8688460051764644216, -1140015778850982296, 5146581487084812608, 5058270879648403781, -8155721701437456364, -6547155125960320111, 2395843596147445684, -9203569857416817334, -7122085546467608556, -3742564753953469221, 5126337021106709280, 2181605251472974418, 4453402898463665769, -3279384917283975696, -8754592065268170265], [8688463370597746726, -2002648027512057418, 4769353566135491737, 8473589902978355412, 2018618994015266087, -8186444656357767689, 6069376890991467120, -1102660976423731397, -3409350159696131050, 2876608664448340266, 8482724075878491351, -7987355588865711342], [8688456732942182530, 7245039899536072636, -3144194176492092893, 1084081492884243970, -4461973810009506156, 4156296092479688555, -8003868968817607430, 1858254702756279746, -7084734062857498931, -6996469918924912884, 5311865804683723827, -5077345039555287428, 4352321618527770784, -1934260712701626121, 9145303430292254675, 2796974060565147644, 4183297917846498110], [8688460051764644216, -6359163842856989225, 5240244632449639410, -9015570277259992439, 1811648512621901912, 2629067776724951139, 2791415592415277736, -6962943378225971984, 905349894560155470, -1643829791732536838, 4297825717451892143, 4436751629716990542, -3444218464236568786, 4140397029761899050, -1821444865983611900, 824451550645175858, -106855411863373177], [8688455073544252717, -5379386806590907931, 4449075748732211631, 4625971673450672097, 9141594809404052979, -2944483261315700976, -7119002092078223498, 5189325334479579410, 5351681447220739810, -1008991193400680193, 8463726624056938171, -232490952351479789, -8040602816360507962, -3384970300570606781, 7253653612073762447, -8531728392182713699], [8688465029998336745, -5168580533053587448, 5052264965238225455, -6618638403844057982, -7760786487541736439, 2141781311885124632, -5104343546102295503, 222676345460910116, -1375075633060717845, -3869155824100773979, 2240876646920110079, 1309561387342105799, -5051112912695865459, -8430630386414145168, -4239714497709392557, 8245154492019390425, 4833705976746217483], [8688455073544252717, -5379376850139484109, -2466287824670707460, -7941498291495985157, 8896677547314558539, -2378030318380384579, 926781635903799628, 6225427307787564419, 5408019659573771917, -4495753668742169257, 3245188791848670293, -60243350697977817, 5016143008883013169, -4341273991647342508, 42548989338612807, 8648623603508834150], [8688458392364054197, -6939513177749909983, -8382920054707256261, 6170957957296699678, 4636451821809431349, 4798821209840438493, -7686072671067447958, 7056423449933925112, 7801739247909394007, -1384360208976500404, 1078047368493782137, 4021557015131448878, -4180911359826189070, -460923044464041236, -7464420271713349458, -1502565100656710116, 4338878417675413010, 8529782690512190544, 3680599662413410336, -1868679541455229294, 6821343682800060271, 8592294581019922079], [8688455073544252717, -5379373531301061187, 1396472151559899521, 6702655598862821416, -1354856058240436338, 895468362120519368, 1057831112517243964, -8767427454800338888, -3766346889954535131, -2114720858046684511, -8213328500295699784, -3948318983360501153, 5107978777703686564, -8430762535924873957, 364040632689787437, -5671894891288829739, 1986839122103226350, -3251923263164335976], [8688458392364054197, -6939521474800743786, -4030273219733557828, 4587991704524604560, -9060794877685993411, -3585601004988985380, -2125200113608118766, 7736906963858780392, 4809167549271917701, -8953543238407219860, 7895427284440023248, 1608841634390824863, 1697137307139457133, 103064080114516518, 7463108165315502066, 1442924619842868019, -3633445145631134949, -8932110730460310680, -1125204395319080962, 3079888646743375872], [8688461711175875059, -6054022793928260668, -3144811045913473668, 8129885203905513755, 698991304370440777, 1672722600354143307, 8385942628469810346, 3929726224555108836, -8458855994177612863, 1991141512391903371, 1828785399650742971, -1550745349336101834, 7804827680537792006, 2155681022673171297, 7630878214205942044, 2650500284693141967, 3604051831734083840, -5264873175067365227, -5250666152312826242, 4772450421987501866], [8688458392364054197, -2982433360831632721, -4425851853656954076, 8168472085809518863, -5688548586081923303, -5036292339337086973, -3501809435591089210, 8584263656897632422, 3373761727024065082, -1416628119648255873, -2538549990891370275, -8618775391368885390, 7555552506522683669, 6788930347333049681], [8688456732942182530, -1022884266554444310, 7708684674912453971, -4455943004444166215, -5990432545819126114, 7790635592473689784, -3484062316769829512, 4100576408991190538, -975801653538966645, -7804148097176490661, 7952383132844303212, -8000307300404885758, -2238496726542064205, 7341934350110676306, -2694123853086002627], [8688443457652335786, -5567376430293648798, 1792679270799253681, -4980574315243858563, 4523162739307093455, 6641228835348383448, -3937200393234360167, -1988133106695239379, 5015507885932772709, 5587987422813642364, -8269034908499671469, -3916376457657997959], [8688466689420208412, 630921844076372562, -8966499928185407217, 8944489266343336888, 718602306796233458, -3736257398591854865, -3898623467805720735, -1384963803134636495, -4616328868027871867, 6403223289376584065, 3885714557255735537, -4875933919103797746], [8688456732942182530, -2025482930910079397, 6709911846249351370, -3985050278708146875, -4011282405570229050, -5412898412602072274, 5278208007271379135, 4555105265009596649, 850844037011571359, 3496793554821027741, 5993449248571944321, 917051273104356816, 5825040757916782815, -8927930533204336566], [8688463370597746726, -254548626797205607, -2674502001414121333, 1915209784536013040, 5072491177695449716, -1288178144111489219, -1809264380626729561, -6885167679687017756, -7103731514676391905, -6055904931058993130, -1672055399493344327, -6674346471443299274, 5143487183425397083, -7710458401226649959, 1204136231828782100, 3698184894068753247, -3693500275907241319, 2190119362304706429], [8688460051764644216, 6265244609741131657, -5405635527575939360, 8451401738419830618, 6634582819748951721, -6336955765376995345, -6647477562211765178, 2720896907908681780, -658630522266342163, 4500614342172730949, -7460716629064160703, -4567857134891031237, -302869190296513153, -7670042483353959571, -6324753072791212141, 847294751096691846, -8021621958669884654, -7350533466089213411], [8688463370597746726, -254553605030898136, 6106124013845496044, 349257459154130846, 7520688413596712204, -3138763646238485503, -9175949503212075749, -6038895981926414589, -7929163449378191516, 6889416461913929966, 3036991209217564850, -6110994469814981980, 3392750881786803841, -2420940264571495675, -4428319331419623150, -1934267350357190317, 3615005215877166765], [8688465029998336745, -5168578873637036193, 2281922709512008604, -7620631814625005723, -844759581184351527, -6806613092819119202, 8687849819972225577, 7510193330547516189, 3319282420055174459, -6643302343194804005, -6951255274952995940, 2626595320752531390, 3278833313968508035, -2757097231768435994, 7632115271892446928, -2271663034641225539, 5978788902957210955, -5295915643920590889, 4114143330556476122, 409903674899131379, 5255510998244985350, 6864094167850391269, -1016856013179038767, 1639550421226624653], [8688463370597746726, 4305713768971521283, 7218782881492226786, 8168485361102025813, -3502432942673354593, -155783654957184346, -7327831478845088333, 6927988409103556457, 7651101107838044413, 2288574469948397882, -7912650069426295428, 2006893490916507942, 2906564346910342548, -1683175649036036568, 6388409353652088127], [8688466689420208412, 630923503498244229, 1773066608954249539, -2190640970034599765, -1393447918380794181, 6664088629906887454, 1242745578865472340, -2300856554598976423, -6005104507307154969, 439836257337568005, 5633360766870661173, -4755858374445785945, -6684241279172782120, 89025582178798310, -5946913260635581582, -3452861279573148749, 7374364147966970004, 5589232777550981051, -5685465131692538245], [8688455073544252717, -5379378509534753716, -8778511963920499253, -4399614748577140608, 1886370626168305844, 6077256645473563487, 228692216322512264, -1422925518537164759, -8532952941225200157, 410039143227001442, 4675056957218354288, 4586769581523216027, -1582692853274957763, 6474847013827204940, 1776164998055353008, -1363365957441740842, -5879017303396686879, -948799828172157090, -6705681317572580493], [8688455073544252717, -5379381828373176638, -2956191277515466518, 3891139342651103728, -299771567819956354, -7244632654332637581, 2000258324568485240, 1765813680384860859, -5179060681391065052, -6828819510882561827, 2751593312241318999, 4759010545521153803, -8532346028249922792, 5324679621875211903, 2280697267690818591, -4566639990128655645, 7014914108033068590, -1116709430829494869, -1028422055134356608, 5095782591007878938], [8688466689420208412, 630921844076372562, -8966498268784817198, -4659692903703724014, -2165634284988387191, 1538610348902650081, 2261719728798715115, 1953795007015486275, 7218167671466115618, 5136704932878869035, 3354160681068317665, -6149569735848351805, 2547711263473692617, -6352841552804938106, -6179670843081667354, -3006493706045524301, -2067650627521068387, 4218935022522809586, 44421169996639799, -1564173615482061609, 5283148707615053392, 1578909051955048443, -8869735074899675466, 7171084165674594604, 147193728829466247, 7156893737027043637], [8688466689420208412, 630920184675782543, 5824448013028677191, 3404478044307433653, 8480866063307636100, -1421696757901493678, -1843524112796620325, -6940125068958879877, -2675128827308207578, 3576566945851891906, 3749749271464419383, 637239155892070946, -6534826921498090666, -1532519255441147701, -4837951397985135605, 4475457385833897077, 627969514661404738, -4847207763925955069, -7474773380520757978, 6797417014774462177, 3540298037042481244, -5295278861548478762, 4766269218956762300, 8071694723842525802, 2995316661312368619, -8112238024956078592, -2253782238634332561], [8688455073544252717, -5379380168956625383, 3356034521148216324, -99442123808292613, -1542867254267896516, -2590700475540859487, -6855701695403942667, 4743716736378051644, -3387888548955652130, 4232998411634971057, 7537820322391860734, -531155989355466243, 2773662602563000512, -6967757931828921536], [8688460051764644216, -1140014119434431041, -1863126818168918997, 2934812419806495375, -1654927576139883741, -3263494151617019994, -8738691343149790741, 3670888445950793030, -8888097403747046332, 8998361660339610352, 2247051086133147946, -1531278878916219895, 5640775582605966640, -4187698588590448411, 7337624555560509861, -4099419509972746013], [8688465029998336745, -5168563938946599430, 2564238811515420652, -5567378089694238817, 6032030385615050024, 5058290792572533073, -7250054887508809108, -1172291986573571568, 3561746372493113420, 3473492185011951195, 4640150486224927575, -436239192191826127, -8627881354275436792, -7904757039672973759, 1675674036982426958, -1143111741908327634, 6988506818696601442, -5453939496970919094, 4539069206289032590, -7945819696363879684, 4886337994236184583, -962248007263527805, -5760175629344365040, -1643343412376071331, 2946384967681051060, 3671334238366078836], [8688463370597746726, 1860111948723869975, 416686818242984424, 5285479189369627500, 1905951759191943351, -7809226691881152288, -3145412980649738092, 8864709237659568733, -3295434251299706911, 7547551451797228774, -5572177708606751606, -4329087000376542737], [8688441798251745767, 7079881860411552268, -6216392181959267812, 3287336575535529991, 3375620632392245330, 6681061072008348685, -166272866975362835, 2777233460823880984, -6365809858451100540, 2894844714818660075, 3427629142802607253, -8658435652632620370, -8009423219781482424, -4778059814291497277, 1508517538720168335], [8688465029998336745, -5168557301291035234, -3841651791918999423, -8106661308854198054, -3915757036017420520, -6734516264325821418, 7373121345416905509, -1319218953564124862, -5532961448597444207, 8648799658756602266, 7452775862248169277], [8688460051764644216, 6265252906797285872, -5895534002165724241, 5229144295852358109, 8933380632689901372, 3458193397629836095, 2829393901924794018, 9115366001383053932, 6370653937761373184, -6040144655502176198, 7918743588934216145, 1145498299947258116, -8153270051181170492, -1305956025142869912, -7401920128815239764, 1216329860752485861, -4820824467405058162, -4983200493088969296, -3217646936887457194, 6582426464089726631, -190825462552795594, -6551494784357074323, 733860375538085389, -6113456969341298319, -6632214515257502366], [8688443457652335786, -5567378089694238817, 6032033704432191298, -6923754561588362658, 8405527080334530981, -5718641396264405049, -243437567097351754, 3519605226437876064, 3505409819556632568, -2781174171089315592, -1728388633591402257, 2861329789990354458, -5270278814157830384, 8150705820667394895, -1225088443422050059, 5946972655734419024, -3351784079504752859], [8688458392364054197, -6939508199510897042, 793302847999296637, -1007749157475162368, -8231664278563377162, -3415390921742157079, -2840422334760598009, -5334487591110217380, -5161308584336112825, 879562661763126903, 82376247743603867, 5093161523138107498, 16773504156526493, -1873482347448557005, -1076292614614552901, 8752169940711226867, 6903454828126622852], [8688460051764644216, -2982431701431042702, 7708676377861620168, -3890737075681361202, 5052269943477238396, -348860170407440025, 6936480054781321688, 1461302776191301675, 5917525817766887793, -929804802399682453, -7874675845358467090, -5412271586705325823, 548956758435945626, 3780326801584155175, 1997785868590745079, 7157040689502523661, -1785948076127216252, 2479046506101584380, -678845118847610729, 2030962133162611883, 5470534737162318374, 206157094477996502, 2135606740933100207, 5839876265987279712, 2926773965252598173, -8630970679695839376], [8688445117074207453, 7965357309521483172, 2416058192707432602, -9109278226730712208, -1185850611088023349, 4289329986337759380, 3241511699776514820, -5553319678815769875, 881421698851672267], [8688461711175875059, 4305717087809944205, -7365186281272339232, 880334912457788681, -2522639312300285281, 7305821583606283026, 6163691753437464254, -1455820255103006473, 8859296960932160822, -6281996716709863617, 4654207237686845262, 1835421458798750876, 3694634841529327064, -7904776952597103051, -8479704054308531870, 7148259218746617889, -8331536710793050770], [8688456732942182530, -2025491227960913200, 7802986262065944155, 1029734335426082136, 6635846428036431741, 7212130228258512511, -7632835400026735366, 7995137829503780069, -7706899158836404770, 1873536896052688476, -2642102834028962072], [8688463370597746726, -254553605030898136, -3708154750490957159, -8867396296112888997, -2091557250886210837, 3388578981586983942, -4668950929045133497, -6203443789258516318, 4185767055001776585, 1750533146531605444, -128926361601605945, 33452982883485227, 2091478883355066849, 3533643724370934066, 7917496574775005791, 8085268283063375582], [8688458392364054197, -4399619726800192313, 8198568214809141883, -419701687682713034, 1114774578402400121, 8286843974630984655, -4198041609204786345, 6099464722956217573, -7460119672561588808, -758964574412364367, -6536682508049129640, -1534363226094949332, 4088991352451334779, -3737509390984757748, -6650578503505463251, 8683667070520996653, 8006257186254467725, 8094522989584983585, -6972687016296640098, 7695700541783850189, 6972602777761080644], [8688456732942182530, -2025481271488207730, -6310073580855614505, -3453341021271389854, -1844761170483125209, -891226217546511148, 8612525771708178663, 4421601585947271837, -979510274427168341, -2136312066078695556, -9156363391946765095, -3681159562779711800, 9008731231530981568, 4196746857988226646, -6929777070105529002, 965381793073709626], [8688456732942182530, -1022880947716021388, 5824452991267690132, -4659687925470031485, -6518902967617158928, -4910331413901009734, -7330319636132491515, -969627082565660572, -2828847102951800956, -334790143655675594, 9211361287903044861, 7477928738698222406, 8804824291597552747, 2087771790147090056, -1291755640027933887, -5320435817887312634, -3376309231707827339, 165566014149542583], [8688443457652335786, -5567369792638084602, -2768191697358641623, -2605847200488116506, -6780380965959697233, 5630435880830051628, 5279441746140742745, 3670873511239074619, 5393360973359628570, 4251219527317514309, 4487672587084980355, 6984328280859838789, -6306998423514403044, -7676951773454498557, -6332770589882008290, -5609667847620225804, -6476007189513219573, -5318127040217726043, 7978156958604517859, -5666014357029412126, 3202902352737164374], [8688465029998336745, -5168557301291035234, -3841668386025987441, 4516511745473969199, -6479725766852845091, 8661587823713308640, 3260487579230785393, -3586846359752926127, 5447226729718959280, 5096255826794862817, -4105583992726379440, 3701307407703131867, -5233558241883494948, 8623477364693063569, -2651208928677160238, 8598318748940338648, 8765625518511179805, -5091385196910217097, 5886953134144518178, 3505558431448663847, -8019764712702294425], [8688458392364054197, -6939508199510897042, 793304507399886656, -4681902640584307913, -1789048124644870976, 1516405590239797475, 3168039919227744164, -8505470481362824500, -2916378953800912221, 1673341129200055955, -3124581514647088751, 803647528016884796, -7439266634194317066, 7564069043355610515, -9097546978773714864, 7751433500546233714, 5331465191238881225, -7732059565734026680, 4752816061629038850, -6705681317572580493], [8688461711175875059, -6054019475111119394, -6290485810189713832, -4735766737521766956, 4730758387183313032, -8639600986345837617, 6763172349055276382, 6600802961024269238, -246542593832737771, 6114130046788682232, 609630417576586086, 521344701303319492, 2314970275131934657, 1591862554636459642, -3883336296291580712, 5613913311029996740, -59755180220557175, 6138533137676758715], [8688445117074207453, 7965344034231636428, 7877068274409793656, 7472229955728436670, 3281333979942492939, 3591852457965441910, -8007554357945917118, 4078507118672169231, -3950636956431153745, 1030834265389447350, 7391495290137571864, 8114621264161906564, 544017717495521594, 6505894460892841483, 2389052287473123952], [8688443457652335786, -5567376430293648798, 1792665995509406937, 2840517470305909181, 1584451818776633888, -2119807749807500353, 4240859912593528151, -835518149949930062, -6256837969228792962, 6491847665908949678, 395860330474027612, 6168492138953242065, -4027818250660130682, 2745435335382981562, 7335157077800500993, 2233608783646983606, -9000156958994486887, 6952531814838150828, -7303316283112059117, -1179081767551707161], [8688443457652335786, 3325930095071157441, 1643278188414408971, 920152214411355919, 8727051911897021441, 2047949509975791525, 8779052125232607707, -2891842946780220485, 6449681628690570089, -5827606647852430079, -7510275148616166567], [8688455073544252717, -5379375190717612442, 8876459631916148699, -6899687578740188530, 2604046156993622214, -3756614867754502300, 3979411783634523578, 7055171457535701817, -108701808566253351, 4930487555880584016, -3523267727514426856, -1808651722814494645], [8688458392364054197, -6939516496567051257, -8798729879318909093, -3397608062493045093, 8614356467080114168, 7418379134075503959, -8283686064244964387], [8688460051764644216, -2982423404358927251, 4898548348995222096, -7660449116578572961, 80526532223582419, 3176055908643635822, 7841554890446409990, -5225510723654217273, -3880269436009183672, -6489466086106371931, -1991705624372671106], [8688455073544252717, -5379380168956625383, 95820341393286638, -952037771037498154, 1510359849981360565, 2706396921779640298, 1564228925157832549, 6153950667559390744, -7908933918111806599, 6420971300995168760, 8840954545008919248, -8586342142956463860, -2744891986968776538, 3820135806465606962, -8265937286020454464, 7547071710091007051, -7663383192467341306, 7938801276567299217, -3261791388572478570, -4731943454048431134, 5047941900945799055, 6833063314870461096, -5618164471534343770, 2736933733253792509], [8688456732942182530, -2025501184433618670, -8269644247494765111, 1837283682984072398, -2427705921011035705, 8699557836166670707, 3298429381706524159, -892463275256957886, -5408116280607173530, -4685010219528249770, -5027178079353099708, 934670454047975438, 1097033204423418386, 3198113583089361640, 6281298029198550816, 5745563062955173627, -2084770153823695170, 4878923178484917880], [8688445117074207453, 7965339055992623487, 6012449252583431899, 6100708418298286653, -8155106491411345196, -3152818738278531523, 3207848924106535745, -4524957145151343963, 8668248774019138366, 4667624649007207163, 7392110500163683032, 168190400836455297, -2790263539888878976, 1474717767050074912, 6875221055032686470, -2067776007653207658, 6727047073882922822, -2984283969140998548, 8216312014813260307], [8688456732942182530, -2025487909143771926, -7987348058418142561, -890619304579214401, 4259867320866505153, 8849584085052992261, 322381912269692760, -2944474964248905937, 2057826064160453450, -5999685592942804304, 1098280218603910388, 7871512232301021673, 3680607959464244139, -1934267350357190317, -4280158625557046040], [8688456732942182530, 7245048196586906439, -4425855172495376998, 3819661043001058386, -5895520726875877497, -1516608576828781059, -563096855657379418, -6923766177461658147, -8606416424717816598, -2644564572478318530, -2482188546813028838, 6210155070985142807, 7995293079035414308, 6499393738373620173, -8715995226915401541, -5174119981055371413], [8688463370597746726, -1516618533301486529, 4844064063792638944, 6452637276925339393, 7574567445224608010, 1287965201071081813, -2601046814972338695, -381119784020381073, -7553179223776260137, -4227515890544015649, 6856857066763443937, 9528106018745358, 1618104637968587081, 654851699182785578, -2724684028043072168, 2077895367682793247, -5541623278507921264, 4036214041907759322, -5388508597001182329, -6273977408476830685], [8688460051764644216, -1140015778850982296, -7101870949907621638, -1908364693882106507, 2282557832462249064, 1931580291901209847, -1205451657038450354, 8961483280790799078, -7611979042837001938, -6673111073157384409, -791530607191812532, 87307123374840860, 1695883655324682583, 3425913871087445343, 5483948068599219944, -6933493221425338243], [8688460051764644216, -536854772325251979, 6239017461115402217, 277152333607339053, -3822675912440786996, 442320329183283243, 5917517520716053990, 1327802415948778343, 8103626526466398298, 3513928015808770875, -4105580673909238166, 4586764603289523498, -4916985726551275264, 1044874422739056607, 3937752170441045758, -1196989114138293627, -4309480976187102791, -5343899206582671083, -7461965302639922312, 8057026081190259663, -2332196378943328729, 2553881622811250771, -190812187262948850, 1288724811358796753], [8688456732942182530, -1022890904188726858, -3935973291996618899, -231700448127958326, 6747276605149307739, 6835542408498445041, 6673179658123002093, 6365268211629619997, 830012570987640370, -1605231293960556653, 1922476755019795134, 8084031225355589050], [8688461711175875059, -6054041047457120353, -4237250338766524963, 7362163114779116613, -7779745772886358788, 6962755326327425163, -8591140869076972064, 1179013224772903527, -603529367637057824, 6875354732218319750, 1454036572334726457, 6043771590047413044, -6689167044823359408, -727306895533027537, -935372460376429513, 5978648588139955333, 6932161968725248023, 6650485967913749582], [8688455073544252717, -5379383487773766657, -6987979932669019320, 1704390235708845813, -6913894601494727515, -1869756239656042294, 1039450530141013413, -3225512523290362438, 7088379250926275050, 1835418139960327954, 6994677939105799065, 5886807841085589409, 8631509948237224893, -4340048549834133113, 1982503675315617997, -3774354582316932780, 7690911772138707661, 4163236911396273764, -4410583828468998735, 2365271810867327649, -1293606248339959920], [8688463370597746726, -254532032690217589, 6521298715485626768, 7244428008327102742, -2862506559786017315, -3585602664410857047, 4884484959899021861, -3248360701959609719, -429578241888656607, -3477399707050108737, -752930450021902534, -1800781924797123130, 4940809004151581197, -2866055845700896828, -8287403874981324883, -4583140987582709574, -3687330814914594951, -868553333079994574, -219532603156741177, 4275128708425498358], [8688455073544252717, -5379378509534753716, 2678143104041209508, -3491297758440225589, 7125108120251444289, -1987529512558384936, -1676977846326780341, 2155684341490312571, 7630878214205942044, 6583031717640472123, -3613240505522571853, -4419841853826369454, 378095724727173251], [8688458392364054197, -1022882607137893055, -3841661748391704893, -442533272242312091, 4147190129573137153, 2612688972324881765, 4884484959899021861, 11855137195909986, 7103646509510965369, 614397614878387861, 4654202259447832321, 8717165401226353016, 1869833121656532545, -4167327844132633820, 8630261274658803078, 572744639319192589, 8823178323394089810, 2462517298645965296, -6155754263267761288, 3213867221011896024, 8466800121997559613, 195041823168996790], [8688455073544252717, -5379371871900471168, 7708679696678761442, 4305705471920687480, -2541630126463614059, 8865952932998977607, -2408726722715682004, -726079794297946475, -524500017304610694, 1576570404891287296, 6445356138359705970, 7979865592680076809, 2131304482364788302, -6737627162092224961, 1794500776323030386, 2405092431635375955, 8441029615033204592, -8665853918926713875], [8688458392364054197, -6939524793617885060, 6823194291117406716, -348860170407440025, -6384790716163005496, 4869666045922211952, -8458249081202335498, -1610910163984931449, -4179050795041457567, -2393924402864481555, 1796998123479874016, -8842876122140846840, -8828677396442462070], [8688465029998336745, -1516605258011639785, 5259233787215038375, -8318727871840575635, 4279456750948957081, 4743103185747210083, 8934007458583987617, 7814072430605315981, -7179042287669213517, 4420366187661356972, 6028934422557704686, 1513317924241266558, 1976939467876377327, -3901712793226123319], [8688458392364054197, -4399619726800192313, 8198559917758308080, 3325928435654606186, -1750452945692692271, -4244513223808619113, 8142851850159066788, -8413641350205695919, 7613132754777291747, 8660982570159902942, 716736763796430868, 1217581853150709156, 2755308570766463449, -5829318469003483539, -5991666284688489724, 5212623385450233034, -3405641538807929354, 2556195378719850303, -3277698748346422290], [8688458392364054197, -2982433360831632721, -4425868447785223742, 8545700006758839734, -3615073626914323635, 4908257906054589177, 717340357927964899, 7078003042097961080, -6367663785585588259, -6675586847968227080, 3565453333959443449, -8594713386738442555, 5859923997147657314, -6699038620790290040, -5161325178443100843, -1629782996724703179, 1393364572615957664, 8606356178973885531, 7788926958398130834], [8688455073544252717, -5379383487773766657, 907212118745476992, 3475321220980636475, -3916352333098120748, 6115848505595299888, -4936591750740715210, 5378553675290696828, -1978883378409984111, 2343665668120937987, 3297203939893314764, 7681041855569706842, 5408620701515371550, 5320349919929881513, 3711766750324475594, -9143540511093197576, 3341360007446311217, 1732756924916776006, -3594259647810666897], [8688455073544252717, -5379370212483919913, -4425850194261684469, 8059047005468663668, -3466284435738448819, -5074890837106406952, -6444829252332123848, -3735007065615503237, -2186487323337037491, 5871035949639515752, 3171113417144423752, 2610838364012855732, -1904811322541500286, -1181690326756178527, 4367588877112461103], [8688441798251745767, 7079886838645244797, 4938367310365340589, 5026648048404914654, 7935864774653394183, -6806619730474683398, 6164940427013225863, 4556352279168807003, 8064426093958153689, -4095715735576590082, -3199897265854981450, 7189305281333196002, -2180299608834152880, -7581426403880408379, -3541630056361797722, -8427703079901306135, -5703217228747490472, 9039282211071023872, -2618801464241167174, 1765036451456506552, -729015529608586487, -8697803082284781265, 1940829127394460530, 8257977372870297738], [8688443457652335786, -5567381408511380091, -977658006693270641, 1915219741008718510, 7521318558307939723, -5450258193265675908, 7575176017616436630, 7941908855516561486, 3092700936254639045, -7370595239163984427, 2133143474787557610, 1970784043229255936, -4950630248673773212, -6548405458939331945, 8785858368597366202, 654226532705250588, -2725300897469773355, 5026500964187787866, 6296578563073087879], [8688458392364054197, -6845206612354746652, -7007561065700637445, 8059662215492114630, -3615071967513733616, -6580660094313260052, -1356108050638659633, 7586893990286247436, 4955492581504924923, -8901541365655082339, 5915025151790242683, 1279623826691258292, 4659142959807467814, -6054805001095627916, -4932881470435962259], [8688456732942182530, 7245048196586906439, -4425870107185813761, 2746212564332617517, 1490163506928951684, 3984205531516018841, -1092180828064972145, -44354244447573370, -4218883031680141156, 5041784816879466203, 3487059106577236779, -5844599002878020602, -1431443714789303066, 2759468855098308271, 5483944749776758258, -3384955365858888370, -2050500465199720378, -6532972227744376689], [8688461711175875059, -6054044366274261627, 4187005772110153136, 3139189144968120037, -6236631669703678611, 8905158343743574951, -4066388538454487566, 5644940845171503991, 7430073874982762551, 4068912092477571160, 3115377139543617305, 8590589265761504403, -7812792571908340231, 6349342598332137004, -774377126058643661, 8980000098114125950, 6630258096042634272, 8183273512868714727], [8688455073544252717, -5379371871900471168, 981279196396229524, -4775590677128238184, -2030896867035417121, 7831235101597284476, 852096029409794654, -4793199901583190100, -8497449513713240313, -350078974583706666, -5500550665344309869, 2814565031509861317, 1700824355665696634, -6430789226702879707, 4727675699418474644, 6262166900194024562, 300313388553936475, -7319190322927719831, 5885077634669349912, -4754761763320843653, 2719178317357757154, -99602483293984497, -4806799244759186698, 4934666219908746438], [8688461711175875059, -6054022793928260668, -3144812705335345335, 3951926004976288295, -3313813174254065795, 8285593641633351379, 2073104938618439258, 5378553675290696828, -3536069167760979974, -4941515988716388007, -4147266837682409474, 8214591764869726280, -654310010190452221], [8688463370597746726, -254546967375333940, 7802979624431661607, -741213243976638398, 624902654379007698, 5081117398895779395, 4033280858810995562, 7564679275150689360, 4259235516733405967, 5307062100350804742, 1132525016062082741, 2917676299380919338, 98895498723857275, -5867425609201266924, -7991069187971644331, -2515855402353167214, 8758827572199915319, 7007014440618862313, 3302763169093542493, -6810330903555479698, 3504799587764213929], [8688443457652335786, -5567368133221533347, 2469920630249622038, 7472211702199576985, 5917509223659899775, 1726590016116724242, -2447940430516433563, -3171039853963734981, -5252527483708803385, -2983677056173701801, -9191228377670061557, 3293650568531426895, 5351676469003008517, -6808473657609171117, 2398920412881266546, 2116490546640292364, -3498089198832252231, -2450259296379090740, 4510348790395240263, -4203610028253172874], [8688461711175875059, -8804759025470357985, -4425850194261684469, 8059047005468663668, 961057962159396762, -4495770262849157275, -791527288374671258, 1702518055050818821, -2953104504284998332, -852020806804574010, -4259937391341494926, 4288566032693931405, -3592395764203473708, 1483978979504221789, 3491381278096280036, 3465122600654504373, 2718554810275491771, 7234219431522944758, -5324764758761003555], [8688458392364054197, -1022887585371585584, -299779864876110569, -7221180881510574621, -6572775361610772186, 7078638165069483188, -978878470272787507, 2503115148345028115, -5916367127590245249, -515248629581522523, 1662257386707102466, -3812963036564278641, 2453401379266708424, 4947476592089033265, 3164924043227648092, -2310256554198134637, 5747268378216251509, -500743665234749748, -7041238009433846407, -7319827105297171752, -7322895756721805575, 3692172342024292373], [8688458392364054197, -1022894223005868132, 1886350713222894904, 7848219159569380990, -1656167952643529899, -4150216614886161252, 5842815320115060998, -3100181742570833130, -2220111932535406147, 3255076961917268531, 7445372662364877651, -1910208664559849992, -1187092647008220762, 9202104921962225397, 213428276570924455, -3977494249789392352, -3254388188710468592, -7918190284052626063, -672052150772698978, 1790340492012467212, -59771774330205399, -7426930132678593612, 2150895571863791485], [8688456732942182530, -2025484590305349004, 6314351465849494395, 4720259985316975743, -3087841922240628608, -593796578815138529, -6253769449529844667, 8002065373109236886, -7307616882263819767, -2717881864551133180, -6892442180602407395, 3174059875531034256, -9060190516924592298, 8338697103770725781, -4686688984206973958, 6958404052041414226, -6532353698901124247], [8688461711175875059, 4305717087809944205, -7365181303038646703, 1366359428432006835, 8142216727187544680, 5323454180062002508, 5092707433669327683, 1713176684682482878, 5018622102516317526, 4856247736246297441, 1060308546728676654, 4291668633404180733, 116637639314084650, 8925510834672529857, -7027172960921094917, -6864815188758062850, 2416685785247347165, 7891856426179142776, -4841037404567115267, 7717910278664434088, 5017986086768752069], [8688455073544252717, -5379378509534753716, -8778515282737640527, -7730668786174830812, 2584441792199451875, 5441187627094804918, 4071262487158934766, 6928005003210544475, -2297313139709794024, 1925546934119333448], [8688461711175875059, -6054032750400966138, 1095181829502806919, 254315770811387261, 5803623184660310398, -482977400095285986, -5143553935083245582, 6930460865083956824, -3105594019300901247, 3992385067535660189, 6426386896537057739, -3962832244758107731, 4640152145625517594, -7881922136293573222, 2431964659702672767, 7021679764472608620, 3021087168282044052, -2029202401041709500, 9193616595106921852, 6864712696693643711, -8615069957556178204], [8688460051764644216, -6359175458746245950, 6728902660433961796, 880333253041237426, -7177196657590880013, 2651267557154111216, 7840949636893004292, 4117103957027598161, 8632735390055754700, 802412129722989313, -8063905845570174527, 4836791222299120972, 172990786357553520, -5302208064570486834, -263050228942355896, -9113596312789446079, 3812251073760458890, 782937362246953159, -4553823746912030880, 6461257627123913812], [8688443457652335786, -5567363155003802054, -4727757385761439494, 3890517494990710012, -2541013257036912872, -5567983343247644515, -5875932956209976824, 2816442190388279808, 19882742501058369, 3293035358505315727, 4130049030929829823, -6487605521337601664, -8381697165081321058, 7476681724539012052, -7664621909575717857, 3989269191535564117, -3841055728213752525, 5052869325999626568], [8688441798251745767, 7079875222755988072, -3634062781677062394, -5035677129310975805, -844761240600902782, -3663548678892247393, 8385924374962232309, 4195026739759737323, 4918142757311366553, 8622375775331768542, 1643254956673138405, -1736250901155884579, 6896052521037996017, 1350003855773208027, 7672557740344830804, -8391429953908560765, 9007475920315616999, 2759487108627167956, 42553967577625748, 6379776494793534046, 4845281975179561206, -4983208790145123511, 5434407802568093147], [8688458392364054197, -6939523134222615453, 511001680688981558, -8224413009415860149, 718600647395643439, 6193794520092651470, -3560591001128291738, 542937568757202204, -1054834322688555049, 5305834999115723680, 8913161057869619865, 3025421087392087708, -9038742181473960122, -1667873542815498546, -2613875698590589886, 691563081608962214, -5404397703246266364, -2247136223034900834, 4113529779946916209, 5761328316753663706, 6600939064229718795], [8688460051764644216, 3819664361839481308, -8665237816124559358, 4306335616653196647, -280807304236321064, 2213269568007875444, -3674495293656740800, -2065923739940591606, 2523781408369939807, -2111629873204410260, -1388508877440370149, -6751060406471877265, -5728986076295294238, 4264035902254504190, -7896144093751850000, -1623742234699958798], [8688441798251745767, 7079875222755988072, -3634067759916075335, -741216562793779672, 6447228319017732962, -3381249170995823363, -6686686291773503796, 1046111480425561491, -6538504013572906345, -1063316778512841068, 4770597261477560817, -8200962895989066796, 3959183911784689916, 4742479678670265112, 9155638285576123922, -4504111637231641002, -6087221523659414664, -4459512203283175020], [8688463370597746726, -254548626797205607, -7685437548093265644, 6171573167322810846, -8496827666052846597, -8899048996753212886, -5989822314032027887, -8483882592147954729, 1757172524470152563, 7306451728338792193, -375715804346467171, -8108513576566814106, -7385394240198043602, 1043629067980436272, 2096414605478349607, -8979470786045445903, -7783466902461142206, -4342524324644975784, -1848477321818895686, -5626803968051122253, 3108597446763872710], [8688461711175875059, 3819680955946469326, 906580314612377806, -2496393910145696156, 5749123964746008835, -8318716255967280146, 1509752937011403612, -3891368879814460388, 435055784745919486, 5793721739296545004, -8326600988669768012, 291673892061099846, 4881387337406503826, 7375447615543712316, 1829390653225430317, -5829318469003483539, -5991676241161195194, -3571717888310586939, -7460714969642289036, 1231618691661895491, -3424003867657960426, -8013733907128973866, 4397056389075761095, 1921370055680500608, -6947554951120948459, -4517675113809667191], [8688455073544252717, -5379376850139484109, -2466307737616118400, 6702653939462231397, -2240348101457355260, -8695312372783501831, 3581969266125215789, 5832320237068525189, 1943303242788751946, -7771880186504735192, -7609504160818163852, 1082842775775867419, -525728777942941981, -8406718784817970395, 4545235348464537684, 3237932544456819927, -9058966734527934158, -8335842419922810919, 1244577040856634103, -6740564556798134580], [8688461711175875059, -6054044366274261627, 1585076985272790320, 2048728398304735851, 2187622781772409469, -2888753621357157695, 6145337721640927191, -6752132126436337530, -1562458343772220111, -7371827318632758018, -4877778656390126665, -6768039486207621044, -2577120278685727159, 3709468690199233942, -954366593378181213, 7103179911379545686, -4570325510974670243], [8688441798251745767, 7079891816862976090, -7196177515281503321, 2025268328431839088, 2261721388220586782, -7566751123575238250, -3862499852049918430, 8638139369708386954, -731490411627424573, -2340063624757464816, -2691031208848458769, 5307068737985087290, -7989210282603464083, -3399461989622212400, 8068128077212072837, 6459569798764488739, -8158214070360607465, 488451624132747385, -6456402824719049234, -3962345865420263666, -7991049275047515039, 2851926471576715176, -379425318026673452, -6934111750289872333], [8688445117074207453, 7965345693626906035, -2674503660809390940, -6077491160878593294, 1168653610051577575, -6564140843351628086, -8423357544899345548, 5433656489336532422, -5480336068763041303, 1232874002898541708, -2369536246685463277, -3249592781428383310, 8765635474978564863, -7010511735696393808, 6846522211487555308, 6758234835789756841, 6731999390113193598, -7882087474018278047, 8070602959212289481, -547675240338379857, 8218775280964123316], [8688445117074207453, 7965335737175482213, -5122700896713313634, 5192421297555546190, 3509752796794469908, -967319964312625236, 6956105991916172574, -7299733808956601508, 3052266764858409384, -8547150007501713260, -7425214860968752114, 5120180703683544540, 3437512202919808052, -8885017268174802548], [8688460051764644216, -1140007481800148493, 2127326628964868, -5059120605076884550, -8364571001128450491, 3253829947760718383, 5070610699978608303, 879726340087241709, 5766867764752787465, -2059626341051682720, -3953717984795402114, -4959743742033213807, 6690303269867316820, 446140293860759439, -7156367743775504864], [8688466689420208412, 630915206442090014, -7384178754857539677, 5026646388983042987, -3313186348351998932, -6131977105481766465, 7164303574523336163, -1453971306207531695, 7975685395426762901, -1423567279142969415, 8256751164448502909], [8688445117074207453, -8318727871840575635, -2917597757958557420, 3551898028267453354, -6174106635642426684, 7682897442120745816, -7134282625955420767, 6310147144038963482, -7208377913583796600, -233099524722026761, -1841679375510291406], [8688458392364054197, -6939524793617885060, 6823209225802523067, 2745570803726812861, 8104263308835850219, -2284945876005231223, -1260572724610485427, -7112986221216621350, -900492539965356494, -21658128213184170, 701459548733714667, -7105445126985643384, 4980651197265630462, 2087783406036346781, 533059355134707376, 8401372540844964122, 2852076742869336474], [8688443457652335786, -4455943004444166215, 4279460069766098355, 7188691730726296295, -618186394413368268, -5207913115069900640, 4620564374959616921, -6486970398366079556, 9215079865245330585, -5453322627530916877, -955587056957698079, 6216474042220052652, 849003385172250796, -1754018825714559802, 2436898722409404270, 594310956193381813, -7745498549403049746], [8688463370597746726, -2002664621635006672, -5895512429819723282, -4455939685627024941, -1542870573106319438, 3763321171268717908, -1711862744974206095, -8485129606307165083, 6786467081208788732, -7333872240885793950, -2465066594469304130, 5776590597104661496, 3282535297222427183, -6221198438508723355, 5710532871235518074, 269127154322006947], [8688445117074207453, 7965358968916752779, 4052885223599845489, 5026646388983042987, 585088671263863382, 1296134780596736043, -3293601896511220151, -622978482878312276, -6983632869992154242, -7957392375980082133, -4441757554032967983, 1819682755561332843, -9176563053816315250, 5565916473056788154, 3883256269365167117], [8688466689420208412, 630916865842680033, -3728367687650354058, 1554362327408633210, -791522310140978729, -7435114646937247901, 7899125948855519474, 653001090886720781, -5384196381976126190, 8472842543436195043, 1605275754350335890, 2328376837211528357, -1273386673524998825], [8688445117074207453, 7965347353048777702, -2748607245512542430, 6829225096688067069, -2144789543690570694, -3154675984246121752, 3354157362251176391, -5264115859079101448, 6970134533376525106, 1569025991840507850, -1662325797762880778], [8688445117074207453, 7965337396576072232, 6106127332662637318, 2253687145275835439, 471174422262708850, 5339965133967480259, -3278306427946246325, 4172206771092055197, -2991683089138169637, 5886791246978601391, -150381334705142111, -5226759397229978882, 661003805012765695, 4365268351830592465, 2264182994949578124, -1104523200609052919, -4335893243735980820, -2727300117679151079, 8872118314102843232, -3613400733287898621, 1619324208756099362, -5633454961884246509], [8688445117074207453, 7965360628338624446, -488396314478258093, -6132590656104627408, -356104801920674490, 9147620636759642245, 1528123562909608281, -3548251180798087216, 8463726624056938171, 4272819032403019363, 1675669058743414017, 3613910132411167728, 206000185527150802, -7952333694194229386, -7323519263798750546, 5187473066766963358, -8743652849228220317, -922561063678452573], [8688455073544252717, -5379380168956625383, -4257463275947203510, 2589875641270200539, -3520160148570484999, 1577797506123708152, -5614446660795323068, 936540975286790969, -2092797627389856995, 816440671204623493, -1301620446618935207, 7641381594305971862, 3748507235522940322, 6443647504305428668, -2010071272058464894, -9182139008870498173, 2491376369959083432], [8688456732942182530, -2025487909143771926, -7101870949907621638, 630931800554398444, 2168655199350351257, 6758388557641166177, 6239635989958654659, -2378657144295752472, 7104871951329495176, -7150947936616489408, 5333929350160467171, -4981197822342085182, -8611350487424548101, -7048490045205910090, -2809242738184232677, -1912079185801325729, 5979394156531898301, -867931485395659004, 8052242289784130076, 3974615483555113299, 3812259370816613105, 824463166534432583, -5948785441290948368, -2481594142508371959], [8688460051764644216, -1140009141195418100, -7195570602306225956, -3547649246061822792, 5070622315851903792, 4022805688707210487, -2014375190027366818, -405820230418205642, 9140372686407984858, -720379351927570720, -6195574884038469800, 3384869467901457249, 4845273678123406991, -453368674961837968, -4083519680625089426, -3360415278968037333, 8090824193446462037], [8688458392364054197, -6845213250010310848, 1886355691456587433, 6265259544452850068, 6427620635427702997, -5733157976500434549, 2187617803538716940, 4681683059888336311, -1206090098827113736, -1368441233334581607, -2017483535601175757, 3457720293565877538, 7722723172866793621, -617109564492190152, 1910282227743198969, 5614520223999953693, 8919333837679407507, 5613896716901727074, 1439367929669159288, -8338184385809033752, -2959895812961980270, 8166611521024787360, -4804930382918300980], [8688466689420208412, 630926822312725297, 5146571530612107138, -1681773253608865623, 738171823957216300, -3571097700066744478, -7534811916689876330, -4230004940644705064, -2653077790496764308, -6135073068557733245, 7952376495188739016, -3752781627808461008, -3103769194938701620, 5440420354633835669, 1101360354176154172, -5908339654021423218], [8688455073544252717, -5379375190717612442, -4915732074736500714, 7188685093070732099, 8142238299528225227, -3132457950293422402, -5951240410361715308, -5154050677527711204, 6954245427126120659, 7116601539867281059, -8836093871596978998, 7061516979350305150, 1640165631252735821, -9128259977221320719, -2030275912167027990, -421709336668610089, -8228584142991133378, 2019851840092625112], [8688456732942182530, -1022884266554444310, 7708686334334325638, -8318724553023434361, -8344961658124529477, 5025397715407281378, 5748500457669063864, 8002685561369040583, -7139213369842350790, -6416122243453863793, -4408731560735101035, -5075636537221375242, -7348059350694921995, 1387348701754355516, -4087861765068261975, -5696426681150128621, -3276466668877648699, -2891829671490373741, 4999622098504829948, 3503721098426484558, 2550179507836966507], [8688461711175875059, -6054022793928260668, -3144801089462049846, -4267336511314724161, -8156351846177946149, 8755901026740094313, -1146656816208740876, 4815190057789084045, 2790191810018619596, 5252587771618266854, 8859935402720824204, -3624951840539478669, -2671413568785723334, -9032089528224284611, 3377475326145959307, 6270328182684806225, 9106102997786670272, 7508336084579925960, -6744281474745150697, 7437492907901402726, 6280667884482002885, 362813531452046169], [8688461711175875059, -6054037728639979079, 6032051957955730571, 144257226915561213, -6290487469590303851, 2857511484732089723, -2239112703171440395, -7888246085740893948, 2455270241110254348, -363503921912525167, -5070705661616740309, 3239784812172096185, -7850770881417856513, -1564185231371318334, -2934125305997625249, -7880226909230886338, -6086604654216752241, -2474322960410123594, 8313698715780667422], [8688466689420208412, 2839880687917835818, -1052975417320374801, 3325930095071157441, -2522637652899695262, -5341421772371238393, -1637178797896752376, -6226890583846886749, 5446596585002411349, -4942597665150893536, -3576506657958389673, -6070565276673726496, -7668308958115258388, -3477409663520154001, -2429586398719896500, -7904753720855832485, 7216303787877543871, -9223049603129206223, 883896580870510353, 1411738517352585255], [8688461711175875059, -6054034409822837805, 6991591165899272733, 1029737654243223410, -7250054887508809108, -7338325669096959351, 3677522845658307826, 858742045003905969, -2668949409842855740, 7794333490285920988, 7159357895948629583, 6436250175453154568, -6379851675222581464, 6490127547683120561, -1058528008886319982, -2106367867793565501, 2261101199955462673], [8688445117074207453, 7965344034231636428, -1561229583136549030, -764048147356038935, 5448462128004874145, -8545914609215798395, 7480866133404132025, 6600801301602397571, -5485261834413618591, 8770558053537686405, 9163073014272801565, -9047231274959130749, 2202286446204284109, 4491847806128543588, -4516469711088045003, -1697678953960937676, -2008214026090874665], [8688460051764644216, -1140004162961725571, -3708141475201110415, -5316732941862670549, -8946907179285814015, 733409604889107054, -220133645098340810, 6627195315649017975, -2876553354793850974, -456580067250145750, 7600939886925227455, -7141537980544625724, -7492525477581030617, -6790255860743769139, 6408638884923793456, 6098095515743022664, -5176604052901086651, -4446704125402339354], [8688465029998336745, -3962213715914855289, -7666471625095739305, 575207138824227280, -1844772786372381934, -5623116026711596519, -8854452881624548384, -6469356195680095317, -697832614193798233, 8033728030222266245, 5539671070923480677, 118349592206784874, -8425841616766342434], [8688463370597746726, -254553605030898136, 4543400567629632587, 4139922266297350474, -5575259503579585409, -6204045723994780742, -7103726536437378964, 1428404720810978893, -5743653059544310152, -2757103869424000190, 6450295179300130002, 7173399580978463743, 8195477229993469692, 3605758806387771123, -5086608043151671088], [8688443457652335786, -5567371452059956269, -5330934986378196593, -1626662142506875814, -9095066225723859252, -7606573403767818429, -1319974478410151858, 2870934772660318205, -8477851786574634170], [8688465029998336745, -5168563938946599430, 2564225536225573908, 5058275857866135074, 3093317805681340232, -4078725039967550814, -8739308212571171516, -7378142971050526589, -6330308090361012363, 4383638211128192318, -4781614845048654753, -741831772819890840, 1643259934890869698, 5834164207727647232, -5802461175661206168, 5175283517729380134, 2902870660707257203, 8660828848308493606, 6067541217385839086, 1551894849669905990, 7027077106490958326, 5979253841690700825, -3376315869363391535, -5147266767585913549], [8688456732942182530, -1022895882427739799, 8198551620702153865, -3076124716195364472, -8551331864179559041, 8286840655813843381, -1032750864287682413, -6109138883285224654, -8116521268931871961, -59007952406742540, -5534208462756654561, -7035053482009116512, -5198655089712529921, -382373435835155623, 6330828338770273173, -9223037987239949498, -302869190296513153, -2247154476563760519, 477338012245619340], [8688466689420208412, 6702660577096513945, -3051721625307287989, 1537998457693680187, -1428962961760729102, 3498645822533643793, -3937813943841259874, 3071869470230708056], [8688441798251745767, 7079873563355398053, -1863133455803201545, -3264727890486383604, -7760139748696918842, -7848447037316186395, 6332077012330073546, 3739881014314630025, 7255512517441942695, 3800069060726011854, 1624268227930215923], [8688455073544252717, -5379370212483919913, -4425850194261684469, 8059045346046792001, 2731995585089411826, 724601583553507794, 4577036792722578380, 1430258647942806406, 6808535604919224605, 1310173278551075693, 5500477276052178822, -2953269710291998247, 3259242224490786500], [8688456732942182530, 7245044877769765165, 8198556598941166806, 1837888936537478096, -7290474124198640770, -1328615634322199948, -5292338148022767663, 5495681868770093540, -864967540110055897, 3363269962813291989, -975808291173249193, -2083683367427151378, -8045540197884380739, -7317506711754289672, -8248825290152095432, 5682287350547921087, -9114052954464121528, -3071343476979169283], [8688456732942182530, 7245033261880508440, -8778515282737640527, 1860113608124459994, -1844154257510508050, 2346768268831187315, 4205999905111904836, -4736993838756848018, 7465590577763287491, -5395901079334808604, -7078554645413428741, -7801678960015891774, -4496248476872493889, 5332227353740472417, -390379468781002017, 5895582674185930985, -1276460171460299855, 1157691928852340435], [8688463370597746726, -254530373268345922, -6498686711621999313, -1908978244507627656, -3768194946076626766, 7024762452237447008, -4258096739483552921, -5866656677323746420, 8949919796596944278, 8787550408565937134, -7210834542079095413, -1531283857149912424, 2098893699111653964, -6659672850538719164, 924942643459748672], [8688465029998336745, -5168567257763740704, 6917512472380545124, 748066631665417498, 7897294486859037299, -6431254033716004461, -2166257792065332162, 3255057048993139239, 7163688364497224995, 2650047093574594350, -1242827265208437190, 8260926383470784494, 4955484284454091120, -5758462017035113561, -8178431985759017305, 4905777153026015213, 7615594361508943295, 6180198495733796146], [8688458392364054197, -6939523134222615453, 510990064815686069, -5148833700315820, -1147267048003819721, -8469372649567489425, 1285022828126159253, -929948567778386319, -5517079872778647305, 7853272863116220796, 2204147777597601046, -1882737053967504802], [8688455073544252717, -5379378509534753716, -8778520260971333056, -160227126716925925, 6615603621456258226, 9109670537230409470, -2976407533497325103, 1084091449356949440, 4431956222434905260, 949965922612949264, -4408731560735101035, -3360890042432585909, -2637793937805085971, -2459652658343966406, 5408635636205808313, 8227424733929665415, -5573414766293256490], [8688455073544252717, -5379376850139484109, -2466304418783015890, -3962205418858701074, 906580314612377806, -4941997389817879337, -2522631015244131066, -3570462577095222370, 4635228039391491561, 8339464376231695030, 1588168736734290829, -4888736887030575767, 4540929771073764093, -5476794313274448923, 7121390309515083793, -384217406491617460, -5859417916841529481, -4687324107157214418], [8688463370597746726, -254543648558192666, 7105510393118158558, -3005251670098724828, 9197331087004859426, 254312451972964339, 7574557488773184188, 402493070778292183, 1341354402807665928, 4594942479887293179, 682452140463397871, -3508435538266391645, 5633375701561097936, 158166894160352112, 5747278334667675331, -289897565833209445, 4597243858850957753, -6705681317572580493], [8688455073544252717, -5379370212483919913, -4425850194261684469, -2496402207201850371, 2019252457570236940, 2816448828043844004, 7559283592546230703, -5412274905522467097, 6896042564581251783, 6984334918494121337, -187732818315251736, 5001330732559107250, -1861263827359050805, 8809156551309666590, 1711182442706797683, 6138533137676758715], [8688461711175875059, -6054041047457120353, 5220640267679410925, -1774851058347076225, 41942969160660439, -2230468228439590825, 2845918131141400161, 1044874422739056607, 3937750511019174091, 3214626196416711058, -2542228742380077003, 5737543886445166017, -1207310562406630602, -5797048898939118669, -2618794826585602978, -4544564062154070142, -1754165778190039826, 8982335426363406029, 7299656969126964071], [8688465029998336745, -5168565598347189449, -3634071078733216609, 8318493356438206034, -4727757385761439494, 3890514176152287090, 491398975319343092, 858106922053665509, -2373231592281158023, 3176045952170930352, -4070093840504266340, -2387423680345260245, -4881488936694879616, -7700256462059434729, -6578334590816320327, 5095180788013261278, -7909569041062047059, -7024086954317833607], [8688461711175875059, -6054039388056530334, -6216383884908434009, -2660329826274148403, -1199918978417916113, -1923028358313981147, -4815871258380122595, 1308336706579254225], [8688455073544252717, -5379383487773766657, 3563618553148480206, 3475321220980636475, -3916372246043531688, -443775308186451358, 2226821554861442617, -1964077739736321976, 1193201993998582827, -5654130285563257026, -1389137362756328061, -8398982664007513808, 7627799738028967867], [8688461711175875059, -6054042706873671608, -4727120603373366131, 748068291081968753, 6709291658002848703, 5026633113693196243, 4864278660373907510, -4526177608752142477, -3501802797956806662, 6813345946891746650, 5144697690553490127, -1605232953355826260, -5972700361688303179, -8900464667454269339, -6175965541010606932, -6338349863753332487, -8120862586745177428, 8050385043811219435], [8688455073544252717, -5379381828373176638, -6102504483559088416, 3475324539803098161, 8708051141260987193, 2816443849799510651, 6332078671746624801, -1400724078691453427, -7761388422278000863, 8795098140431197648, 6124497958560841987, 6756984502813405213, -6496228423728770687, 6874130949803040168, -4423378631059987657, -6031988351245087064, 740046430635059569, 2187623548375674491], [8688445117074207453, 7965358968916752779, 4052885223599845489, 1295514592336932346, 435049147090355290, -6000332331787621901, 7859306987501362217, 2500617801209466133, 6409259073183597153, -9144632143987107545, -5839191704386965426, 5987416783582072507, 4939598497020827947, -1096365236951373766, 5676870095584160441, -7294660192485632410, -1406895330842297814, -7693477662071694719, 1175420794171342508, -8727132070565081800, -3752923602050248503], [8688465029998336745, -7338937560303269039, 7218784540908778041, 371457239580630717, 7727648938517370909, 3536749643919606316, -4520775288494779830, -7339561067385534422, -5801834349745838275, -2286187911925428636, -7761386762856129196, -2340043711812053876, 3373763386440616337, -4456573149176675382, 2714866102335361221, -5829331744293330283, 9061333379602832258, -8069446952967228099, -1293606248339959920], [8688465029998336745, -5168568917164330723, 7802992899721508351, -4283091808653809800, 3449720898256973898, 2253697101748540909, -1635321551931822353, 6422201721047391096, 773073316711630072, 3836663354499354379, 5844057356035258411, 5417281003732322674, 6140387064811246434, -1031679012578915178, 3294760586687862695, -8791339056380552425, 4917517590812549915], [8688465029998336745, -5168557301291035234, -3841660088969833226, 3891126067361256984, -4123946321573750306, 8285606916923198123, -6855698376586801393, -569714661273867432, 59084834428514439, 4498135248544747004, 2490746225242535501, -1700158047594242033, 1457116707906970241, -2733794202564089841, 2194416516450586242], [8688466689420208412, 630928481731936758, -2748612223730273723, 1029740973081646332, 8762533767049679296, 1516400612006104946, -3559987406975476059, 3443686773866512065, -3654275718841779705, 1820914835035426846, -7477868450802059967, 6555710378364690085, 8016134501513429325, -2615242221856242397, -4733308317889551772, -1062231783261194265, 2642021147685997222], [8688445117074207453, 7965347353048777702, -2748590651384272764, -2910965017654292849, -3708156409907508414, -5810463889787251082, -5648111095863231956, -5474940386139961204, 3333942765669907825, 3512065791623449353, 5593541805500542680, 4514062521242820016, -4449159094475766500, -7183362931486750223, -7832378683170990679, 2793273604986132987], [8688445117074207453, 7965347353048777702, -2748597289039836960, 5872904811480401470, 5710537082865945581, 8224186791064324351, 8460641510251001858, -3138783559162614795, 417321941214506532, 2025878560218937315, -5782223347317385388, 6600187750998158070, 6807932010769069132, -8333386558054718982, -9130582928528326046, -3006355050620878080], [8688463370597746726, -254551945614346881, -903567697301247543, -7432008727388575651, -1071349362057002392, -1799526613587078973, -147913856947793449, -7732524372723209580, -3067012115633248874, 4303853204208071428, 2755325164873451467, 2032199190873058621, 1058443003704932210, -2645804949003246336, 469315516894528602, -5891353804909750127, 6988511796930293971, -6016218119215564662, -1426498036211936280, -703386996901980197, -4894302885606732808, 5494904639836418821, 6249964974232788028], [8688441798251745767, 7079885179228693542, 6126336951007553149, -8616147554123184638, -5310720389796928027, 1861349006410374859, -1259935942241033506, -3930565993508223929, -8195562235153575816, -8357915029077594942, -6276450631073797104, -3782388693541319007, 5086513081518859494, 6695121142287407646, 9157517103892375316, -2279546874567670056], [8688463370597746726, -2002662962223775829, 6239012482881709688, -3962208737675842348, 1040085653091253873, 160007545999672675, -147908878724741744, -3852146874962875026, -73820228735968871, -3186335322523388395, -8439876795882259162, 8472847521680528396, -2050498805783169123, 2539227914852081601, -6537907949870319653, -4975019297671398135, 249517811315425727, 6373745689220213487], [8688461711175875059, -6054039388056530334, -7007564384517778719, 7174188425780113539, 1624887649570793362, -4735763418704625682, 5904092573387235489, 7203968945767730848, -5910799601333863305, -296209899404574476, -4413047094593259684], [8688465029998336745, -5168568917164330723, -6611980772355369530, -3702750770817043257, 7124479634935486377, -4245131752651871555, -865610960132411808, 5479151001913884437, -6254381340738814561, 7115979692206887343, 1492606860126423135, 6082348515476052476, 3115385436599771520, -8484026357526658595, 1418521528954791536, -1400247655826314832, -4705686436007245490, 1616880723830282177, -7249448867330856740, 2917539171657779668, 7891737683702567701, -6127662332695247285], [8688460051764644216, -1140017438251572315, -7987349717834693816, -5567381408511380091, 6991582868827157282, 1516395633788373653, -2372603106965200111, 8193162575739958374, 2208477479542931436, -5849059068744750199, -7531715953632530992, 1086540673588098623, -468170102023694038, -630519577109290242, -7626010903135777392, 3648662114944599671, 8016132842091557658, -2188937445913098460, -2097111501852746037], [8688466689420208412, 630923503498244229, -8798731538714178700, -3192639359049240035, -7383551928936851372, 9055793164997783271, 471187697552555594, 4891903992817662036, 7801122378466731584, -4073036213449188900, 8898512328146803430, -929968480702515611, -8736844946446910567, 1091609311825375192, 7422680631572176395, 1411738517352585255], [8688458392364054197, -6845211590593759593, -4425856831895967017, 6288087810192647645, 7011200508905853953, 8285595301055223046, -7251907155242706808, 4022790754000812488, 8612527431108768682, -8225663342392211777, -8533571470068452599, 5574076096131018562, -3368906031848477567, -7263480595909267078, 4822582540128030732, 5619775591781836316, -8385402467152381480], [8688463370597746726, -254530373268345922, -6498696668092044577, -7127492844958663732, -7478473704358125871, 5119715896670419786, 8028940919975053530, 5511427209636473709, 4714244114434091947, 1514531750186500876, 5840956414749540956, 7492595721947238320, -1820849568902911672, -2794605756052416641, -8856301830520023162, -5383711530297225380, -2263661979931731880, -944636225023170994], [8688445117074207453, 7965344034231636428, 6991602781772568222, 6829226756088657088, 4186992496820306392, -402710992073673766, 8218777833156717920, 5325924976617871002, 5978182882781918793, 1178999949483056783, 7539672590104476786, -7581416447428984557, -7419053697029599755, 3294882647984239250, -4837954716802276879, 1977107992697858310, 2150270405364974847, -7575737577383328113, 3861197702106155066, -2997258145820838714], [8688463370597746726, 3819662702417609641, 115418068526572369, -8507332705569427670, 4864892210978147011, 7683671352231958849, 7085269245957196504, 8316652704596225265, -9191246631193600830, 6779829362665511220, 3149655125221086106, -6754128159543618684, -5843507238253104693, -1039538985843946339, -2594259717928444470, -2904799768273452546, -3627905829349716100], [8688461711175875059, -6054044366274261627, 5220638608262859670, 4024643021734710188, 3301540279472927702, -9109283204953763913, 6011832383162051124, 6961501674533932261, -5198653430311939902, 5190555754531801746, -8661532514053498936, -4998944174538798210, -1915763047246750308, -6434353315587830867, -3128919513643252944, 2806081682888250301], [8688445117074207453, 7965342374809764761, 4335186390915480980, 4172808705828319621, 2282571107749435602, 1483504216039673213, -6425861669910065636, 4727214079499465842, 6161824551013129791, 3667785845243203908, -4572786351079114915, 6239001633632960869], [8688458392364054197, -6845214909410900867, 8198564895992000609, -1516620192718037784, -4822058972896308236, 8755901026740094313, -6386041049139357124, 7438103139688500953, -8213325181478558510, 4354769949966915382], [8688441798251745767, 7079880200989680601, 6897904788769233511, -3491299417835495196, -3842278617813085668, -7620611901700876431, 1114792831931259806, -2778063273328232461, -4144182490501019831, -7183229122559470179, -4763882660933793054, -4040763324565022550, -9117141387092519527, -1988748316721350547, -2296699589084272875, 8269097622412989979, -150391291177847581, -4341273991647342508, 42539032865907337, -1566015926743253839, 719823537002957200, -1361664092742111204, 7328369087964602183, -408134118047170290], [8688441798251745767, 7079881860411552268, 585692265416679061, 748048378157839461, 2885743730151121614, -1703996265795257502, -507994041611543824, -5097705827561678197, -7591767765094156294, 7150738312379922246, -3090310166603902498, 2871536707396582629, -5524478861026191012, -6409947672501839368], [8688443457652335786, -4941990752183596789, 3676280809732790001, -7809856836597700219, 6559273706178001776, -7018689612299483901, -7836095601112686384, -7112997837089916839, -337128922466403917, -6298987412337524327, 548339889009244439, -7395910895587920164, -4048032847241399248, 1028351852939001719, -9099400905908202583, 4270955148803806792, -2901100972134930998, -8101261540794750423], [8688466689420208412, 630921844076372562, -8966499928185407217, -819141004929169059, -2937220376276267032, -1267205464917410204, -1503668481178863368, -2436212501395198935, 1660998756677256829, -7842751573182163375, 1526878208150987946, 9037421646302253605, -1842299563754133867, -5531885511449649234, 57209334953346173, 219578722984353317, -6066995311210171021, 9074291728797570870, 2322996089300166669, 5141771911715555585, -3504895442194350520, -6934111750289872333], [8688461711175875059, -6054019475111119394, 3301536960655786428, 4736157388618213993, -5460124791001574217, 3741729963210104803, -6721569531025659943, 5470988060001231107, -861300404507945688, -5451002233985374591, -605378316532532602, -4779925357293960073, -7916958965655491941, -2826393793300245477], [8688445117074207453, 7965360628338624446, -488394655056386426, -3381262446285670107, 3394621403030939784, -1195133527608536301, 8385315802570403689, 4210775399448579178, -4333392577761995916, 4358949380598342826, 5480864614207174680, 4507125021164657729, 2972627182733543615], [8688456732942182530, 1422714234897347372, 1585076985272790320, 2048721760670453303, 605306586662273222, 3984822400964001676, 9009344782156502717, 6515284504019294227, 792662746794082000, -780552463624573932, 9047913410513026698, -4322442644198982677, -5045563639965682994, 7926011452215323236, 2567318947085004230, 1066467290195599525, -2637793937805085971, -9010499979608824821, 3297195642837160549, -1779162506763546930, -8758309876004530761, -5054063582712903470, -6423988722646113416, 1456974733670503158, 7742931898417044661], [8688455073544252717, -5379386806590907931, 4449097321078212590, -3005263285993301965, -2842893897962294821, -7033816424301329980, -1146046584424302855, -4471693323549559325, -4332774048918743474, 8638747942100215574, -7345581916483489305, -3625578666433564914, 6202880570075073580, -2591925917354068882, 4955471009164244376, -2216573495885236689, -4636525211080280748, 5308153733258015741, 8221246077519991810, 7173411196851759232, -7134290923011574982, 6262171878427717091, -5127048852187503709, 5814089164931897909, -7556263570960309986, -7718629640171515650, 5330236430605870350, -3855872982755389737, -7898606593259544897], [8688461711175875059, 3819661043001058386, -5895522386292428752, -6901543165291227504, -7063910893905683393, -3343901006218816248, 6484559889703713295, -288670464598128383, -8272126659939890330, -4966679582689504427, 7592297969938879690, 9171560448336100525, -6550711049509482172, -4975037551194937408, -4787184923518912949], [8688441798251745767, 7079880200989680601, 6897901469952092237, -2605835584620141429, -5498714991717400187, 8757126468555963914, -1219510067916919296, 2495570735299569081, 4992221450835414574, 7564052449253942909, 2265410096166037744, -7302826453215427014, -8837311016356694384, 2437350385834425954, -2332189741309046181, -111792793403207190], [8688465029998336745, 442922263919547667, 7218784540908778041, -2058991218080160612, 2809809450076034619, 2086696751362828311, -1825767037499994951, -6016692882680113238, 4485810362899658833, -2905898038817606299, -7495616462420644662, 7172795986825648064, -3028431871387468168, 2047949509975791525, 8779045487598325159, -8619862046021122212, 3842191953249729319, 462679457767802345, 9006860710289505831], [8688458392364054197, -6845219887644593396, -73193402836562214, 8545073180859433077, -958665533108070196, 2346763290597494786, 8687828247626224618, 1515795358450039042, 3978188001237865438, -685619072335324356, 8780919327659602376, 723391076446696398, -3837951468081631530, 2935270589161395727, -1107451405466803738, 6060143756813199870, 8374354121392448197, 6591826463688884845, -8549473851603383378], [8688458392364054197, -6939513177749909983, -8382938308230795534, -3924253659928878280, 7276372193446157191, 4782306937096537820, -2128286120190098428, 7375459231411687393, -2296684654393836112, -930578712508235280, 6429480307399148267, -3737499434533333926, 7463114802971066262, -6792710063216591469, 2787709397568173965, -6716025997582188034, 2343200729408729765, 808694593905500200, -774377126058643661, 8979983504007137932, 1659769996025624512], [8688441798251745767, 7079885179228693542, -5479090713999100556, 4024638043495697247, 9218167531267803356, -4963590257269101843, 8332678806865365502, -4226288789308934587, 8184519760403378411, -7394513478394441748, 5577033403782339121, -3561082490441475096, -7463811699340142280, -7552099075019319305, -6172275940275811591, -933513555008249265], [8688455073544252717, -5379383487773766657, 9178348569892364451, 5285479189369627500, -5989210422823057993, -4941360607443107004, 3601583587370809950, 1742351951111374077, 8914421347318676963, 3912110362444592724, 3749754249700772118, 7940665160177152612, -4541008138583626433, 6098852831747247679, 400787755519874507, 2610831726357291536, -544711295047456338, -5679434326116557480, 8937099210029526890, 8057016124722874605, -7893050682892419678], [8688441798251745767, 7079885179228693542, 6126345248063707364, -4587599394027567504, -1768830209249121342, -6358548632830878057, -6270251300684315974, -2079361962537975203, 5904094232809107156, 5741716547721945797, 4059046387541658054, -176746377678557891, -1959275694798672498, -1073813520978588338], [8688458392364054197, -1022895882427739799, 2208469182486777221, 1485371418464007676, -7423994397389235248, 2079737678941325271, 4507890502483390195, -6297113572260285874, 3943911674960986656, 2447994080775653248, 5679357486268298601], [8688461711175875059, -6054032750400966138, 1095175191847242723, -513402999505849225, 6709299955061663124, 3310178116570494724, 8499835305124963919, -3586237787361097507, 604054594264049927, -5357790620319883945, -9210219191833390335, 370215203639151656, -583306474004955455, 3982973452047245250, 8121998811789134840, 6417883634993977637, -6067003608261004824, -4128754237542417310, 5449061510548543965, -2521414763279080471], [8688443457652335786, -5567371452059956269, -8194942046893772119, 748071609899110027, -6196801092481546277, 2213883118612114945, 2697729215285238514, -2777456360352955096, 1564864048108073009, -1077366892340476207, -4781609866809641812, 9149474563894129964, -3525716058953571454, -1031669056106209708, -3090950267795816105, -5584982335928799234, 8351672939848495760, 6758846726998726735, -7983647734580774668, -6428943596627206409, 3151519008822958883, -3858180999353336859], [8688460051764644216, 6265246269163003324, 906573676956813610, 386597326877643952, -6460726655633362098, 315117367829668797, -431442125493189590, -593788281758984314, 7746011267364741775, -461526638624837533, -4539153444824592044], [8688460051764644216, -6359163842856989225, 5240247951272101096, 8545693369103275538, 1698377683643103291, 89774601113568080, 7050386006726322005, 5441829387700609574, 5205354755565860921, -6069323240732247435, 2523794683659786551, 1366992891986977688, -830731039702717347, 3631524335118433615, 1211570960498857683, -7480807504911219811, 4827531537519878586], [8688458392364054197, -6359165502273540480, -5311315686898909903, 1860712224043583144, 7802367733225351919, 7266634426385224955, 2939594551798733913, -7755364254338962852, -4125191676337691053, -8602256140385971776, -8607660120059885678, 103057442458952322, -4384821618576759165, -5993393172292908359, 6141603316797578677, -5043705627392167537], [8688460051764644216, -1140005822378276826, 7199790407928307989, 2934812419806495375, -4311340648179829709, -5034453346890375811, -3689155639271474166, -8278903932252725849, -4648731354246133638, -13306797360655179, 8929698562381393164, -6211596774677182530, 381816854301956669, -1243897457495332758, 2995293429571098053, 501244767328466700, 6215098329087619899, 2525022551498132635], [8688465029998336745, -5168565598347189449, -3634069419332626590, 536611959866728163, 1490151891034374547, -6015454165555775451, -6177823553586782595, 5440574076482584799, 8745397646637404289, 7022925119209947307, -6199278526692978967, 7665291536485595380, -7401923447653662686, 330871005749542975, 1675048870483610320, 7234828003893491730, 4490130874996830423, -1848328709926864407, -1961751469614835581, 6095766825143986369, 2391517213019256568, -2945233939672342413, 6299662017462472937, 7259217819513003117], [8688461711175875059, -6054022793928260668, -3144794451806485650, -9109881820870226857, 2697727555884648495, -7691463375432893674, 5333937647216621386, 6131130698870426970, 2455263603454690152, -5676338363043250906, 1495082634923964776, 1406815172174237455, -201759700380334661, -8082734772567586518, 2608373306722416146, 825845649021513000, -9002623543957170758], [8688465029998336745, -5168578873637036193, 2281934325379983681, -2794453693617558560, -3747960436549947260, 8412178074167655237, -4781609866809641812, 9149484520345553786, -2640250566295064372, 2801790141843001687, 3755290247141107839, 3843585919887079903, -672060447828853193, 6485806903862923649], [8688455073544252717, -5379383487773766657, 1792667654931278604, -7150337704810769739, 5126968825239808466, 2213886437429256219, 5729521259373710163, -6431252374294132794, -3051721625307287989, 1538000117115551854, -4218888009919154097, 222659751332640450, -5426460355933665329, -2607702787039155480, 1776153382182057519, -3266601730566282263, -5408107983556339727, 4836185968724433626, -4423390246949244382, 7884303716072209115, -6066998630027312295, -8486970258167767294, 4961045173076190516, 5940051749763244755, -3761417805489476775, 1639708989578060372, -2263028516382081439, -9036273805369039468, -5700760600257512071, -2158858803817788455], [8688466689420208412, 630913547020218347, 7406780802251121868, -8130724972863949260, 7821957163307803847, -4338207897989492138, -9002005015092636668, -6117311781646641600, -8834233306809587289, -6565382879277145911, -4842895417159252166, 3592338837297965563, 9121383531663867541, 503116947986493692, -6407484406356296771, -8617549949534394347, -4859419646357236867, 3198113583089361640, 6281307985671256286, -7974523518150683993, 5885100866431902126, -9182142327687639447, -848474073103570749, 6387172295944301595], [8688445117074207453, 7965347353048777702, -2748598948440426979, 5872896514426907461, 9177730041049112009, 8380543627050870621, -844764559418044056, 2141799565408663905, -2804321950767347918, 1522091097919736467, 474254557837612840, -5812329432808335320, 8670690467800058562, 5777834292444070370, -2840433950649854734, 5306928291423524698, -9025312255911449092, 2249369059203800538, 5958549415218120568, -1213491771014219223, 8139120764132859548, 2663953441996923563, -52371126660790025], [8688463370597746726, 442927242158560608, 4221277120145358771, -1077370211157617481, 6293495108683702821, 7627959965794294635, -7587445593580433449, -1226766315303449250, -6983634529414025909, 5575309835021663820, 6941432371011592464, 2422837124436819376, -8029646113400283763, -4325379907165905738, -6540374534830343318, 1929724705350170873, 2977564564257416392], [8688443457652335786, -5567369792638084602, -3559987406975476059, -3193267844365197947, -6330303112143281070, 8849584085052992261, 322395187559539504, -1759089123368387626, -637180527415119968, 3553741998945196839, -7419066972319446499, -7330766321337121700, -7681758796604558916, 4478411242910468362, -370766806954619317, -7199123207043567155, 5846499049840120461, 1655593117586791672, -7643158639434648918, 2746038929535797241, -5798134025929752030], [8688443457652335786, -5567368133221533347, 2469922289666173293, -7919285235776978336, -8155734976727303108, -5246504975191637041, -790280274215460904, 6398134738199216968, 153993334541320752, 4344900926195239560, -7815882663953289485, -8538995362666495793, -1088483823066027174, -4792720159887609201, 7820108214412329069, 4892358843336799672, -8153278348237324707, 8738758268677575522, 7690921728608752925, 3213867221011896024, 7032021125665074887, -8299609119780984339, -5805547182264467478, 4597864047116081862], [8688441798251745767, 880339890696801622, 5749114008294585013, 8567903105999820673, -375112210209612728, 8169103889942618049, -3501812754408230484, 2822144292193828260, 1452179326388417876, -8376301482466221577, 7650482578973510323, 8589353867475589538, 4073702521539264943, -1888152649514714193, 7911939004988669111, 3182831389814234558, 8185142374709600445, -4786417782778308816, 3757768447977087199], [8688443457652335786, -5567379749110790072, -903572675534940072, 1516408909078220397, -4613859730869933186, -7284458253337038622, 852087732353640439, 4556343982117973200, 3434438704981846816, -2040771761819489027, -3649335018500765654, 8436719820477717735, -181551741433348643, -3759548811928225941, 2350468724410201972], [8688466689420208412, 630926822312725297, 5146571530612107138, -4681899321767166639, -7309466597783841215, 3631683035208855892, 6031433429112478129, -6940141663065867895, 7445982894157296290, -2457821962956069665, -3275214676479425404, 8810840162480436543, 5485196742172321347, -8501623966126936464, 2752837774189313307, 2444904755355250664, 585683075565860055, -6261644225780908711, 3390288382265807914, -8896107390411555348], [8688441798251745767, 7079886838645244797, 4938368969765930608, -7620610242279004764, -3768199924294358059, 4274051111879773572, -3783465523462497123, -8859850223642898090, -3373850051022594128, 1053035705216537240, -7856306878855532028, -4550874736311544124, 8523159906677971237, 6914563461780058368, -6153910292590017803, -7762466911615730234, 6242712806713757169], [8688461711175875059, -6054034409822837805, 7802997877944560056, 7714700545795337767, -4519546527843147513, 2652516230729872825, 8748505225586666558, -4307782298584249311, -1859424834914999849, 424087597635425120, 9155651560865970666, 3725827581675174024, 3076810170587683343, 5895600927714790670, -5777914451114790935], [8688466689420208412, 630915206442090014, -7384175436019116755, -8921898834839011422, -1750456264509833545, 5025401034243044094, -6460733293288926294, -6828819510882561827, 2751594971641909018, -7002778933687117259, 4596642816912018326, 2722147240885033408, -7856328451201532987, -7104808344616191463, -416154953979049567, -8148941110312799983, 4748512143660136926, 9074908598240233293, -5343130406446797343, 5370814235641817319, 1666562964095215851], [8688466689420208412, 630915206442090014, -7384170457801385462, 3890529110858685089, -1185868864611562622, 7432407675535856491, -7161911145477330009, 2666559706901943768, 6931552629730154381, 7979405763927246644, -963607892886917150], [8688460051764644216, -1140004162961725571, 5635839860482683882, -6430638823689893293, -5707522806140924269, -2003278172247226791, -9175340930820247129, 3309561247122511889, 6614381498460190105, -1454594813284476666, -4421524703925499938, -230622090510594071, -805562467490587986], [8688445117074207453, 7965339055992623487, 6012429339659302607, -3491316011963764862, -4633457458005879123, 6115234954985739975, -5159459635440638047, -5882564037097690140, 964773220703162654, -5395906057573821545, 1776163338654762989, 8660840464176468683, -8832401844813105114, -140016741744803218, 5126954657173918373], [8688458392364054197, -6939518155983602512, 8782766617151826929, -5145514888494958, 4863668428581488871, -5451495250976122646, 1320519617982554901, 2478409723729472253, -3370151386604437696, 2665794093841564538, -7723423388058331325, -531162627011030439, 814125124161767796, 651750757889087505, -6779161395172184952, 6192408718769808337, 3885712897839184282, 7877057425161044837], [8688466689420208412, 630925162898834248, -3559977450524052237, -2660323188639865855, 1604678031244498973, 6546935545264348509, -7310098401916940401, 2666558047501353749, 5160595093854728377, -4417207378925104506, -7878994698039087425, -6533716903341654866, 4755298474095445717, -1292512824290512138, -640261555784688749, -6002783215419361103, 431961481086503961, 3944522673372631553], [8688463370597746726, 1860118586358152523, 7218799475620496452, 2629061139090668591, -5841053035780282363, 8340718028046469580, -1898638542710430996, -1101445491056625412, 4165550799025238412, -2121034851042581415, 6084672359556440946, 1701922757948836945, -3300383248712836413, 8967183723177136069, 1769975624138577348, 5441040542877678130, -7001405772789842406, 2845283774794424723], [8688456732942182530, 1422712575475475705, 699601536162859416, -1117194150745467267, 3073123122045482606, 5567163487234619950, 6030801624979378943, -4737633939946101419, -4763867726227395055, 7721012879374683416, -336502096545715612, -8657960889168071794, 4939580243497288674, 2932184582560794623, 1323603072371939959, 1411892107462347827, 5161214389322527489, -3110545568906625353], [8688466689420208412, 630930141132526777, -977636434347269682, 1516398952605514927, -5330930008139183652, -5245878149289570178, 5804233416447408625, -2081214230274533109, 8780901074146703927, 5668400915049721166, 7202890456422020859, -3186341960178952591, 6183282842936467437, -7747813203656561064, -8058349935181767660, -7734388256333062975, -4685465201786373964, -2891842946780220485, 3070012224279079063, -3777320055304042438, -5784707419184382274, 5469751002317386429, -1229395680229374905], [8688466689420208412, 630928481731936758, 6220031625191086380, -160242061402042276, -7384163820145821266, 2119576553222272026, -2956801509307885157, 5026626476058913695, -5632827243171553619, -5246498337554694287, 1040087312513125540, 441686865633632802, 6445986283092215137, -4322452600650406499, -5595474100163514181, -1832423009569471942, -4725275866087037212, -3116712609427042233, -847865500711742129, 125892345854314095, 5202278705435305081, -7418444358037166319], [8688461711175875059, -8804762344287499259, 8594161783444256542, 6586757825435647040, -4613843136757624756, -7432630575070251015, 6971374909901452912, -4628040203063400125, 4314971794336872620, 2307567836322942706, -997875922091680481, 238413389255174834, -2844747825091462128, 3353547130464078164], [8688460051764644216, -6359163842856989225, 5240254588927665292, -4588209625819986143, -7176576469325755904, -6712923396871938706, 2018617334598714832, 7095008672413398347, -8458855994177612863, 8379294953475109012, 9176474729839067852, -4073037872871060567, 117871378204729908, 4444291064526096841, -1916376597877591869, -6620005951619419988, -848474073103570749, 7209050859310815397, 1644479505694343215, -944636225023170994], [8688463370597746726, -254548626797205607, 7802996218543970037, 1915218081586846843, -6384177165537484347, -7918660069278161698, 1510993313515049770, -3742563094531597554, -997875922091680481, 3764564866610786988, 6554944897024675971, -8335723545707249286, -3131364526243974620, 8305679539267999606], [8688458392364054197, -6845203293537605378, -3539759535125642397, 6005159816982925909, 9028314023979150948, -5762384312535939, 717340357927964899, 7078004701514512335, 8423285815029086168, 4248745411923222893, -975804972356107919, -3469865250472034761, 4633370793445182980, 7938804595384440491, 5518847901950383491, -8338174429336328282, -5106827617950670947], [8688443457652335786, 880331593640647407, -2823904743194235650, 8450776571942295628, 1455268651808820460, -6149566417009928883, -6816486328207921501, 1241026988317207920, -6890566681127239129, -3157141802589579365, 695278471873093222, 2274524356142044391, 4746649919474815404, -1614014424111732032, -7575857979279114649, 4983107957475973979, 7402446122064118331, 555120480139221232, -5805540544608903282, -5720966899782626422], [8688445117074207453, 7965337396576072232, 5240879755423821724, -3702145517266297765, 8707434271818324770, -2567862253323036028, -2918848090958850902, -4926238773674953454, -7420294073557187767, -1589939144212724101, 23569791048579518, -3040000333820335909, -5710622088031372117, 1065225254254120464, -615719809471966045, -8047395784435419713], [8688463370597746726, 3819659383600468367, 416701752949382423, -3774235708104031353, 6689075402005028882, 5472251668288711127, -3462592408978516789, 6365886740472872439, 2453401379266708424, 4947463316799186521, 4224360574537404035, -5907247889393847103, 2739419464521379414, 1337034657335041008], [8688445117074207453, 7965342374809764761, -4841028214718956467, -4752764070786370420, -3916980818414078660, -1422917221481010544, 3904101010662983614, 3741726644390303323, -4333412490707406856, 4084817792848264655, -5327863147856786612, -1062842015048292492, -4220735299414038856, 1820157519025881419, -1505519089493549607, -7051566095336465930, 3115387096016322775, -408134118047170290], [8688463370597746726, 442927242158560608, 6655420923412485670, 8264028984181033822, -5856328591421126897, 504350686855857302, -7553174245537247196, -6830073162697336377, -1408740068128626733, 8128653124439400370, -5654268940987903247, -7262877001756451399, -2849695163088040375], [8688455073544252717, -5379373531301061187, 1396467173326206992, -8804750728414203770, -3935974951418490566, 4682303248150800214, -2541621829407459844, 763805334897515119, 1717351903702104257, -7018077721090514007, 302165656287834175, 3097484727647467602, 98900476968190628, -874844094310679058, 3451542403799372045, 2728442980352070627, -7100039487895178227, 5681215630586121028, 8590432356831940351, 4207704327551715867, 5161207751688244941, 3172337966165628562], [8688460051764644216, -1140015778850982296, 2564235492695619172, 5473475450685369267, -3728364368833212784, 8357703745416495907, 3281312407601812392, -7826225684546345771, -9041838911153191924, -3154052477169176781, -8230438836750167767, -7943353878025742483, -1656758271506498834, 3419603196911349919, -4388507007705068853, -7104831576362782441, 3446623275780417099, -3400727257310282439, 1823841380476626410], [8688458392364054197, -6939508199510897042, 793296210343732441, 7753894340650678386, 3280697197575701224, 4625966695216979568, 8330231242053427780, -2812823552896536971, -5141714176014647956, 6944352278818509480, 7783989576874258057, -1957440913990369461], [8688443457652335786, -5567364814404392073, 8292247954304898557, 2330397761487272156, -562476667397575721, -5638863026978566707, -4559368808030407280, -1799536570038502795, 3749757568523233804, 5284247109895533497, 6406168981138647899, 3310632967089632360, -1899877259818807547, -4983040133581995764, -5334016014742444962, 4169722699225058311, -8801827501790145480, -6994759757174449443, -1519549290373113600, 4368193998945501685, 2585689572983208899, 6938956596216711029], [8688461711175875059, -6054044366274261627, 1585062050582353557, -2605847200488116506, 8520685024656472945, 6380545426671054550, -3655524392417541314, 9093144648613213308, 2171718740815607023, 3590003509069967132, 6009956883665601210, 5847607408580005006, -1830729310184349755, 3644494431906832832, -4664627098130820633, 8419585359471353159, -198686202442373425], [8688460051764644216, -1140014119434431041, -6799962098985994946, 6171569848505669572, 7614369812487738485, 6796973780125959824, -8740540292045265519, 918285011992341868, 2600958490989770885, 180996819322021356, -6991072576906563178, 8150719095957241639, 2490756181693959323, -6127520358453459790, 6562360479405809756, -3266108713572874002, -5760175629344365040, -1643356687668578281, -3251923263164335976], [8688460051764644216, -1140002503561135552, -9155096464842143801, -1023496157742132556, 8406167181523784382, -8976991692412141546, 7197956393723269974, -5467390994858149435, 4559890715840258109, -8485743156932686232, 7033276436880439456, -8845340281062432786, -5684836646376580333, 2446766979540572186, 883886624397804883, -8619860386625852605, 1769357095274043258, -2405170032541973273, -6992301337544894465, 9034474426844003632, -3376320847597084064, -6149733414151184963, 7220634256428799489], [8688443457652335786, -4941975817471878378, -2032747475347443154, 5229144295852358109, 1340125642171994847, -8375046171248196802, -7911414671140380563, -3532504180509835380, -6931637634895580917, -2552720506609471538, 1773687563843920318, -6283847325021889650, -7966515825785626138, 3573477620431489322, -3598586797544781241, -8704437482010917503], [8688455073544252717, -5379375190717612442, -4915737052975513655, -1211499056718758931, 6427620635427702997, 6891268729626546018, 2677529553410367947, 2972160584583502490, -2503033288113505541, -2340658921840825250, 8913791202604789238, -2685627229174544867, 6109189214706021417, 3615165443642493533, -5313799758763246583, 2743735130099903179, -3468785101715093929, 6285615354198946248, 147188750595773718, 3689090547035497334], [8688463370597746726, -254555264431488155, -6216400479015422027, 3421455464623965971, -5444844257140338184, -8263608463687752023, -4747978619979650814, 5700680441589451712, -4877778656390126665, -6768039486207621044, 8498601566255600309, -6243881279455926017, 1997772593300898335, 9169845308346624143, 7578239559081692396, 9186845960428368881, 7404293411566983708, 1929126089433707929, 4377473596627591715, 1146095256444509599, -1291762277662216435, 3034667365137176380, 9030155442440357975, 7259217819513003117], [8688458392364054197, -6939509858932768709, -7101875928125352931, 7079885179228693542, 4186994156236857647, -1910207005143298737, -2468151708280560855, 9131260085867150908, -5124589671478328644, 3419601537494798664, -19934559452508869, 877247246456597558, 2926767327597033977, 8401969497363497253, -6739932752665035394, -5131366177187899141, -8436806616785381054, 8739861517458082010, -4732703957133471071, 7338240532189886051], [8688455073544252717, -5379373531301061187, 1396453898036360248, 3005056980565895459, 5918144346610140235, 1727221820271105076, -1091568936856002251, 3498172718490966884, -9134883527677426490, -8411787423071208200, 7975680417193070372, -6280154405448671387, 3300316497054987914, -3563548308784932709, -6456409462374613430, -4410436875993518711, 1298437818982272284, -4176744437838780052, 5651716458062467843, 4454012237458759411], [8688445117074207453, 7965358968916752779, -6290472534899867088, 6681066050226079978, 1135002450273515431, 4839257040637258173, -4618792134173414464, -7511638353056697186, 8297803864672023776, -8146007166160357990, 1429511420128991771, -1064568770913724569, -8009428198004534129, 8754652353161672498, -4823297690004684787, -3775444555807592524, -866217873107689173, -2648750509044945054, -2811111600003836747], [8688443457652335786, -5567373111455225876, 2772449669409770779, 7338722957827688936, 3147803750300474639, 6852058340664217381, 926181360562804811, 6193159397121129362, 436291183031834351, 2855626028784215987, -8815255767938765461, -1102669273474565200, 8725808216554952361, -1345756732970827690, 2284412526215963041, -1980600309536376864, 4014920956004722621, -8956654136173623403, 1739396302876604773, -6948775414721746973], [8688461711175875059, -6054019475111119394, 5937732117294662350, -5661681336266940462, 7011202168327725620, -6109744136838630352, 3542142007696282875, 3630442658683928086, -8265327054214734795, -4026112935422994654, -7172862870203861679, -8781455996260691420, 796356432991846933, -1697683932199950617, -7312547626148089584, -3015460246902882812, 215879926827210327], [8688465029998336745, -5168568917164330723, -6611984091172510804, -1117195810162018522, 5656044500591246978, 5815956367356232372, 2902865682473564674, -9127021260112944168, -7267786305020405785, -1792600729384872381, -1505534024183986370, 4516372958312996626, -6314418217507342894, -8303297959465421859], [8688458392364054197, -1022882607137893055, -3841670045442538696, 6547537480000612933, -7403776481990825408, -4455331113235196321, -677009445241982695, -4888277058272425190, 5880155187835913898, 6803594011764924321], [8688463370597746726, -254546967375333940, 1283184728479433294, 277157311825070346, -5198043198503560027, -4150209977251878704, -3501197544382119316, 5043015236931688539, -7191255068448067307, 7014748902028728881, 6291644500371676788, 8785704778487603630, 7919358798960327313, 140554350869637480, -7916977219179031214, 2784015579647383710, -3251923263164335976], [8688443457652335786, -5567364814404392073, 8292237997832193087, -9180739932255148090, 2093961295802852274, -576673733695370472, -33387716756290465, 1014470395674494327, 8599100824384680574, 3123882060511229280, -8953688531487430277, -3516596820735891660, 2695886904045327932], [8688443457652335786, -5567381408511380091, 8762535426460910139, -4283090149237258545, 6843427141200932907, 8505867770112175527, -3580187068866307862, 1422095706032813282, 8668248774019138366, 4667636264885823064, 3483975652187851721, 8073709010478666641, -9027775522062312101, -8428314971110276029, 4719800024822498814], [8688458392364054197, -6359160524039847951, 6239015801698850962, 7682432635128902710, 7520078181804293565, -6336949127742712797, -5179070637863770522, 3513301189914684630, 8216938840731288406, -4267974953103387543, 2735720800105883188, 1725849294235448481, -7140467021635843692, 7131733330132081933, -487785316061292784, 2790799489591841571], [8688456732942182530, -2025487909143771926, 5334547879025001261, 8153350252020083665, -3728364368833212784, 8357697107782213359, 2509137656862194459, -9165593207307891071, 4942052699490990071, -7144013755360788807, -8800597081737923144, 6827381126007663378, -4086594837960980475, 1977713246251264008, 4397688193208860281, -5991542563972901708, 7033894965723691898, -8960958185884172091], [8688463370597746726, -254555264431488155, 2658537079830487914, -5473074843137498408, -5613212921925959458, -8506090669627948609, -374477087238090620, 2087910577308062629, 5031410267473023900, -3248360701959609719, -429581560705797881, 4609607803741039486, -717435319566096905, -6313661033223482995, 5188233569846682883, -3430037992067043701, 5262320560421564707, -2129379544239546210, 9145316705582101419, -1258104480249871743], [8688463370597746726, 442935539209394411, 1490775398119300136, 3984824060359271283, 5032670556922080998, 5755771639759331611, -92792789370437964, 3286724684326560097, -6217017348458084450, -2912197097123066440, 3226219550028682268, 8302595953136967784, -241601893491723720, 1367007826693375687, -1958665463011574271, 8017987667589578605, -1207320518879336072, -4354090366605614037, -604774722379716923, 5681815905900513785, -8499920310290390455, 245362505222593846, -2317507823345651650, 987919340959323313, -4216419765555880207, -3767453589296489863, 6473606505560630370], [8688461711175875059, -6054032750400966138, 6032048639138589297, 1029739313659774665, 5408638188419684565, -8522461176993145416, 981272558740665328, 670752421322446750, -863753714167481785, -4243264550227537092, -6458252540239070682, -496413963310701006, -6592384704638635054, -4320588717064494958, -6954307200550276629, 3725834219330738220, -2161943917623724768, 4286857530341397777, 5969509436995486041, -7238472251446503249], [8688445117074207453, 7965344034231636428, 6991597803533555281, 4610203100821739714, 5976322318015808732, -1195745418796224547, -1221970908021363968, 4665793953643252276, -7291729435414005339, -4472946975345712433, -8103111256314771871, 3700055415310228984, -9157587174343423235, 3144254464385595126, -4101893625367037429, -4409806731255689132, -2010076250276196187, 4019226533395496212], [8688463370597746726, -2002661302801904162, -73211656344140251, -1681769934791724349, 3676884403890926092, 5345653960485842173, -3181546552878245867, 5761455488025379554, 5410492882176058748, 5322212144115203035, 3713632293348220038, 894841536221112711, 909041921341369148, -101914579780712362, 5785845303644890941, -9184467699464214056, -2412442874056772893, 2846520832502211255], [8688458392364054197, -6939524793617885060, 6823202588168240519, -5262868844919891094, 1584468412899583142, 6586767781908352510, 4314970134915000953, -3491931221989876030, 9197959572320817338, 2025875241401796041, -6840414523889802644, -9221787654260937664, 702683331151654455, -461384532638743068, 8458789242538385806, -3140612595133960281, -2187099214546007385, 2768868854697466485, -6456427715882191467, 7799413744391172634, 7448451138541851828, -8001400724433051892], [8688461711175875059, -6054041047457120353, -4237238722893229474, -7941501610313126431, 116018343846285538, 1650531116986457857, 5166159301293969047, 2008909436955899006, 8118925313872455252, -7418587098898180072, -1132614999461201806, -645823342730418283, 6130047231293684658, 2863190354777746167, 7054101265248806249, -8831296804895682255, 665964418299190686, 7439204729052456186, 5329602967053559703, 9033857557414642239, -3479728529382811178, 6828750968103758193], [8688465029998336745, -5168562279530048175, -3559974131685629315, -7087677202426968161, -1937207171085576419, -2817268684072829805, 6347992669173472511, -7772349971735591239, 7271434811906323178, 2836176152471322066, -4335888265502288291, -2130150003797291617], [8688465029998336745, -5168580533053587448, 5052268284055366729, -6148329359323423999, 4844050788502792200, -1587468347635573959, -3372624609209384733, -4981192844108392653, -602288991112130018, -2943232928320727906, -3105590700483759973, 4877840603700180153, 281959356762719824, -5193244472404333471, -1859426494331551104, 560543474389692434, 4264811340045942126, -6375064564996650397, 8692157056776890217, -5976255392466742303, -5204227594199944188, -1662325797762880778], [8688445117074207453, 7965340715393213506, 4335178093859326765, -8804143815444246817, 1812281976171552353, -2230483163145988824, 678771729558139888, -9149715716930782113, 2133135177731403395, 4877845581939193094, 4715481172141878479, 5213392317327753538, 999649822294434193, -2082449628557787768, -5239719405825307513, -8555506316593255192, 7328370747365192202, 6348588732881379615], [8688461711175875059, 4305707131337238735, -5198029923213713283, -4903397232645309133, -786593225673260167, -6674358087316594763, 6518847831853887566, 1442914663391444197, 7310620309726791230, 1889283896319658664, 8175251017538905637, 8189449743237290407, 5416038836086439733, -8150811631551615514, -9198644852821918279], [8688461711175875059, -6054044366274261627, 1585067028800084850, 2308184705768265335, -5498690100554257954, 1273309833695361388, -9115919264093791200, 6437955358969925480, -4140468891373805194, 5363268163177146824, 4566083408574175043, -796458163984626603, -4101891965945165762, 6725345077462928068, -2291740635219719551, 1412500679856836653, -6417834196343903811, -1179081767551707161], [8688456732942182530, 7245048196586906439, -4989213811760637046, -4816023189089295148, -2071321081958941312, -6586987362599003700, 4433793555457084549, -608926709652747324, 7598470749769948980, -2703239772465259499, -5892427316013786969, -9197886009137468361, 379951311278212225], [8688441798251745767, 7079891816862976090, -7196190790571350065, 2558216302995594102, 3147825322646475598, -4024242414165557681, 2114180870620473575, 7589363127441525911, 8426373481048898733, -2268577028059245877, -6533569950866174842, -1817775939244585320, -8569059962868694032, 1230996844001501775, 8006864099208463442, -8860627452576572809, -2574043461930624649, 3698181575251611973, 8930919792585456700], [8688458392364054197, -1022879288320751781, -2466307737616118400, 8662206352556561082, -1052977076736926056, 5794341927556348701, -7325357363448136711, 6930460865083956824, -3105608954007299246, -5998463469946736183, -2294205560765852167, -9141539499749563687, -1038301796418454897, 3551406670695916760, 2429496415320777435, 3403254261889493865, 2736316097186583416, 1850853923366499256], [8688460051764644216, -1140017438251572315, -7987341420783860013, -1211504034952451460, 1697747538931875772, 6891270389043097273, 8573930592755999958, -1141264452432064317, 4091480402557344606, 1420853670107295457, -3655539327129259725, 6098857809986260620, 7855616620142020206, 5519606745634833409, 3446624935202288766, 2398766822771503974, -6501777696456292946, -1425417887454995448, -5457648249579485906, -3037688237328287632, -3563700239494105262, 5940063365657821892, 6028327509585087527], [8688445117074207453, 7965342374809764761, -903554422011400799, -2512152526304583275, 3583834809125018379, -5034443390422990753, -3499942233172075159, 6328533597440891147, -5785933627627458751, 8073690756955127368, 4180842948773070964, -3876688621275597730, 6808542242553507153, 2896088410160729155, -8452694830235800298], [8688465029998336745, -5168562279530048175, -3351773230256004040, -6618621809715788316, 1792050785483295769, -3570485808857774584, -5916362149351232308, 1499874723388908784, -772536474211342480, 761958045402630360, 8819471361919779163, 8096383554372375294, -3201129345326415247, 2863196992412028715, 4332078811966218711, -4432651591110455345, -5155757652186718899, -7952322078326254309, -2311953572379116450, -703398612769955274, -1278324055064832838], [8688445117074207453, 7965339055992623487, 5220645245897142218, 2253700420565682183, -4593635177834580592, 8826120696339012370, -6420917650735949075, -3360901658300560986, 4055353467963119379, -8109280849027783355, -8832401844813105114, -140036654690214158, 3786480566814725311, 6605256389230114227, -2337730716983074431, 1532459135885956197], [8688455073544252717, -5379381828373176638, -2956201233966890340, 8318508291144604033, -9174707467265276276, 9109658921357113981, 8460651466729027740, 8076024425787856192, -6666471695213516878, -2630531052784273469, 8008112772784225051, -6752899398915928221, -956832411716318414, -8202967226157822577, -145455569054564823, -868561630136148789, -7289256212811718508, 8668843178323795245], [8688455073544252717, -5379375190717612442, 95820341393286638, -952032792803805625, -2842300260279524406, -9202964603842129988, 3885111855894924443, -8076248984717520323, 55382851174595291, -4135547972220594083, -830724402068434799, 2078515555947917356, 2286256496877745290, -4885806261695275048, 8711759762149188889, 6217707781089416262, -4487135744592673381, -3439290907449075127, 751003133597943974, 588632086147725369, 5178357147387706486, -8360392463289027632, -4582039266482427989, -9009416512032082509], [8688458392364054197, -4399614748577140608, 1886360669695600374, 6702672192969809434, 3789558276345871170, 7980495737417906388, 1736332761411349007, -2850778630664782687, 454021707746106031, -2851407115980740599, -4294817311757888357, 8190071590897684123, 1018012151144465265, 7759591464219874103, -8782218158762282612, 1606982729025304821, -6273977408476830685], [8688465029998336745, -5168558960712906901, 4335164818569480021, -1774832804818216540, 1456495753025280080, 5647421598200077955, -240359857550244659, 2548809665762153340, 4338873439457681717, -6751678935315129707, -4081055521703503480], [8688458392364054197, -6939521474800743786, -4593635177834580592, -1288188100584194689, -8135525358387707689, 3537994998656945003, 1456507368911876599, 8232363008245542777, 1871690367608161538, -7314404111044040344, -6569080016012417234, 6262785429058558652, -6560595769048554638, -3904176059350384268], [8688458392364054197, -6939518155983602512, 8782750023044838911, -8616135938233927913, 4147191788995008820, -6110387556845025027, 5391507046225140851, -3226781109795573751, -8024702094242128438, -1064070775705245221, 1660385206051735680, -2303332329409819094, -5027806564669057620, 7381751652069563956, 6239620162476213311], [8688443457652335786, -5567371452059956269, -8194942046893772119, 748064972264827479, 4053498774209405402, 9055791505581232016, 75579194232324584, 5151983807336854843, 6090841820549087314, 7023538669840788868, 8671333887825074679, -610170404997476610, 3580748802527077481, -7693949106716441815, -7856308538277403695, 8096371938499079805, 8651727863635634733, -4097563025076795253, 8221252715175556006, 4257543476764835035, 789593334316430150, -2179078378632749550], [8688445117074207453, 7965339055992623487, 6012450912005303566, -8107885091250856194, 2394591603749222389, -8954165086088895224, 3205996656391259487, -4245745303277392704, 6806701590714186590, -1250839935807187574, 5995283262782302748, -5242049887563920385, 571646237036052278, 6348588732881379615], [8688458392364054197, -6359160524039847951, 6239029076988697706, -121660157739710315, -1730231711474480951, -7692080244878216303, -5406239121712793803, 5159524901567832809, -6801824323171316468, 949962603795807990, 1413609038594060992, -5758465335852254835, 8799271700052889214, -4778683321368442248, -1074435368660263702, 2156919739781547848, -9043691178887089624, 6287942385397392524, 2097038112560614990, -5827609966669571353, 533044420444270613, -3657868149443340724, 6215085053797773155, -5228001433155496707, 4423917899601373174], [8688461711175875059, -6054044366274261627, 4335169796787211314, 4024643021734710188, 1604681350061640247, -5097720762246794548, 3711155751926131727, 6529946509055899260, 8949924774830636807, -5277529190513342812, 5185768644300550267, -1292365740094666998, -4996621989858999759], [8688461711175875059, -6054032750400966138, 6032033704432191298, -1587471666452715233, 8875824508965908239, 8152716788470433224, 8064431072197166630, 1703773366266183390, -5954947371836025955, -1306414194500430470, 9008721275058276098, 5082197415935015317, 563610466416396444, -1776231881433566623, -3384800116332574543, 3787231113427059778, 2417300995273458333, 7007017759436003587, -5403787471459168137], [8688456732942182530, 1422705937841193157, -3727739202331735940, -3004656373018024600, -7853832763461240612, -4715427521882658794, -3254998420502887231, -2028573915725751588, -8703195446085399678, -7921306160052722135, 7199796152770585952], [8688455073544252717, -5379380168956625383, 3356012948802215365, -6147709171058299890, 8520668430549484927, 8608975719168752480, 2959827401908862164, -6900941230554963080, -959274105499898816, -7542197761394540469, -1992938470450030131, -3763876093380045195], [8688443457652335786, -5567376430293648798, 1792662676692265663, 5496920585875809885, -6028425790040360807, -8522447901705958878, 5749754109483838414, -5701506935255380267, -226306424926749894, 3482893844032981076, 5882627643829615295, -4152065563802917678, -2087866883521548414, -516014242641901753, 7615615933854944254, 8338698763171315800, -5068860924330411390, 2663933529072794271, 8085268283063375582], [8688443457652335786, -5567376430293648798, -977659666109821896, -4361021229022891716, 5842808682459496802, -1329250757296382262, -449179287839083612, 7283620143781853342, 3092705914472370338, 1085330166460005579, -6722818204604081758, -5999698868232651048, -6796893579287046651, -6133817757321087028, -5253762881992058044, -437476249880991217, 4504781264138858319, -1629782996724703179, 1393362913215367645, 84819732690702700, 5433789273724840705], [8688463370597746726, -254550286213756862, -8081041073182464331, -1720370091961634347, -7269647636429683958, 8701413422717709681, 8103029569966486609, 2141169420676154738, 9062573756127760064, -8038882566416973935, 7295338116451664148, 103055783058362303, -3939694421552780875, -8204669090857452215, 3881415617504564906, -486073363171252766, -6744875112422600700, 7051625490437963578], [8688463370597746726, -254548626797205607, -2748612223730273723, 1029734335426082136, -7175959599880433275, -7181355282500853168, 4073096501363972781, 3067077381765764048, 7257993270470516659, -1360276632021338258, 4017988709063163010, 5250738822704170634, -4874061738445770754, -4150957336788718661, -3128916194826111670, 7655274667438454331, 8629025876370228007, -764515638282123409], [8688441798251745767, 7079891816862976090, -7196194109388491339, 1672734216232759208, -6271519887189527287, -6994620970029438106, 7801729291436688537, 2503115148345028115, -5916367127590245249, -515248629581522523, -603531027037647843, -5679904111350073733, -7780989468228427868, 5967044379728988309, 6183287821154198730, 6082345196637629554, -2613867401518474435, -1566015926743253839, 3806710098086430640, 264808301646707024], [8688443457652335786, -5567371452059956269, -6216385544324985264, 2253688804676425458, 5897913155921883651, -3813437800028827217, 6293495108683702821, 1805630982338428097, 7841566506314385067, -8336318842787949514, 811648582739679485, 6191322064114911309, 6409865986158874518, -5813554874629525333, -392238374146522059, -6354088566964148460, 4920587769933369877, -7828696481123495913, 2343200729408729765, 2531048378853721901, -1733961138078816524, -125371330841788263, -5692273034452566347, -2799393627355307589, 6704351724273080292], [8688456732942182530, 1422725850765322449, 8198566555413872276, -2002666281035596691, 416695115293818227, -5545163374579962389, -9175332633764092914, -2889370490799820118, 436289523615283096, 7698181294809763947, 267284076457549695, -6924991619296149190, 4674406899556395417, 4688615581727485657, -7367036889589685677, -1966543558079779589, -5744898414286969251, -7575727620910622643, 1551424932697403179, -3524968064517870355, -4646883298126702209, -2528817202085412216, 3757768447977087199], [8688458392364054197, -4399609770346108285, -6008206215220079300, 7848831050778350884, 7332693811676240044, -2495777040724315381, -5801212502085444559, 3459433774154763901, 9082794990343311178, 4500625958046026438, 3452787758539370938, 4249975831975445229, -7876529772492954809, 8150242673076141808, -6689172023062372349, 5425283586135342266, 2071264286773798283, 1348156566299604916, 6790182339731272976, 4482721037479256249], [8688463370597746726, -254545307980064333, -7101889203415199675, -741193331031227458, 2584456726911170286, -7620616879934568960, 2207867247747852591, 7683051163972155152, 7668867372980168381, -6188168233620331990, 6501712604220316114, -5983186254902641424, 8861159185117482344, -3623726398718288656, 3523191019405154535, -3250054269603085142, -1670813363567826502, 5176508959542589529, -6098174014989211356, 749140011046429018, 7847122416702791934], [8688458392364054197, -2982418426141195958, -3882097579188524573, 7589361468024974656, 2435037390997465891, 1711926351687509808, 341984617641991432, 2722137284412327938, 3171126692434270496, -2191411561307389876, -8515210800616351340, -3438827759855161834, -8984881403353642353, 7976299712658209278], [8688441798251745767, 7079876882172539327, -5726515279718144096, -6774338544518401597, 4052881904782704215, 1163252949194804947, 8158730999931445353, -5772346793119422433, -7913876277869371905, 7940665160177152612, 1167416552343791043, 6773510391430601375, -6198029853111896946, -1143110082510397821, 4332072174310654515, 141177857946582451, 5291646229890044380, -2765895296631329784, 433800473530554917, -3993543583805123567], [8688441798251745767, 7079873563355398053, -6987958360328338773, 4611451774397501323, -9080405880130407534, -2119794474517653609, -260584410606878901, 5214619418562834600, 5804226778813126077, 441698481522889527, -3085991313928602575, 8042504522723197840, 870448401784460050, -1211014336802786533, 796376345915976225, -3468611598657260211, 648202364766212577], [8688460051764644216, -6359162183456399206, 6125725059795923049, 277162290058762875, -6103123012402340858, 5982960036559086244, 6219426371616399034, 6131127380053285696, 1643256616073728424, 1553136885590103403, 7804827680537792006, 2155679363256620042, -5670808104894946153, 8683653795231149909, 4168009086915806832, 463766112441320815, 4979399204867407167, 6027225788484805942, -6705681317572580493], [8688455073544252717, -5379381828373176638, -2956194596332607792, 3005675509430429549, 7501082389385990610, 5511427209636473709, 8424534488604847777, 3348138172551151321, 5842188494215654341, -6924996597513880483, 2412963889066638519, -3548899579038174420, -2182778702448835795, -8031351428661361645, 2773667580796693041, 4874751278277117363, -6724653878207049586, -2313203905376749726], [8688466689420208412, 630916865842680033, -3728361050016071510, -2119794474517653609, -260566157072698804, 6515277866385011679, -1166876391031682589, -9111117219156141722, 5505426273465308324, -7561672528870576623, -3371386784877051531, -4678687929481519063, 9178334401810513122, 1812878039876799251], [8688461711175875059, 3819667680656622582, 6239642627614218855, -4149591448408626262, 1960442682031469257, 9132495484153065773, 5428230937316617561, -6068706371305546248, -8631589975163638488, -4440664129986180407, -2857575815917708734, 4949318903350225495, -5439886962676374879, 6233595227917949042, -2120264391484836008], [8688443457652335786, -5567374770877097543, -2654307317756982059, 3632296585813095393, 7822583989207210504, -1815280251509613357, 678783345447396613, 7039434413720155451, -8027780570400481173, -3438063806213994065, -5366430116834002222, -2379887564347974808, -3536695993660386631, -5145245975030534866, -8058354913420780601, -4354100323057037859, 5217560898710432163, 1159530160224751922, -2544716133066875369, 1067555604267047808, 418534874362415853], [8688445117074207453, 7965347353048777702, -2748595629623285705, -348860170407440025, 6936480054781321688, 1461306095013763361, -1675745766852686338, -1838126770756988971, 8989116910285387407, -6320586917428349793, -1582687875041265234, -3964070961882445518, -510466497586623779, 4890656978637170034, 5989727352391235675, -6096330805383107340, -5373231381959747776, -3986895908789140585, 8799875294205704893, -8609970688850427404, -5700752303201357856, 1598492742748129609], [8688463370597746726, -254555264431488155, -3559987406975476059, -3545790340693642544, 4186992496820306392, -402706013839981237, 739437091642626133, -7878851064380748675, -220130326275879124, -9095209859382198002, -8631589975163638488, -4440670767620462955, 5387793447103246626, -8868028100245988183, -7008804761042706525], [8688460051764644216, -1140009141195418100, -7195565624072533427, -7033189598407243735, -3728362709416661529, 2558209665340029906, -9041212085259105679, -3609062734286414016, -3372609674497666322, 5159518263933550261, -3783463864061907104, -2174888991507334988, -6954934026444362874, -107603406277792628, -5722186470570138703, 7547083325969622952, -906673616828638145, 8401976134997779801, 1229913376424759463, 2430099116681588529], [8688461711175875059, -6054022793928260668, -3144804408279191120, -890620963995765656, -7063892640376823708, -2873004961668315840, -5218889599220587985, -2325998576228752090, -5025959275195454509, 1334723321919952612, 4219433149491557140, 4515145857099197212, -8892428765114248389], [8688460051764644216, -1140009141195418100, -7195570602306225956, 3193661814278786258, 6823824435828634235, 3498172718490966884, 3147191859091504745, -6524943729663184957, 3716088155213651769, -7558578225208500892, -1563088488504729278, 7055181414008407287, 7291637792614296255, 2425175771500580523, -4496250136289045144, -7315020980470741531, -142954903080579919, -6341269771560249503], [8688458392364054197, -2982436679648773995, 7406772505194967653, -27957186505343281, 6747881858723995085, 3442458013236161396, -732100643414522800, 8926757848831740211, -4161315292088172946, -1507822127855143994, -4104356891491298378], [8688455073544252717, -5379386806590907931, 4449087364605507120, -1931186321987621536, 1698986256034931911, 6515296119913871364, 3622401778083612547, -8537758304977330703, -53608950971841579, 6232978358491247855, 979435225715825833, 3872286422838121496, 8741080453378655621, -2255147102496734847, 469308879260246054, -7662298065474047739, 3125731907772897492, 2077915280606922539, -8831141555364048016, -5437433652998217340], [8688445117074207453, 7965340715393213506, -4445457877865015464, 3139174210256401626, 6843422162967240378, 5245660227994188595, -5143548956849553053, 6474856970278628762, -1978881718988112444, 6639389842925614140, -3670803266875527122, 1145499959342527723, -3880254501302785673, -2773618142154599833, 6730117252982461136, -1240359020823881652], [8688461711175875059, -8804752387836075437, 2376237571936724090, -1328008721354903201, 6803603201613083121, -929209505297700577, 416074927036674736, 6796330360119565149, 2507885664469291576, -9165608142014289070, 8859296960932160822, -6281993397892722343, 9007469282660052803, 2971548693395814244, -4220723683524782131, 8338240593813755242, -4146658265311862502, 2774767642480423371, 3011212405218337262, 7281134412514266437, -5354872371929518184, -1812970575489794568], [8688443457652335786, -5567363155003802054, -4727760704578580768, -7620631814625005723, -844752943528787331, 6327301517990738998, -864979155999312622, 8638757898572921044, 3978184682420724164, -1571104477920620936, 2944531933322606690, -5998463469946736183, -2294203901343980500, -2456576608210750360, 3468071611231049275, -4550883033367698339, 2641394321786590565, -7010501779223688338, 3491991509883378263, 6891118326613559604, -5269050053506198067, 2180227747224906942, -2035835141351294483, -8809070473886828690, -5672038524947168489], [8688460051764644216, -1140012460033841022, 397720895237477467, 5872899833238728323, -6686056147062276277, -2457823622372620920, 7973824830639371192, -3625580325852776375, 3768741745049619828, -6133822735560099969, 5465594036800022675, 3910881601787639995, -2672677177049261500, -8736991898922390591, -5823899554639132874, -9143537192260095066, 526266387059795625], [8688445117074207453, 7965360628338624446, -6364569481947454382, 6587358100771321445, -9134880208860285216, -7526323589834572785, 4883244583374094055, -1078597312395358749, -3179697603982771089, 934662156991821223, -8272746848207674645, 2851928130993266431, -379421999209532178, 2430099116681588529], [8688441798251745767, 7079873563355398053, -2748612223730273723, 1029739313659774665, -6216387203725575283, -1195742099979083273, -7083508621038969124, 1725366233720066102, -6332165336331262798, -5609054297015986303, -8029020946922748773, 8779805990680704890, -935369141559288239, -4192506372820128857, -7970851272573234491, -3455203245456711376, 6934019214676877016], [8688456732942182530, 1422707597241783176, 7708687993750876893, -3038776551402396121, -7628489996766421543, -8351594398426133842, 1641389413646733755, 6231141025469068566, 1828787059072614638, 4248732136630715943, -8171003894733865094, 521339723064306551, -1087241787124548113, 7644320516692106384, 796994874759228667, -5976263689517576106, 6821340363982918997, -210272918398780439, 3169256171192794759], [8688465029998336745, 1860120245780024190, -5386027843972608365, -2567252021535937801, 40707570874745574, -7637605916148338621, 604059572503062868, -8296498222017241002, 4393357724660264869, 2854385652280569829, -8588662668240992704, 4382875916884954362, 3357255751352279860, -6323054395188358661, -847868819528883403, -759584762672168064, 8388415851088058413, -4583142646983299593, 8684732284574199692, 1512681141869154431, 7977548386236631093, -4182628290936620587, -2648128793104916454], [8688458392364054197, -6845216568827452122, -3935966654364996557, 442927242158560608, 906562061083518121, -1587460050579419744, 8405545333842109018, -6132574061981678154, 3844055836838301066, 8920438877602150778, 9082798309181734100, -5037532715840733131, 4466196041659385084, -123519063107890563, -9097545319357163609, 6929228785628484263, -6441123950261063426, -3774371176445202446, 2150291977710975806, -4432641634653711111, 412992239269176142, -784735213097084504], [8688441798251745767, 7079883519806821875, 645122229193968793, -1736249241755294560, -301642089061432091, -8993982388039802256, 1697135647722905878, 6773518688489415796, -8265320416580452247, 5911334652691914114, -7208371275930892610, -233112800011873505, 6542749476977356869, -304561230262423879, -8288015766190294777], [8688466689420208412, 630926822312725297, 5146583146501363863, 144260545732702487, -4613236223790328009, 4329785730056048146, 7238995818672905333, 6099487954697488139, 40090701426762739, 5441192605328497447, 7860555661082444238, 8887552438087142867, 5900978356809011084, 8395051910214784670, 2581355785617472213, 2665177224414863351, -3222584318411329971, 3064004650452349482, -6839808503714510482, -522658598840743461], [8688455073544252717, -5379381828373176638, -6102509461798101357, -3209625076440548010, -4915115205293838291, 5724750743254767114, -6463811769444618823, 6906554241740096022, 8233443157005143815, 8395820842094965380, 4502943164492132360, -9085960262817307850, 5981254721300668568], [8688460051764644216, -8804759025470357985, -4425850194261684469, 8059037048995958198, 2583831560412353648, 5889275318845598277, -958058620138113243, -4337569456200828756, 6199820347426959088, 1610096945608849638, -1547182788131375577, 5228682807674996071, -6653038450833864574, 307569635959087871, -1810488163044669349, -6001418986439858723, 6232838043650050379], [8688466689420208412, 630915206442090014, -7384175436019116755, -3679915867437642720, 4864270363317753295, -5795196631205220969, -8437425912250519960, 4813966275371144257, 7538428894762407706, 8261528318207048918, 2447870360062725438, -4248207802782427395, 4528729372771470814, -946487731685429225, 9030167058318973876, 1262949326176710439], [8688443457652335786, -5567373111455225876, 2772446350592629505, -5035663854021129061, -918834955885937862, 2386602164891742571, 4883246242774684074, 4720896767689087870, -3160098217427613691, 1429630162626848494, 4338875098858271736, -9031464361746749621, -2468776874779377493, -6877013034851800289, 1354802581896376437, -7574015668017922419], [8688458392364054197, -4399594835631729668, -73188424602869685, -3476177584067341646, 2809796174786187875, 5628570337806307184, -3897985026017057353, 4233597027554094207, 2829388923707062725, -5186940435881142037, -7194349372102162420, -6471210122809262624, 8892326273028547602, -8831296804895682255, 665959440060177745, 1639715627212342920, 1531203698481852065, 7213841288359208150], [8688461711175875059, -6054037728639979079, 6032038682665883827, -6774341863335542871, -3916970861962654838, 6717780751469397888, 6295966671864117985, -1252703819393099115, -1278942583908085280, 3589843149562993600, 9065037022270642455, 1184066928319743333, -4954949994146398132, -5117321041599276943, -7611381319715203785, 3523782104876708904], [8688460051764644216, -536854772325251979, 6239024098770966413, -3038773232585254847, -6441740819709046261, 5157665996199652561, 4995311542880363828, -1291294020111585291, 5484578213329068905, -477283595361852985, 1245202207355450741, 7062132189376416318, -8475390179848303034, -2513531689971862212, 8536571578714282788, 8714699582901516845, 2584444218245870212], [8688441798251745767, 7079886838645244797, 4938365650948789334, -7997826547355030146, -450431280237306907, -3415987878239408562, 1452792876992657377, -5657219610983659610, -788420602222733986, -876702999678859306, -1298535332807678482, 1980031219321916600], [8688460051764644216, -1140000844144584297, -1957440021193044464, 536625235156574907, -9041212085259105679, -98203406699916062, -7270257868222102597, 3591844160909287695, 4884488278716163135, -1453979603258365498, 1455266992386948793, 2503120126584041056, -3146033168914862201, -6258539965648787716, -6406245689250580426, 1326535488844157049, -4710627136366880983, 4138695165083551060, -6100651449221925694, -1909755473441302375, -7743639644034869498, 7775345102142408487, -6952489013843641198, -1676381782600251795], [8688443457652335786, -5567381408511380091, -18112161115445931, -8296506519073395217, -2334666282720493668, 5472236733582313128, -4916980748317582735, 7322190431554928578, 4768104892559730128, -7716780691276040872, -3201147598849954520, -8013126994159016913, -692906848543220945, -4234782094403251073], [8688445117074207453, 7965342374809764761, -4841038171191661937, -5357177069710324032, -6404993696855017337, -44342628579598293, 2563621942064777611, -2944471645426444251, 1172352274467073801, 3991129756304334384, 5318025309224946373, 3709475327833516490, 4338266526485064558, 1593549484642992311, -4443604843509231300, -4605989166254617061, -2109311900133757668, -554599465124035194, -3499337872410674046, 691558103369949273, -863146034586279192, -5345602862419217092], [8688465029998336745, -1516615214484345255, 2261711431747881312, -4910328095062586812, 4992218132018273300, -2326018489174163030, 3280080328149000037, 5989880942524940101, -2429574782851921423, -1549511610466738224, -8178431985759017305, -3588703605701894914, 7241457425380615027, 3936030261075640064, -3236030838080829019, -8312392306498677772, 7289780546646706026, -3613404052105039895, -3921300563889363786, 6704351724273080292], [8688445117074207453, 7965342374809764761, -4841029874135507722, 2629064457907809865, 2791418911232419010, 448020771574940646, -3330332425236979409, -437461315190554454, 2867964189719150902, 3001964336325691395, 6449699882219429774, -6109304221009929479, -8697631238648819214, 4273907346479788058, 1477324666832674611, -1179081767551707161], [8688466689420208412, 630931800554398444, -977661325510411915, -1328612315510379086, 2019252457570236940, 2816438871565818122, 436304458321681095, 5911488374543323450, -8418420163380793183, 1387347042332483849, -2316914185662881235, -3040021906161016456, -5967751364296455325, -6690872360060495436, 5395215667113342547, -5010059445847797922], [8688455073544252717, -5379378509534753716, -6102494527086382946, 3215873210597203060, -2996628767712876217, 402484773727458380, -7023478381926004987, 6060735735076758824, 6875824649185502149, -8752135305052506336, 6949936530923526206, 7673017700839307733, -1276458512038428188, -8508416173146169982], [8688465029998336745, -5168578873637036193, 2281939303618996622, 7776749156970169451, -3219503290063042838, 597428491594067904, -7628511569112422502, -3437585723932304215, 4768108211376871402, -8602262778020254324, -678848437664752003, -5334479294059383577, 493238734363998864, 7265243646847310735, 3959801547830617361, -4906498173933686794, 3341346732156464473, -3950641168040299604], [8688441798251745767, 7079888498045834816, -1373843553586623842, 8003319024924011436, -865615938371424749, -5374313190119938833, -2766356916526396732, -8187688351699836769, 2639535416418410317, -665890088491295039, 8179564891980513031, -438706669933213553, -1560633519410020484, -7035804160363097743, 2544623597475161700], [8688461711175875059, -6054024453350132335, 3167411433911786252, 3631052890471026313, 8009958402865218761, -890611007523060186, -8948137599338036351, 5307702201534737731, 8539040715869561263, -6469367811548070394, -8963434727319561432, 5338109547437722933, -6822047216808739249, -3867425749420860834, -2959273965280304906, 2117100778427390591, 4124499758202307564, 5469765937007823192, 5329593010580854233, 30980526911065478, -7067000219326085977], [8688458392364054197, -2982431701431042702, -1373853510059329312, 277779159506745710, -394089749083094762, -7566147529422422571, -790268658326204179, 5496303716430487256, -3446703302728112342, 3474699373322902965, -2783493803560558203, -4392062038462226329, 5111679994330398836, 2267141962001488702, 4285012661337363948, 1688477897701209564, 6014887627549871027, 2473012381689840899], [8688465029998336745, -5168567257763740704, 209717996266171504, 348620676784678925, 1490758804006991706, 3099355248904904575, 3582589454369058250, -3663558635359632451, -1166874731609810922, -7582643548642783971, -9137367599544423376, 3950700563163078900, -5877763651579252123, -2099437005349685762, -6174123229770696350, 8568381188281510523, -5032747265034013525, 368372892377959426, 280087176104692832, -3014856652768688575, 6488887039435167433, 140570944976625498, 3049794308880669223, -5438194156104538925, -1808033193949960555], [8688456732942182530, -1022895882427739799, 8198551620702153865, -3076111440905517728, 2959830720726003438, 7150726696506626757, 3993465216273979579, 8371141968035161152, -8057729746921963963, 7131872117274433064, 2957351627092699081, -2168584954984143554, 3719183225497613964, -5223812177793010557, 8146548855152691347, -7481419396120189705, 6301515944596960656, -6940894000836400381, -8549473851603383378], [8688465029998336745, -5168568917164330723, -2674511957865545155, 5003786594445820629, 1678139855320564159, -8711054394832740726, -5574009170603233781, -98830232599322719, -335268357676352002, 5815946410883526902, 1226236284355264196, 5417132260114605867, -5194337896453781253, 8338223999706767224, -8529239342097985520, -1387911154313251584], [8688460051764644216, -1140012460033841022, 7802991240310277508, 5943769560499605251, -7250038293401821090, 1368244884379880571, -4465692387373073528, 7620392321004904829, -408740138225122658, -7353587949447957141, -6400086184727979322, -7895988844206914731, -2745517153467593176, -6390963627714439902, 5048563748608852977, 4311249005358838977], [8688443457652335786, -5567371452059956269, -8194943706310323374, 6547537480000612933, -7403778141391415427, 4195646928024861432, -2090937062621086728, 6640621922373106083, -1977649639540620501, 1537998457693680187, 7351682966417697155, 7738001915583132665, -8988575089551407286, 2479043187263161458, 1755917213260108406, 559916648492945983, -89097443774743218, 7643690371975558453, 24191638711633440, 8314775545701845538, -8114067959274996070, -7199730120013524108, -3227533315824459473], [8688460051764644216, -1140015778850982296, 2564220557981240555, -741203287503932928, 6991599462955426948, 7714690589322632297, 323000441112945202, -2286196208981582851, 1246439265039295419, -8350987485456176889, -6816481349968908560, 2178517585469123089, -5804935291055497584, 7392724817392469203], [8688460051764644216, -2982435020248183976, 8292236338415641832, 6020926730195307037, 8839707530849708894, -2646415180795664975, 6370670531884322438, -8728203790532202271, -5423405111540525014, -1895700381379974707, -3048649786785878008, 6417888613227670166, -1822683583091988451, -7710476654750189232, 3544001679691669999], [8688465029998336745, -5168580533053587448, 5052276581111520944, -2119792815117063590, -2031508758244387015, 5214619418562834600, 6971381547557017108, -6398986123044248992, 6501710944819726095, 4532887231056897299, 2978196368390515578, -6776207406338005667, 4897296356596998801, 5105040616365249657, 2587530224827849874, -1116709430829494869, 2398917094064125272, -3961740611866857968, 3210308871416315626, -5732698147721002324, 6826287701979497244], [8688443457652335786, -5567368133221533347, 2469923949066763312, -1234317366007132686, 7634587727886148325, 5684280064822099731, -1339600415545002744, -4158366281508967838, 3973245641480300132, -8177661526201271898, 3982493578620658411, -5521258410634031400, 6490744285386796426], [8688445117074207453, 7965345693626906035, -977658006693270641, -3359037774696028003, -4332790643025731492, -5380630501935637217, 4092092293766314500, 7564667659277393871, 1527491758776509095, -4434345158748610356, 662230906247846757, -2729007092332838362], [8688455073544252717, -5379381828373176638, -6028412514750514063, -4980564358792434741, -1447938841217659881, -7409798990507991752, 3864877346389526585, 8136195878086929591, -7742405905165505888, -4755853396206773004, -5288644461822342524, -1049420386563217325, -7896741050257082101, 4514055883608537468, -6972088400377516948, 4302611168261271955, 5498618370683998574, 4356478584042474332, 8946201985860583782], [8688461711175875059, -6054042706873671608, -4727120603373366131, 748069950503840420, 397092409921519555, 3215874869992472667, -9194925382663686116, 308806693648252961, 5784007203998164982, -5057890185024662214, 866744759129950883, 6341946928896414159, -241603552892313739, 4178499191725989906, -4101265140051079517, 8353360768202600421, 4275755534319584603, -800634144078547657, -151608435940223173, -1339601308342327741], [8688455073544252717, -5379381828373176638, -2956192936916056537, -4941989092759064916, -751081501105146108, -3664152273042402866, -4085992903227376257, -3132471225583269146, 3639538665117774018, -6188928868444358485, -7723426706875472599, -4700282456351953030, -4463826077746064062, 4122180892334329975, 3014289221973439772, 2247663743966664510], [8688465029998336745, -5168567257763740704, 6917512472380545124, -8616152532340915931, -1842898946297803687, 441686865633632802, 6445973007802368393, 558218102610457619, 1662257386707102466, -3812964695980829896, -2087850289393278748, 8301348938977757430, -6501184058776182737, -8109748974858049383, 4124504736436000093, -2648750509044945054, 730776921146040125], [8688443457652335786, -5567363155003802054, -4727764023395722042, -8506084031993666061, 229330658111175646, -5245891424579416922, -6706275721855955724, -2293123752603000904, -3159466413291854299, -2111629873204410260, 3924307310188097965, 4086678357619695128, -1314433502733463402, 1381661534649884651, 8439198153036722417, -8000150259715053500, 2137470624537633190, -8576477336365462540, -5708771479714025672, 3565299743849680877, 6716080414465954389, -304581143186553171, -6888113371470363238, -3684860779406424072, 8777184922813593656, 3538445769308583544], [8688466689420208412, 630915206442090014, -7384172117201975481, -1023502795397696752, -2145416369589977351, 4140529179267307427, 6278212915389954297, -1454599791523489607, -109312040353351578, -271693044260314417, -846616827130660108, -123512425473608015, -9038120333810906200, -419848771899839822, 8523153269022407041, 2117107416061673139, 5969509436995486041, -7238472251446503249], [8688441798251745767, 7079880200989680601, 6897908107586374785, 3005063618221459655, 3958562064103014552, 6452630639291056845, -5633445772036087709, 8152726744943138694, -6029034362410907779, -1047559821773165410, -4649960114881804719, 6875351413401178476, 1226237943750533803, -1267835609655239783, 44422829397229818, 4235307189309878060, -3642099445094043225], [8688445117074207453, 7965340715393213506, 1471179330402565660, 7433031182618121874, 1886964263848416053, -607069463706438743, -3861882982609916213, -6806634665165120161, -4520773629078228575, -7826200793383203538, -4689182119733390081, 1083444710512131843, 775534923440621414, -6033212133641745204, -956830752299767159, 4444299361582251056, -4009439327705771798, -6059592111326879395], [8688466689420208412, 630931800554398444, 2168656858772222924, -5003415856273502884, -2540990025274360658, -4622362992436955142, -1485297855259377051, 5737395142832769622, -4725901032583193644, -4888273739434002268, -4236024130342069928, 1725831040711909208, 3807321989295400534, 103059101875503577, 7275108585158677171, -2006364178850488101, -1357968615426051342, -634854257293633573, -3128912875987688748, 1035894606570569704, 6923674402920302299], [8688466689420208412, 630928481731936758, -2748587332567131490, 5058275857866135074, 3093319465097891487, 6797588990152070992, -394708277926347204, -6681287290341263041, -8571528207231967922, 5041781498062324929, 5130053939048404985, 1750511574185604485, 7350432633441345527, 4633516086498791337, 3149651806403944832, 5093773414347077392, -1165025016089789474, 1551269683171089352, 4415433652634850372, 7720867454574107883, 2718559788519825124, -5413040518582846327, 7185132488338711312, -6632214515257502366], [8688466689420208412, 630925162898834248, 5428859422629915267, 4705746723919369165, 8010558678200893166, 3420840254597854803, -1675745766852686338, -1838120133122706423, 5728920984059317406, -1665399427421207130, -1428957983527036573, 3992381748697237267, -8933492188432361190, -389287704145445284, 3314976842667061074, 9202720131988336565, 7420220684265056720, 3878318887825333104], [8688441798251745767, 7079880200989680601, 6897894832296528041, 6986193823859641379, -8155731657910161834, -232323955210223709, -2749840984381906040, -6454100552963380075, -4594857300835969125, -4432512803962783802, 1281315866638547576, 2078508918292353160, 1656699816926086198, 1091629224770786132, 8052255565073976820, -7089063003747151088, 968456950428222117, 1130818041387113810, -4290516712603467501, -59164094730381364], [8688466689420208412, 630915206442090014, -7384170457801385462, 3890520813807851286, -3916370586626980433, 7683052823388706407, 1812270360303577276, 7526095712087767380, 7688456803062620309, -3586854656809080342, 9103026181031567762, -757715900831282346, 3359093084374459149, 865061016238815814, 1038221769489381096, -3329232363553249079, 5406182326551592628, 7014745583211587607, 8799886910079000382, -900631195384682303, -8093855022094317523, -2433875513745328837, 8956073430085867650, 4366355006501450729, -1923176203581465756], [8688463370597746726, -2002666281035596691, 416688477659535679, 5285495783476615518, -8834851835652839731, -4455947982677858744, 7143463811464532607, -2364739179976185916, -827019099997374377, 5948841517575304742, 7275735411079365476, -1441306993705399895, -4746739136249387799, -957444302904006660], [8688443457652335786, -5567368133221533347, 2469928927300455841, 4117710870000215320, 3394609787152323883, -8765541998852465152, -3051721625307287989, 1537991820059397639, -8512720091115071906, 2761967861655741920, -2448542365252697987, -8336320502209821181, -3630374073731611432, 4987899147596006201, -6212698495782784527, 1844816480158896149, -7756449381337576831, 7429329966010031044, 4134376180661283961, 7838622473974192900, -6194954695778666103], [8688466689420208412, 630926822312725297, 5146574849450530060, -5756589836377086569, -4803089731078980417, -4714789080093995412, 153990015718859066, 7001332251756064595, -618186394413368268, 6591219550718927892, -7724043576318135022, -2647665513772016603, 867990880515778094, -5640854081852155332, -5478481375004006914, 2831238639227084173], [8688458392364054197, -6939521474800743786, -4030258285048441477, 1444910696482764115, -4767581325349289280, -8545909630998067102, 3938964336964408409, -647045465726486404, 9181422067830325687, -2904649365257805926, -4467534698634265758, -5515364601068805807, -2618816398931603937, 7198559095084081068], [8688465029998336745, 5285474211130614559, 5259218852508640376, 669520341848352747, 905965104588926844, 7605113446546919021, 5996533595758654376, 4948703693324114327, 8727043614846187638, 1859480144590770789, 7900372963036011476, 5081593821782199638, 865527614367575291, 1027875430057901888, 4036981182643043043, -5106053839575784266, 6316798137872087738], [8688463370597746726, -254535351507358863, -2842893897962294821, -3641952492618563201, 5861794518407754493, -2756493637615620315, 266662228775874331, 8888162669879561506, 8577635894827060380, -2946332210213835960, 433206835847784502, 7280540774834156228, -6839813481948203011, -6781003706433377182], [8688458392364054197, -6359167161674130499, 812892278081748565, 8850186019786596479, 866754715602656353, 4627198774685753159, -1038310093485249936, 51035656777365097, -1207313881223771876, 488454942949888659, 2907786469906410669, -2168596570857439043, -1667733227995582718], [8688443457652335786, -5567373111455225876, 2772446350592629505, -5035662194599257394, 4957324936293411683, -3132459609715294069, -5368300638075477959, 8002060394870223945, 4826913008676626144, -531781155854282881, 2639533757001859062, 4248128542480560470, -7837931274718314418, -2561853912893041425], [8688458392364054197, -6939514837166461238, 8762553679995090236, 3287334916118978736, -6082264995819998029, -5034438412202599254, 7937105151178321989, -7714298278830915653, -468176739657976586, 1140406429944769127, 3409275111008730396, 5001327413741965976, -8044314756068511138, 4115846986393022131, -5463210797602175321, -366611500856467024, -2639034314330013777, 2836174493070732047, 3559283872966797081, 1921376693336064804, -6947538357013960441, 8045447662292667070], [8688461711175875059, 3819657724183917112, 6239632671141513385, -5035071875736288459, -92812702315848904, 7116601539867281059, -8836092212175107331, -2475409615083642064, 5772425334555085381, -4568482301368566227, 1393367891433098938, 7516492388837015094, -3049268315629130450], [8688466689420208412, 630921844076372562, 4335188050310750587, -2660318210400852914, 5072487858872988030, 1899932569494578487, -918846571759233351, -8726978348713672464, -8874672456423548243, -6164868523227806699, 7028332417701002483, 4436118166162019689, 6443507189461570986, 8863480477005276210, -452270272681357863, 8861771842950998908], [8688443457652335786, -5567373111455225876, 2772433075302782761, 1163859862170082312, -2728996243068128307, -232315658154069494, 7648642819923534139, 1686766076528874456, -5064516287678683001, -3279396533157271185, -7869118275574790616, 7900854495876489364, 6969535917478683604, 6733076220034371714, 742493995449657497, 1067557263683599063, -3123338712097024256, -7476628967071796952], [8688443457652335786, -5567376430293648798, 7802989580888405841, 144267183366985035, -6216390522563998205, -1626680396014453851, -3916987456069642856, 6585535702434258507, 5768113119516728212, 5605743731483060862, 2300304951283508762, -4644559454025032091, 1716109867779246638, 636627264704382700, -7535418829667813901, 5776588937704071477, 5750335238498648549, 1559429306242659554, 8520053987147920429], [8688445117074207453, 7965347353048777702, -2748592310806144431, 8755894389105811765, -1825158465110826537, -7787011976745594212, 2676300792780017278, 2588015076506750684, -5956181110726671213, -6909724360711458871, -133863743138779752, -296209899404574476, -718063804879394611, 4757143343102139752, 6365714896818288946, 6866579899117978174, -5219496512187884732], [8688465029998336745, -5168565598347189449, -3634067759916075335, -741201628087381673, 3449719238856383879, -2660334804507840932, 2544002642585490921, 8019226384697955156, -6043693048625051126, -967314986078932707, -5069453669218517014, 7016607807396909129, -6949391391351123163, 4946386618598373521, -5608905685118634612, -7104813322849883992, 3586301394095682868, -8578327944682808985, -3103127434332896964, -3265496822363904108, 6562967392375766709, -2758954477720064987, -1076287636372879754, -5419069664734295219], [8688445117074207453, 7965337396576072232, 5240883074240962998, 4327923505873386830, 435049147090355290, -8507956212651693053, -1504267097097986518, -6979479223315873616, 8725801578920669813, -6205296056971132370, -1940309771798485953, 1763961412672244807, -1559366592326680838, -1615723058187290982], [8688461711175875059, -536854772325251979, 6239025758171556432, 763821929004503137, -1863740368773158498, -7222424576852643701, -375090637868932181, -3038163000795496414, -3274601125875185903, 5668395936810708225, -2092794308572715721, -2443770189735825125, -4561841264008147441, 8808536363044542481, 6959789721641232037, 6819630070490808792, 2645107920892523554, 4327759827549272024, 9070599570295992076, -2528807245612706746, 5972604507276788030, -2970394214828317559, -888901606844236214, 2652973639015793914], [8688461711175875059, -6054037728639979079, 6032035363848742553, 8850821142736836939, -5330928348743914045, 2347393435330003953, -4351781457210341918, 3529200252632474135, -3318128708112224444, 5458813445675366294, 3038851774002296353, -5505359347916241895, -6172269302620247395, 837430705556048347], [8688441798251745767, 7079875222755988072, -3634066100494203668, -2910963358253702830, 1886969242066147346, 6984938512649597222, 2810421341285004513, -1454593153867925411, 1850223778649951325, 840347294545824089, -2485286169289585637, 407555071381286204, 7179588193844881582, 7956080137837927771], [8688455073544252717, -5379376850139484109, -2466312715839170105, 7362164774179706632, 7011197190088712679, -4659696222520865288, 7500472157596232177, -5640081831157493554, -2260564357460495493, -8749793339168943709, 7390259891846336587, -4246368810359658087, -6991065939272280630, -2888900705553002835, 2956726460593882443, -2405785242568084441, -1452265224345848997, -879040119070376168], [8688456732942182530, -1022885925955034329, -4425860150713108291, 8662194736683265593, -563090218023096870, -5152811960424655065, 6520676867825233052, 1045491292165757794, 9028952465746532682, -2082442990902223572, -7965275449260698332, -6430770973195301670, -8099422548350699467, 3277764781103484134, -6437431923482509954, 6608206927510825886, 269732407896694293, 5744952831173395812, -6002644559994714882], [8688455073544252717, -5379373531301061187, 1396467173326206992, -8804759025470357985, -3728377644123059528, 536615278705151085, -9174712445504289217, -8225029878839901130, 717957227375947734, -6454075661800237842, -3334022792596321420, -477285254778404240, 2828155184816417467, -2021047756206492033, -1654321555961931373, 5517761115556499905, -6363956824113937818, -2984449306871023785, -4257472465795362310, 8747865891000678179], [8688458392364054197, -6359157205222706677, 8708066075972705604, 4118331058260019017, 75594128938722583, -8264231970764696994, 5991596214234781599, -2591947489700069841, -1638402580293410516, -915299838050249472, 2793905409137853615, -3093887662520347166, -2074430320303473188, 3682432915546808882, -492079277578770886, 1352935379474702180], [8688441798251745767, 7079881860411552268, 585713837762680020, -2307178844643046924, -8551315270072571023, 9172316104923774285, -5083518717731268504, 630313271708485796, -5183371237015531172, -7127644907414803461, -841077510875843319, -2449630811063132828, -3819609052161050162, 7455103791770245691, 8477148252571275604, -6832550596908769067, 7571459866296627389], [8688466689420208412, 630925162898834248, 5428861082051786934, -6242029011743309965, -5518909675371879255, 2612703907015318528, 7613769537152064080, 3098109894146284240, -6553791185081725956, 5606362260326313304, -355492910730326038, 3294895923274085994, 7291644430248578803, -1697067062770589224, 3171731945987676194, 6476553856739245459, 2587528565427259855, -6030739677669325455, -7474151532860364262, -6495139977913015434, 750996495945039984, -5937668510565397401, -861282150984406415, 6310775629354921394, -4986758842681889488, 3942059407248370604], [8688443457652335786, -5567379749110790072, -8798728219897037426, 1516413887295951690, 6635206326831217104, 2158155138067462713, 3354155702834625136, -5829310171947329324, 8987266301973361374, -3250833157932029468, -9172856092347325015, -3697678813762625414, 8051628739153288515, -8006956634821458759], [8688456732942182530, 1422714234897347372, -7195557327016379212, -3890748691554656691, -7968355584832942116, -8390192896198114027, 6352291608911342112, -7903544873144290696, -35226709200341421, -6980087795686420588, -694138928011994536, 2611309808638981386, -8663364868841985696, 5415895202428100983, 3807320329873528867, -4810957869671820059, 265421852272228173, 9208425552592404849, -2390987900950576521, 2539211320745093583, 4597243858850957753, -6705681317572580493], [8688466689420208412, 630923503498244229, 1773078224848826676, -8129487915177444376, -957431794238706586, 1461927942695438725, -7404390032600385321, 1327178908869173166, 2207237103018003630, -8506700901415046836, -3106225823434000433, -1024723258974553412, -8003868968817607430, 5909626150358001928, 3164938977912764443, -5453340881054456150, -787807051618494485, -6807998894144622541, -1225083465204318766, -1823933916089621727], [8688460051764644216, -8804760684886909240, 1584446840553582183, 1672724259776014974, 4581975833663002412, -3774842621073988306, -2166262770304345103, 8379286656418954797, 5634599483979037724, 2408180097660508932, 6015527728757745870, -2042015457161558107, -7192465575578820557, 1309566365581118740, 7197336205458145865, 2769972235198338089], [8688456732942182530, -1022890904188726858, -3935953379072489607, 1539227218350632916, -5632840518461400363, -4323056194803222178, -7064527763351006022, -1102660976423731397, -3409353478513272324, -4457185040364363628, 246445972799336158, -7373057738684980354, -7496226694210403095, -2906509930026576193, -5368902572811742383, 1654981226377821778, 607133070419742456, -5679452579629455929, -7461957005589088509, -1468170924697921050], [8688466689420208412, 630928481731936758, 6032051957955730571, 144262205133292506, 5072494496507270578, -402725926764110529, 8540271135921783599, 6931714516896071168, -8378004245508102795, -9115292438178423307], [8688443457652335786, -5567379749110790072, 3054132307882153828, -5003410878039810355, 3791440413476603632, 5668381002104310226, 8577640873060752909, -5279386436486253453, 756549087510985165, 7642471567796631606, -3725924334447562195, 6028479440299580492, -3686700670179425578, 6702511833484117550, -218897480206500717, 6067688169861319110, -2317527736291062590, 8347344897319716625], [8688458392364054197, -6939513177749909983, -8382930011158680083, 2331016290330524598, 2168665155823056727, 7643852390883122004, -2332777507955478658, -4472945315945122414, -1093406269878181540, 3456971274633767974, -7738707240750009662, -2662317562330595754, 1853323827146324401, 2015666664597638057, -4108686593436628768, 5884338703930310934, 4577025943452547913], [8688463370597746726, 1860097014017471976, 4769361863191645952, -2402702554803246053, -751089798161300323, 2141801224830535572, -9116524517647196898, -498262912206175784, -4540989885054766748, -704490245682486685, 2170494958397667235, 8980611989323095844, -5858786112708430295, 2140392191745140225, -5464446195888090186, -1917620293219660949], [8688458392364054197, -6939524793617885060, 6823204247568830538, 536611959866728163, 1490141934582950725, -891227876968382815, 1152134359068663961, 6020913454902800087, 1433826953992470832, 7321595134474228350, 6899761141923537507, 4945594454958300803, -2639034314330013777, 2836171174253590773, 2673798467384160707, 8149020550074753275, -2847228578120036092, -7436948661121004268, -2480960678953401106, -635946021921209688], [8688466689420208412, 630915206442090014, -7384167138962962540, 3005058639987767126, -3615070308097182361, -4338197941516786668, 4581987449530977489, 2973395982869417355, -4272758744514837542, -81821283461423766, -5747350064543255123, 3177757773343265460, 683700814041819686, -3490846226716947579, -8009434835660098325, 8592294581019922079], [8688456732942182530, 7245038240114200969, 1396467173326206992, -8804744090779921222, -5895534002165724241, 5229140977032556629, 2735088995951502354, -4433753180487711608, -9117759915938432175, 3684763265562396432, 2224355736523305416, 8016591909796690208, -2184625991943720554, 3777229179112918788, -507376405544334731], [8688456732942182530, -1022880947716021388, 5824436397139420466, -2307173866409354395, -2333409312088577844, -4683149654743518267, 8331458343267227194, 5512679202032036798, 5090846868903217622, -6508563265819962268, -222592825804855669, -6448393472937440124, -4839797028063469109, -2758330970637799604, 3075558178194780460, -4096473051586135509, 5483951387432322454, 5588619226946741550, 378095724727173251], [8688445117074207453, 7965337396576072232, 3449702644749395861, -2512160823360737490, -6686687951195375463, -4549015830943363876, -8814010413172164508, -8538973790320494834, -2543484053614063014, 6960251341536298985, -4710622158127868042, -8218717545263215687, -6160678369501787321, 125895664671455369, -5127055489821786257, -4153295983855140014, -2544727748956132094, -428353692867451797], [8688458392364054197, -4399613089165909765, -3351768252022311511, 5591238767136288087, 6936480054781321688, -1666661376292135895, 1057822815461089749, 3065225114053147996, 8141621430106844452, -1612788982298522637, 6128191644761267126, 5321588637038258064, 7328987616807854625, 3063998012818066934, -2263048429306210731, 555735690165332400, -1125216011192376451, 3945141202215883995], [8688445117074207453, 7965337396576072232, 5240878096001950057, -7316744417511051716, -637802375075513684, -726069837846522653, 6445982964275073863, 1443695211142260190, 2978196368390515578, -6776197449886581845, -8666468236176781694, 2534155957781702522, 865509360844036018, 8153823356068080986, -2424639060728638665, 2165087659906612059, -7663383192467341306, 7938804595384440491, 5518852880189396432, 7045601322520207215, 3415432063314795042], [8688455073544252717, -5379376850139484109, 4523169376941376003, 5403234208740450251, 8708677967160393850, 8286843974630984655, 3919374906881956481, 4383004747573221465, 4735697428123737064, -7330756364885697878, 4313111229544160499, 5308158711475747034, -2350553729570308096, -6848299256613572158, 553282248766809745, -5601645352290416714, 2806700211731502743], [8688445117074207453, 7965340715393213506, 3449705963566537135, 6775372615615922897, -4613844796179496423, 4329153925925609166, -7270267824673526419, 7337479262485619856, 9103024521630977743, -8280137671122089459, -1993563636948846769, 7760841797196225731, -9151407756899353045, -8177663185620483359, 1073103349319665576, -5287546059557823655, 5539679367979634892, -7608415715007729011, -832570032146768303, -6055420211121739084, -6368290611500956152, 4183297917846498110], [8688441798251745767, 7079878541573129346, 6991594484716414007, 1163869818642787782, 3093339378022020779, 8568519975447803508, -1111776895802988269, 8716693956597567156, -1185853929905164623, 3403867812517675220, -6350512730469575459, -875338770720638574, 5409240889777835453, 8687825695436290220], [8688465029998336745, -5168557301291035234, 8762528788826627591, -2512155845127044961, -1956808217059945278, -4775595655351289889, 5864268633799385703, -2753994631058186666, 2732012179217681492, 6922933046161447044, 5106129062181004910, -5607810601673917223, 6466195901439791174, 8960254520155127997, -4896757854680159954, 3943768041302647906, -247132912695706706, -8304669460983388341, -2829483885323913083, -7905845353741761836, 6366345041550798113, -4635782961524100496, 553899118212132374, 3245041839370530063, -8177810138098623589], [8688466689420208412, 630926822312725297, 5146583146501363863, 144258886316151232, 1530602656542912638, 3685550450963456209, 3904089394789688125, -2057769095084092491, -6425858351092924362, 347400213186540617, 1999014629226416160, -819746258503856405, 119116732942068595, 5174024887675592643, -3692266537037877709, 8322951762904345612, -5710633703899347194, -1519702880482876172, 561764836338062940, 5612054405661816492, -7758306627283885412], [8688443457652335786, -5567371452059956269, -2822684279614718784, 2706380327672652280, -1809274337099435031, -2606452454041522204, 4240873187883374895, -4377383439337254720, 1288118791178184179, -9115292438178423307], [8688461711175875059, -6054042706873671608, -4727130559846071601, -4588229538744115435, 8009948446408474527, -5035680448128117079, -8739923422597282684, -4549020809182376817, -6231690969362664560, -2040766783601757734, -1878410670860597334, 8436724798700769440, -434517282829080639, -5021628674905212333, 5367592125833106452, -2378182380831203896, -1404419556031455143], [8688460051764644216, -536833199979251020, -3935964994940464684, 4305715428393392950, 4769360203791055933, -8202209910169558798, 247681371085251023, -8977616858910958184, -34618136808512801, 1239806524737691054, -8475401795737559759, 8362769064836631202, 8011804799565438729, 4335168904011167965], [8688441798251745767, 7079886838645244797, 4938367310365340589, 1201199729912216860, -7252519046451676702, -405178469812400986, 5807315211441524076, 9186826047504239589, -5555641863516849974, 9038653725755065960, -6737475231377731996, 6060142097391328203, 4277591207946494285, -1846616757034164183], [8688466689420208412, 630926822312725297, 5146579827684222589, -741201628087381673, -4445467834321759698, 4024659615841698206, 7668864054141745459, 8622374115909896875, 5299042792096490162, -176126189434715430, -7894900398412441126, 5305838317932864954, 6914419828121719618, 4813337790055186345, -3215806285050796837, -1912062591694337711, -6645019274321196758, 8982942339317401746, -3103117477881473142, 1899168615856070924, 9219390420867136499], [8688466689420208412, 8662196396105137260, -6875304400778901545, -6712923396871938706, 2018625631649548635, 2157554862753069956, -6743036119999831392, -1666654738636571699, 6539042515489745192, 1796827939241841778, -8285538331978862087, -1940773051110104156, -1217663671214039122, 3417139037989763973, 4613146240391208944], [8688460051764644216, -1140005822378276826, 7199813639669578555, -1588105130002365674, 1321154740932795361, 7681817425102791542, -3615717046936679546, -758969552646056896, 4430697592381117769, 2822147611010969534, 6864887859149407242, -3016240662933333689], [8688465029998336745, -3962228650621253288, -6875302741378311526, -913437613846306508, 2206605298884904444, 4852544860221655356, 7972594410587148856, -6848441362575724769, 9104254048891195494, 1120799512944703154, -2184625991943720554, 3777230838508188395, -1334045397953920874], [8688443457652335786, -5567381408511380091, 8990352308576622684, 6077259964296025173, 6051031156251084272, 1461299457379480813, 8633367194191514092, -5622474266105791863, -5445436235403897138, -6493281072544835186, -7439266634194317066, 7564049130431481223, 1715488020097571274, -2874250316410974939, 4129435480304308674, 1537219569364735861, -145452250237423549, 2737552262097044951], [8688441798251745767, -7338935900881397372, 4769353566135491737, 8473603178268202156, 9196704261105452769, -6431260671350287009, -4085381012018406363, -381116465203239799, 8533493102537308611, 2571629634432495672, 356656579124699875, 519012691865860275, 8325905751714583043, 8488263523880275316, -1488366374958325346, -5030268171398048962], [8688465029998336745, -1516613555062473588, -1052960482629938038, -8225041494729157855, -7271501563564171677, 5629193844883252155, 3393367751234786676, 480283704007683174, -8138002792617761821, -3024250014714942799, -299789054724269369, -1096980446977484934, 7634581856855130799], [8688456732942182530, -2025506162651349963, -7873443765889693499, -796294485681793445, -4708783165702438528, -3100186720809846071, 5863033235516131044, 1273319790146785210, 8371273985820204413, 6773520347900646639, 5218806253474372910, -2191401604855966054, -8287408853215017412, 2987289056028501884, 2560535935482797949, -2515847105281051763, 7146538968803083862, -985049722423631894, -8569693426423664885], [8688458392364054197, -6939516496567051257, -18090588769444972, 3287338234936120010, 6823824435828634235, 3498167740251953943, -8626014151856422741, 4421601585947271837, 8686609443465919213, -6941365445462526035, 4333337441998724554, 5941905676897732474, 2191958228562678028, -2285107894910134568, 5846495731001697539, 770127624949566238, -6401928495989171552], [8688441798251745767, 7079886838645244797, 4938372288583071882, -8506093988445089883, 7822595605096467229, -3452107282380744596, 5468061514560031543, -3813417887104697925, 8049780683055138734, -7487736707933227883, -4668949269644543478, 1044882719795210822, -1468765329007898341, -3077375049171716100, 5465603993272728145, 3857010867215898404, 3842827076202629985, 8002548433621959059, -7531096658167392086, -2528810564429848020, -1620660439711163759], [8688458392364054197, -6359167161674130499, -7082268244532662760, -8130124697549556503, 2697744149991636513, -8576935505723023098, 154608544564771714, 3670254982398482383, -3353643751497479777, 6474843694988782018, -7781002743520934818, 5190562392187365942, -4837954716802276879, 3590013465521390954, 2447855425351007027, -9223039646661821165, 3748513873178504518, 7053342421564356331, 8195470592337905496, -258248184004706418, 5583188696693134160, -1588847511300192690, -2896155293538942770, 3951153754278966311, -7719709788931116688, 5236563454935795993], [8688461711175875059, 3819680955946469326, 906578655190506139, 5285479189369627500, -7760148045753073057, -4941357288625965730, 5051636479922267543, -1776706644898115199, -1504275394154140733, 6553232944134635953, -3409353478513272324, -4457199975076082039, 6597857269262205404, -5562916364432239613, 305254088916232174, -3399007139081793116, -7966524122841780353, 927405909605291269], [8688445117074207453, 7965344034231636428, -1561232901953690304, 3536746325081183394, 6955469209546720653, 2086698410763418330, -6367040278503322876, 4022167246918547105, -8063904186148302860, 6208292846799821285, -2261793118090846162, 3025879256746988060, -3297923301400396326, 6205815412567106947, -3762649884958250366], [8688466689420208412, 630926822312725297, 5146566552394375845, 3005063618221459655, 3958583636443695099, 3928495804502886500, -3067003818582415071, 7963344682301893588, -2425872799598002275, -6338346544936191213, -809273640592665934], [8688466689420208412, 630916865842680033, -3728361050016071510, -2119806090406910334, -3051124668804716094, 9109047030148144087, -2977042656447565563, -7167948588700894352, 8351056070421794573, -8037657124598444128, -5144802608643045955, -7638833017362138035, 3057217421688090141, 4475480617575167643, -5194344534088063801, 1977721543302097811, -3958051772182420448, 6472376217250054798, -7105597057700136349, -1630394887933673073, -541020927688114327, -5617408946685656568, -3123342030914165530, -8362101097364586582], [8688460051764644216, -1140015778850982296, 6032032045031601279, 2629066117329681532, -7760149705169624312, -4455331113235196321, -676991191713123010, 3513296211675671689, 5674416785911323314, 6231144344286209840, 9140372686407984858, -2459035788903964189, -2766978764208072096, -6471220079281968094, 6429463713292160249, 7477306891016547042, 453408157120584882, -5907264483500835121, -2573429911323724942, -6055420211121739084, 2002106380687916669], [8688458392364054197, -6939513177749909983, -2748607245512542430, -2756475384108042278, 5787707527830212463, -4871737894344100636, 3788956341609606746, -8695947495733742291, 3902232148822097896, -6918669329228136835, 5107363567674915190, 4059513752292303995, -7363344862808471999, -5711710533841806958, 2095172569536870546, 6286071864134635139, -2580217901156963546], [8688461711175875059, -6054039388056530334, -5330915073454067301, -2660331485690699658, -8209609030142788033, 7603411581847289383, 5744196539700161940, 1154463181409347020, 1316835888257495438, -7389724708767920662], [8688456732942182530, -2025482930910079397, 6709905208615068822, 8318508291144604033, -9174700829630993728, -7566125957076421612, 343215037694213768, -6978872310348576869, -202993439249698271, -8994769573427561003, 1847142750285702956], [8688466689420208412, 630923503498244229, 1773081543665967950, -8578794411091203346, 5204119357279946056, -4073649764080030461, -3425247562997369300, -8014969305420209143, 5281311374606175133, -5993393172292908359, -4899853817756126734, 5093156544920376205, -6992914888167755408, 4765169157270371764, 3717329298363126245], [8688463370597746726, -254532032690217589, 6521302034302768042, 6358952559217171838, -5009425089500822484, -818524135502467872, 7387194690985811214, -7754118899601624165, 4319889262928635487, -1532522574258288975, 3942672957852610105, 4475464023468179625, 2587535203061542403, 3495695284258252546, 5104280113285530132, -2953256435002151503, 1636457010364534125, 7263536803913988568, 91467407685404034, 3633369204125127650], [8688465029998336745, -5168558960712906901, 4335188050310750587, -2660326507457007129, 4261097740918727489, 1767039122203390666, -6837332728922289253, -3438207571592697931, -5046784103563821302, 4946241193803118400, -5632214585359318703, -1042497821175491801, -2238485110647487068, 9036189566833480014, 3074342692827674475, 7664059457011501377, -4686702259496820702, -5345602862419217092], [8688466689420208412, 630913547020218347, -5479108967527960241, -6202208390969941247, 3301548576523761505, -3888544256579134, 5709910256950577688, -7071300057422168394, 8420819230082363533, -8978091622375506760, -4639005071338131775, 4092553913661381448, 5185765325483408993, 6233591909100807768, 584475120654303469, 4126350366514333597], [8688463370597746726, 1860118586358152523, 7218779562675085512, 7188685093070732099, 8142239958950096894, 2667016216840292865, -1920086878161063172, -5812949621054837987, -1223221240997715596, -6072400950279354530, 888217092967681943, -720379351927570720, -2727770034646333478, -6417365938795932873, -7951862117826456968, 2019851840092625112], [8688460051764644216, -6359177118146835969, 416685158842394405, 5722875243779598848, -2032764069454431172, -9204798618052488415, -8251276940408381304, -1479270368524479414, -7441125539559837108, -4528034854698451058, -599829043805010343, -6769268246864573773, 889430918912916261, 3708215038384459392, 3357235838406868920, -8094001974569797547, 8234677662499054095, 5332862476711994525, -8226745150568364070, -5584509231886122325, -6737475231377731996, -7785293517938976556, -4582059179406557281, -7238472251446503249], [8688465029998336745, -5168558960712906901, 8762528788826627591, -2512154185726454942, -8135505445463578397, 5308922665135536245, -3856328731640720807, -1037547930986318950, -1991066289792003139, -4485133205563494177, 8346743855380777198, 4642485946199893182, -4084130679042054735, -379892682785300011, 5140378837878190204, -7426936770334157808, 3847754501275078940], [8688458392364054197, -6359155545800835010, -73195062237152233, 2745570803726812861, 8104256671201567671, -4055905071278587040, -6800598881355446867, -4793186626296003562, 6674410078175224429, 6836786103840514121, 7485801855527414783, 5213390657927163519, 3769973824499771977, -5733784802394520794, 1038231725962086566, -6603480063002223826, 8403699703763775514, 7429923603690141253, 2022335911962282204, 2745417081875403525, -3384795138093561602, 8701272976156147089, 7146550584671058939, -3242665237806965257, -4216433040845726951, 1022329344421835375], [8688460051764644216, -1140015778850982296, -3634056144042779846, 5910871505116622263, -1730845262081380658, -1760954666392132070, 3639535346300632744, 3551281158840752167, 8783969593829690986, 4194271083172063563, -3425249222419240967, 4632265753522439709, 2114773615508579199, 1161245300214228304, -3029667269678703445, 5389031271435579828], [8688443457652335786, -5567381408511380091, 8990348989738199762, 5097476290393001125, 510389789480011664, 6398149672905614967, -7458869339563955532, -685640644681325315, -8493755827531436616, 441084930897368378, -6782848443719706101, -7935807805577033224, 1567950821335880989, -2622981661497141288, 1092089185262602855, -2287411694346028630, -3725924334447562195, 6028479440299580492, -3874076743253985090, 3465125919466325235, -9019756345549644285, -7819583880561380315], [8688458392364054197, -1022885925955034329, 2282559491881460525, 4141794446955377466, -1507375442650513809, 7360319144098712922, -5124588012083059037, -2379887564347974808, -4165002340635694095, -5773610401404242247, 3151514030589266354, 5645556055197615159, 569179652068047995], [8688461711175875059, -6054022793928260668, -3144794451806485650, 5473470472451676738, -8175336022704332173, -1399490339822089817, 1980052025059332125, -6564145821569359379, 2038836909413675927, 3897443379174295162, -5119639014672589741, 6741229205474319574, -8272118362889056527, -232476017639761378, 2071242714433117736, -3016240662933333689], [8688455073544252717, -5379381828373176638, -2956196255733197811, -2002667940457468358, 6728896022778397600, -5755974626350975401, 1019861100058561485, 7400139764869421434, 3695878536871396144, -7903533257255033971, 6278209596567492611, -569114385940853233, 3017386844444676159, 6365259914557504546, 4654195621813549773, -8391428294486689098, 3694653095052866337, 7398911004233750353, -8762005221602885713, -6996454984239796533, -2109310240738488061, -5054053626240198000, 324229968389124189, -4490696646375527971, -4653062715592054047, -1834276936703959661, 7817634099018037653, 7535958098206539212], [8688466689420208412, 630925162898834248, 5428862741449716747, -6242027352321438298, -5518932907118470233, -43709165024627440, 2865519177097147578, 8827357754046798902, -5292948379815186302, -5381255668431793649, -8493749189875872420, -7770639809979807386, -4140473869612818135, 449247872810021708, -3329100345784167054, -835040067646958564, -8641924830447507735, -8123178900420560413, 2266035262662194176, -4536834578961934867, -6427100387018442187, -5467527990882205637], [8688463370597746726, -254553605030898136, -3708153091069085492, -5151588178027996925, -5874690920268497763, -6227370325542467648, -1358567997945779308, -8774960251959201403, -5070717277484715386, -2576650361713224348, 3784013981852041440], [8688441798251745767, 7079878541573129346, -675745836954502675, -7448981169490036882, -4311952539367517955, -5035050303390287500, -5049242391454389722, -2983668759117547586, 5708688133951849361, 6756514717566587930, 999654800533447134, 3419601537494798664, -19947834742355613, -1062863587394293451, 8517603996289564370, 4516996465411223245, 2097034793743473716, -3452256025998461403, 1165562625214623736, -3900320485986702548, -8267796191391294918], [8688441798251745767, 7079881860411552268, -18098885825599187, -6735149727880792271, -8853230758628480263, -1681148087107388779, 7688471737753057072, -9149715716930782113, 2133140155970416336, 4627203752924766100, 8445364295212227511, -7182605615477204796, 3132529854081501772, -2121031532225440141, 6084674018972992201, -2538061820416609839, -6456404484140920901, 8684905787629373204, 4510355428029522811, 1294748979297834764, 5884460765239988519, 808095977986377050, -7471691585531962939], [8688458392364054197, -6939508199510897042, 793291232110039912, 5662095219101997859, -6008811468794766646, 6077259964296025173, 6051016221560647509, 7870422258810361929, 4977556126981668267, 5441190945911946192, -4273982526908835476, 8324198777063555966, 8913787883771686728, -29210838317457625, 9027083603926928612, 6208292846799821285, 6182064038760200796, 4100578068407741793, 7013660456218294040, -5437588902529851579, -6590534989118613606, 9037424965119394879, 7502935423744434980, 3623024392389834581], [8688456732942182530, 1422717553714488646, -4915730415319949459, 559461797952526699, -7424001035023517796, 3850713468326989518, -918844912337361684, 3968313106453793532, -8874664159367394028, 3309422459982820964, -5897986545214014698, 7234217772101073091, 1619340802884369028, 1767501508744285932], [8688463370597746726, -254546967375333940, -6216392181959267812, 3287339894352671265, 6843422162967240378, 482739565873114905, -3580197025317731684, 4078515415728323446, 5616218901602807173, 3122181855228150897, 9084033707467648965, 4178510807615246631, 1057215902488472590, 746677511544054533, 7033269799246156908, -2984447647470433766, -601677992697824915, -2501195188458798964], [8688461711175875059, -2002644708689595732, 906576995795236532, 5722880222013291377, 2319902678438076141, 2783557410292483358, 1829999225595977289, -664031183123114791, -2523269457032794448, -2833804529160071231, 7804821042882227810, 6403223289376584065, 3885719535494748478, -1763428781783763280, 8856834461405844483], [8688441798251745767, 7079873563355398053, 7802984602654713312, 1633535443141065854, -2144806137797558712, -3192636040232098761, 1397082383352318160, -2253299812996529676, -8437425912250519960, 4813948021847604984, -35236665651765243, -6204692462818316691, 5297212096724554657, 8190068272080542849, 5445384418457767050, -4309029312743459665, 1136855484610678153, -3939532534386864088, 1438762676118413796, -5733305060696279689, -8227366998228757786, -3225060991567084428, 405108267617046097], [8688445117074207453, 7965358968916752779, 4052888542416986763, -1908978244507627656, 7520680116540557989, 3724754202291502298, -3743648221530211533, -4214724406770168001, 2561137870219062373, -8808455263860717522, -7229229292537177293, -8837797527433525007, -9000145343121191398, 564849950143999253], [8688456732942182530, 1422715894292616979, -2768193356759231642, -5661066126238169088, -5197404756733518087, -5920517455449384601, 4334572840284639419, 143646995109841544, 757789464014631323, 3026644869786085642, -1563086829088178023, -4190655764521403854, 193212020573104634, 3498634206665668716, -9102500954404575659, 6850206072930319681, -7405625430886300186, 73263647202769917, -4516469711088045003, -1697688910433643146, 8175264292828752381, 2714250892309250053], [8688455073544252717, -5379385147190317912, -2560609324756307554, -5285073603561462052, -6082268314637139303, -5919907223656965962, -3499938914354933885, 5443051510699337901, -1353632275841117992, -4172418054731872584, -7117166418472595464, -269812566546133210, -6365816496106664736, -5091383537509627078, -7321046807826330797], [8688443457652335786, -5567363155003802054, -4727762363979170787, -1908974925690486382, -4633464095661443319, 5269123616710828692, 1094556663003990281, -4793208198642004521, 7070010284444621636, 2480291860838923067, 7366343312029770315, -8187549564557485638, -999103023326761543, 6247023494079870053, -776853667470091148], [8688460051764644216, -1140000844144584297, -1957440021193044464, 536626894578446574, -5009425089500822484, -818519157268775343, -656146450420626925, 7401358569048348281, -5217627650365620456, 3474712648612749709, -5143557253900386856, 1703761750392887901, 2642626401239402920, -7709234618808710171, 8516356982135674428, -6699028664317584570, 8590425719176376155, -4381107887707897764, 1506656973935436832, -7436355023443554265, 3550176118923329308, -3642102895652831263, 6923674402920302299], [8688455073544252717, -5379370212483919913, 833125128170595168, 1443695211142260190, 6312470988137973394, -3515998204835389952, -6232923048815476915, -3719251768271097186, -1845999887586181348, -7247123363836577221, 1003340189659096616, -1190668483508114175, 8728891670946997625, -7710461720049111645, 5482714329727196128, -8303916488329955949], [8688460051764644216, -8804760684886909240, 5052271602872508003, -7033826380774035450, 7238387246281076713, -6547775314220123808, 3206613525817960674, -8954155129613529548, -222606101094702413, 6679205485457309711, -6292338077902329884, -2906509930026576193, -338359342518626253, -8808468539150564266, -7199888688383581269, -8837784252143678263, 7026466874698539687, 7843882819989768052, -1733964456901278210, 760105777690014308, 922475165718361246, 3033893586741008051], [8688463370597746726, -254550286213756862, -8081034435548181783, -7033196236041526283, 1773056652502825717, 8945121070476436074, 6052251619830601138, 5245673503284035339, 2133150112443121806, -7770649766452512856, 1078679172629541529, 355574770969829230, -8098175534188828907, -852024125621715284, -678860053554008728, 4397544559550521531, 5336397594545022709, -7678205425247991459, -8951226924758438935, 3533658659077332065, -8436191406759269886, 1953036031610671241, 3604657085287489538, -6859407890267007674], [8688465029998336745, -5168563938946599430, 2564227195636804751, 8850821142736836939, 3449720898256973898, 2253687145275835439, -1051746656684703720, 6532898706731880526, 7580718652709676341, 5527347844700264173, 8251818761142361425, -1441171525377529832, -5615692015561924021, 8714221500598545347, 1468080048506797400, 3653739050232710043, -2855102593299460667], [8688458392364054197, -6939519815384192531, -1580830629092296447, 4705143129769213692, 812267111582931927, 9053934259629603023, 8236526611394528873, 918288330809483142, -223838180544854562, -8281361453542689453, -7327828160006665411, 6042524575866921042, 8536574897531424062, -2177361447506356797, -8025927536060658245, 7115371119815058723, -2124594093430166398, -8448401629795282077, 7560496525680838994], [8688458392364054197, -6359157205222706677, 812905553371595309, -795677616231150404, 7935873071709548398, 6569763810988184850, -3145429574778007758, -6282613586152526040, -2578365633441687288, 7736769836114359074, -3537909819605620949, -8109275870810052062, -7457021283465805751, -8625414769312752921], [8688461711175875059, -6054019475111119394, -9020972597514694880, 3724125716975544386, -6030261463645988841, -4863576611874600621, 1983735754765770146, 6100576268792878276, 3606515990655669786], [8688445117074207453, 7965358968916752779, 4052878585965562941, -1023516070687543496, -3936591820842531547, -2872996664617482037, 7915039946287687596, -7654138442399817331, 1112310419480814175, -3586373255686307364, 7502918829616165314, 330872665150132994, 6255522544016464502, -5939509162404717964, -7309472468814858741, -6532972227744376689], [8688465029998336745, -5168578873637036193, 2281937644197124955, -5450863446840363254, -8175334363282460506, 3984822400964001676, 3335796692804395544, -8263613441921444552, 7540909647814923524, 2951177948937999653, -1239721345659764940, -5755366053980428429, -1165647630374729860, 4548166105514883107, 3973247300875569739, 4962141915942779572, -5501174172421254840], [8688460051764644216, -1140017438251572315, -7987346399017552542, 8473599859448400676, 416083224103469775, -2889377128434102666, 9102399355132161105, -7371838934506053507, 267294032930255165, 7439348494452441700, -4749199083556507474, 9107804994206665026, -4382937822024155036, -192055121554660109, -9058348205663400068, 6569625023843173513, -2860039974839294680], [8688458392364054197, -6845203293537605378, -3539767832176476200, 6453232574027321269, 416078245869777246, -8319343081866686803, -8345580186965121713, 4139290462164251288, 7276363896395323388, 5737408418122616366, 8199794423252218360, 2704982910479173864, -7873447977520121006, -140655183533466600, -2654303232315294115], [8688445117074207453, 7965347353048777702, -2748590651384272764, -2910960039415279908, 2678134806985055293, -4150203339596314508, 8821356817870313105, 7212755394757329149, -4460755005835899721, -6954797030441588320, 7065071243501537398, 778478955802095229, -1641479397048513026, -4888728589974421552, 5104258540939529173, 6631038512067764737, 6542757774033511084, -7691014264200466594], [8688441798251745767, 7079875222755988072, -3634057803443369865, 144255567499009958, 7332688833437227103, -7409784055801593753, 40700933219181378, -7205437200039464059, -33376100882994976, -3907724452473259196, -4955547717270856491, 8488868777433681014, -8378617796133623944, 2896083431927036626, 7479644010405403698, 7391348337662091840, -6568451530696459322, 4706229784440071956, -142974816004709211, -4570325510974670243], [8688465029998336745, 5285479189369627500, 4636451821809431349, -5694576072832782176, 7276974128182421615, 4233003389873983998, -5482204930603927021, -6984507308604060, 5638309764262509027, -8218712567024202746, -6891820332942013679, -7638381485660141673, 7240231983567405632, 6098102153398586860, 1907192902320136179, 1921363418046218060, -6532353698901124247], [8688456732942182530, -1022884266554444310, 7708684674912453971, -4941985773939263436, 1905339867988293869, 763186806054262677, 6312480944615999276, -3602131871847854689, 1474247850098853749, -945722118627710201, 3447843739381215613, -8916198392452674431, 8932165147322795387, -3227999913974500598, -3390367642588956487, -680550434106028405, -1451648354897866162, -4270422517917985471, 8139130720584283370, 7480236755296169528], [8688441798251745767, 7079878541573129346, -2674525233155391899, -4283093468054399819, 5220651883552706414, -8318089430073193901, 738185099247063044, -4494528226923639450, -4634686218657511440, 387202580431049650, 5506024889363149826, -7864321208876154079, 4916895743152156199, 4193791341473822458, -395928741527145718, 5565904857183492665, 4011220632172675140, 2815198495043550522, 5633980955114503634], [8688455073544252717, -5379381828373176638, -1071946318559574287, -6148337656374257802, 8520074792869374718, -7432628915648379348, -8007551039123455432, -6398976166571543522, -354270787734257917, 5120933041435455584, -3788414520875626625, -2849561485902407095, -4842897076559842185, 7846988739517158654, -4447313464397432996, -6996466600107771610, 5311867464105595494, 6891103391901841193, -4779760151289620364, 195041823168996790], [8688441798251745767, 7079876882172539327, -5726516939118734115, 5872898173827497480, 3657921799702560409, 1163858202769492293, 4468696707633369988, -121036650657444932, 7273285420218349211, -3115935380493367514, -4237877164681892856, 33454642305356894, -1564322227374092888, -4659854922608627359, 4920592748151101170, -8806753399161087884, 8253028375478449884, 3737410217737479883, 6650485967913749582], [8688441798251745767, 7079881860411552268, 585715497157949627, -7221189178561408424, 4053488817757981580, -8505458865494849423, 8158735978170458294, 27140649309459990, 2549573487659014139, 4829246809248341526, -2556290472078347425, -1211012677380914866, 7290400734906509723, -5710473476134020426, -4101903581818461251, 4767026403216680345, -9044919939522760705, -6314277902666145418, 1787736018249683790, -6269818783561537118, -1595508461606022416, 4366361644157014925, -8827451188004706005], [8688455073544252717, -5379383487773766657, 9178346910497094844, 5285474211130614559, 5259232127798487120, 4211412181836652541, -7459486209011938367, 5025402693643634113, 8330216307341709369, 1482898962464985867, 2943314788560231098, 5683514451783002149, 4000877479816690442, -5827623241959418097, -6135538007269941467, 5463877105673629922, -5987362366719587800], [8688455073544252717, -5379381828373176638, 1792665995509406937, -2794458671856571501, 228693875739063519, 7400759953129225131, -4144180831079148164, 182237195825667514, -4407499481282288680, -5381234096085792690, 979430247482133304, -68422886717619165, 8182057260903664132, -3491441523818929455, 3606515990655669786], [8688445117074207453, 7965358968916752779, 4052890201838858430, 669510385396928925, -5218261113901969867, -286809899808076468, 3018625561553052710, 637250771781327671, -1356103072399646692, -5060346046892754151, -4106832666307461461, 4514669434212776969, 1621801642988813700, 573961784081568181, -7010652050516309636, 3698821676440865374, 3049802605936823438, 5469770915241515721, 4820738569444966835], [8688463370597746726, -254545307980064333, -7101875928125352931, -5959719547376840671, 5978177904548226264, -2079352006086551381, -1105597478337636431, 5040679908703690108, -9215169848641789444, 2870934772660318205, -4124576466311579885], [8688443457652335786, -5567364814404392073, 8292256251361052772, 9015362312439976532, 9103643050474230185, -4753367664944506511, -4252517597351215282, -6815416135921025933, -7632813827680734407, 424701148258286063, -2245910649480044675, 260649676731413457, 3269735516397745732], [8688460051764644216, -1140010800617289767, -18087269952303698, 2401859467009047832, 5749742493610542925, 5441826068883468300, -5331548537003717742, 5943142734605519006, 6105500506763230661, 4571010965366989114, -8799345089345020261, 7227417399772652534, 476110144385991608, -9102954277264770040, 2171720400216197042, -9057253122218682679, 8666379912178252648, -5106063796048489736, 8087735760802102802, -9024553412245620616, -480363862675743533], [8688465029998336745, -5168565598347189449, -3634067759916075335, -741201628087381673, 5220650224130834747, -1626680396014453851, -3916987456069642856, -8390191236800184214, 1924944232758522354, -1290660556577896086, 6840948047572948962, 3835417999759355486, 7539682546577182256, 784791289381440878, 5564828027262314549, -867936463634671945, 1552041802148046220, -6579578417878754523, -7080431804305148262, -4020420790087491466, 8139752568265958734], [8688445117074207453, 7965358968916752779, -8135517061331553474, 482751181746410394, -1199907362544620624, 7535495711665643946, -2367058812471370381, 6413430206764190794, -3090316804259466694, -7457789190825636142, 7386576162142558772, -4935963265424757298], [8688443457652335786, -5567373111455225876, 2772451328831642446, 8734309818705423062, -7853224191090693640, -1005890252106982120, 7051633020885532359, 8099469560975636604, 1738815173861794638, 5929719446698572172, -5706909255528704150, 6600796323368705042, 5951775593464073087, 1474709469993920697, -163191072002529032, 8918583291069733246, 5539062498531652057, -100221012137236939, -5948778803635384172, 8599695228689337453], [8688445117074207453, 7965340715393213506, -4445467834321759698, 4024657956419826539, 2242117023426416443, 3569004279293534423, 8064439369248000433, -553833852082277406, -3481583223141845567, -8640833065817271414, 2943303172686935609, 1632151301237434182, -1747364513064294272, -8845343599879574060, 983125593077828050, 6205823709623261162, -3163792796422703621], [8688445117074207453, 7965342374809764761, -4841023236501225174, 1932192183110179741, -3916363948992697885, 5912091968696139129, -5969611036267900595, 7283613506126289146, 6560495829174069897, 5763302777517604107, 4655444295373350146, 1388592397096424596, -4368290751720550062, 708098926698863846, 8617459834414910166, -3265505119420058323, -520788077580646282, -7382324061098505288], [8688463370597746726, -254530373268345922, -6498686711621999313, -1908955012745075442, -3051109734098318095, 6115236614386329994, 1850233735101375147, -4997096885046573657, -806184315172263350, -7166866912266388823, 742508930161375908, 716275143880082272, 5940815571686707614], [8688455073544252717, -5379376850139484109, -2466309397016708419, 5285495783476615518, -8834840219779544242, 8605864821402348937, -1599195510153543565, -8446519492664549615, -8682969233614874387, -1510936344438688811, -1223853045152096430, -3894436632894182425, 4163078343026216603, -5068098761828820198, 8238981580467956019, 3825827951801110150, -3346228169137627640], [8688465029998336745, -5168562279530048175, -3351773230256004040, -6618638403844057982, -8700099483009432898, 1162007594457466260, 114174373184503289, 1053035705216537240, -7856306878855532028, -4550871417494402850, -7267181051467000087, 3284243931297986133, 1749751071084603312, -4536834578961934867, -6427083792911454169, 3401395356518653411, -4428936200843664131, -1846616757034164183], [8688445117074207453, 7965358968916752779, 4052890201838858430, -6642070263718049796, 3260487579230785393, -3586852997387208675, 7029554540699730810, -4495760306397733453, -3353623838573350485, 4703911050292459483, 2562369949671874728, -256397575692680385, 5218781362311230677, 1027870451818888947, 5915041745902551113, -1376800861243264813, 2561149486092357862, -8808478495623269736, 6913807936934031372, -2029217335753427911, 9050398249004570254, 8363267317972836671], [8688456732942182530, 7245039899536072636, -4103738362648045936, 4477322928836359873, 773074976128181327, 4172206771092055197, -2991684748533439244, 387827746929866288, -6533573269683316116, 6827381126007663378, -4086609772672698886, 3646197956023013725, 2091473905121374320, 2862580122990647940, -7041223074722127996, -4983200493088969296, -1427109927402284732, -704007185161783894, 5508493133747705364], [8688458392364054197, -6939513177749909983, -977651369058988093, -2119789496278640668, 2544009280241055117, -6579414739575921365, -7687299772281247372, 6169719240188323127, -9082258147843023586, 9202111559596507945, -8270881305181269995, 7063342696485887920, 5693415897146767543, 3251976020631551076, -2935987530182946771, 768280335449361067, -4336501816127809440, -3613389117393321484, -239750518552490811, -2881954908424006745, -3192501596421918811], [8688460051764644216, -8804744090779921222, -5895524045693018771, -8318727871840575635, -3803076525906911246, 7024157198686701516, 1039470443065142705, 6419110736226398493, 2130674337626958723, -1534373182572975214, -7496221715971390154, 8342433168014664314, -7049248888890360008, -1087383761361015196, -5051106275061582911, 8808536363044542481, 6801130745640663372], [8688443457652335786, -5567368133221533347, 2469915652010609097, 1672732556832169189, -1730236689710833686, 7078623230357764777, 8539047353503843811, -2326020148574753049, -8854454541025138403, 5989880942524940101, -2429576442268472678, -7128280030365043921, -4631607742485857675, 8603387387190916247, 5616843175288337578], [8688463370597746726, -254548626797205607, -2674508639048403881, 5003804847953398666, 8708047822443845919, -4337559499749404934, -8779142108631726772, 6185606687016855907, 1826310517650526327, 291822635673496241, 6327761478487876133], [8688466689420208412, 630928481731936758, 6220034944008227654, -819132707873014844, 2300926798965184126, -6642071923139921463, -7291092653041893212, 7078003042097961080, -6367653829131504231, -3062843534250570249, 3961041924355545167, -1401483054117550109, -5592410558695598209, -117205070111993659, -4217038294399132649, -3833034760558847926, 8253036672529283687, 3250738962923764544, -3035845027722183616, 3994069577056662340], [8688441798251745767, 7079885179228693542, 6126341929241245678, -1681769934791724349, 3676892700941759895, -5826832737735896634, 2054137356217662694, -4306543581475872760, 4997157172956037126, -6602256280605565686, -241598574674582446, 481525739927880587, 2711167437898583347, 6129885344127767871, -7380458518074760844, -2378169105541357152, 3982493578620658411, -3439929349237738509, -1746759259510888574, 6060123843867788930, 1572256398726654580, -1371538855805817994, 5800515605711048129], [8688456732942182530, 7245049855987496458, 1886359010273728707, 4705133173291187810, -1655539467327571987, -1493166760479423569, -7853829444644099338, -1891979251826472937, -1205468251145438372, 7001939164728681754, -7102502754040720824, -8076252303555943245, 1435682540543509806, 7323422511023702169, -484682715351043456, 4044987215610171085, 8987261323734348433, 3910863348264100722, 1210954091058855466, -796454845167485329, 4678737368126272477, 504198624418339015, 5093922026239108671, -7066219803295635100, -8436186428522917151, -1871150338011097788, 6858071659333224925, 2588763070921170135], [8688461711175875059, -6054037728639979079, 6032037023270614220, -3796438807363633734, -4593643474890734807, -5316736260679811823, 3301528663599632213, 5308924324536126264, -7531714294221300149, -285581139177725799, 6561747821572293192, 8662824881421095172, -7067622833611026363, 7188225264317901934, 7911337963031108242, 2510216146205244242, 7466197490738564856, -5018683114863513615, 4072484610155002887], [8688445117074207453, 7965358968916752779, 4052888542416986763, -1908979903908217675, 7520703348281828555, 8136202515721212139, 8611898945792810770, -6486978695422233771, -4804318491730612734, -8508576400911496750, -1766975515492747159, 5683534364707131441, 6805457895372117510, -1252076993493692458, -4572786351079114915, -6181381136557816323, -5458268437844610015, -4836113298333089234], [8688445117074207453, 7965335737175482213, -5122704215530454908, 7848817775488504140, -6271501633660667602, -5192012392930239468, -7686074330468037977, -8900299329729564514, 1488919811586882604, 863807364424041264, 6859331948782282023, -3455810158431988741, -1277702207383157474, -3869906502470716446, 6032659637555554606, -2247141201273913775, -4365210616148306278, 4690313366538334552], [8688456732942182530, 7245031602479918421, -4841031533557379389, -5638234541662608795, 4750974643181132853, -1210873890241223941, 3791435435237590691, -1665407724477361345, -5856330250837678152, -9112347639208364058, -7174109884363072033, -4355339040181375646, 1680611418500979323, -7185694940897607380, 8590438994468883105, -634854257293633573, -7556270208613213976, -77374492889861325, -1733954500444533976, -5438204112555962747, -379426977448545119, -482219449205500859], [8688456732942182530, 7245044877769765165, 8198559917758308080, -99452080259716435, -1221368973285099544, -4871759466690101595, 5916275484790536165, 4759468714878714361, -1202376499705219511, 6043771590047413044, -6689158747772525605, 1561289871030051263, 962910996517841132, 1686031992281881243, 131301303745959290, -3135553913369389182, -1971472774270523473, -7859250911222326255, -1823317046641638892, 2228062698010917093], [8688458392364054197, -6845214909410900867, 8198564895992000609, 8662201374338829789, 3261102789254236355, -1572349832663280035, -2938442499277655565, 7304607757682330356, -3953722963034415055, -648911008750230848, -130146825199744253, 8001451822499676973, -7288020814525803643, -4034447672152574391, 3624259790659788210, -2526352144797632836], [8688460051764644216, -2982425063775478506, 3864890621679373329, -1681163021819107190, 4166180943736465931, -1869772833763030312, -261186345340483119, 8607722067353977930, -4762645603226006522, -1531285516550502443, -4836730934384337091, 5911959819190730752, -5615685377906359825, 6943273921217106461, -7312554263782372132, -6755849937170037820, -1377569661379138553, -8313172722529128649], [8688456732942182530, -1022879288320751781, -2466311056438580086, -5285066965927179504, 2583218009802793735, 5982339848293962135, -1637175479079611102, -8883303655886832717, 6935871482410774716, 127121106489985176, -6970831429745601124, -1872877093876529865, 8823198236339500750, 7775346761542998506, -4182151736329835228, 8566513985862496472, -566799731687341915, -8299612438619407261, -8610132576037625839], [8688445117074207453, 7965335737175482213, -5122700896713313634, 5192419638133674523, -6967747082564211481, -4698881720320051692, -1789656697018078154, -779935594184571715, 5090229999457894993, 4367123938378971233, -5406869266447963176, -5757838509952848178, 6257374811731740760, -2833804529160071231, 7804819383481637791, -4355335721342952724, 3451557338489808808, -6376910195074983901, -955582078718685138, 557447511337667508, 2095179207192434742, -8590531530081878422], [8688461711175875059, 4305705471920687480, -5895537320982865515, -8389574367360181997, -2427714218061869508, -7017429322829145155, -4520788563784626574, -3797670886816446089, 5882634281463897843, 5284242131661840968, -1884580131853243702, 8034961769091629855, 8973818122881990659, -2300843279309129679, 3526878067950015478, -2888889089679707346, 8195473911155046770, -258251502821847692, -2010066293824772365, 8096848361364218400, 3831857097952559042, 1013076297298157185, -3064550508904257532], [8688463370597746726, -254535351507358863, -2842903854413718643, 5567780356658660931, -7403774822574274153, 6852060000064807400, -5386031162789749639, -2026121372677461131, 4749762476639148760, -1610921779874188174, -7720949272664039909, 8943282078053666766, 1964143005868837150, -3289410083360668900, 984375926075461326, 5175278539490367193, 9215061611721791312, -1424781105088203733, -7797508719211341482, -6242787987148124999, 7161199314417817228, 6012426787445426355], [8688463370597746726, -254548626797205607, -7685442526337598997, 372072449606741885, 6259852245961794892, 765055667873866747, -3768198264893768040, -4910328095062586812, -8512740004060482846, 991002028742783143, 6184544791786114554, -6226273714396243708, 1133760414332036370, -2003423597045142118, 5356618828760573823, 3370821013495693777, -3801238426260185287, -3910188611413466584, 9032001072521351685, -708175766528501283], [8688443457652335786, -5567378089694238817, 6032028726214460005, -741193331031227458, 2584446770438464816, 5927223758958279797, -8077957618793079273, -1346868278804828187, 7430072215566211296, 4611303030785104928, -6916340506908735424, 6325895803743766573, 3757768447977087199], [8688465029998336745, -5168563938946599430, 2564228855037394770, -2190639310612728098, -5746729876299412662, 6851451427694260428, -8215773512896421460, 2589260431244089371, -5218879642763843751, 6380548745488195824, -4649965093115497248, -1706470381189548918, 3452787758539370938, -8885797684205253425, -635330811895098520, 5502937223359298497], [8688461711175875059, -6054019475111119394, 5937733776692592163, 6076643094848042338, 7050410897889464238, -7205418946531886022, 8687211378202183637, -4322445963016123951, -5931022494965965674, -3696430140186863805, 6840337815783190529, 878480985328621374, 2487070792568309841, 7962246411752419423, 6988520093986448186, 7711612879775525202, 4406170780780113476, -4536834578961934867, -7842266721505922771], [8688460051764644216, -1140014119434431041, 7802984602654713312, -5003410878039810355, 6521930519618725954, 5474103936001327179, -8531095695252289516, -7299725511905767705, -7211458049156040384, 1406816831574827474, 8430707268414635419, -7359630370889252777], [8688460051764644216, -1140014119434431041, -6799965417803136220, 5286102696446572471, 1169270479478278762, -3420451262923279433, 4637091922998684750, -5412271586705325823, 548963396091509822, -2269824042218456231, -2181548282396613459, 4138698483900692334, 8294726155140877917, 487831435872943688, 2096414605478349607, -7051571073575478871, 5093303497395856229, -868553333079994574, -5295432451679522982, 3322845747892428004, 7917494915355794330, 4429473809984459629], [8688465029998336745, -5168567257763740704, 7877076571460627459, -3397631294234315659, -1937208830507448086, 7982344686313381166, 5709910256950577688, -7071308354478322609, 8069998598453548574, -2643944384218514833, -1670201472358856608, 7833535582192095410, -5494367929061816757, -7102966033357659439, -2026578014354796786], [8688456732942182530, 7245049855987496458, -2332780826772619932, -724225867166118962, -6820201586730405745, -8359163702637395315, 4937103702077860569, -4862961401848489453, 8108577183298739261, 7589821296799086469, -1276460171460299855, 1157691928852340435], [8688466689420208412, 630913547020218347, 7406782461646391475, 4234230491109065060, 6728284131569427706, 4838015004693118906, 5748500457669063864, -8861709129008418132, -5482196633547772806, 3136074928365953778, 4016138100767098213, 2477182622494391191, -1713718331525245069, 4646941033827609838, -3410573942114070838, -1802009026034864398, 5730732533126349877, 2203056012964704519, -3198069122678300755, 1569783942727632771], [8688456732942182530, -1022877628898880114, -8194947025127464648, 7433032842034673129, 2282562810693281387, 1485376396697700205, 9144075562453908591, 2520099206319784835, -3367673952374383564, -3117180735257308261, 6386551341081232876, 911380700128155617, -7954948891032983300, -4413047094593259684], [8688466689420208412, 5285480848764897107, 5447845258562211722, -8993370496833492568, -7063904256271400845, 8794471314531790991, 3319269144767987921, -5373074473011562282, 6787097225920016251, 204928333842325421, -1051119064163410599, -6127513720797895594, -5404394384429125090, -8833625627231044902], [8688460051764644216, -2982435020248183976, 8292239657232783106, -4266717982471471719, -5632823924354412345, 7941291986068578651, -5252519186652649170, 6701418541176316532, 2111701776995149836, 8073556948049128972, -6079800070273865413, 206760688628151975, 8759444441629276712, 7711621176847640653, -5061442789762003413, 8308895011442427925, -5784714056839946470, 8957793680050683325, 9174017208551764454, -7695817968538706091, -2808648333874255386], [8688463370597746726, -254551945614346881, 4938985839208593031, -3852783657334987153, 5827534786235203523, -8016059278910868887, 3164932340278481895, -7224271866326246812, 983140527784226049, -625459235928167888, -5289259671851113898, 8567764318860129748, -7668949059307171995, -4850154983362923394, -8887491383569093964], [8688445117074207453, -4941994070995417651, -8344966636358222006, -3476159330543802373, -583303155187814181, 761968001875335830, -6327216338915473090, -1250834957573495045, -6293566838559282613, 7962244752341188580, 1210939156368418703, 3479792902718001355, 1150900620199300351, -8352849709641498411, 3955499289259645250, -1519724452828877131, -6522008887144549530], [8688443457652335786, -5567379749110790072, 3054110735536152869, -5638229563444877502, 5052881834664926642, 8357698767182803378, 7935871412287676731, -8014198714123477178, -6648099409893440542, 2855622709967074713, 267299011147986458, -6093381926524267348, -1054222431479585155, -4834417939547377028, -2372008702655222820, -2313203905376749726], [8688460051764644216, 6265247928558272931, 7218787859725919315, -4941987433361135103, 8029562767656728894, -1798909744139096138, 8989120229102528681, -3171041513374965824, -4367047056378480982, 3991123118670051836, -1657993669800394317, -3266588455276435519, 7934020803975650698, 5384862690050240997, 8220634186332303564, 8267852267675651292, 3678123887618528901, 4731371045016829596], [8688443457652335786, -5567378089694238817, 6032028726214460005, -4682514531793277807, -5257459887012284663, 1616394344497758524, 2339492108517867863, -2073663179568189467, 6544611701162678391, -6080573848643431682, 5518844583133242217, 1639710648989291215, -3451026367017878536, 1223290592571918714, -4989221342189584385], [8688461711175875059, -6054041047457120353, -4237247019949383689, 2048706825964055304, 4957973334554780535, -7128129627330775859, 4373779910451108430, 6867815297403893039, -8908312000328314898, 2220208727481307338, 9195472181636679178, -1518487395142372247, 5257391475951185939, 181010094611868100, 4564829756780682141, -2263515027456251856, 8937080956521948853, 7328521018679095148, -1688563034581680804, 4273293795870228145, 2718559788519825124, -1830108355315960624], [8688460051764644216, -536838178218263961, -4425868447785223742, 8545704984992532263, 3958573679992271277, -4776836031873557489, 6748502046967837546, -3829942116300022420, -7608293653711352456, -5999697208816099793, 6787083950630169507, 3097498002937314346, -2864365465154197563, 839907378717123216, -5372604556044379883, 5619792185888824334, -7574015668017922419], [8688443457652335786, -5567368133221533347, 2416056533306842583, 4423457172477029163, -1937210489905377899, -2817275321707112353, 8782131494198926263, -2270282211576016789, 5388423591835755793, 5604648779753388177, 7213233608759384115], [8688465029998336745, -5168557301291035234, -3841660088969833226, -326023607611488233, -7498079728547565817, -7409795671690850478, 3864877346389526585, -3719738147608941251, 4898548348995222096, -7660452435395714235, 7673799776265028217, -1306415853901020489, 2884496715991911260, 7210918061735149860, 5331481785345869243, 8591216091679532502, 7008112842907323036, 1606991026081459036, -4033986052238886001, -2986154490385134491, 1204139550640602962, -6042005220270946465, 224369152032746070], [8688441798251745767, 880333253041237426, -7177185041696302876, -6454087277673533331, 3226219550028682268, 8302607569026224509, 2468693529014540976, 1326535488844157049, -4710608882838021298, 4315567858039459312], [8688443457652335786, -5567371452059956269, -5330934986378196593, 7737542086830302500, 1040079015456971325, -2755863492899072384, -919455144129780323, 7360319144098712922, 1172370527995933486, -5999690571181817245, 5030803354497746535, -45573048631820629, -7514600638947030686, -7676950114032626890, -6332780546354713760, -2167958129090057309, -5570955585610683485, 8684909106446514478, 7542757703913073305, 7705098881966457148, -868696966733012912, -8040753087655789466, -2565560874380653102, -4277695359411503443], [8688465029998336745, -5168580533053587448, 3301530323000222232, -8223786183495171844, 1456490774802228375, 7817161756025718565, 4201055885932467863, 3810871275210280047, 2454643415208187485, -4392680567324100213, 2201664598522608745, -767741066926596992, 3719183225497613964, -2727296798862009805, 91475704757519485, -6113475222864837592, 5309390029894162804], [8688445117074207453, 7965339055992623487, 6012435977293585155, 1163259586850369143, -2749227433756384891, -6393305593603322941, -6026551183357197126, 2665790775024423264, -7307616882263819767, -2717883523973004847, -580208084903851986, 2947463457018780431, -4859416327545416005, 5854533292784871804, -1056079677449835590, -8672634510072651904, 902869141510299858, -453365356128735458, 269732407896694293, 5744959468807678360, 2831860486887477889, 2108754425808554129, 2223125316471083080], [8688455073544252717, -5379371871900471168, 7708674718461030149, -3962213715914855289, 1114170984249584442, 4023404304626333637, -7177181722879161602, -5568621785036307897, -7325362341681829240, 1085316891170158835, 2944536911556299219, 3607601117648963353, -484672758878337986, -1532532530730994445, -3315033637854864309, 3856997591923391454, -8875912832948476049, 3533658659077332065, 4261708739335692798, -2247141201273913775, -4365220572599730100, 8606352860156744257, 4019226533395496212], [8688456732942182530, 1422729169582463723, 2376239231353275345, -4941977476893750045, 4279475004477816766, 4686746719886599939, 9025856502691847550, -3259334760082500169], [8688445117074207453, 7682422678656197240, -2032754113003007350, 4814586463636268366, 7934640992235454395, 4555100286775904120, -6931015787213905553, 6928621872658527310, 7746011267364741775, -946334009834019889, -8118403406062604423, -9128269933694026189, -260581984579082006], [8688445117074207453, 7965335737175482213, -5122722469059314593, 2086691773129135782, -5159469591913343517, -1739345204809979692, 1397680106474116313, 6872907167403721822, -3030904327365208329], [8688458392364054197, -6845204952959477045, 2124007790541946, -3890740394498502476, -2353008698643735242, 2463291208754518123, 8292856526675445529, -4526814391118934192, 2433821905656961966, -5844585727588173858, -130781948149984713, 7115379416871212938, 136222091176145079, -3447326043185831055], [8688455073544252717, -5379376850139484109, -2466302759382425871, -6359180436963977243, -5405640505798991065, 8168487020502615832, 2809791196552495346, -3532495883459001577, -8757056224189756211, 2916427625821118965, 7844648301308500518, -7692867430279276080, -5458285031951598033, -7066853266850605953, -3128912875987688748, 6864102464906545484, -897390832049771957, -6785190541323633844, -3648125404169997607], [8688456732942182530, -2025491227960913200, -1863141752854035348, 7714690589322632297, 323017035241214868, 1931585270140222788, 7520683435357699263, -8844582965058207771, 5502336181423019276, 1798071634583910858, -2689797469979095159, -1736255879389577108, -8230437177328296100, 1631666581300180136, 6015532706991438399, -7333242096153284783, 5859935613036914039, 313898563648081744, -8139835147406248581, -3550133317928819678, 6468685718143745611, -5617402309030092372, -7476628967071796952], [8688461711175875059, -6054039388056530334, -4445456218451124415, -2307784098199112828, 5897913155921883651, -3813436140628237198, -904186226144499985, 7627959965794294635, 9176483026889901655, -2098199947663180878, 2978193049573374304, -7661674558394442562, -7499313467416929427, 5401370325138577474, 702673374678948985, 424092575869117649, -133843830193368812, 1474709469993920697, -163172818478989759, 4578428207143392506, -2224441634480736537, -8112224749668892054, 3973848342819829578, 5818879593980290662], [8688443457652335786, -5567363155003802054, -4727760704578580768, -7620618539335158979, -3030908412804236067, 6945753014829129170, 8554337843856406756, -5411656376679214655, 6600316449942118203, 6688622079163455943, 8033881620332028817, 8942038382711597686, 8042365867298551619], [8688445117074207453, 7965357309521483172, -8081634710862574540, 3834195876760627159, -6629135146288523604, -5020545339046174931, -2751696570932945014, -6242794624782407547, -7851376134973922417, 8322943465848191397, -7180295939462706419, 3974612164737972025, 2975708977706377418, 4554963159034143008, 1249512762979916861, -8981796289542385628], [8688465029998336745, -5168578873637036193, 2281924368907278211, -1908958331562216716, 585087011841991715, -7997232909674919937, -5500553984161451143, 8755277519660489136, -1810509735385349896, -201914949906648488, 8667010056910761815, 5361548044969939149, -1583306403903139118, -6010663736507382698], [8688456732942182530, -2025482930910079397, 6709918483904915566, 8247643542125400252, 2772439712958346957, -1422927177953716014, 2716106478839007379, 3669643091189512489, 6974471639580684714, 5964583539624543637, -4424633942288653256, 5079109749915202752, -5384178128452586917, 1787858079562021581, 665944505353779746, 7234060863174169245], [8688458392364054197, -6939523134222615453, 511006658922674087, -3679914208021091465, -1259950876952751917, -7016827388092880731, -7517675796285581941, -741830113403339585, -8725268055221562259, 5065833546204101058, 4829400399360764304, -3495652351543377800, -1688554737530847001, -5779129810287836945], [8688455073544252717, -5379378509534753716, -8778516942154191782, 725225090651734413, 4355400987475467898, -2589463417833072955, -2427103986274771281, 6099477998246064317, -3803079844724052520, 4344280737946076687, 4318045292250892002, -2685627229174544867, 7142856898494575654, 5079731597596878116, -733961208183293067, -2219517528246710504], [8688443457652335786, -5567373111455225876, 2772439712958346957, -5035665513416398668, -7948754538882515111, -4244516542625760387, 757787804619361716, -8185205939249391138, -7532956330138837356, 199829826192252854, 2073096641562285043, 5965822256732920188, 8630256296425110549, -3455831730772669288, -6368884249186386773, -8219905599839337, -3331547910596104776, -7183991416802708135, -1782859643501478459, -6785190541323633844, 8061370082945787116], [8688445117074207453, 7965344034231636428, 7877069933826344911, 2612695609959164313, -1239718026842623666, 2988531091948699297, 7028340714757156698, 7751445116435490439, 4638928363228859454, 934660497575269968, 3317426833525417133, 1762709420279341924, 2041308472594091091, -8299604141563253046, -2263663639332321899, 2731996351713958496], [8688465029998336745, -1516621852118627803, 4844062404392048925, 653149834504437588, -4030891748598091918, 160004227182531401, 7163681726862942447, -1550745349336101834, 7804837637010497476, 3215104278719682556, 4337026149962796958, -8688401423285033032, 8388415851088058413, -4583140987582709574, 7799261813697961317, -7828706437596201383, -1708164080558709869, 8109188181694422922], [8688455073544252717, -5379383487773766657, -1071944659137702620, 536621916339433633, -8967138369974070599, -3062226664823869062, 8764383482567040538, 7790642230129253980, 6014282373996465329, 4459564960747729914, 6068151449172937313, 769495820813806846, -4879637561758306913, -3831814296960709618, 4711151470196548089, -4386045400973417305], [8688443457652335786, -5567363155003802054, -4727757385761439494, 3890517494990710012, -374485384294244835, 7831218507484976046, 6783381967397532007, -5302706059797587624, -8215773512896421460, 8340709730990315365, 1242737281809318125, -8654864926113386662, -3239716227227760149, -3077358455064728082, -2650577124522779404, 2425790981529351897, -1839201941277577068, -4657984401348530180, -4495616672742054909, -4111004566507281360, 6204129243650835189], [8688443457652335786, -5567373111455225876, 2772449669409770779, -1814671679117784737, 7540907988393051857, -5904773773999555687, -9136133860675059766, 5941890742207295711, -4254373183902254256, -3234919160523803200, 4633352539916323295, 3024790942651597923, -605365041242685858, -6066385079417752382], [8688466689420208412, 630920184675782543, 5824454650662959739, 1633520508429347443, 2000274918675473258, -3474928910488919831, 40707570874745574, -7637607575543608228, -5217637606822364690, 4360194735356963161, -5554424718754474382, 8302612547243955802, -1187095965825362036, -8359160383820254041, 4640787268597039702, -8803667392579108222, -4213940671922575850, 6914565121196609623, 553890821155978159, -8360389144471886358, -9009416512032082509], [8688460051764644216, -1140004162961725571, 5635823266375695864, 7244431327144244016, -7854446314089421967, 6796338657175719364, -2730228322536901898, 3231620210864173248, 6861796107703867969, -8618011437709096179, 3245190451249260312, -459047544988872970, 6915665182880339953, -1628529344931210277, -905424943247556124, -8147861093294845709, -679453691239439349, -6567253400513301236, -6972078443926093126, 5188081639137510330, -2317507823345651650, 987917681542772058, 7903464714476230337, 4361562918036506721], [8688445117074207453, 7965345693626906035, -2674506979647813862, 5943769560499605251, 1530599337725771364, 1368241565562739297, 6669466059001107868, -5889501537178512633, -695977027642759259, -3412910168692301467, -6305774641120405110, 4894831299330501069, 5942684433527593332, 2400782637087869716], [8688445117074207453, 7965340715393213506, 1471157758056564701, -7221189178561408424, 1397092339825023630, 9055786527342219075, 7273265507294219919, -1345009373436647939, 8673793068512968096, -8304055910352546780, 8608208578428148347, 7342551219555998935, -7799351030472533712, 8066925993307591923], [8688458392364054197, -6939524793617885060, 6823199269351099245, 6985581932671953133, 6971379888135145441, 6248275486475433142, 4770588964426727014, -3286940946202730219, 6788322667738546058, -403959665633474139, -830732699119268602, 777855448703868610, 8909480646980323118, 2400637344007659299, -1790276885280542057], [8688463370597746726, -254553605030898136, 6843420503566650359, -4431264130387022193, -6290474194300457107, 1767027506330095177, -4653667076348134748, -5209004747961150403, -2273989304783993582, -5676960210724926270, -5514604097981105664, 2292285643050475830, 7693400822220775634, 7385471122219815501, -672068744879686996, -1409356937550007508], [8688463370597746726, -254532032690217589, 6521300374902178023, -913440932684729430, 8029561108234857227, 3442444737946314652, 1435050736410410620, -7528164241673893348, -7950011509514430935, -2474787767401966700, 756560703384280654, -2662322540569608695, 3624256471842646936, -8860629111993124064, 7092049705361487769, -2715580485608750254], [8688455073544252717, -5379386806590907931, 4449089024022058375, 2911357328167291141, 6615605280878129893, 3310178116570494724, 8499835305124963919, -3586219533837558234, -449194222550802023, 5026027860139790545, -1923780564364148517, 9155798513341450690, 1098281877999179995, 2072021471041696946, -5985508439587760287, 6704365760613284857, 855798012642432154, -8619236879543587222, 3689090547035497334], [8688443457652335786, -5567368133221533347, 2469922289666173293, 4649413489802689793, 4487055717663599580, 4398773320207474260, -4219504879364476726, 856888117874738662, 8103034548205499550, 7055174776352843091, -7420277479450199749, -7332010016679190780, 3942672957852610105, 4475462364051628370, 7854989794242613549, 8902826334311436146, -188341390685798708], [8688458392364054197, -6939511518328038316, 1980677191536867115, 6303212962799224117, -2389147249105935546, -7864336143582552078, 8309995073128818461, 7586903946737671258, -866836401953601821, -1589942463029865375, 8428841725412172623, -6618778850402960368, -4825136682451395949, -6433728149110295877, -4013766477439886142, -3242656940750811042, 6818871226806358874, 7574541661269461192], [8688455073544252717, -5379376850139484109, -2466304418783015890, 442927242158560608, 906575336373364865, -4941989092759064916, -751079841709876501, 7870435534100208673, 550197134960873432, -2716653103920782511, 7524383759195067156, -419837156010583097, -1237277992459633283, -5428180605895820798, -679471944762978622, 8824281703916243062, -2376322577118111862, -3424169073659639929, 3599723022580758035], [8688443457652335786, 3325915160364759442, -2032755772403597369, -984919232316153330, -6969587734403532044, 2195495005809597261, -1035863421452015769, 5736159744541534345, 8445968655973628624], [8688461711175875059, -6054019475111119394, 5937728798461559840, 536623575761305300, -186484144739490127, -98201747283364807, 8574559078071957870, -9149083912797682927, 3449087434720624487, -4283710337497062242, 7876438129693245725, 4571012624783540369, 3528100190948743805, 6420971300995168760, -8720329014283798433, 817075794154863953, 5480887845969726894, -163333046244316527, 7156893737027043637], [8688456732942182530, 7245033261880508440, -4841026555318366448, 1046716733997588631, 7822600583314198522, 3232857268571959780, 6199810390954253618, -3224898972664841289, 5996536914575795650, -2098199947663180878, 2978181433700078815, 3293668822060286580, 9007482557949899547, 4420369506478498246, 6914414849903988325, 7962251389975471128, -8929778589307806759, -1117943169698858479, -7155127367250577058, 3159996486434834021, 1551426592119274846, 1389053885271126428, -4646868363436265446, 9210134054926317035, -1179081767551707161], [8688441798251745767, 7079880200989680601, 6897904788769233511, -3491297758440225589, 7125103142017751760, -4361024547861314638, 4581972514824579490, -8788373583414724415, 792045877367380813, 8849580766230530575, 2340740782080328442, -3945853165017043540, -301640429660842072, 5291177972339413236, -1619420063186235953, -6206531455262367647, 5656665455475597345, 1465759523243550204, 6393965264019213346, -4342522665228424529, -6230456463868754280], [8688456732942182530, 7245048196586906439, -4425855172495376998, 3819667680656622582, -1655534489109840694, 3442446397341584259, -5084759094256196310, -8789000409308810660, 2300308270121931684, -6769266587442702106, -7120255743892998048, -9127658042485056295, 7764391849740972326, 3174671766742664356, -6329695432548777447, -3510917950711516864, -9134282485741147269, -6315514960373931950, 2430711007890558423, 6134953982365044440, 2504794679648298973, -7736228908172383538, 2401390316661091691], [8688458392364054197, -6359155545800835010, -6270879786000273886, 3232853949733536858, -8927916365122485237, -8711704452494699597, 8330849770899340428, 5660218060212938544, -7306381483972584490, 426416288247762445, -3764507897534426029, 5989902514870941060, -1202371521466206570, -5718019548604011333, 5659139570869888761, -7975145365832359357, 8164892930497804588, -7708738025091716163], [8688441798251745767, 7079891816862976090, -7196189131170760046, 8357717020706342651, 5032038752788981812, -3171673317510725216, 154009928664270006, 5230376375302510258, 6727650668035738501, -6605340627792275741, 4221883140325971345, -8971923054180185389, 2302768217429051359, -9168695808018140399, -6275832995006588011, -1387911154313251584], [8688461711175875059, -6054036069218107412, 1678758384163816601, 7079880200989680601, 6897911426403516059, 2723367704467210480, -8175937957437936391, -1815283570326754631, -5218247838612123123, 1953785050564062453, -8834229987992446015, -123512425473608015, -9038115355577213671, 6005654493371603777, -472494825714050251, -1338835827002313627, 7279435734911412957, 2553874985176968223, -6537291080419676612], [8688445117074207453, 7965337396576072232, 5240883074240962998, -8129474639887597632, -206091828345481328, 7909629328976830940, -7083495345749122380, -5474928770271986127, -5608909003957057534, -8084582062046510041, 1136848846976395605, -7598570821362138631, 4370058780897606660, 4207684414627586575, -1680092062905004746, -8912029811064675394], [8688445117074207453, 7965340715393213506, 5220636948840988003, -889367312180991106, 7728904249732735478, -6791952747204385836, 3414205854893000213, -5452095526293175609, 8994052632408670165, -3838101739374252828, -945247223440136303, -4348214810563927717, 3125718632483050748, 2815186879170255033, 1032675815576339905, 7156893737027043637], [8688455073544252717, -5379376850139484109, -2466309397016708419, 6702662236518385612, -6875301081956439859, -1079224138286784788, -8251275280991830049, -1479288622032057451, -7609504160818163852, 1082827841090751068, -882120254642619952, -6730701277890018369, 4919368965757103236, 4756981324194576201, 2168654306555686466, -3306549522608706623, 6595990066837870941, -8957872940352550250, 7783371048031005615], [8688463370597746726, -254553605030898136, 4543398908234362980, -7056032798837478075, -7082263266298970231, -795687572706516080, 8708052800682858860, -4471691664127687658, 4259847407942375861, -7826215728094921949, -2897995052586258748, -2174893969746347929, 8835387018752537304, 4452642395383946244, 2769972235198338089], [8688455073544252717, -5379375190717612442, -4915727096502808185, 1444912355904635782, -2729614771932662397, 2910743777541769992, 6614988411432807264, 6452632298691646864, -8289843909364315266, -5795810181828081912, 1450329610865736222, 402489751961150909, -9027160312036200933, -8466888577700492539, 3058439544668197026, 3781565518692531726, 8107961973272628093, 7800047207940823075, 7711759832251005226], [8688445117074207453, 7965342374809764761, -5330915073454067301, -2660326507457007129, -1937195555217601342, -2661568543398486190, 6253041024363343868, 6976178614252993439, 6668252233055873550, 2746038929535797241, 3768126535023508660, 226224738583785044], [8688445117074207453, 7965340715393213506, 1471172692747001464, 2119571575004540733, 4864285298008190058, -3193267844365197947, -6330301452726729815, -191886464991532362, 2302163856651689010, -5890726979010343470, -73806953446122127, 4515898194848448050, -905426602669427791, 3981728097307246357, -9043687860069948350, 3631532632174587830, 7261706869597731296, 89632495151415469, -2376324236518701881, -6550861320823385118, 8738609656801505479], [8688461711175875059, -6054019475111119394, 5937747051985099113, -7033826380774035450, 4314960178460916925, 7714090314008239540, -7023476722525414968, -7997212996750790645, 3898540122040884218, -3720978524133869057, -7123936154784955001, 7131872117274433064, 2957354945909840355, 2234232290723928577, -3932891497023785096, -7637122855627635830, 5895439040527592235, 5376696429317786187, 1997159042675377186, -4363500322656196073, -8887491383569093964], [8688455073544252717, -5379378509534753716, -8778525239210345997, 8059662215492114630, -3615070308097182361, -4338209557411363805, -1166883028665965137, 3701904364205703762, -8606413105879393676, 332099766382553850, 2205388154122528852, 7281772854284308377, 2170493299002397628, 2343678943410784731, -8629123390198294411, -3227993276318936402, -4384821618576759165, 6259221208431960728], [8688443457652335786, -5567373111455225876, 2772434734724654428, 7848829391356479217, 6240266134696484238, -1891364041800361769, -3499932276699369689, 3672120525400945179, 417321941214506532, 2025893494930655726, 7278839671184884411, -460752728502983676, -7706900818258276437, 4130513969663319693, 3259242224490786500], [8688455073544252717, -5379376850139484109, -5142923790350736415, -6751521894646579097, -4405647213548390980, 967090427149268576, -4994766403307960785, 8864861300091766608, -4444850198273172047, 5383635588812499729, -2070726677654284433, 4581963324976420690], [8688465029998336745, -5168562279530048175, 6106137289135342788, 4910116811422769425, -9020979235148977428, -8076253962951212852, -4876539939279089908, 6169724218427336068, 2770590764041590531, 7926013111610592843, 8879521513964853210, -1872862159183432896, 4014922615405312640, -3157146780823271894, 547096193669835565, -8808473517389577207, -9044914961283747764, -8321815537860388200, -802480672501792947, -8549627441734427598, -1378176574349095506, 1927240633483173987, 1619329186989791891, -3392223229139995461], [8688466689420208412, 630923503498244229, 1773079884244096283, 4517760419055051220, 6447239934906989687, -5638868005212259236, 1040072377801407129, -568502494731883339, 3825058385040689740, -1650125531202234263, -1487757802587778374, 8090062923720914194, 4487669268267839081, -9016823929056145547, 3468068292411247795, 4515898194848448050, -905431580903120320, 9039268935781177128, -1539161952215457536, 5658995937211550011, 7844661576598347262, 2531036762964465176, -8047395784435419713], [8688456732942182530, -2025501184433618670, -8269647566311906385, -2473557347352404570, 2395230045516604123, 5214019143243121431, 6559283662650707246, -6886394780922098818, 7087122280294359226, 9152710847337599361, 2772435501327919450], [8688455073544252717, -5379383487773766657, -6987966657379172576, -5262873823137622387, 4656689650129310275, -6618023193817946814, -7987949993154406985, -2512782671039752648, -1146646859741355818, -3154055795986318055, -2991688067371862166, -497649361580654635, -7493140687607141785, -6445289212831921189, -1558132853436035580, 50430403226619605, 2522570901241846763, 7705107179017290951, -6106810953741866592, -1275242260076037799], [8688460051764644216, -1140012460033841022, 6917515791197686398, -2910960039415279908, 8762532107649089277, -3397609721888314700, 3281312407601812392, -9203564879183124805, -1205471569983861294, 3513926356413501268, -7761400038145975940, 6169704305481925128, -6286787145771557400, -6375074521450734425, -953726492167646164, -4657981082531388906, 965381793073709626], [8688455073544252717, -5379381828373176638, 3563616893726608539, -4980574315243858563, -5142923790350736415, -6751520235245989078, -5196801162578042202, -1681158043585414661, 8935244516289113943, -568482581807754047, 2221899108028006603, -4791493058671149581, -6400084525311428067, -4392690523775524035, -2932269719446586275], [8688445117074207453, 7965347353048777702, -2748593970222695686, 3631669759919009148, 3395220018944742522, -6319956772711801862, -7928541601717797800, 6828616524293578243, -7913869640235089357, 7227420718589793808, -6553787866264584682, 4720888470632933655, 1193201993998582827, -5654131944985128693, -6653043429051595867, -7004011013155890850, -6796278369260935483, 1309546452635707800, -6916355441599172187, -140496483448364735, 5009956953783378783, -1763278378752155424, -6353000121153713619], [8688460051764644216, -1140012460033841022, 397705960552361116, -8545299399189687227, -3351764933205170237, 2934809100989354101, -769443829973798622, 3421455464623965971, -5444821025377785970, 4722122209502297265, -7928543261121048025, 4383011385228785661, 7762545453038092152, -7974393028061826871, 2245205456054814442, -5812331092208925339, 3243946755904531026, 4167397195706836938], [8688441798251745767, 7079886838645244797, 4938367310365340589, 3928490826258553147, 4016753310793209381, 1082842775775867419, 6483964592601731419, 9154546520943227395, -5087238187868219019, 1199355759229152963, 5390281604411931456, 8836614886612165036], [8688443457652335786, -5567376430293648798, 7802981283832251626, 5058275857866135074, 3093324443336904428, 1139194263402785034, -5104985306710760365, -6713561838660602088, -3387895186611216326, -7755360935521821578, 1187624511290777061, -420928788920454302, -8874667478205816950, 2329613894898033241, -1733316058661191006, 4154440505949931229, -8817089782141143270, 6073563725903005430, -5201132523923962611, -6755849937170037820, -1377572980196279827, -8378001819482966106], [8688465029998336745, 1860111948723869975, 7821957163307803847, 5630430902591038687, 5616235495709795191, 2290580459533704918, -5668327351866372189, -8993982388039802256, 7692158786295257809, -4943854635782809360, -7871584093918248229, -8594690154997171989, 37599991925483305, -759584762672168064, 8892341207734945601, 1668401195467627338, 7704361610622687777, 6095763506326845095, -3064550508904257532], [8688465029998336745, 8662201374338829789, -7365182962455197958, 2346144761754242344, 8632115201790630591, -5435726678344530057, 7934640992235454395, 4946854744428639549, 7671324001454185546, -7866170157771628857, -5141710857197506682, -2232480855659180409, 3168624367059695573, 1828800460529919297], [8688461711175875059, -6054022793928260668, -3144809386518204061, 3215856616468933394, 6669471037234800397, 5872277985580994813, -1596124438256680254, 4291655358114333989, 402641682657022432, -4187083378564337243, 1288102197076516573, 3849463135329356242, 8108567226826033791, 7371279034155713279], [8688466689420208412, 630921844076372562, -8966489971712701747, 9076774141242696089, 4487060695897292109, -2286196208981582851, -2448545684091120909, 2032199190873058621, 1058441344304342191, -8445294050846019808, 7182670881609719970, 5698813239165117249, -8267182640765773769, -6848912807223132071, 6864884540332265968, 1389674073530930125, -218902458440193246, 8071676470334947765, 6516990585902258573, 9174654117091334496], [8688466689420208412, 630926822312725297, 5146569871211517119, 3005061958804908400, 9009333166267245992, -2590083606092876652, 154628457510182654, 4345536049164101462, -5232294633617296576, 8183755938503857406, -1319997710172704072, 3756390308824838169, 1262339987181616797, 4063860048347282609, 5085899530909299581, 8286683615124011123, -579609468984728836, -8366894845230120609, 5350447708351376200, -1841819690330207234, 7100552205854210050, -6113470244631145063, -5720966899782626422], [8688460051764644216, -2982433360831632721, 8292239657232783106, 7000703766440106683, -4273980867513565869, 668271668272591138, 1131909806035971573, -9073158822570754732, -5368899253994601109, 769502458448089394, 607144686308999181, 4646941033827609838, -3410583898565494660, -916533576922273288, -5551971409081637255, -76760942259019764, -8134280896439713381, 7007017759436003587, 4262320630544662692], [8688445117074207453, 7965340715393213506, 1471159417457154720, -1421678504377954405, -6518299373464343249, 6852066637720371596, -3124588152281371299, 8474850192424752304, 2825680302818861029, 1217115386736994383, -3743034670899369972, 5834796011860746418, -4554438064146137463, 6071240774593339897], [8688456732942182530, -2025486249727220671, 7877079890299050381, -2512155845127044961, -1956799919987829827, -1868539094891006496, 7668859075908052930, -2848292899397195782, 7465598874819441706, 2917679618219342260, -5991667944110361391, 5423461187822221182, 8856834461405844483], [8688461711175875059, -6054037728639979079, 6032038682665883827, -6774338544518401597, 4052885223599845489, 5026626476058913695, -1111785192853822072, -1274139646175771011, -8121473585159482531, 2518402319859168138, -4460741730546052977, -3412888596346300508, -4782853562151710892, 410669287956850403, 5338873369339904144, 2520095887502643561, -4253151060906186135, 5143620860611030363, 4981264747869869963, -1963604635672363419, -3572181167643486790, -6839038044159425281, -4419073053669214066], [8688458392364054197, -2982425063775478506, -3935973291996618899, -231700448127958326, 2677529553410367947, -702006173815489799, -3823299419523052379, -6038279112478431754, 4749757498416097055, -6524953686114608779, 2320506272574930584, 535373242763672024, 1078659259705412237, -1415382764905596774, -6005117782597001713, -7169177349336565433, -2978266438865505351, -5609666188224956197, -3602282143140475987, 7774898548658143418, -3696583730296626377, 4485335467712084935, 561768155155204214, -2351315892071899288, -9198644852821918279], [8688441798251745767, 7079888498045834816, -1373868444749766075, 8380535329978755170, 624897676161276405, -5223665093575883769, -8927914705700613570, -8711691177204852853, -6439905146082136579, 7815932995374086248, -1127059089078115351, 4178495872908848632, -9043671265941678684, 8058886645961690136, -7569089902367345131, -7480800867276937263, -4986750545615094449, -3938917324360752920, -2959899131779121544, -5505491497421650272, 3437495608791538386, 6905310414656380178], [8688466689420208412, 630923503498244229, 1773058311903415736, 6396912615197828435, 8256129316766827545, -1455219979783293304, 8028327369365493617, 3519606885854427319, 5202288661908010551, 2930481058444613730, 4539060909232878375, 2901165345472781381, -4994152086073854202, -5156529771161015561, 7120760164782574626, -6664601940580626575], [8688456732942182530, 1422725850765322449, -2916370656744758006, -4495766944032016001, 8291012556018983692, 5472251668288711127, -3462602365429940611, 5480398016075754997, -4422164805114753339, -6916205170303890683, -2725295919252042062, 7267726059297756366, -6737488506667578740, 7338240532189886051], [8688441798251745767, 7079885179228693542, 6126358523353554108, -8129486255760893121, 8708679626576945105, 1861347347015105252, 1624900924860640106, -756487140200931677, 8747259870822725811, 5834167526544788506, 3561761307178229771, 7533024915109775452, 3754694950041786169, -436237532769954460, 5277591137828716712, -1305320902171347804, 8364481017729331426, -5891350486092608853, -4843503989527138932, 2963379113848878366, 9101784145106049937], [8688466689420208412, 2839885666151528347, 2677522915776085399, -4267336511314724161, -6761386832979227181, -2097588056454210984, -7720959229115463731, -8444071927849951687, -6895520656774061160, 3097498002937314346, -207932480190122303, 4381790921627987147, -8909544079802408901, -3212115785941827444, -302867530895923134, 3888028444884700185, 5282548432292680017, -5992154455187192014, -5833632475186737697, 3465122600654504373, -5403787471459168137], [8688443457652335786, -5567379749110790072, 3054124010825999613, -3076109781488966473, 7030796576643870077, -1587468347635573959, 2602820715175092407, -8092153025674322769, -5421531271463286561, 3387345242717620332, 1789563394799157609, 5839257737144027270, 7783371048031005615], [8688465029998336745, -5168567257763740704, 7802989580888405841, 144258886316151232, 3301550235945633172, -6452855198220720976, 6675668708207730272, -7135674040378895099, -7161926080183728008, -5553324657049462404, 8164291888553544749, -4629895789593157451, 6969514345132682645, -3493773533229786612, 1375010540819420601, 5872742792572837919, -1518945696220297921, -8133200747680112343, 3466222662335574497, -3455203245456711376, 2540318020081727903, 6082193265944418237], [8688466689420208412, 630926822312725297, 5146574849450530060, 1743580711747045158, 6070007035723976287, 1482880708941446594, -8513963786457140986, -2552105296580700164, 7651716317861495375, 5761457147441930809, -16265764431187199, 3762089091794623905, -8588664327641582723, -1416629779064807128, 5544009836528230304, 291058682034988678, -3973940878432824895, 4083598988671998014, -8649339646198774438, 5314945940255967611], [8688463370597746726, 4305705471920687480, -2541608554117613100, -2778071570379066264, -8739925082019154351, 5441822750045045378, 2261716409981573841, 3913362354837495607, 5258616917772375952, 1084083152300795225, 2735724118923024462, -5395922651680809563, -900494199365946513, 3615152168352646789, -8681742132401074973, -987396666546207462, -3202368062429471386, 2759483789788745034, 1492603541293320625, 6967810689296136636, -4779781723635621323, 4163220317268004098, 533062673951848650, -2733782586690794352, 175429161323992648, 4366351687684309455, -2406890282485507300], [8688441798251745767, 7079888498045834816, -1373866785349176056, -4266714663654330445, 4468680113505100322, 5981708044158202743, -7232294493397702666, 691113209302235459, -1826405479270036891, 6231129409595773077, 8725173093604711901, -3360891701827855516, 7913791272703945369, -6729449285489134868, -8327231133407597591, 8510948024220087379, 3035739216819341555, 9100065554579067165, 7912572468525018522, -8925605029686115193, 6215700263823884323, -4780538907919481222, 5047928625655952311, 6095760187509703821, 8070591343344314404, -1683780902589442266, 6373745689220213487], [8688455073544252717, -5379386806590907931, 4449089024022058375, 2911367284618714963, -4747358431717186911, 7737543746225572107, -2239109384354299121, 7227427356245358004, 940846684419211324, -7638844633251394760, -7801220658916684452, -6846575819573261973, 2733846960025984529, -916526939266709092, -6363346592326839591, -5899708454579420392, -971492757312430338, -2019332616217015651, 6112287603807124886], [8688461711175875059, -6054037728639979079, -3634071078733216609, -834884686397619415, 2469922289666173293, -7919298511066825080, -4539761124424416079, -59006293011472933, -9002001696275495394, -2849551529429701625, 6292259710397787956, 7846988739517158654, -6821435325599769355, 332718295228466498, 8201034799777146166, -1627437712018678866, -4932881470435962259], [8688466689420208412, 8662199714922278534, 5749118986512316306, -3193879735571507635, -6573398868693037569, 9210296073836540792, -3522629285725763474, -6941512529679652823, -654933517267397192, 5306913356733087935, 1853323827146324401, 2015683258704626075, -6115925345446218973, -3900957268361474881, -5973935759974218044], [8688466689420208412, 630915206442090014, -7384175436019116755, -3679909229782078524, -5894915473322471799, 5135454599902517407, 133158549713549519, -5828696621343089823, 5673184706458510959, -2945080217818272871, 587545299756501989, 2688633975475939252, -7215182497529343634, -3172419017625693506, 605912606840225590, -7532350309960884988], [8688455073544252717, -5379373531301061187, 1396475470377040795, -5450861787423811999, -5613216240743100732, 6005176411089913927, -6405627160404667778, 786658491797794723, 2131898120044898511, 3105652647793813461, -94043122368071240, -813452178429428587, 8596596839593554396, 1752837844312411292], [8688443457652335786, -5567373111455225876, -2822684279614718784, -8976376482386030378, 6090851777021792784, 3272054382260402909, -4371999372608751758, -3648875058006288725, 8425138082762983868, -740109995196131910, -3160098217427613691, 1429640119083592728, 2984350894692725183, -8123185538054842961, 6693399232922001952], [8688443457652335786, -5567373111455225876, 2772434734724654428, 7848827731939927962, 2262339917063839224, 6515281185202152953, -5084128949523687143, 2973391004635724826, -2166271067355178906, -779928956550289167, 7955465820606481394, 4251229483768938131, 6520069954849955687, -248236293217859958, 6915665182880339953, -1628534323164902806, -7474168126967352280, -5865570022671509598, 3151515690005817609, 731554018338068080, 7062598787505175795, -6956794591234414789], [8688455073544252717, -5379386806590907931, 4449092342839199649, 4422840303055648388, -1863748665829312713, 6193787882437087274, -6874685871932988897, 4743715076956179977, 736949700955827767, 9147625614977373538, 4958590203981481722, -4869913836611768091, -9136132201258508511, 3553748636579479387, 4051644847074917683, -8914977928873157565, -430816958991712746, 2555738868784161412, -2142949784621973068, -1934900813904180552, 2135608400333690226, -7692872408518289021, 412970666923175183, 5814100780805193398, 5301529290004584973, 2540944972151252681], [8688443457652335786, -5567373111455225876, -9020987532205131643, -3662311621203082303, 1738791942099242424, 6815191576970080154, -2768811885621105526, 5553113373409645017, -3950636956431153745, 3295497858010350418, 450951528646567717, 7856375463826470124, -1898011716816344751, -850186792599535995, -4025339157032146737, -9101703944267136764, -5870363770537043625], [8688465029998336745, -5168560620108176508, -7893041493044260878, -3570475852385069114, 2716119754131514329, -3171671658094173961, 8988496722025583710, 4594920907546612632, 2997177226102420534, 7775346761542998506, -1357980231294026419, 5814100780805193398, 5301522652349020777, -1471706042528289028, 6630256436642044253, 4086518896478915030], [8688466689420208412, 630913547020218347, 4335184731493609313, -3545792000094232563, 5072492837106680559, -5316739579496953097, -3499942233172075159, -5975626907150784391, -8572763605525863405, -5679925683690754280, 4244571852301531327, -5491457977706323563, -7689160337071299287, -4221211854020824215, 4322985992607867289, 4485340445935136640, 4658506177438015893, 231162120102337409], [8688461711175875059, -6054039388056530334, -7007559406278765778, -4267329873680441613, -6574025694608405462, -6736378488511142940, -6272735372530031212, -1196353991188053167, -8815869318540344756, 6906390563415981216, 2942686303244273186, 5667148922651497871, 8971964195750163146, 3496783598348322271, -2900480783875127301, -6864196659914810408, -7837947868825302436, -3172422336442834780, 6730122231216153665, 2247663743966664510], [8688455073544252717, -5379371871900471168, 7708691312568018167, -5262870504320481113, 699002920243736266, 5701289013981280332, 5126333702289568006, 6734916871894973925, 8371890855246905600, 7229764343895228102, 3266038511377519113, -3507190183499790692, -5682981059825541359, -1093280889748702475, -8840397789563220716, -2642102834028962072], [8688455073544252717, -5379373531301061187, 1396475470377040795, 386595667477053933, -6460744909162221783, -985537761175367008, 7484558160185345703, 1522712945604072037, -4348069517483717300, 2313865235214511798, 8027692246415253157, 1254461892113411479, -1490221961509364320, -3204083334139312884, 8881984780110395807, 4765162519614807568, 1288724811358796753], [8688465029998336745, -5168558960712906901, 3449709282383678409, 1068334492617273782, -8646858893148918826, -6995226223582843804, 8706814083571822103, 7172326201594792017, 6639536795401094164, 6787704138895293616], [8688461711175875059, 3819662702417609641, -7779749091724781710, 6077268261352179388, 6239644287014808874, 5229756187058667797, 5392137190962970430, -83081572910480864, 6129408789526302924, 1539693684759027277, 1513453260843451093, -1211034249726915825, 5564836324318468764, 1042405285583778132, 620571293033087289, 5463116602588589985], [8688455073544252717, -5379385147190317912, -1675133875643716444, -1211495737901617657, -6538515629462163070, -1344999416985224117, 1960442682031469257, 9132498802970207047, -6478477093293044718, -6305286470624363026, 2716731645337824017, 2879076142208349134, 8592914769285046188, -1321696387775557552, 9067512797068184096, -5262394081455342518, -2394696521838778217, 1309546452635707800, -6916338847492184169, 4757148321335832281, 909657131367480316, -9018672877972901973, 6122630756141827936, -7247745211496970937, -7031496791835407781, 6792635781124475219, -5544087437429507210], [8688466689420208412, 630930141132526777, -1863128477564188604, 6547550755290459677, -2144807797198148731, -4564757853000583389, -4875294584523129779, -7693962382006288559, -4522624237390254608, -257647908690313661, -4913288721536369057, -6595938968771245860, -1727158213539179921, -4342516027594141981, -6860026419110260116], [8688441798251745767, 7079886838645244797, 1530579424780360424, 2480270288498242520, -2448549002908262183, 1255695630982775089, 8177114901127477384, -5771900239648458394, 3922455042454200265, 2156926377437112044, -8153278348237324707, -7990903981988586270, -4685471839441938160, 9171552151263985074, -2914510984752031088, 2973252217490713489, -5439299196021961784, 6646790490573747866, -1848488937692191175, 8791380329694837152, -8328454915804255731], [8688463370597746726, -254545307980064333, -7101884225197468382, -2910945104730163557, -186490782373772675, 1672737535068521924, 8520051561106822504, -8318082792417629705, -3950640275248295019, 2410034024792336445, -8076705626392195772, 1634618778976161402, -9196172396844178118, -8398976026351949612, 544006101622226105, -1950025966513417230, -2038308363969542550], [8688458392364054197, -4399614748577140608, 1886372285563575451, 1163252949194804947, 8821960412025788990, 7941908855516561486, 3092705914472370338, 2461425665754715533, -4710622158127868042, -5758458698217972287, -3310092937492568610, 7964595015278245216, -7134279307122318257, 5424671694929032578, 8561720237996962445, 6067678213388613640, -7965887340469668226, -1841679375510291406], [8688445117074207453, 7965337396576072232, 5240876436585398802, -5357190345000170776, 8405540355624377725, -8883303655886832717, 6935864844755210520, -4737632280545511400, 1548346456547031062, 8810244865378454667, -7139848492792591250, -8635746174053795366, -5726524469566302896, -4386663929816669747], [8688458392364054197, -6845208271776618319, -883348122480966036, -1234320684824273960, -1146048243840854110, -7411037707616368303, -4575262892514504256, 1710700909866319795, -3690410950486838735, 6138054923674703749, -3635934962335089386, -4683763205369039416, 7424514645782534822, -2177999889276398737, 531823956843472099, -8086452583303947014, -7289269488101565252, 4207684414627586575, 3578886578339095753, 2044373805201583640, 5715466933958210813], [8688445117074207453, 7965357309521483172, -8081656283208575499, -8107891728906420390, 6955489122470849945, -3759095620807018118, -8608278648905798326, -3531892289322147134, 3828148477064357346, -367226710882578192, -5913268738489141780, -3345152998619699749, 7709899267482234959, 2633517886118975266, -7081663883757960617], [8688466689420208412, 630926822312725297, 5146583146501363863, 144262205133292506, -9154489551866866436, 1234734567661991563, 926784954720940902, 7250725407216011628, 4654198940630691047, 9169843648930072888, 6351061188859119776, 8771019541712388237, 5445381099640625776, -3423538928943091998, -3187090847393357245, 5376688132266952384, -8999548386602658267, 6067694807495601658, 5959187857006783950, -7411193088884328894, -4948780533153751764, -8630352150852586934], [8688456732942182530, -2025492887361503219, -5914513200455757530, 6171569848505669572, -3653653871181385989, 5215242925639779571, -185868934713378959, -6806014476899996052, -1092172531008817930, 7526097371483036987, -5217627650365620456, 3474712648612749709, 1153381373227874315, 7023541988657930142, -1993553680476141299, -1816527265668823711, 1563000164503540026, 8824905210993188033, 627350985818152296, 2235949090113994978, -2914512644152621107, -2826251819055797776, -3177216084329650455, -358433624258697343, 8758830891017056593, -5320429180253030086, 1892514303184523746, -5539150055910954845], [8688455073544252717, -5379381828373176638, 3637710521959714765, -7637000662573651275, -2634683040038682428, 7227424037406935082, 6253687763202841053, 2062776852710499323, 1544014328576563983, -2646889944260213551, 7525015563328166342, 5739851004698201353, 8464336855852017016, 6693399232922001952], [8688441798251745767, 7079885179228693542, 6126340269819374011, 2723374342122774676, 1114786194275695610, -3474932229311381517, -8289868800527457499, 4195013464469890579, 7218169330882666873, -3171038194541863314, -3522024032172357776, -7129356728565856921, 1488928108637716407, -45579686266103177, 8572690216231072152, 2139930703567778187, 5445384418457767050, -4309009399819330373, -4072582890610276167, 785257755792495445, -6834240977455468332, 5251823817977099085, -1521418152213999318], [8688445117074207453, 7965340715393213506, 1471167714523949759, -9015590190184121731, -2749219136700230676, 669515363614660218, -3447330128630179205, 3724754202291502298, -449794497865194780, 6545700146978433644, -7197399638277571442, 4077286655092652365, -6119027053361803510, -7920037573547510822, 1037007943544146778, 7654182902810878216], [8688463370597746726, -254545307980064333, -7101889203415199675, -741216562793779672, 6447223340800001669, 5567156849579055754, -6518914583490454417, 5080512145342373697, 4561749621208438357, -8766187078275411082, -6494381134228565516, 4634131296524902505, -6965285475837880345, 2863188695361194912, -1726538025276716018, 5120804210760489511, 2774909616722210866], [8688466689420208412, 630928481731936758, -2748593970222695686, -3679914208021091465, 8896060677893177764, 3420850211070560273, -8739313190810184457, -1195743759395634528, -4970848164072183052, 3647426716658684806, 7351677988184004626, -4119797653136482621, -8775420212453678332, 5081585524726045423, 7350424336390511724, -8898584189742748338, 6593538416581585069, 997306065268634783, 8892342867156817268, -6174893689325781551, -5221338823449076962, -3612777226205633238, 1787712786487131576, -5384323421506195274, 5112297630376326281, 8816543923689235220, -52371126660790025], [8688461711175875059, -2002657983982102682, 6615600302644437364, 8224183472247183077, -7551943825485024860, 8513410523746403718, -1187104262881516251, -248234633801308703, -410607340646796915, -6446542864625414091, 2542170287797004161, -6204221018189530831, -5250682746419814260, -6298519286509918505, 4528712778664482796, 1709951890934210231, 3993451048192128250], [8688463370597746726, 3819677637129328052, 6728902660433961796, 9148252440892741431, 5259232127798487120, -4455949642078448763, -751700029969680198, -8883303655886832717, 2790185172363055400, -6377594338647107, 4372531236870026409, -7935806146160481969, -1973950975103842627, 1741133146932447230, 1398930439471749589, 4798065553252764733, -7436194795678227497, 4163238570791543371, 1270360823094874632], [8688445117074207453, 7965345693626906035, -2674505320231262607, 1029734335426082136, 6635839790380867545, -4564771128290430133, -8269022399813089747, -6131340323109654338, -2863121769812128483, -725444671347706015, 2790190150596747929, -4942612599841330299, 3749750930867669608, -7849665841495113242, -8572758627281530052, -765877183327384421, 400779458469040704, 8715925024717386446, -4799359537844777762, 6502315305581127208], [8688461711175875059, 6265247928558272931, 7218789519147790982, 6702667214752078141, -2522640971716836536, 5722861968489752104, 2809791196552495346, -8789610641101229299, -2013769936473961120, 895481637410366112, -7119612323870642137, 8833076449940713930, -6704447578681935235, -2836268688084317383, 1753444757282368245, 6120927100299961515, -6289869833539055994, -8665853918926713875], [8688463370597746726, 442933879814124804, -5895537320982865515, -8389571048537720311, -4198668435120154238, -7902926344301038254, -804943938647335544, 7189306940755067669, -6063927558130448984, 7793111367287192661, -1408726792838779989, -4449028736128556142, 8576390540063119633, 2539212980145683602, 4093918777523783734, -787795309556459433], [8688456732942182530, -2025489568544361945, -8872823507528073465, -8224424625283835226, 4863665109764347597, -8107890069489869135, 1247677982150332176, 7243166059456173977, 3126353755433291208, -1116712749646636143, -6965283816434630120, 8568362934757971250, 2324213234062542261, 8684904128207501537, 1675058826956315790, 9005005123738466857], [8688460051764644216, -1140007481800148493, -8798736516953191641, -7339551110907508540, -5574020786471208858, -2269202194536780867, -5426473631223512073, -4487612299191478122, -5629728854091731798, 5644947482805786539, -7098795792553109147, 5386088131866110598, 6875832946241656364, -4723578847906055399, -59775093144686467, 4367588877112461103], [8688463370597746726, 1860108629906728701, 1697762473616992123, 974639818431080345, 2791427208304534461, 2440448008326943989, -7874684142414621305, 1805634301155569371, 9176479708072760381, 4688612262910344383, 172990786357553520, -5302232955733629067, 4278221352663042216, 1011374432598527547, 2624883367859831166, 3840503232103620073, -4351162161742542806], [8688456732942182530, -1022890904188726858, 5750361022453795367, 5151962234996174296, 6877074982161853777, -6979945689729588389, 2523802980715940766, 4573324721275588646, -1670808385334133973, -1508457250824005896, -1859426494331551104, 4705607936758396592, -7380455199257619570, -1492696975248567522, -4798149030737966366, -6579575099061613249, 1700207486238995447, -1902191147447772195, 3806710098086430640, 8306287218862503229], [8688463370597746726, -2002646368111467399, 7218801135015766059, -4055896774227753237, -6800590584299292652, 160020821289519419, 1945163807573483449, -7558589841087116793, -8532339390594358596, 8544451333177757713, 6426380258902775191, -5733781483577379520, -1068242675905065120, 4208302943470839017, -1753547249346787384, 4207692711683740790, 8797409475867567692, -1546575108552833190], [8688443457652335786, -5567374770877097543, -2654284086015711493, 4517758759633179553, -5687311528374136771, -5223676709465140494, 6030808262616321697, 6193164375354821891, 792040899133688284, -7487715135587226924, -3843507378470038397, 746207726297237250, 1469308809158429717, -8993987366262853961, 7692163764534270750, -5938282061190918550, 23566472231438244, 7830454553843808277, -4329705529219795179, -5884426261304293310, 3322984403309093607, 2806862098897419530, -5646881568608334617], [8688456732942182530, 1422715894292616979, 6897913085825387726, -1681776572426006897, 7747886766839910041, -3359649665910318309, 737556613931105132, -1933038589700237588, 7009955154147233618, -553360748018318849, 7578254493766808747, 2367735969807535037, -4215799577290756098, -6112233186923358531, -847845587787612837, -1645061871185349193, 7052247338122299148, 4233461559231544556, 2624866773752843148, -5947703633114796075, 3806696822796583896, 893617753803172923, 1941447656258994620], [8688465029998336745, -5168580533053587448, 5052261646421084181, 8451395100785548070, -3709375214070474025, 613178810699461014, 6899150910136439280, -272911848436581058, 3505413138373773842, -1895707019035538903, 6354756534457474728, -4163170878639211920], [8688465029998336745, -5168558960712906901, 699606514396551945, -2605840562853833958, 6823814479377210413, -983058667550043269, 8520688343473614219, -8066834050425265140, 4395208332956329666, 5929722765515713446, -8442353337301687267, -7097080520843267649, 5689695660369309122, -9056637912192571511, 3428241034008916941, 1805477392228665525], [8688465029998336745, -5168563938946599430, 2564233833271087299, 7079880200989680601, 6897908107586374785, 3005056980565895459, 5918146006032011902, 7526707603275455626, -4634075986870413213, 1726608269640263515, -4559974061583812978, -1180463225521097465, -4930404036224529569, 3175440698617524654, 6554943237629406364, -4824389454653542550, -303474443852579057, 1481670201834635198, -8218871135372978259, -2098356988331731488, 8689681281966047546], [8688466689420208412, 630921844076372562, -8966486652895560473, 6986185526808807576, -769428895267400623, -2378028658979794560, 7937111788812604537, 5443054829511158763, -7041829094900080364, 5552498163383533849, -8854467816314985147, 5401378622194731689, 3171745221277522938, -4885799624039710852, -5682992675693516436, 7362642856480017924, -3026564668968454117, -2878403963108537213], [8688455073544252717, -5379375190717612442, 7990984182808878001, -6899687578740188530, 2604054454044456017, -1891375657689618494, 5976950803331766644, -8278903932252725849, 4131893001591612072, -13298500304500964, -3392839205769371651, 2893743125460025254, -756635752071681308, -3490842907899806305, -5381088803032184333, -3053440215831610555, 2171120124896483873, -6609520825048249855], [8688463370597746726, -254553605030898136, -8135505445463578397, 5308932621586960067, -9095062906906717978, 2991015163815696183, -1596111162966833510, -4440654173513474937, -9027780500296004630, 5244424829710933936, -717435319566096905, 1468213725692430680, -2706301786250290362, -5390222209310433808, -200541788993412399, -5390979393578332471], [8688458392364054197, -2982426723197350173, 4013059624592784242, 2965234700399917340, 4528108417881800035, -9189539656518631899, -3640232242669708762, -8878991309120129814], [8688466689420208412, 630923503498244229, 1773059971319966991, -8616135938233927913, 4147193448390278427, 1727208544981258332, 4636473394155432308, 1082839456958726145, 6483949657916615068, -7302209583772764591, 5034502018913242761, -5264866537435742885, 1759012283538750189, -4202991499409920432], [8688445117074207453, 7965358968916752779, -7250048249874526560, -9109279886131302227, -6612602620037044894, -967313326678342688, 357273448572682710, -5662918393953445346, -5500558962395143672, 8284356583946846495, -7876524794253941868, -232487633513056867, 6087747516910953437, 6082345196637629554, 7690926706829144424, -7598564183706574435, 4999617120265817007, -5389587086338911700, -8134284215256854655, 7892491549150664884, -8060203862316255379], [8688445117074207453, 7965335737175482213, -5122725787876455867, 3820279571865592476, -3842281936651508590, 9147622296160232264, 5183913057770792941, -2435593972551946493, 869214662915096440, 7790642230129253980, 6014269098706618585, -6957272805236469755, 8522536399598366060, -4929341374385202782, 6976921630436380567], [8688460051764644216, 6265247928558272931, 7218801135015766059, -4055913368334741255, -2710628935981744500, -1987527853141833681, -845389725916860694, 7117228365787969364, -6179045676585510922, -3907271261354711579, 2749749341566235720, 6566677804406205188, 3842211866173858611, 2233622058936830350, 1997173977381775185, -4850163280419077609, 5321742227169302284, -5893057460746296136], [8688443457652335786, -5567369792638084602, -5479097351654664752, 5701895926951237285, 8520685024656472945, -8952297883669881173, 417300368868505573, -6430011997769204988, 5319275642201298001, -6414260019268542271, 6807907119600606487, -5278151038195018176, 7693410778693481104, -1397760265142176672, 4461892123669201512, 19399550244029226, 3324838330443581326], [8688465029998336745, -5168578873637036193, 2281934325379983681, -2794452034201007305, -9174704148448135002, -9204816871576027688, 1583216420504020053, 6074787508299663570, 6806676699551044357, -5279393074120536001, -3221367173648954379, 204923355608632892, 2624878389620818225, -6620009270457842910, -1659869169272902377, -8581261888851212214, -5672038524947168489], [8688443457652335786, -5567373111455225876, 2772444691176078250, 6963350623429407039, 6937115177752843796, 7660219579409895889, -6270874807766581357, -1681149746529260446, -7102502754040720824, -8076244006499789030, -6138009570471638279, 6420991213940579700, 5051014632243252385, -7035063438481821982, -2651205609838737316, -8013723950656268396, -2686728950274826452, 9183270123933795880], [8688465029998336745, -7338944197937551587, 5259222171325781650, 1803780374026402064, -2637800575460650167, -2694123853086002627], [8688466689420208412, 630921844076372562, -8966489971712701747, -3491302736673918118, 4167409704393418660, -3381247511595233344, -7572165059721857622, 1726588356716134223, 2093327832250541627, 5512067310825727110, 4204749572114271560, 8395050250792913003, -2731465380244688430, 8646914202808728530, 5802371192262087103, 1215264778427628556, -2677604602124370661, -4315498506465256194, 5677490283849284550, 1899163637617057983, 7374347553838700338, 4703754009623908873, -500583437469422980, 7022769737963268364, 6299662017462472937, 7259217819513003117], [8688443457652335786, -5567369792638084602, -2768196675592334152, -2794453693617558560, -3747962095971818927, 5041149693929225743, -5348079403859926845, -6956647638758934765, 1661623923157452025, -3360284788857898563, 5485193423355180073, 8378067852240027950, 2091475564537925575, 6810840302700030453, 5256154418264681055, 5492589224511268034, 91485661208943307, -1443010517802959346, -5700750643784806601, -1273386673524998825], [8688460051764644216, -1140010800617289767, 7877081549699640400, 7024152220442368163, 3319904267736849823, -6995227883004715471, 1850230416284233873, -7653498341210563930, -1765728501333536805, 7719145676950348953, -4617547672206798714, -8173643216111214571, 6967665396215926219], [8688456732942182530, 7245044877769765165, 8198553280124025532, 1366359428432006835, 8142239958950096894, 2667022854495857061, 2640790727633774886, 2478419680180896075, -2523892964115059831, 4648178091514114722, 7142230072595168997, -5263637776797411598, -7160074705247155305, -6488222390764302851, 5374982817027156150, 5548166802042933852, 5710529552418376800, -1334045397953920874], [8688443457652335786, -5567368133221533347, 2469927267883904586, -2119806090406910334, -3051113052915459369, 7776135606365929950, 6633974247378404749, -4714797377150149627, 549578606117620990, 3458811926473088537, -6930387301895287435, -8538985406193790323, -7889972973345312583, -3374319967973815291, -6193095790410485855, -2797524765514421871, 6864872924458970479, -8046631962533238502, 2455864645412251021, -38170741543193794, -6532353698901124247], [8688456732942182530, 7245036580697649714, 2168656858772222924, -5003402580983656140, 3865509150522625771, -3867296918732593731, -562475007996985702, 2910120270459504609, -4520768650839215634, -2026733263886431025, 4111673426792612213, -8859850223642898090, -3373840094549888658, 1616409279182874875, 508522587055677201, 8566062454160500110, -5496855319745954917, 4930932449948297830, 1491383077711143553, -6814649887977746797], [8688460051764644216, -1140014119434431041, -2674511957865545155, 5003809826187091195, 6051643047460054166, 7808388582325967008, -3466284435738448819, -5074890837106406952, -6444829252332123848, -7002762339580129241, 3635846638357841988, -852030763277279480, 756540790438869714, 2587383272355030056, -6842285045152560029, 7413563052797649916, 19247619550817909, 1067072543746345017, 1285638038149610215, -6609520825048249855], [8688445117074207453, 7965339055992623487, 6012449252583431899, 6100716715354440868, 8594770355814803514, -724832780138736121, -8309469846501826358, 2079755932454223720, -3882085963293947436, -6774967029834359509, 8366324988409735117, 8232363008245542777, -7067622833611026363, 7188221945500760660, 2474866308824328618, 8153194870752123074, 6618682097630572197, 272219798580832453], [8688445117074207453, 3325933413888298715, -6385415882661822134, -3038778210818947376, -7628491656167011562, -1666648101002289151, -3275236248825426363, 3896834806803748190, 716720169668161202, 1613923547920608382, 3000234129912112104, 4608832234207954786, -5706316510640598526, 4460663231291883667, 4697121269319644302, -2474934851619093488, 2202914038728237436, 7441034663368713458], [8688461711175875059, -6054019475111119394, -7175974534592151686, 6681072687881644174, 853339724751863734, -1078612247096436336, -6499950319906819127, -5748448466826395434, 7573303836958409638, -7567976565393768057, 6291644500371676788, 8785679887324461397, -2563080121330797490], [8688455073544252717, -5379375190717612442, -4915728755919359440, 386602305111336481, -4763869385643946310, -1777323514340777622, 2265418393232832783, -6643920872038056447, 7241460744219037949, 3050556471382260415, 6197319681452974184, -5476175784431196481, 5603414909142377803, 7838003945109658810, -6417837515166365497, -2064553897844496791], [8688465029998336745, -5168577214236446174, -2259322321516356226, 8129890182149847108, -2333401015037744041, -5638859708161425433, 4013046349302937498, -7660452435395714235, 7673804754504041158, 5292396776497058435, -7326601058792865997, 2156929696254253318, -559990169505442146, -6846587435441237050, 2022330933717948851, -6713087075196053512, 902864163292568565, 4389178294007555777, 4275732302578314037, 84833007980549444, 9005005123738466857], [8688460051764644216, -1140017438251572315, -7987349717834693816, 4610829926737107607, 5447848577400634644, 2629064457907809865, 2791435505360688676, -5192027327641957879, 6481473116475905315, -9072376615403387484, -7493132390550987570, -7169177349336565433, -2978248185336645666, 9107823247730204299, -6842271769862713285, 7711619517431089398, 7261695253724435807, -6595317121110852144, 1506655314534846813, -1848332028744005681, -6512134124080842740], [8688461711175875059, 4305713768971521283, 7218777903274495493, -1399482042765935602, -5103733314312537070, -5129990332335101272, 1830637667384640671, 6420361069202750121, -8572783518449992697, -7450858328387076815, 5150273513866026286, -4214702834424167042, 2071871199749075648, -1253773879959629567, -8856310127576177377, -7066241375641636059, -3761401211382488757, 4296112105142640664, -6491914549287163293], [8688445117074207453, 7965335737175482213, -5122717490820301652, -6148329359323423999, 4844062404392048925, 653149834504437588, -4030895067415233192, 2384741600128292716, 8893563330736334134, -2779940432219951982, 5143488842847268750, -2914070937181683451, -5798752554773004472, -8352839753190074589, 853949063746957376, -634854257293633573, -2243425811009782767, 4928625331695262494, -6744871793605459426, -620663828646082606], [8688460051764644216, -1140000844144584297, -1957446658827327012, -1234309068935017235, -1542258681897349544, -7017442598118991899, -730845332183196995, -2339435139441506904, 1564238881609256371, -873618652497469663, -1670810044729403580, 2520110822214361972, -1508599225068453597, -6095725551829701642, 6846497320319092663, -6152062104766182494, 967851696856194977, 1130199512543861368, 2040689943750838649, 1732760243733917280, 7842801011808295347, -5365203908396246157], [8688443457652335786, -5567378089694238817, 6032038682665883827, -6774346841569235400, 2094569868197341100, 2817669291620700664, 9103638072240537656, -724829461321594847, -2090923787331239984, -7864953013009253265, 7537820322391860734, 7375462550228828667, 7067517915521470535, 3103807017715479957, 4786468880820992043, -2060858420504495075, -4593032476473769498, -2984442669236741237, 2490747884643125520, 4984803184538660863, 6695867477285275842, -5972080173444460718], [8688466689420208412, 630920184675782543, 6991579550010016008, 2401876061116035850, 6843427141200932907, 8961489918425081626, 3959197187074536660, 1577812440830106151, 307723226068850443, -6219357786666742586, -3310094596914440277, 2165087659906612059, 2002708315424181093, 8363395890751999095, 1166192769949793109, 4059050604703711114, 9135430326650419552], [8688455073544252717, -5379375190717612442, -4915735393553641988, 4588000001575438363, 1282564540214309185, -8295272780198711195, 7689081969542815505, 5269103703765417752, 1376249257927797152, -8452218275634335351, -7330296404391220949, -3626050111078312010, -1131998130018539383, -2456574948796859311, 6856852088529751408, 4475469001707192566, -2696577162758839754, 2745440313616674091, 4397059707892902369, 6608195311637530397, -9019762983183926833, -8040768022367507877, -1037083885050154077, -8659679479716336214], [8688458392364054197, -6939524793617885060, 1530597678303899697, 3537986701606111200, -7175959599880433275, -7181365238973558638, 6675653773517293509, -2418477765066460984, 3523174425298166517, -6900921317609552140, -4555056592989389905, -6163611552598551081, -5352383321828828769, 7673021019656449007, -29665820578242025, -4234782094403251073], [8688465029998336745, -5168557301291035234, -3841661748391704893, -442546547532158835, -6479722448035703817, 4532283636925363268, 1964128071157118739, 355574770969829230, -8098172215377008045, -7050325718811538124, -1899877259818807547, -4983045111821008705, 1938362542447737895, 3283641996559061503, -4083544571788231659, -7388955141986218604, 6883240231545354286, 1342590567718127463], [8688455073544252717, -5379385147190317912, -1675132216248446837, -4588217922870819946, -7082264925699560250, 2629079392619528276, 6955489122470849945, 1067696050828610400, 7989126936862569420, -8037657124598444128, -2448544024669249242, -2536833059780938758, -8498691549654719374, -7224280163382401027, -2147888825562397100, 8315394074566379628, 2956723141776741169, 4004561341283396669, -4938427424346343244, 3605755487570629849, 3579503447787078588, -8273805424618614518, 8589822125026220682, -7491911160346924034], [8688458392364054197, -6939519815384192531, -1580833947909437721, 4705756680370792987, 6240249540589496220, 2973392664052276081, -730843672782606976, -4511054115540835612, -1054229069135149351, -1040015408725046170, -7326586124081147586, -8374455852385227867, -8158207432726324917, -1282505911724057177, -4685471839441938160, 9171563767153241799, -2499342920748843118, -1520333025220705751, -3128922832460394218, -8604110067520459495, 9119524626293027087, -4811589673807579451, 3965345842327107297, -3044330934110578085], [8688461711175875059, -6054042706873671608, -4727125581607058660, 8318496675276628956, -2144806137797558712, -3192634380831508742, -6572160151584661018, 7190552295497726768, -7551947144323447782, -7714306575881749456, 9197947956447521849, -6430016976008217929, 8164300185609698964, -3435131521462142091, -8142305051186073726, 6129882025310626597, 212809747727672013, 1186547681348317297, -7756452700154718105, 6787570461709660336, -6540382831886497533, 7262901680963748108, 8629025876370228007, -482837978070034949], [8688443457652335786, -5567369792638084602, 5220648564735565140, 1046106502191868962, 3053507141383337190, 8474845214185739363, -3486530561133103402, -1877935775654401994, -5183367918198389898, 6476543900287821637, -444862094580334944, -6096344080672954084, -3187095825627049774, -7664163608497792183, 2060906199732697234, 1013072978481015911, -5022867523728633588], [8688458392364054197, -6939513177749909983, 6917499197090698380, -4965444184419550798, 6708066216171017866, 5660226357263772347, -8196790995786586691, 3402625776570875747, -4239102606500422663, -8726981667530813738, -8098175534188828907, -852022466226445677, -6105587171323926804, 3818890451722947863, 7008111183485451369, -4192504713419538838, -8085370775127794721, 2554498492259233606, 4163073364792524074, -4779922038476818799, -3583914836054092180], [8688460051764644216, -1140015778850982296, 5146581487084812608, 5058294111389674347, -3708153091069085492, -1891377317090208513, -1358584592074048974, 175919884012629336, -408753413514969402, -3301604610637265065, -6458879366138477339, -1303468634458731752, 8272021741834373266, -4050491135131967668], [8688441798251745767, 7079875222755988072, -3634066100494203668, -2910946764125433164, -1937197214618191361, 733386373126554840, 3642636287610292053, 8371750540426989772, 8835393656408101500, -4534969035959472071, 8024005197873052420, 2562998434987832640], [8688441798251745767, 7079883519806821875, -8135518720753425141, -6993372296453676497, -226311403144481187, 7815932995374086248, -4594858960231238732, 6043753336518553359, 5445366164950189013, 9208417255541571046, 2016144878620974671, -2466311949233244877], [8688461711175875059, -6054037728639979079, -3634064441098934061, -8710450800682585253, 5072486199451116363, 6225437264260269889, -5934727797037026096, -836750229402742417, -2765116540022750574, 7586900627920529984, 4673801646002989719, 5721629889036939749, -5288642802427072917, 3654347622624538663, 4377470277810450441, 260649676731413457, -5439279283076550844, 8417724794683961450, 7234060863174169245], [8688465029998336745, -5168560620108176508, 4335184731493609313, -3545783703038078348, 1322998711594577610, 8170317715887852367, -7551943825485024860, 4462027460271386047, 2468700166670105172, 542930931101638008, 5921226141604255686, -115972990659181304, -1713723309758937598, -8877628104658317547, 264189772803454582], [8688455073544252717, -5379370212483919913, -4425853513078825743, 8944492585160478162, -6592988298775489497, -1117799404320154613, 2187005912329747046, 5667170494997498830, 3585664611723570741, 1977101355042294114, 7053489374039836355, -5106677346658049649, 4322994289664021504, 3361566306976745980], [8688443457652335786, -5567378089694238817, 6032032045031601279, -8710452460096476302, -977661325510411915, 1029735994842633391, 7125706736170567439, -4148949687802821606, 6164925492306827864, -6524928794951466546, -5064516287678683001, 7021683083289749894, -6046780714628902455, 8085268283063375582], [8688458392364054197, -6939511518328038316, -7101875928125352931, 7079891816862976090, -7196174196464362047, -7919276938726144533, -4465689068555932254, 1422095706032813282, 8668232179912150348, 5849471292181877783, 2523794683659786551, -3022253981599681027, -2225062589365086904, -645823342730418283, 6130048890710235913, -3373696460891549908, -805562467490587986], [8688463370597746726, -254553605030898136, -3559977450524052237, -8263608463687752023, -4747971982321426412, 7941905536699420212, -1413689065520474587, 4249979150792586503, 4747875361288024799, -5641313910631587557, 3283775673747354989, 6028476121461157570, 6751585501378504252, -7060342587858679173, -8698274658652553683, -1526203603023379130, 7986652821465617798, -4498234421792024869, 4999006888478718780, -6879627465087289181], [8688465029998336745, -5168580533053587448, 5052271602872508003, -7033829699591176724, 8499850239815400682, -5451475338030711706, -261821468290723579, -8954166745492145449, -5574645952970025496, 2250611095145279599, 7725813264890461227, 878462731799761689, -2444848679068234084, -6149116544724483776, -8045528582011085250, 7508336084579925960, -2806791087925286599, 8213978214260166367, 6557423097863315537, 2074954654138460706], [8688445117074207453, 7965339055992623487, 6012437636715456822, 1444917334138328311, 3771194288097910285, 2086686794890122841, 5767491271832392642, 1592949209309978112, -8608276989486586865, -2967933374723872887, -3275846480633806238, -7711093524179550625, -1601054415521723813, 4997766511953790974], [8688455073544252717, -5379370212483919913, -4425855172495376998, 3819659383600468367, 416693455898548620, -3476174265228918724, 1039455508358744706, 2573958325044832997, 548951780218214333, -665274878465183871, 7952996683448542713, -1698917671069314227, 7804839296405767083, 8809133319547114376, 825687080672737487, 3158306237605839666, 8872118314102843232, -985056360057914442, 5300915739379063824, -2742433699078208118], [8688460051764644216, 6265247928558272931, 7218789519147790982, 6702658917679962690, -469398862659365119, -4112248261849350440, -5065774917727150080, 1781565658912125636, 8067537758349103902, 7979257020309529837, 587550277990194518, 3967072729928865726, -1578975935330601852, 6041891112333231837, 1753449735500099538, -1950813151898515771, 5052869325999626568], [8688460051764644216, -1140005822378276826, 7199811980274308948, -7056027820619746782, -1279548604086037648, 2910755393431026717, 1450326292032633712, 1287983454578659850, 1598515207883474947, -2592403999635758732, 3038216651052055893, 1819055929667246598, -8083505232125331925], [8688443457652335786, -5567364814404392073, 8292237997832193087, 7000690491150259939, 2413582417912551167, -6204694122234867946, 8067516186003102943, 6528550751257690451, -4914505866298744649, -2021643053308473909, 1510980804849749696], [8688443457652335786, -5567373111455225876, 2772436394119924035, 2049325354807307746, 679391917815283379, -3829330225112334174, 1039473761882283979, -4645189598754881052, -4839185136854499215, 2886341453272919767], [8688460051764644216, -1140009141195418100, -7195554008199237938, -1233688880691174774, -3050491205255065653, -9087667105755950429, -3219499971227280122, -7809221713647459759, -6687306480038627905, -1172903877782541462, -8928531575148596405, -3548882984931186402, -1940293177691497935, 2649430224126611515, 3377472007328818033, 5384864349450831016, -2370781601441423406, 1075576571916631995], [8688445117074207453, 7965345693626906035, 6991581209426567263, -3397621337782891837, 4187010750343845665, -5381255668431793649, -8493742552241589872, -5999698868232651048, 6485186715603119952, 6060747350966015549, -712511213332070872, -5302216361626641049, 7479012206277624924, -8992884117479687267, -9001397335519414693], [8688463370597746726, 442933879814124804, -5895515748636864556, -819154280219015803, 1905343186800114731, 8191933815104287293, 6050412627410492036, -5623107729655442304, -3388503758981763298, 2573359709125709847, -4422163145714163320, 8322968357011333630, -4409968618442887567, -2796453045547301400, -3149132450807970255, -1620660439711163759], [8688466689420208412, 630926822312725297, 5146574849450530060, -3796450423236929223, -8946917135758519485, 3389814379875559013, -3856323753401707866, -4479236077175806898, 7278816439443613845, -5692707210991896458, 4809801012805606906, -2362283318113414391, -1340207328517619903, 7602779777714190197, -672065426062545722, -523884807278499526], [8688465029998336745, -5168560620108176508, -7893024898915991212, -3702130582554579354, -3842263683127969317, 6115221679695893231, 8839690936742720876, -8823737457135844604, 5448447959920362610, 6245632714520674185, -1146054114850589988], [8688443457652335786, -5567371452059956269, -8194927112182053708, -1421700076718634952, -6572161811006532685, 2370826954625867434, 773076635528771346, -3742563094531597554, 5126330383472426732, 5849464654526313587, 7444122329391186229, -2945098471341812144, 191956709357740065, 4270960127037499321, -3559374749163241143, 3261086961771795007], [8688445117074207453, 7965335737175482213, -5122722469059314593, 1163868159220916115, 4469305280003916960, 4118345992971737428, -4203594200770731526, 5300136216145937944, 2221885832738159859, 613332532550870350, -7840409475554293778, -107595109226958825, 845919930761584090, -4658599611374641348, 6875231011505391940, 588627107914032840, -7292338007805833959], [8688441798251745767, 7079883519806821875, -6008196258768655478, -5756594814610779098, 6070010354541117561, 1201198070490345193, -940306523077840604, -6299000687627371071, -4161320270327185887, 2610697917451293140, -768839469196436273, 3746806898519496823, 42542351683048611, -5993378237581189948, 5261091799791214038, -3385592148231000497, -5068244054887748967], [8688466689420208412, 630926822312725297, 5146571530612107138, -4681897662345294972, 4186994156236857647, -6202210050370531266, 2717948790100199609, -3169806115091711165, 1758394647471541096, -2764029753607585340, 5367570553487105493, 291212403886398014, 7251825468902402164, 5392602129696460300, 2087155052440753985], [8688456732942182530, 1422715894292616979, -2466309397016708419, 6476697622139230973, -6008194599352104223, 2025274966087403284, 2488914763230092090, 8003320684319281043, -5084755775417773388, 2462667701680233358, -5594858890134742807, 8660980910738031275, 5257990091872969295, -3791983719733256872, 4974456845109841861, 6098095515743022664, 3604040215860788351, -6221190141452569140, -6048021091153830261], [8688460051764644216, -536851453508110705, 416701752949382423, -1572955086237967381, -2296082719657571688, 3084063099159732229, -2507360437842299473, -4790872870406025472, -1898010057394473084, 3820749357091128111, -697844230083054958, -6173018189831991843, -2414906140181033842, 8567764318860129748, -7668940762251017780, 1911491973799652544, -7803683158443000791, -5666017675846553400, 472400630700464915], [8688461711175875059, -6054019475111119394, 1604681350061640247, -1720975345536321693, 1362200803522033680, 8209519807815308437, -1621881669917887501, 4664687386024322866, -2527568396768003843, 2774761004846140823, 2051656603167807082, 1003818403682433230, 5864876313380588296, 2544623597475161700], [8688441798251745767, 7079876882172539327, -5726505323245438626, 2723366045066620461, 3958565382920155826, 5567158508998267215, -6518902967617158928, -4910334732718151008, 6689075402005028882, -1368432936278427392, -2828858718846378093, -8585716976478928870, -717435319566096905, -7490682267974926601, 2898541851559251810], [8688463370597746726, -254532032690217589, 6521295396668485494, 8129898479195360499, -1542240428373810271, 9053319049603491855, 4788329445613704164, -968558681421001787, 8611903924026503299, 6230497605441392243, -7329085130641241441, -2426491328462536365], [8688456732942182530, -1022877628898880114, -8778525239210345997, 8059645621369165376, -7196174196464362047, -7919283576360427081, 2000266621619319043, -7503480389404338445, 3394613105974785569, -7880093100324887942, 3563003343125029244, -4040760005726599628, -1370154845643833086, 5056445162494199569, 1943921771653286036, 346146561390387509, 9106093041313964802, -6846595732497391265, 7335153758983359719, 6537959047913002880, -2479120027114080543], [8688456732942182530, 1422705937841193157, 1396453898036360248, -99457058493408964, 2809796174786187875, 2783549113236329143, 4318040314033160709, 1576577042544191286, 2299673147150409576, 4571467475323959653, 2788953092910243045, -4943846338731975557, 4559899012896412324, 4217706261887138505, 6637694484142562140, 5589824755835821653, 5806069856677583329, 2437348726433835935, -7758923496731868247, 3692330910373067886, -6022877410104843133, -7631448963820992327, -661102978260043560], [8688456732942182530, 7245038240114200969, 1396465513925616973, 6265259544452850068, 5542155142769195915, -3961591868254461573, 6936498308304860961, 5723498750856543819, -1825151827476543989, -8187069822856584327, 1057826134278231023, 3950695584924065959, 9027078625687915671, -3602742103637613122, -3953734578902390132, 8206430482394905853, -1445470596854385991, 2258770718219510007, 6087747516910953437, 7625457640425040124, 433208495248374521, 1481036738279664345, -1332809999668006009, 6200418070548757241], [8688460051764644216, -8804750728414203770, 8520073133447503051, 4329142310052313677, -2615710479404213335, -929814758851106275, -6330941553910662804, -3836877956980254894, 8351066026873218395, -4872989886742323931, -7292946580176380931, -2262261375641477306, -3215793009760950093, 1373912138536280290, -7199890347778850876, 2015683258704626075, 7656033511122904249, -962236391368950668, 1531805633215456283, 7007016100040733980, -1050512151190793440], [8688445117074207453, 7965358968916752779, 4052885223599845489, 5026648048404914654, 7594767107115439813, 4759000589069729981, -4184003111274388549, -7111734228802436819, -4615096788577719718, 5001325754341375957, 3466834553544544391, 653006069104452074, 3842201909706473553, -3777316736465619516, 413605789873415643, 7585637019654331612, 2164315540953597045, 6526853733076708638], [8688466689420208412, -3962225331804112014, -730853629255312446, 6116472012672244859, -6330924959803674786, -1665406065076771326, -7627267873767693216, 1876467521382668783, 638329261127037660, 2289955293034888280, 2001479554772548776, 7077885827298950702, 967851696856194977, 1130206150199425564, 4435654886850401486, -3139254368927122191], [8688458392364054197, -6939518155983602512, -3559985747574886040, 3443685114449960810, -2694733192102377917, 7133736000876305841, -112400472981749577, -992470283019836766, -4594877213760098417, 3230394769042983235, -4577720413801807654, -6177209236352676012], [8688466689420208412, 630921844076372562, -18092248191316639, 1930966741275688698, 2093314556960694883, -4902170131410228071, 362219127147389290, 4986051858101121442, 3451539084976910359, 1842984125370409389, -4577730370253231476, -4740111374176155551, -8065749816226636364, -6901691908908944311, 7354127979039700479, -5617407287269105313, -4894296247951168612, 7240720154063447716, 8817642325951093883, 2781696845502431443, -8006338105978206317], [8688466689420208412, 630931800554398444, 2168665155823056727, 7643854050278391611, -7498089685020271287, -6524325200798650867, 2093959636402262255, -5490690705245354314, -3387273338929540962, -5693957543989529734, -2903545984735652674, 627835837475771458, -4448533927995571304, 5940666959789355923, -7030893197677271690, -5422305049854134478, -5872225994722365147, -6447154755834383985, -3067632303898372983], [8688461711175875059, -6054036069218107412, 1678760043585688268, -1305192071504362349, -6103116374768058310, 4212030710679904983, -375092297264201788, 6398152991722756241, 2092702665773006637, -8296498222017241002, 4393362702877996162, -8977003308285437035, 8894808685494954469, 4406937921515397197, -8775438465982538017, 1053034045815947221, -3315048572539980660, 1951939420483068743, -6803069677935257215, -1196974179447856864, 6107952157019516533, 3910248138237989554, 997187322773438266, -6174878754614063140, -6972088400377516948, -6325379898685298386], [8688455073544252717, -5379380168956625383, -6102511121193370964, 315750831381979444, -826413846443968679, -6714168751635879453, 1527496737015522036, 3762087432378072650, 6033888398185905275, 3652506970785218100, -3519560766029475385, 8079874259862167150, -4653067693825746576, 4920621084320124240], [8688458392364054197, -6845209931193169574, 7708683015517184364, -5661684655084081736, 4166787856711743296, 841132820530332611, -7686082627518871780, 1891764649369514276, -8512743322877624120, 1876485774911528468, -2903550962974665615, 3457101764722625096, -2299761471148938622, 6318505112547056669, 6554949875263688912, -5929930730338389559, 6668229001293321336, -1152836233676752920], [8688461711175875059, 6265261203848119675, 3771204244549334107, -5357178729110914051, 4146555006622896693, -2945101790164273830, 4243344751066450265, -6864188362863976605, -2525105130638422482, 5903458217040260051], [8688466689420208412, 630923503498244229, 1773079884244096283, 4517763737872192494, 7823214133939719671, -795082319150450176, 2114170914147768105, -8430026792261329489, -2750452875590875934, -4246363832120645146, 7028340714757156698, 3988053706173778544, -8813406052416083807], [8688456732942182530, 1422729169582463723, -9040588578176840296, -5772346793119422433, -7913872959052230631, 5378563631742120650, -5199892147420316453, -2381111346744632948, 3452777802087947116, 3364502042266104344, -9157587174343423235, 3144242848512299637, 815352225394188652, 6967812348691406243, 7690910112716835994, -8484018060470504380, -9133033812157405042, -3319374194599190513, 720425471739221624, -1050512151190793440], [8688441798251745767, 7079873563355398053, -1863130136986060271, -741201628087381673, 2094571527592610707, -255147242716328757, 4977541192296551916, 7471611426885184228, -2106220915315425271, 1443691892325118916, -8384783938309129038, -7613671082805572870, 5411726621045422358, 7680578707994414991, -6214562379384657304, 2987305650135489902, -2223219511479348004, -1870543425041140835, -7832390299038965756, 6607590058062843051, 4717339184720714348, -5908339654021423218], [8688456732942182530, 7245034921297059695, -7497466177940666110, 3514523312910752751, -8156350186756074482, -3891362242180177840, -2032138902976896182, -5810457252152968534, 2057824404759863431, 6647544487760831607, 8973821441720413581, -1415376127250032578, 4580105312402905233, 2971528780450403304, -584540212874319065, 1912125437346642779, -1518937399164143706, -1681318403068446339, 4827531537519878586], [8688441798251745767, 7079885179228693542, -3708139815779238748, 482751181746410394, -314443529307985209, -2387422020923388578, 7949909910242016381, -208414013030600191, 5753442817426629170, 8662682775437660913, 8126961084492111086, -6487122460822219285, -8907092429546123029, 4755909472491129378], [8688445117074207453, 7965358968916752779, 4052885223599845489, 5026626476058913695, 7668854097690321637, 4345532730346960188, -8497442876078957765, -7449611314227866461, -4881487277278328361, 4061523060697412511, 1825701945261357913, 5964727305003247503, 415453079373620814], [8688458392364054197, -4399616407977730627, 2772434734724654428, 3669649728845076685, 2413603990258552126, 4022167246918547105, 5768718373064813498, 5606363919742864559, -5366423479178438026, -5528797845448458111, -2858187707105396980, 5737540567628024743, -5861879523570520823, -460746090868701128, 6752212327272590497, -5133079657755503856, -467539190666638201, 5893105239974498295, 8219383853334670288, -3956815607271958913], [8688465029998336745, -5168567257763740704, 7802991240310277508, 4681688038127349252, -2165639263222079720, -4683141357687364052, -5406240781134665470, -7487725092059932394, -2898009987297977159, 8834288616485358229, -4012537716785593619, 3159521722970285445, 2700825944985751964, 627839156314194380, 2862416576386898250, -4757100410387265006, 4820738569444966835], [8688445117074207453, 7682430975707031043, 8292856526675445529, -6768041145629492711, -6119013778069296560, 3874006541058630201, -1168746912267837914, 1325316684665230202, 8685345835178439193, -5171653264367002014, 6103038007242234734, -5921916532062074478, -5833630815786147678, 3465117622420811844, 7932173514496727175, -5039386642991182086, -1808033193949960555], [8688463370597746726, -254553605030898136, 4543377335888362021, 2934814079207085394, 116013365628554245, -4148966281909809624, 8822590556739676715, -8576325273935924871, -5780997905504175993, 3685552110385327876, 8069376750771873210, 7981096012732299145, -8304524167903177924, 8544441376705052243, 5431936239387677983, -420488873091753429, -1975183054572616218, 6605866621022532866, -3297926620217537600, -6727137950074046472], [8688460051764644216, -2982430042014491447, 2979430107281160836, 1194297077469902276, -1596114481783974784, -2643931108928668089, -9215163211007506896, -1816674349864668851, 6240867176635423665, 3746808557920086842, -7852608214440035802, 674592298924052238, -3955568593112748559, 7717926872771422106, 6012426787445426355], [8688443457652335786, 3325915160364759442, -2032757431820148624, 4249367259583616609, -1599197169548813172, -1761564898184550709, 4525014114227704922, 4436728397954438328, -7496228353626954350, -1628056240861931308, -3672648896953860626, 7602029099344247730, -942167087867892519, 8000838271874155824, 828783810351969289, -3362143694226078811, 7333926657748278657, 3439352093687489146, -2921313909296988103, 9005005123738466857], [8688463370597746726, -254546967375333940, 7802991240310277508, 5943764582265912722, -6686059465879417551, -325386825236715900, -4499938844231835900, 8098237481501542601, 8385320780809416630, -5153422192214413498, -5158822853068525920, -8640824768761117199, -7701965096134993679, 5008876805023777745, 4846502438759078072, 4300285664764332230], [8688465029998336745, -5168580533053587448, 5052264965238225455, -5262865526081468172, -3615081923986439086, 5003192956765710420, 6031423472639772659, 7079251715673722689, 1301532122636367397, -8413652966073670996, -6836712540657165144, 5761453828624789535, 9066272420543256290, -1573580252715502371, 587553596812656204, 9113490501886604018, -2144808689990153316, 9129877603358788843, 1545233899361416058, -462158442755276513, 7278818865468750534], [8688463370597746726, -254555264431488155, 2658535420429897895, -8616134278833337894, 1376871105609472516, 5699415173901381673, 5391507046225140851, -3226764515688585733, 1528125222331479948, -1064087369812233239, -3484054019718995709, 4194262786121229760, -6006953456202629747, -383588921178319754, 7823811857066838236, 2178522563708136030, -1451650014319737829, -4151589140921817847, 438129282662599074, 3435033109286503695], [8688465029998336745, -1516618533301486529, 4844064063792638944, 6452637276925339393, -2977024402939987526, -7370595239163984427, -4876553214568936652, -7769396114637738306, 8553707699118577177, 2705143269986147396, -3581437401842659490, -8171182376006769899, -7954933956347866949, -4795688951689199927, -5314424925246101985, 8957780404760836581, 8456931996568135371], [8688456732942182530, -2025492887361503219, -5914503243983052060, -4376778185783849022, -8966498268784817198, 8944490925759888143, -2937200463330856092, 8285605257527928516, -8626649274806663201, 316359403752526416, -4273350722773076084, 7149494617037853166, 7311852389195564821, 8659747171868667665, -7663391489520835315, 5706977840478360598, -579609468984728836, -3424162436025357381, 2714250892309250053], [8688458392364054197, -6845216568827452122, -3935976610819080585, -4455947982677858744, 5372529507351658817, -8978228750119928078, -8815869318540344756, 6906390563415981216, 1681861751498612599, -1549508291649596950, 8765638793801026549, -4354110279529743329, 2655451073248508252, 6920437358421154669, 5564231070743781418, -6109285967481069794, 5490132464292943899, -8366878251123132591, -7555653339170551553, 1386728513489231407, -6744876771844472367, 1183926613478545857], [8688461711175875059, -6054034409822837805, -7497469496752486972, -5888881348932009966, -4989215471161227065, 6610217895308543803, 5047325924300461629, 872787180592528167, -4787179052487895423, 5205841266645351750, -4297900766144613209, 7900836242347629679, -6767566250423297371], [8688443457652335786, -5567374770877097543, 6106115716789341829, -1774852717763627480, -447942230152578728, 7284855542067768207, 3093946290997298144, 7133724385008330764, 4220661910121907809, -6979952327363870937, -1824541595684125350, 6984328280859838789, -6307008379992428926, -7354838282424308769, 5431937898788268002, -6375688072073595368, 8913172673742915354, 8824890276286790034, 5222499939650856195, -7467367622897284959, 2184533456352006885, 8471120765815096319, -6522008887144549530], [8688441798251745767, 7079886838645244797, -7175957940482503462, 4078503799855027957, -1353627297607425463, -5544551483373652701, -107456453802312604, -5193264385328462763, 3057209124615974690, 6043771590047413044, -6689165385406808153, -5641327185921434301, 3491978234596191725, 1883421615567819088, -1470619256137065648, 2720281697882570612, 968480182169492683, -1525593371236280903, -654310010190452221], [8688445117074207453, 7965337396576072232, 6106119035606483103, -889390543943543320, 773081613762463875, 7133739319693447115, 7970752992117961211, 7589366446258667185, 2925539459758687893, -2150843581005161819, -5265950771634371661], [8688466689420208412, 630930141132526777, -977636434347269682, 1516397293188963672, 5957948373273860729, -2848307834087632545, -2127669250768717653, 6247504895178701177, 4564823119125117945, 6795579681752282888, -3915127784076915938, 5377295045236909337, 3822600863753386342, -4850164939835628864, -5201122567469878583, -5052961861612621885], [8688443457652335786, -5567381408511380091, 8990344011520468469, -1398855216871849357, 5823827824768873494, 974651434304375834, -8116519609531281942, 4855013997376933831, -4648726376012441109, 2777238439057573513, 5487053988145231988, 6061981089835379159, 3642019418167629630, 8276837062059209282, -8592993136789588116, -9008646052474337102, 2071872859165626903, -31049830761508581, 8219387172151811562, 4515147516494466819, -4692249872807791706, -4780538907919481222, -8490672373142051558, -7501145696032637860], [8688460051764644216, -1140010800617289767, 7595387295361942480, 8318495015854757289, -2654307317756982059, 3632296585813095393, -8926679307414698705, 3482880568743134332, -9002019949804355079, -6698263051257205340, -3159473050947418495, 3201191292636468735, 3567930768170876139, 2707471960579863279, -2952495931917111566, -6656735587574456309, -2878403963108537213], [8688463370597746726, 4305715428393392950, 4769356884952633011, -9087675402806784232, 3072483020856229205, -7206040794192279738, -4239107584734115192, 6961509971590086476, 2473640867005798811, 7063342696485887920, 5693409259491203347, -6996473237763335806, 1210952431658265447, 2485363817914622558, 1807929042484951397, 1401393705601330950], [8688460051764644216, -6359158864617976284, -5895515748636864556, -819129389055873570, -3332807307255817495, -2364750795854801817, 2828786988970798301, 3065238389342994740, -8193105606666257621, -2717891821023838650, 1398938736527903804, 4458959707196984422, -4409981893732734311, 5492609137456678974, 1249506125324352665, -8293549978059922358], [8688458392364054197, -6845209931193169574, 7708681356095312697, 5722883540830432651, -1542875551324050731, 9091917547378132246, -3068862723950595319, 5172809402337748924, -6987967550176497573, -2398247467175529397, 3469916348517378194], [8688458392364054197, -6359175458746245950, 75579194232324584, 5151980488519713569, -7363950882986424367, -4110389356481170192, -7799970325940332824, -3319202219234882728, -1884576813014820780, -5662931669243292090, 3428242693409506960, -6975158579498336910], [8688455073544252717, -5379383487773766657, 1792661017275714408, 1704401851582141302, 6447234956673297158, -1610304910431525751, -9194922063846544842, 8245776339698405583, -5045565299387554661, 2126512393899844294, -7776063702577850580, 1481041716518677286, -3479103362886654746, 5213243573710036731, 1833716143540333200, -6740106255720208906, -4277695359411503443], [8688460051764644216, -536854772325251979, 6239022439354415158, 5191165986340181621, 6333330664144848096, 858128494399666468, -602295628765034008, -4306535284425038957, 7441050490872436454, -5043855005906085280, 2824453201583779967, 330397901685584418, -6163766802124864908, 8504617437117202457, 5178983973281792731, -4176125908995527610, 5652346602800297422, -5061584763998470496, 6611902404829545954], [8688465029998336745, -3962213715914855289, 2885113585415952241, -5733166273551268352, 3696502043948341115, -7848427124392057103, 4749747541948711997, -6508569903475526464, 3319915883610145312, -1933040249122109255, 3542160261230462972, -4698411935094516057, 8156887029274983516, 3748650869181279072, -7924841277885750319, 8967193679628559891, 5411106432780298249], [8688465029998336745, -5168557301291035234, -18095567008457913, -8317482517097916536, 9103639731657088911, -3474932229311381517, -8289862162893174951, -1329252416696972281, 3864277071075133828, -725462924871245288, 1736962906127896938, -2630527733945850547, 8894820301368249958, 487834754690084962, 2096398011371361589, -4762027967180079077], [8688455073544252717, -5379385147190317912, -2560596049466460810, 1704390235708845813, -6913871369753456949, -7636999003173061256, -4311327372889982965, -1492549891052722382, -6967742104327858746, 6742487835522786653, 8291005918363419496, 2103060621077781334, 3640769085169996354, -1506754487782124678], [8688461711175875059, -6054022793928260668, -3144809386518204061, 3215874869992472667, -7423984440916529778, 2612082059352264606, -7627269533168283235, -3923024899277245963, 8103022932332204061, 4703899434424484406, 8894816982551108684, 8732447594517441334, 5352920164345077597, 865052719182661599, -1509204478624519501, -3117812539390407447, 9201011497912777615, 5895584333607802652, -9171633969348596688, -4095262544458042465, -4403177309768565835, 260634742025015458, 433818727038132954, -8161919504152033003, -4122114859582588543, -7724508515030343244, 1007063745253696311, 5434407802568093147], [8688463370597746726, -254546967375333940, 7877074912065357852, 1461304435613173342, -8873447014605018436, 1515793699049449023, 1207867317852329134, 897315651618064333, -7687299772281247372, -3360893361249727183, -7065144632775047003, -2419211849310793991, 3109836163866928849, -7279391274500352072, 7166755224779622035, 5558201924594992732, -2895540083512831602, 5949926512826951545, -2594264696146175763, 4366359984740463670, 7461872767026926995], [8688443457652335786, -5567374770877097543, -2654289064249404022, -5473073183720947153, 3469942132491146454, 7660831470618865783, -7270279440562783144, -3742563094531597554, -997867625035526266, -2552580060047908946, 2112922240572006496, -3531272101062343437, 469315516894528602, -5891363761382455597, 7968273898489977266, 4264030924015491249, -2914510984752031088, 2973247239257020960, -9112819215576136476, -2177222792081710576], [8688455073544252717, -5379370212483919913, -4425855172495376998, 3819662702417609641, -8665239475525149377, -607684673735210117, 2845903196435002162, -5285713704771997101, 4294738944226744369, 8960264476606551819, -247141209751860921, 1822004808526086590, -4213948968978730065, 9156410404550420584, 2132531583599869364], [8688443457652335786, -5567376430293648798, -977659666109821896, -4941378860971966689, -1636563587870641208, 7055811558724955218, -2596114411666197211, -2433756639524446792, 1242130368839361172, 7203972264584872122, -7172247660177750511, 4501249465122971409, 640792527248638403, -6677447412736997347, -8120859267928036154, -9115303287443133362], [8688463370597746726, -254532032690217589, 6521297056085036749, 2330411036777118900, -1844147619876225502, -6226892243242156356, -1523252933027622767, -8296499881439112669, 8934644240956099744, -4888270420616860994, 7596626779086885083, -8768654556035419950, -5389115509971139282, 7508352678686913978, -7738707240750009662, -2662324199986159950, -279566161086846588, 7085890200841546871], [8688463370597746726, -254553605030898136, -8135505445463578397, 5308927643353267538, 8634576041895075263, -4904037333829242122, -1994787419366786557, 1404349353836100254, 3638920136274521576, -5122728340090332119], [8688460051764644216, -8804755706653216711, 6239010823481119669, 2839877369100694544, -6875294444322157311, 5722875243779598848, 9028315683374420555, -2756475384108042278, 3131307731080113239, -7183842673187651534, -3952485905326628523, -7826835916354725646, -6218269340856307745, 1199354099833883356, -8327224495752033395, -8164845151269602429, -5155747695735295077, 2901775577262539814, 5321752183620726106, -6518927092155754491], [8688443457652335786, -5567376430293648798, 6917504175324390909, -741204946904522947, 7877073252643486185, -4283088489836668526, 5957953351512873670, 308808353070124628, 1846530092452186392, 5151977169702572295, -507987403955979628, -1368434595679017411, -3714315914427449312, -2105742701294748863, 5140377178456318537, -983827467685917009], [8688463370597746726, -254553605030898136, 5072489518273578049, -6202213369203633776, -1937197214618191361, 733409604889107054, -220130326275879124, 7512674083576090153, 7486433659660513969, 2410052278315875718, -434518942245631894, -1816672690464078832, -1901712933445717229, 2509740358223005553], [8688456732942182530, -1022890904188726858, -3935971632596028880, -8318729531257126890, -3992289931990349017, 2368361136285070027, -6574635926400824101, 8699569452061247844, 4525019092461397451, -2248234493581714793, -4349296618718798362, -5397151412332441880, 9085895038860965902, -1977041959940796466], [8688441798251745767, 7079883519806821875, -6008194599352104223, 763802016080373845, -3823289463071628557, 7776122331076083206, 2375010470722924676, -5019304962523907331, -2200530799522409464, -2362880274610665874, -5762003772523705941, 4877837284883038879, -1408746705762909281, 894996917473112066, 732627529442104922, -8210369533243789206, 4942666250100549984, -5106677346658049649, -3572182827044076809, -99590867420689008, 4564201271464724229, 2736933733253792509], [8688455073544252717, -5379375190717612442, -4915727096502808185, 1444915674721777056, -7572165059721857622, 1931588588957364062, 4013064602826476771, 4101343681470781229, 2657925188642799668, -4863584908925434424, 5525647507680859438, -4042625548750344072, 4806680158587779541, 3198113583089361640, 6281307985671256286, -106855411863373177], [8688456732942182530, -1022877628898880114, -3841666726625397422, -7621853937621073844, -2918232880932739734, 7470996216856412854, 3507275362577716806, -2662167159296327692, -3013152996929482360, 7376071122620657287, 3185140299204186265, -342541199191151622, -5447320031937879825, 7923039341596591236, 602825833612417610], [8688463370597746726, -254530373268345922, -6498683392799537627, -1023512751870402222, -9081041003077987788, -7472456174074652056, -3763244289246946009, -4041848319821989765, 1826320474107270561, -593639538146587919, -8933480572543104465, -4003279691444184136, 3581359034316835914], [8688466689420208412, 630923503498244229, 1773064949558979932, 8733684652206606424, 8896059018471306097, -5035070216335698440, -6405006972144864081, 1273306514856938466, -1146658475630612543, 7698808120714491016, 7558648469577368801, 4232993433401278528, 4956099494480202288, 4571485728831537690, -5743653059544310152, -6791484621395401456, -3087221733983485117, -7278144260341141718, 3333329215065668324, 1445388778785735613, -4516444819924902770, 3953652760839060166, 3159999936972340411], [8688441798251745767, 7079880200989680601, -5479095692238113497, -7261623349941676849, -2996632086530017491, 5928474091931971219, -4460741730546052977, -3412906849875160193, -8438654672886191041, 5817180149752890512, 2245207115471365697, -3399007139081793116, 3995311612976859753, 1519602047840328700, 7164912913539711453], [8688458392364054197, -6939523134222615453, 510991724216276088, -8334486487996802548, -6968377227296720648, -2777444744463698371, -2561224534779758516, 4210772080631437904, 979431906893364147, 2986825908431928385, 4595409078042654716, -4347601259933086156, 2898541851559251810], [8688443457652335786, -5567376430293648798, 7802992899721508351, -4283088489836668526, 4187005772110153136, -5919910542474107236, 7051637999124545300, -3742574710404893043, 6747263329859460995, 3348156426080011006, -6555671662798567369, -194999022174487160, -4369509555883515673, -813455497251890273, 4545233689040005811, -3187577358467527662, -278319146927636234, -8335860673446350192, 7838487137366687953, 6029089672086678719, 4896666211864489634, -578502769664055752, 7289785524880398555, -8338186045209623771, 251381694922618916, 3388426919152125861, 2002106380687916669], [8688441798251745767, 7079878541573129346, 7802997877944560056, 7714692248744503964, 3978786617156988588, -4816031486145449363, -226321359617186657, -138029005688355867, -6424598061643867264, -9095219815854903472, -6276448971657245849, 6208446568648570415, -2734558791106778958, 1382273425861514751, -8932865362514333091, -727166448971464945, 4349224888848538982], [8688443457652335786, -5567369792638084602, -2768191697358641623, -2605838903437282703, -1956813195277676571, -8576933846306471843, 3657304930259897986, -6171185835043505083, 3409271792170307474, 4573319743036575705, -1240348171580453245], [8688441798251745767, 7079883519806821875, -6008204555824809693, 1163864840403774841, 5354760816189718572, 765049030239584199, 3033894479538333048, -1555827262863225147, -5820821845092025779, 4007657304335421595, 4294752219516591113, -4957271286055473646, 8899747726435378501, 3981736394363400572, -1564323886774682907, 8338238934413165223, 5593555080790389424, 118332998099796856, 6122634074958969210, -4591312226530235471, -7159449538748338667], [8688463370597746726, -254543648558192666, -2748595629623285705, -8710455778916277782, -3332155590177307369, 8341324941016426533, -4291729645751376822, 4454504619569267766, 3657311567915462182, 616258179647158128, 4245815547646260613, -8186932695112163009, -6841643284546755373, -3170573387547360002, -6476010508330360847, -4056652430815426997, -4364602043756477658, 4327769784021977494, 5375604664690210072, -5202832860940707140, 403252681066007123], [8688441798251745767, 7079878541573129346, -1789039827594037173, -8506090669627948609, -374475427842821013, 652537943295467694, -1132619977678933099, 1686174098265315502, 732624210624963648, 1977721543302097811, -3958043475131586645, 997939528823605636, 1795130921055539553, -8594098176712331387, 4906560887873607364, 8286083339809618366, 3277616169206132443, 7867332933389959345, 6152726753421085840], [8688463370597746726, 3819680955946469326, 906578655190506139, 5285480848764897107, 5447848577400634644, -3664782417780232445, 2621814848155562459, 1013210106225437229, -3275236248825426363, 3896826509747593975, -3201140961194390324, 3646197956023013725, 2091475564537925575, 5425301839658881539, 2022311020793819559, -2168596570857439043, -708175766528501283], [8688456732942182530, 1422714234897347372, -7195558986438250879, -7221794432114814122, -6404385124484470365, -6242014077031591554, -3332800669600253299, 315115708407797130, 1642037811910762813, 7117230025183238971, -713104851017501493, 2179739708470511622, -9078574418117964123, -4488831103375725381, 7013035289719477402, -8791491118831371742, 4296573725058989260, -2875477417646056001, -3524479894045770125, 1950704022199814084, -5221340482870948629, -8526789219521924551, 6516995564119989866, 1927237314666032713, -7744880020559797304], [8688466689420208412, 630921844076372562, -8966491631129253002, 2308184705768265335, -5498690100554257954, 6193175991249399028, 7559271976656973978, -7371845572161617703, 1849601930968275961, 9021674646014001769, -9137986128387675818, -4229993324755448339, 5450306865291203064, -6149108247673649973, -5027183057592112649, -2530505791495195110, 5350451027168517474, -6784538824266405366, 4859337067219607226, 5818879593980290662], [8688441798251745767, 7079876882172539327, -5726528555007990840, 1046733328109897061, 5636451751691653776, -6805997882793008034, 6689685633794787315, 2276545280417788190, -4158222647850629088, -6539610712912200871, -4045550434796274029, 544159691753270325, -643340031935060866, -7237711748361463312, 8646175272069689552, 2359579665550445903, -3300371632818259276, 7914414779786210752], [8688443457652335786, -5567363155003802054, -4727757385761439494, 3890534089097698030, 6352918434826710005, -4871140937846849153, -6761388492374496788, 1781567318307395243, 984369288419897130, 6946202887130535513, -861912295714255376, 6944985742368159921, -2538545012673638982, 2737552262097044951], [8688445117074207453, 7965357309521483172, -8081644667335280010, -8389577686172002859, -4708784825103028547, -8899670844413606602, -3803081504124642539, -4526177608752142477, -3501804457357396681, 3670254982398482383, 6312469328737383375, 9131276679974138926, -772536474211342480, 761966342453464163, 6692772407022595295, 313896904247491725, -1030287598136819404, 3160618334095227737, 1552033505091892005, 7838624133372122713, -7031513385942395799, -5482810184157332719], [8688463370597746726, -254535351507358863, -2842912151485834094, -2119791155700512335, 8707450865946594436, 7117206793441968405, 2319279171342509728, 5667167176180357556, 3585681205830558759, 6404450390614325333, -841679445612107743, -3335733086093752037, 8750331709344135792, -8769881657249219364, -3139254368927122191], [8688455073544252717, -5379380168956625383, 3356017927019946658, 7682424338072748495, 436306117722271114, -1605844844564796154, -6195576543439059819, -438706669933213553, 3751584052278042832, -5117322701013167992, 3904702052601923041], [8688456732942182530, 7245043218353213910, -4915121842949402487, -325401759948434311, 4676895949662405244, -7378746565182060620, -6835463867081403535, -8444063630793797472, -2448552321725403457, 2141181036565411463, 5901618457992944073, 6875361369852602298, 8819476340164112516, -5436343547787192480, 7048550333099412323, 8662049311885350266, -1916374938455720202, 503583414394888053, 8561100049737158748, -5694728135267640257, 6716092030339249878, 4126958046092875984], [8688441798251745767, 7079873563355398053, -6987976613851878046, 818918105416056183, -4257468254164934803, -3209628395257689284, -789660085955657207, 8379280018763390601, 5204135951386934074, 3324683080911947087, 1567942524263765538, -3469861931654893487, 5148414608497846038, -8164850129503294958, 1492600222470858939, -6142325997127121925], [8688463370597746726, -254553605030898136, 4543398908234362980, -7056026161203195527, -8664619287260025268, 4306934232572319797, -2614473421696426803, -4886887938135100989, 189486805577914920, -2191892962427502648, -8552557305992768436, -7488952193295013456, -6737486847272309133, 6470524710587796567], [8688455073544252717, -5379385147190317912, 6220028306352663458, -8035811494520110624, 1282544627290179893, -6524336816687907592, 4824446423729903509, 7643235521435139169, -6706292315984225390, 7150744950014204794, 1054749317523128513, -4307780639162377644, 7707442638994916764, -819749577320997679, -7192483829102359830, 5338114525655454226, 5990377410053194546, -1181693645573319801, -3601661954896633526, 8558486512293674441, 6920594267350718721, -8619238538944177241, 2803618416742707704], [8688465029998336745, -5168578873637036193, 2281922709512008604, -7620618539335158979, -3030908412804236067, 6945766290118975914, 5803604931131450713, -3907721133656117922, 757784485780938794, 4063241519504030167, -9082261466660164860, -8359170340292959511, -108705127383394625, 6177880522663143554, 6351071145331825246, 7885555708473092616, -4937833786666233035, 1921371715097051863, 6923674402920302299], [8688445117074207453, 7965347353048777702, -2748587332567131490, 5058292451994404740, -769438851740106093, -8577580585145969028, 2676891111642986213, 1068327854961709586, 905965104588926844, 7605100171257072277, 266761838912953, -3602123574791700474, -7291704544250863106, 3982970133230103976, -7103723217620237690, -5758462017035113561, -8178430326358427286, 2210798771430725302, -579614447223741777, 7838625792793994380, -3458895403958290170, -2960989236990146404, 9199170846073457052], [8688456732942182530, -2025491227960913200, 6991602781772568222, 6829233393744221284, -6216400479015422027, 3421458783462388893, -2614465124640272588, -6318726352659579526, 6541531565590434607, -7315485787483866285, 5507890432389554476, -2549634500006210228, 4180836311117506768, -5647622925388471520, 356658238546571542, -7801678960015891774, -4496243498633480948, -8389119516817102507, 6731974498950051365, -3657229707675958990, 8804819313363860218, -744921098240293424, -1055449532714666217], [8688465029998336745, -5168560620108176508, 5072479561816833815, -983065305184325817, 2692793493183237404, -2582530895993923609, -39557177748936833, -2420936945754354401, 7968272239089387247, -7413518460644942267, 4820738569444966835], [8688456732942182530, 1422709256658334431, 3281925958227333541, 7752682174121995323, 93951479552400920, -953895016991787353, 7296591768245157050, -4376943523508553847, -6965273859959264444, 6891725239583516557, -29682414685230043, -7481434330826587704, -4344359237200245997, 2887578510959424651], [8688465029998336745, -5168580533053587448, 5052261646421084181, 8451388463129983874, 6916890624698869760, 764420544923626287, 5428232596738489228, -269218928866023001, -1066410321116578360, -4386034551724668486], [8688460051764644216, -8804760684886909240, -7196177515281503321, 2025278284904544558, 8311225493178380591, -3774842621073988306, 5145317878818614236, -2026734923302982280, 8914427984974241159, 5683052963605640111, 1583223058138302601, 1763948137382398063, 716119894348448033, 4420366187661356972, 6028944379014448920, -1143108423085865948, 3560532546547879102, -4056060452530586395, 4049802535835007101, -8110357547228596355, 5093923685639698690, 3040544580574132307, -4618186113995462096, -4928716207889046350, -8531126457446449275, 5488273558927423857], [8688458392364054197, -6939508199510897042, 793307826217027930, -3796437147947082479, 8762532107649089277, -3397608062493045093, -3030896796936260990, -5245891424579416922, 3563001683703157577, 7267239679959912301, -6989190439775830716, -5757848466425553648, 528105379503846581, 6888797933070677524, 2373164840644591172, 3981724778484784671, -8548842047470284192, -6940272153154725017, 8201046415645121243, -5818353600728751889], [8688455073544252717, -5379385147190317912, -2560592730643999124, -8035801538047405154, 5408646485475838780, -5849677597588002641, 7689075331908532957, 5629810714331234990, -8626032405379962014, 3460058940632298891, -804937300991771348, -8821289892321246676, 3976320798813530975, 3253211418917465941, 2492001536460560276, 2329625510771328730, -6214562379384657304, -5107929339050952532, 605904309784071375, -1591798049580904349, 9144679923215309704, 8982328788707841833, -8490675691959192832, -2977038571005877619], [8688463370597746726, -254545307980064333, -7101885884598058401, -8710442503626431038, 8594138551681704328, 5701290673376549939, 6971384866374158382, -497641064524500420, -4031511936841934379, 5762078995123606173, -8305762885011554475, 7925994858087053570, -2973325738503209652, -9112342660974671529, 399554016650510897, -4676835661747621363, 4357227471254218780, -5545313777592948803, -5823896235821991600, 7147625755196967448, 6657275617166199647, 7705110497834432225, 4960408390704078389, -3657853214758224373, 8280055853053439081, -7510275148616166567], [8688455073544252717, -5379381828373176638, 2678129828751362764, -1837493307223299766, 6071857644038662526, -2871136099827430122, -6176564923554276752, 6279908274173006297, -5390956928442987133, 8864851343619061138, 3360346736167952051, -19188991060565901, -4856333639756635763, 4193786363253430959, -6455797571165643536, -7503620835965901037, 7806059760006565597, 1844221183054254067, -3542848860546044981, -8619233560705164300, -6936575016414133282], [8688465029998336745, -5168558960712906901, 699601536162859416, -6618638403844057982, -7760778190485582224, 4648809895668495556, 7558034918973129300, -61483727222905623, 8482707481771503333, -4002803268563084305, -8910796072195311784, 8488121417896841057, -6442969580336736724, -3948934193386612321, -8139855060330377873, -1779165825580688204, 2095175888375293468, -997264923674715172], [8688461711175875059, 4305712109576251676, -8739940016725552350, -5434492939475166447, 6976312291441286925, -4981179568818545909, 1435660968197508847, -8068066129902019349, -4239105925317563937, -5773125681466988201, -4799376131951765780, -6581912086711483347, 2995915277231491769, -7171018001175885996, -4261804593765829389, 165566014149542583], [8688463370597746726, 4305705471920687480, 7124496229042474395, -4150206658434737430, -6874689190750130171, 4798827847474721041, 8103649758234270924, 6138678430756969132, -1616945947791944537, 879716383614536239, -4160685147355663779, 2125893865056591852, -6668940832374115765, 2274042955021931619, 1741261845879067569, -7762465252199178979, -6298515835951130467], [8688455073544252717, -5379378509534753716, -8778511963920499253, -4399608110921576412, 4543395589395940058, -8036433342180504340, -6914498195647543194, 818306214204426083, -716184986589745277, -436230895135671912, -2651208928677160238, -3249582824955677840, -5803683298662594701, 2782312055528542611, 8006860780391322168, 6864729290800631729, -2564935707881836464, 7866722701602861118, 7743548767843745848, -1199446635422936819, -888904925661377488, 3538445769308583544], [8688456732942182530, 7245041558931342243, -4915120183527530820, -5850292807614113809, -2146041536088793989, -6109744136838630352, -3200534048224433371, -4809100623722851272, 9047910091695885424, -5207928049760337403, 4372524599235743861, -2247609327082898155, 9101168935079938769, 6607115294598294475, 3788322878075917541, 8566517304679637746, 4671942740634809471, 3474235201213959765], [8688461711175875059, -6054037728639979079, -3634064441098934061, -8710452460096476302, -977641412586282623, -4283083511602975997, 5354760816189718572, 765042392584020003, -8814013732010587430, -6579413080154049698, 6218157785111187721, 5495068318139251979, -8686679513919627338, -6360409197615609560, -2651213906894891531, -3249581165539126585, -1262429970578075656, -4966676263872363153, -2959283921753010376, -6174888711092089022, 7121393628332225067, -2382351723269560754, -5052961861612621885], [8688466689420208412, 630928481731936758, 6917512472380545124, 3193660154878196239, 2396470422038871723, -8804143815444246817, 1812263722648013080, -1891994186532870936, -7102502754040720824, -8076255622373084519, 174217887592634582, 7431173936666492881, -8305762885011554475, 7926009792793451569, 3338875168976049309, 572741320480769667, -6402555321885918003, -1096370215169105059, 8259199495866365859, -7442844130108101528, 1288724811358796753], [8688466689420208412, 630928481731936758, 6220031625191086380, -160248699057606472, -6270266235374752737, -3326763226392650192, 6501724220109572839, -6925600191666696162, -6610136035074361023, 2258775696458522948, 3867353887808954690, 974476140106965539, 7750355011203183931, -3524347876274027894, 6537208501300668413, -389770129783248169], [8688458392364054197, -6845209931193169574, 4355402646892019153, 90411383480359795, -2802463045399167670, -858336459219682375, 6313713024079452455, 5590620238293035645, -830089279096912691, -5021015124274370772, -4297895787905600268, -201908312251084292, 3576408377503116393, 7118310173942840009], [8688460051764644216, -1140005822378276826, 7199805342618744752, -5285080241217026248, -2259314024460202011, 3215853297651792120, 6352918434826710005, -4871135959607836212, 7144077362071432314, 2572722926756257926, -8138002792617761821, -2662802282267849800, -3858799528217870949, -9018047711474085335, -5239717746424717494, 6034971865762647587, 7008721415277870008, -5476154212085195522, -3241580110829632926, -2970395874244868814, 807944047293165733], [8688455073544252717, -5379376850139484109, -2466289484092579127, 4705750042736510439, -9174709126687147943, 2424697689224211085, -4520160078468668662, 9077382713631864503, -2146661724345937480, 2855631007023228928, -222616057546126235, 2196745338785948889, -3651835684474750558, -2928716348105980054, 1774914665079001380, 5290561102891430401, -4483432101935504008, -4834411301913094480, -3712486111831557156, -6489449491999383913, -453522265074260746, 2851941406283113175, -3065169037768791622], [8688443457652335786, 7682444250996877787, -1542852319582780165, 5629185547832418352, 5392752400989081598, 8920420624094572741, 4654190643579857244, -820999910297349307, 152761255085848191, -1401956158160227018, 8175866227565016805, 4796360369735993821, 3540299696437750851, 7610810570100153502, -4948163663732370989, 5158749332056029757, -7501769329303642806, 4584302103784488807, 2946376670624896845, -3015470203375588282, 7768722318289567738, -4760150682115581229], [8688456732942182530, 7245031602479918421, -4841023236501225174, 1932200480166333956, -1373228343560512674, 3724754202291502298, -449799476104207721, -2340066943579926502, 4620566034381488588, -8749796657986084983, -7776058724344158051, -7613684358095419614, 7573315452826384715, 8526833811653350552, -8459487798310712049], [8688443457652335786, -5567379749110790072, -18093907607867894, 2817687545144239937, -8531103992308443731, 3068304483000845110, 8782134813021387949, -365827634272548521, 979433566315235814, -8265465709636720810, -128914745722990044, 5832943744148130366, 3560510974201878143, -4542706816186479913, 1419161630160006173, -3657234685893690283, 7364479428430557744, 118334657516348111, -9112815896758995202, -6859407890267007674], [8688443457652335786, -5567373111455225876, 2772441372358936976, 7870418939993220655, -1730853559137534873, -781157717180639836, -7025317374370055943, -3321081037529852474, 1977551359085347221, -4490698305797399638, 4275733961978904056, 5884338703930310934, -7013134462966755267], [8688455073544252717, -5379376850139484109, 4523182652231222747, -6751530191697412900, 3489523265520104373, -1586856456426604065, -4109284316563747333, -4832413609383941659, -1596109503550282255, -6997698679581865613, -4819594047350175620, 7977993412022049817, 4865508187628804849, -210873193715833402, -1406903627898452029, -7442824217162690588, 659154856117290917], [8688456732942182530, -2025486249727220671, 887602775736235566, 725233387707888628, -3539762853942783671, 3632281651106697394, -6271513249533963091, -5623104410838301030, 662871007437100158, -4268571909600639026, -7648094361536650028, -7073175556897336660, -2746764167624143324, 1444166655789667492, 2472397171666389937, 3520218777063397213, 3807313692239246319, 2650513559982988711, 8937097550628936871, 8057036037647003897, -8160072975728787713, -5815890334599170528], [8688463370597746726, -254550286213756862, -8081031116731040509, 8059035389574086531, -2729009518360635257, -4337571115622700423, -1032745886048669472, -5622474266105791863, -5445436235403897138, -6493281072544835186, 2523796343060376570, 3294892604456944720, -7493140687607141785, -9128739718919561824, 8364499271252870699, 7641381594305971862, -3883954825134833154, -1909113712838157925, 2936498588744048781, 1694191615356111651, 947628803221432402, -7442982785532747749], [8688443457652335786, -5567373111455225876, 4187015728582858606, 2785386446263828844, -127674369200722444, -8185209258066532412, -1898636883315161389, -6900929614665706355, -4950636886329337408, -2456586564667494594, 9008727912713840294, 3311261452405590272, -8848910246531308673, 7989267251679825042, -8700726308908839555], [8688455073544252717, -5379378509534753716, -8778516942154191782, 725225090651734413, -2842903854413718643, -7127496163797086654, -2862519835075864059, 5135469534592954170, 7746031180288871067, -2114725836280377040, -6007573644462433444, 5610825645004863763, -6498707517356754632], [8688465029998336745, -5168557301291035234, -903574334935530091, -4283081852181104330, -6364566163109031460, -7338328987914100625, 2134400445419473434, 3742975317974045550, -522024242493768023, 6318516728420352158, -3254389848111058611, 6781671673908082008, 7760694844720745707, -4221206875781811274, 8750331709344135792, 7908226933544339583, 1846524221421168866], [8688465029998336745, -5168567257763740704, 209716336865581485, 3608843153574481178, 2885737092495557418, 66952973024014287, 229312404582315961, -3100175104936550582, -2126437171294623650, -4227515890544015649, -3694719846689433188, 5809015548439647163, -8933473934908821917, -8845179921574080696, -1632238097539777089, -1886293744143873739, 1493235345445041253], [8688443457652335786, -5567378089694238817, 6032038682665883827, -6774343522752094126, 5240878096001950057, -1587460050579419744, 8405528739735121000, 5512675883198934288, 9216910560635887532, -685640644681325315, -8493739233424448598, -6885166020291748149, -598605261387070555, -8405465133021817287, -3046797519054640514, 8779815947156070566, 7731966131776119577, 1844212886008740676, 5544621727737200198, -1400242677592622303, 2115390484935280386, 2838496546016864352, 9124481920762310804, -6002644559994714882], [8688456732942182530, -1022887585371585584, -4915733734158372381, -326020288789026547, 9177731700470983676, 9015355674784412336, -7665834842720966972, -3474932229311381517, -8289868800527457499, 8583660062739496331, 5204132632569792800, 6419754156232793168, -5253771179048212259, -2434977103103963658, 1755920532077249680, 1445398735237159435, -163192731403119051, 73275263076065406, -7870992115633407627, 6310777288771472649, -3369529538925422538], [8688460051764644216, -1140012460033841022, 397709279369502390, -3890738735103232869, 5052266624638815474, 536615278705151085, -4613853093235650638, 1068337811434415056, -3106227482850551688, 4774744270519558895, -3254384869893327318, -8803655776689851497, -8419048648696751095], [8688456732942182530, 7245036580697649714, -7497461199706973581, -231707085762240874, -7666463328039585090, 4610829926737107607, 7030788279571754626, -3609064393687004035, -2561232831835912731, -8976991692412141546, 3656056256697437407, 4930490874697725290, 4397686533792309026, -31048171339636914, 7447816015570329720, 4554961499630892783, -5760170651110672511, 8119532993445677227], [8688460051764644216, -536831540583981413, 2376234253119582816, -442546547532158835, -6479714150979549602, -984902638203844900, 1924309109808281894, 6115220020279341976, 5183918035988524234, -8956015694406241669, -5651215355995352951, -4677439255900437042, 4900376492169242585, -4810956210273890246, 8160587353107030997, 6567762799657851991, 6141008019695596801, 1950082174518138720, 2673183257358049539, 916434403674995423, -6793813443714802867, 3034659068081022165, -5022867523728633588], [8688455073544252717, -5379380168956625383, -5217009121503746572, 3475329518036790690, 4355396009257736605, -3452720833011586157, 4205996586273481914, -5622465969049637648, 4809179165145213190, -4943854635782809360, -7871582434496376562, 4537960847546487839, -8308840594556001364, 4662681396460297478, 8747865891000678179], [8688445117074207453, 7965344034231636428, -1561229583136549030, -764044828538897661, 4468698367028639595, -5920529071338641326, 41311165027561253, -4001415807842311359, 377491363971092550, -4981191184686520986, 4522544210463841013, -8937792919323108398, -7889958038633594172, 8959034056554329483, -6991067598672870649, 8150231057202846319, -6684224685065794102, -3697677154346074159, 1739397962277194792, 5957323973399590761], [8688443457652335786, -5567378089694238817, 6032048639138589297, 1029740973081646332, 8762537085882781806, 975269963168909924, -394693343241230853, 7752663920598456050, 7103644850094414114, -8037657124598444128, -2448547343486390516, -1651350973015443658, 3379314318590010263, 4501234530416573410, 6183909668835874094], [8688456732942182530, -1022877628898880114, 8480846150362225160, -2341295704212937377, -806804503416105811, 4625361441663573870, 3545865563298863188, -5397151412332441880, 9085893379439094235, 8362787318360170475, -714336930464993436, -5855710955369879040], [8688465029998336745, -5168568917164330723, -977654687876129367, -3702145517266297765, 8707454184763735710, -2966057875248704621, 8573942208623975035, 5268486834338716565, 1638327531606009862, -8654876541986682151, -2844147549755787723, 6191318745276488387, -4443599865275538771, 3613908473010577709, -8574637445597781446, -1653219834856329376, -2524501536488267009, 8027083674023424537], [8688458392364054197, -6845219887644593396, -73193402836562214, 8545076499676574351, 2885113585415952241, 4422840303055648388, -1863742028195030165, 2180993360282625966, -450414686130318889, 2462667701680233358, -5594863868368435336, -2685635526246660318, -2879637701977900823, 1710085699840208627, -5313806396397529131, -6111001107473206382, -3616934191699055138, -6754139775419574379, -1501196917977166556, 1411897085701360768, -8932867914728209343], [8688443457652335786, -8318734509496139831, 2319914294311371630, 6646315727109199290, -8494996204053704216, 8300121837742676368, 8536571578714282788, 8714702901718658119, 8406764904645582535, 6937101009665672055], [8688456732942182530, -2025487909143771926, 5334544560186578339, 3725974665892300812, 2678139785202786586, 2589877300692072206, -2031515395878669563, 6641228835348383448, 2598503521895062091, -1878559282734007171, -7727138646580815569, 330392923467853125, 4359116246019233790, -3772512271077022198, 7826901182484580614, -4657984401348530180, -6929767113632823532, 79909662802201644], [8688463370597746726, -2002648027512057418, 4769353566135491737, 8473591562389586255, 5728901071113906466, -7787628846193577047, -4482810254253828644, -1988758273194056017, 4371891135686093420, 5095032044395544471, -3839818670505965993, -3666634685490188291, 6973221306604333086, 7587373731984488541, -8362721285608429043, -6825007843277201082, -8194951236741930919, -5376177073721811610, -8784078723552334527], [8688461711175875059, -6054036069218107412, 1678763362402829542, 725228409468875687, 813519103981155222, 6397522846992907280, -5763249127261044628, -7653506638266718145, -6292344715557894080, -7788262309743227488, -2598581889426206079, -460916406829758688, 4276987613793678606, 8000846568924989627, -8832403504234976781, -5939519118877423434, -1452273521396682800, -2500095126775068634, 8951139367379136147], [8688445117074207453, 7965340715393213506, 1471179330402565660, 2629057820273527317, -6726491977856435751, -7449609654805994794, 5596022558550398292, -2387438615030376596, 1938974433654047583, -555050996844652998, 2285639627451044103, 1977716565068405282, -2611998539698870365, -3335116216645769202, -7924836299644077172, -1077507338902038799, -3349309964110461443], [8688455073544252717, -5379381828373176638, -6028407536511501122, 1163861521586633567, -5632817286720129797, 8623004260650386660, 7747891745078922982, -309653100259592456, -7102484500517181551, 8795096481030607629, -1770665882852089170, 723372822917836713, -73806953446122127, 4515914788976717716, -5723426847095066509, 3857000910745853140, -1564312270901387418, -2538075095706456583, 5519471409032648874, -728543953240814069, -2263028516382081439, -9036280443024603664, -4845369532553543582], [8688445117074207453, 2346166334094922891, 3299679714682875787, -4433121376354612422, -168126794123151584, -8225646748285223759, 7875211028458164663, -2364132267008889169, -1905429851384752728, 692825030477230773, -3894297977469536204, 6769809174798568691, -4232318828273669712], [8688455073544252717, -5379370212483919913, -2708786624741833918, 5098113072765113252, 3053515438434170993, -9032570929344397383, -4252529213224510771, 616268136119863598, 3360960286798793612, -7352992652345975265, -6049248958992176345, 3833719453879527328, 3869829662619797361, 5215100819682947372, -9171018759322485520, -2323686479739364019, 3151522327661381805, -2972708869081828877], [8688455073544252717, -5379378509534753716, -8778511963920499253, -4399599813876063021, 6239020779932543491, -608314818446437636, -6083508691162067109, 7776115693420519010, 5051644776978421758, -2778700055695024176, 4541549959317606554, -1479903832058168619, -6066987014154016806, -5343899206582671083, -7461965302639922312, 8057037697068875564, 5784601608302821861, 4176044989277109430, 8070604618631500942, -3975798124379133476], [8688443457652335786, -5567379749110790072, -1789051443462012250, -6525557280267424458, -2334661304486801139, -6957271145835879736, 7596606866162755791, 8646925818697985255, 4942661271861537043, -3749670730047377877, 6949936530923526206, 7673027657290731555, 5253061007405250733], [8688466689420208412, 630926822312725297, 5146583146501363863, 1482893984231293338, -6272738691368454134, 1460064059090905742, -4085992903227376257, -3132459609715294069, 3788954682209016727, 6607718888756430566, -4650575324907915887, -2540397280386255034], [8688455073544252717, -5379370212483919913, -4425855172495376998, 3819656064783327093, 6239017461115402217, -5921782723132134228, 850238783458165661, 5229145955252948128, 7652326549656574220, 480283704007683174, 642633179093279378, -156408821456000984, -1130146755076646268, 1796847852187252718, 8968275487807372390, 5872739473755696645, 1165575900501810274, -6016834988642265849, 6769934554936028374, 4971991026771704660], [8688460051764644216, -1140009141195418100, -7195557327016379212, 3702514596014083637, -7968363881889096331, 7753907615940525130, -3520772039779454893, -8523086343491962054, 6030809922038193364, 5927223758958279797, 2601580338650164601, 3065236729921123073, -1880883126838337495, -5773742550909650624, 4054744895592572407, -6260395552199826690, 6429476988582006993, -4622959948936866831, 7240218708277558888, 879559342945985629, -3222579340193598678, 8863493752295122954, -5843508897664335536, -8588201048324644108, 433822045876555876, -2822210277205848441, -7264717785337418726], [8688460051764644216, -1140009141195418100, -6216383884908434009, 1899322337707480260, 8671322271935817954, 1968925137861075688, 8254903874953618150, -4230003281228153809, 1002729957864017771, -383590580600191421, -4310729649762864400, 6889886247139465601, 6166771889009708038, 9051473419525158351, 6730113934165319862, 8338705400826879996, 1907179627030289435, 5463260236246928735, 5300907442322909609, -8704272276006577794, -1729010481273077621], [8688443457652335786, -5567364814404392073, 8292256251361052772, 88552478112179547, 7747263259762965070, -3852151853201887967, -3541625078128105193, 4515893216630716757, -4561229372799177547, -8752138623869647610, -1539165271037919222, 6566659550877345503, -5759565397557266813, 8496286019210084406, -4062701489912286829, -210271258976908772, 1398311910607215499], [8688441798251745767, 7079883519806821875, -6008197918169245497, -7997834844411184361, -3334027770835334361, -5435106490079405948, -8814630601434628411, 6192544187095018194, -3522629285725763474, 1553750436220944964, -3295434251299706911, 6607113635203024868, 7404301708617817511, -3870374628279700826, -1820844590669219143, -5077971865475975733, -75657561758148160, -7247723639150969978, 5905307165954356271, -6032583648325787292, -2727151505781799388], [8688466689420208412, 630923503498244229, -8798739835770332915, -1838106857832859679, 2939596211220605580, 7266010919308279984, 7103639871876682821, -6352839893388386851, -5689785643768428187, 9154561455654945806, -5986742178459784103, -3093877706047641696, 5820725224058624166, -539942438345064544, -3993543583805123567], [8688460051764644216, -1140007481800148493, -4445459537265605483, -929811440033965001, 8989743736184794064, 7320960011502706242, -4839818600404149656, 2499412272320386030, 7407381844192721501, 3290546308404626312, 8935857174104009065], [8688456732942182530, -1022890904188726858, -3935976610819080585, -1117195810162018522, 7425763319358296431, -7621850618803932570, 6633974247378404749, -985537761175367008, -3710008677620124466, 7117221728132405168, -8835475342751066350, 3324681421495395832, -5441737570988400912, 3472853743244569461, 3446621616385147492, 3284245590698576152, -1444843770954979334, -8616918145401295161, 1769353776456901984, 721527192836843003, -2658018490859060007, -7159449538748338667], [8688465029998336745, 1860095354616881957, -7365187940672929251, -4941997389817879337, 208475960340653679, 1256310841008886257, 7955465820606481394, 4251227824373668524, 2864292075883348164, -1651354291832584932, -771304394742568889, -3320465827503741306, -4690409220968471143, 5948222988732052300, -8233548075094699643, -6152047170059784495, 5934024263012385882, 2796969082326134703, -5477871143216908687, 7827510521482334462], [8688465029998336745, -5168567257763740704, -1789056421701025191, -2512144229248429060, -4593633518418029337, -889378928054286595, -2332797420900889598, -1609671446876554898, -7705662101147239680, 8599562444279747522, -4371989416136046288, -1986906005481439965, -3595502450355410980, -3906027566012642499, 7693410778693481104, -1397770221614882142, -1235410790035298820], [8688443457652335786, -5567376430293648798, 1792662676692265663, 5496917267053348199, 4523184311653094414, 2158786942200561899, -5460731703968870964, -4457183380969094021, -7762620501746774454, 1741128168693434289, 7711151259883118460, -586859078736976242, -413696666069859705, -251323959221711287, -6458886896586046120], [8688461711175875059, -6054036069218107412, 1678756724747265346, 7848209203096675520, -9060791558868852137, -2700148787644266896, 4260475893258333773, -3359039434117899670, 2019244160514082725, 8567287895973709505, 736946382138686493, 2596178018398122366, 2433813608600807751, -3602133531264405944, -7306391440445289960, 4853786896141852769, 7578254493766808747, -1925504133122163612, 3788322878075917541, 7775340123908715958, 5958547755817530549, -7012972575800838480, 5784624840044092427, 5061518778965168667, 8144689949784511099], [8688460051764644216, -1140005822378276826, 7199813639669578555, 7362166433590937475, -3728362709416661529, 2558208005939439887, 6937113518330972129, 1860727158749981143, 3583216280287086349, 2213266249169452522, 3750969735043936249, -4793198242185260287, -5554429696972205675, 2503123445401182330, -7197414572989289853, 8811455372506547711, -2859414808337817836, 520104324778391686, -8098180512422521436, 2291060201231946023, -2414911118420046783, 8363404187808153310, -3161937209871664647], [8688441798251745767, 7079876882172539327, -2674510298464955136, 161259538397895970, 8406779072732754276, -7620610242279004764, -2882716178128272940, 7265995984617843221, 1053523875709919118, -7004025947867609261, 2087155052440753985], [8688441798251745767, 7079885179228693542, 5957943395040168200, -402706013839981237, -4741792564877356222, 3876483975270062891, 5018620443094445859, 777875361649279550, -5025329130457624930, 3592935793800537458, -8567821245765637893, 2072033086933613877, -7594238561650024788, -7480814142566784007, 1583829078316254969], [8688458392364054197, -6939524793617885060, 6823194291117406716, -348858511006850006, -7854444654667550300, -3663558635359632451, -1166879709848823863, -4472321808865517237, -5520161667770102550, -8280136011721499440, 5827538105073626445, -8029487545051508250, -2651212247494301512, 2425169133866297975, -3675758901922939172, -2067150841154391020, 6593550032454880558, -7662293087256316446, 3937113728652382376, 3848857881775950544, -6729596237964614892, -3424167414259049910, -3335883357386373335], [8688443457652335786, -5567363155003802054, -4727764023395722042, -8506085691388935668, -6271519887189527287, -6994625948268451047, -8631589975163638488, -4440665789402731662, 2731396969191570324, 2705146588803288670, -4466916169769731668, 651906139162368508, 7425144790515043989], [8688465029998336745, 8662206352556561082, -1052970439081361860, -8861112172513826855, 360346946489362298, -4229378114729337171, -6347439232552895871, -8148486259775040905, -1787813619150960696, 4498146864412722081, -7027179598555377465, 932814867496936464, -5914527368542929271, 6644451843523287749, -2298536922106452164, 7279295420067555275, -2432047238824341172], [8688458392364054197, -6939523134222615453, 510998361871840284, 3005060299404318381, 2430109965951618996, 4368356017853065236, -9002011652748200864, 2198584331229999845, 74985556546893963, 102579360177262472, -5401916950217692400, 3068177311729129262, 4190090885916089449], [8688466689420208412, 630915206442090014, -7384178754857539677, 5026633113693196243, -3916367267809839159, 6852068297115641203, -3124586492880781280, -3286954221492576963, 7351679647600555881, 3160768737129495799, 7648017653427377707, 800705286789667146, 3709928650693710871, 9155798513341450690, 1098265283892191977, -584381644525543552, 2324830103489243448, 6515760926905714470, 6365729831524686945, 5642620451628621911, 305857683069047853, -6703825731021541519], [8688460051764644216, -1140009141195418100, -7195570602306225956, 5214009186770415961, 7633990771367615194, -497646042763513361, -9082266444899177801, 5762085632757888721, -8587437226427783309, 1241036944789913390, 4546480703201876371, -6690883975955072573, 1793275334504500579, 8495674128001114512, -3179074989697830703], [8688466689420208412, 630926822312725297, 5146574849450530060, -3796440466764223753, 3449719238856383879, -2660329826274148403, 2698359360017747681, -5034436752788708205, 9123857647058158957, 7736916920331485862, -8215778491135434401, -6620474077449686016, 8913175992581338276, -3007735741965721714, 7632105315419741458, -6700278997315217846, -4934737056987001233], [8688455073544252717, -5379383487773766657, 907203821689322777, 4611443477346667520, -5424608088218389071, 6100703440064594124, 9009955013948921356, 1461302776191301675, 5917515861294182323, 8826745862837829008, -5990444161692421603, 1013215084443168522, 1602819125876318725, 8378678084027126177, 8369430015142460928, -5812326113975232810, -6387278106847143656, -4778680002551300974, 7918726994827228127, 4421471095837133067, 5374981157605284483, -4128755896943007329, 2792641800853033801, 681251715980788624], [8688443457652335786, -5567371452059956269, -8194948684528054667, -8106659649437646799, -1259325710453935279, -6335728664141914283, -4198053225094043070, -670340197879998754, 303399395157197785, 801312199759624099, -6840402908021827567, -6163001320806132442, 6808545561370648427, 519002735414436453, -2373851780540961720], [8688443457652335786, -5567378089694238817, 6032033704432191298, -2910960039415279908, 7877078230882499126, 1516403930844527868, -4311335669940816768, -6713561838660602088, 9062565459071605849, 6568543347408667984, -7494364470025081573, 4475480617575167643, 7706822450727132449], [8688456732942182530, -1022895882427739799, 8198564895992000609, 8662208011973112337, 5843443805431018910, -1328625590800225830, -3748583943632212643, -929828034140953019, -5371350904250886981, -340680634406420119, 1341982888123623840], [8688463370597746726, -254532032690217589, 6521298715485626768, 7244416392453807253, 8218167601364299281, -2589461758432482936, 5468066492799044484, 8772876787661357024, -7291092653041893212, -5019293346650611842, 5332710546002821972, -3610284857287802549, -6722818204604081758, -5999700527633241067, -5911419789593667002, 839900741082840668, 1226214712009263237, 1388590737674552929, 172987467540412246, -6187676876046135190, 1680598143211132579, 2074954654138460706], [8688456732942182530, 1422727510187194116, -3935973291996618899, -231700448127958326, -1205476548201592587, 3162004135420731076, -3124589811697922554, -2401473794146293324, -5346195607307322716, -5582656964152224625, 3360338439117118248, 7015362452638288794, 4942666250100549984, 2049808415343971773, 7525008925672602146, 4680450980419562720, -5708751566768614732, -470019050919168816], [8688463370597746726, -2002646368111467399, 7218784540908778041, -5921782723132134228, 850247080514319876, 6646319045947622212, -3068852767477889849, 3291798300797529195, 8294097669824920005, 7414041135079339766, -4746734158010374858, 5642475026833366790, -5780400182377057428, 5494291089208237466, -8154503790069155544, 4092693335705253927], [8688441798251745767, 7079891816862976090, -7196172537042490380, -2119794474517653609, -260577772951314705, -98198428466223533, 40720846164592318, -5434494598891717702, 5333939306633172641, 8849585744453582280, -7325362341681829240, -3610284857287802549, -6722808248128716082, 6074785848899073551, 1379959538232550103, -1925494176654778554, 8463736580534964053, 5158281206225763729, -8360237213762713805, 5895585993003072259, -2161953874096430238, -8508416173146169982], [8688455073544252717, -5379378509534753716, -8778513623315768860, 8662209671394984004, -3822674253045517389, -5357173750893182758, 604693036050053103, 841144436424909748, -3333414220225774448, -8900314264438622719, -6762640484772720083, 5133592375717195885, -5181536456207228135, -1981822432537765397, 4503559141142790198], [8688463370597746726, -2002662962223775829, 6239017461115402217, 277155652424480327, 1811648512621901912, -6642076901373613992, -2937812354539825986, -7771255020005918554, -1485292877041645758, 1082841116380597812, 9140377664641677387, 8417256668877637276, -1559369911143822112, 3430095727746669682], [8688461711175875059, -6054044366274261627, 4186992496820306392, -402706013839981237, 739438751043216152, 2517137052171098099, -4348057901615742223, 167556937286804856, -1202381477938912040, -2645819883693683099, -6912043226574116048, -6564908115812597335, -2525111768293986678, -5343894228364939790, -8649344624416505731, -3618656101064460832, -2821458071176962719, 9005155395031088155, 1807935680119233945, 1959811644522916741], [8688456732942182530, 1422727510187194116, -3935964994940464684, 3796839414911504593, -8289228699338204098, 4743708439321897429, -7365814766588297144, -4871737894344100636, 3788958001026158001, 3951302497899343324, 8068129736612662856, 8188841170845461787, -2218288767597738393, -9065609431288942963, -2292364142296664522, -2318611203867804902, -8679292141540058708, -8767546329021220933, 3617468482006748126], [8688441798251745767, 7079875222755988072, -3634069419332626590, 536608641049586889, -7122083887072338949, 7133732682059164567, 6600939957024383586, 9094988619269675145, -5573403917028546435], [8688456732942182530, -2025501184433618670, -8269649225728457640, 3005061958804908400, 9009333166267245992, -2590086924931299574, -3387279976585105158, 2574593447995073457, -2012539516421738784, -5170421184898228423, 1676912754085483097, -743057214641080853, 1306472822977381448, -5865560066198804128, 2002721590714027837, 5401846748022337511, -2217666919934684471, -3359805047172958488, -8208991394094200382, 6072946856455022595, -1546575108552833190], [8688466689420208412, 8662209671394984004, -3822674253045517389, -5357177069710324032, 5917527477188759460, 7526090733848754439, -93422934108267543, 8849592382109146476, -2636531988955438854, -2724829321102000937, -1582692853274957763, 6474856970278628762, -1978886697227125385, -365359508463564141, 132523426742027411, 3025404493282439484, -1564315589718528692, -8806755058582959551, 4597237221216675205, 5274671996646346366, 149665292009881411], [8688455073544252717, -5379380168956625383, 3356014608202805384, -1516608576828781059, -563091877423686889, 7494439692624981805, 3790176805210405260, 2816450487455074847, -4575262892514504256, 1710690953414895973, -3838588250453743657, -7144023711817533041, 2775524826748322034, -1814191937414223220, 3224972535848190266, 1686028673464739969, -7180287642406552204, -7294665170724645351, 7373727365594857877, 2297359259521444928, -7605188626960005203, -3015476841031152478, 8111043768245461896], [8688458392364054197, -4399613089165909765, 1396475470377040795, -2058986239846468083, 7162447987990918631, -8861107194274813914, 6672562788680339670, 823995040704166555, -619415155070320997, 6552626031162018794, 2774291087878958424, -7804146437754618994, 3411106572999892159, -7789504345666085107, 1135605151634326525, 4300285664764332230], [8688456732942182530, 7245043218353213910, -4915738712392064910, -7338927603835883981, -563100174474520692, -4018555247085028670, 4712995440858330338, 8903912988984954616, -3182155125270074487, 5360797366599996682, -6062062907904029537, -2022273198019701428, -2694123853086002627], [8688445117074207453, 7965344034231636428, 8762552020573218569, -1626677077197312577, -3708139815779238748, 482746203528679101, -1199905703128069369, 5575951595627468476, -8002013382266568456, -1719882053207239027, 563625401101512795, 8315392415144507961, -4685468520606175444, -6181376158340085030, -1104994776976825337, -7066854926267157208, -293609637258917531, -5384323421506195274, 5112307586849031751, 109986645480960394, 4978783994841295999], [8688466689420208412, 630925162898834248, 5428849466162530209, 3820277912443720809, 1812900505014804795, 8984948328902708782, -7041825776082939090, 7700648772569772815, -6706287337750532861, -992465304783484031, 7950525120268127549, -4135542994002862790, -5994766333206144448, 6947456538945310063, 8732594546995581564], [8688460051764644216, -1140014119434431041, -6799985330748547160, 7057037000559446261, -2654284086015711493, -4643930968709074179, 3393354475944939932, -9165606482597737815, -4970856461128337267, -3477399707050108737, -752927131183479612, -915296519217146962, 206615395555922176, 557435895443090371, -8209003009962175459, 3464509050026323018, -5700745665545793660, 109993283136524590, -4479731778103456527], [8688461711175875059, -6054037728639979079, -3634059462859921120, 1460059080851892801, 1548339818891466866, 6004546266357404760, -3710632184702389849, -2662792325795144330, -1939694561772374785, -5467379378984853946, -4744266680271647638, 3874009859875771475, -3121498060257703693, 3654352600863551604, 7845268489568304215, -4221195259913836197, 665946164770331001, 5181592532486264097, 7601554204159334038], [8688443457652335786, -5567373111455225876, 2772436394119924035, 2049322035990166472, 7050400941416758768, 3984203872099467586, -1018082221616794832, 1475959802991553973, -4930402376823939550, 4291050104539646643, 1984349305393951501, 722145721682755651, 2907783151067987747, 8673780559847668022], [8688456732942182530, -1022894223005868132, 9218177487719227178, 6836782785023372847, 7405552041594169139, -3869152505283632705, -6613852953013396522, 2078513896526045689, 469934045759062692, -2002194836393509801, -2028433600905835760, 7964591696461103942, -812352116748358463, 8056557955362653841, -3542848860546044981, -8619250154833433966, 364652523896097125, -1258104480249871743], [8688460051764644216, 6265259544452850068, -2352997082775760165, -4847070636181533751, 4582587724853350864, 1100589127993862095, -4935328142474516838, 7150736652958050579, 777992444727924812, -9124558760591948241, 3940828987196148268, 3778451302108986909, 1888198769342326333, 8848816812573401570, 9011179562970126166, 1066943713058077914, -467554125373036200, 6724718251542239763, -2218278811140994159, -8180140619834576255, -1413058154179379986, -6948775414721746973], [8688465029998336745, -5168565598347189449, -2748587332567131490, -2888751961935286028, 6031418494406080130, -1140634307694234738, 7104871951329495176, -7150944617783386898, -7572783588567770270, 802402173250283843, 5318045222149075665, 5480393037842062468, 2567327244135838033, 5389031271435579828], [8688466689420208412, 630930141132526777, -1789048124644870976, -5192024008824816605, -7537900349318274329, -1251309721038043621, 5071245822928848763, -4432502847490078332, 7949904932008323852, 777862086359432806, 1495087613157657305, 4313865094994917888, -5722204724093677976, -7729582131522593990, -4099419509972746013], [8688465029998336745, -5168557301291035234, -3841648473101858149, -7621840662331227100, 1924319066280987364, 7000697128805824135, 6974456704890247951, 480272088134387685, -5368300638075477959, 423947151071202322, -9153875234638080265, 7758347768877805023, 6354144643248504834], [8688465029998336745, -5168558960712906901, 699599876762269397, 3608843153574481178, -5894900538610753388, 442307053893436499, -375095616102624710, 3763949656584675820, -2730234960192466094, -5623102751421749775, 8632733730633883033, 8324805690033512919, -8661510941712818389, -8940124928739285967, 2398915434663535253, -8875764221072406006, 8617458174993038499, -3265510097653750852, -803099201366327037, -5390217231076741279, 5859327040645085419, -8809093705649380904, -7422763210712466242], [8688463370597746726, -254551945614346881, -1789049784045460995, -4283078533363963056, -8457632211759673075, -7378151268101360392, 4448465516945113404, -7150944617783386898, -5954958987725282680, -8773729831906979067, 3300303221765141170, 481524080532610980, 8024001879034629498, -7285682035733696762, 7197346161930851335, 3655444365491127719], [8688463370597746726, -254535351507358863, 645133845067264282, -9109279886131302227, -6612597641803352365, 6757763391142349539, -5820830142164141230, 7150731674724358050, 7535352078028586844, 3457715315348146245, -830732699119268602, 777860426937561139, -5183994744097796555, -6147252661122610999, -1557535896938784097, 6648177951315802460, -6929765454237553925, 8860545634507922431], [8688443457652335786, -5567363155003802054, -4727752407527746965, -3774220773410934384, -1280178748802585579, 8395657163768190368, 4942049380673848797, 6270326523268254970, 2566076911156826199, 8662047652484760247, -204230496936203155, 4163221976684555353, 5771803486873410017, -1847705202844599024, -2821466368227796522, -2098347031859026018, 7730123820514927347], [8688458392364054197, -4399614748577140608, 8896665931446583462, 7400754974895532602, -6855064913031830540, 6116470353276975252, -5158210961859556026, 803622636848422151, -3783468842300920045, -7974376433954838853, -3413057121167781491, -3250669479626536104, -113645827740369912, -8171177397789038606, -702768336317080991], [8688441798251745767, 7079891816862976090, -7196180834098644595, -3797050698551321980, -2635316503593653281, 1068956340277667498, -7384780689591143895, -6110390875683447949, 6652955105066367851, 6891890577308221382, -7067606239504038345, 145347200406220957, 1287508559393746158, 2010606323416515703, -4910812946741487622, -8615060899449666168, 544017717495521594, 5010127138021411021, -2885185315288871827, 4286852552107705248, 2605907488381618739, 3505550134397830044, -7965910572232220440, -956207245217501776], [8688443457652335786, -5567371452059956269, -5330938305195337867, -7826205771622216479, 54752706463367772, 5105045594604262598, 4057204076280465824, -2232318836751616858, -2468783512413660041, 2932343282648556694, -2087241717022731776, 6693399232922001952], [8688466689420208412, -3962215375331406544, 8123861035977116568, -5246495018734892807, -6855076528926407677, -8506699242019777229, 5675030336539504669, 3082829360287708413, -4724042127217673602, -2229985167918888034, 7464330288314230393, 5266626269553985062, -1188347958223585331, -7975150344066051886, -6437420307614534877, -1847706862245189043, 1531820567927174694, -6016849923348663848, 3737548873162126104], [8688441798251745767, 7079880200989680601, 6897903129352682256, 3193671770751491728, 1376852852080612831, -569721298908149980, 8161817773159253333, 7438716690298060866, -4012529419729439404, -5154672525209386568, 7033261502190002693, 4812102391769271480, -8045551813773637464, -2501195188458798964], [8688463370597746726, -254550286213756862, 5220651883552706414, -8318086111234770979, 8668232179912150348, 5849454698074889765, -2179686058211291937, 2549418238132700312, -4223827050859578129, 4719179968299021469, 8098709057869315019, 3656224781521578596, -4545935563650754976], [8688458392364054197, -6939518155983602512, 8782768276573698596, -160225467295054258, -8175326066231626703, 1727216842032092135, -790266998925614160, -1800150120664023944, 1018629020589787894, -6416112286981158323, 587553596812656204, 1310656339071778484, -372012161691958004, 3667767591714344223, 8610046678080194718, -8006956634821458759], [8688458392364054197, -6939509858932768709, 2564230514459266437, -8710452460096476302, -977641412586282623, -4283083511602975997, 2490138545648031878, 6681071028459772507, 2341996093311654247, -2864830403887687433, -6569086653667981430, 770124306132424964, 1493235345445041253], [8688455073544252717, -5379371871900471168, 7708684674912453971, 7871032490600120362, 1697739241875721557, -1681764956552711408, -6345603558947267837, 1711941286388587395, 9137904442044710968, 6210160049224155748, 5412970316387491438, -7237713407762053331, -3932894815846246782, -6751675616497988433, 252000223765871358, -7763098715748829420, -4062693192856132614, 7211994759935962860, 2110448125177715080, -1209176105430375046], [8688460051764644216, -1140014119434431041, -977654687876129367, 7433034501456544796, -3842267001945110591, 5912093628118010796, 8821348520819479302, 7283620143781853342, 3978166428891864479, -4714178848306897185, -5762002113101834274, -7769396114637738306, -7162542949610429195, 5870429036664238387, 7553099196849846542, 2963379113848878366, 7919357139543776058, 7815790889411933637, 6207211038623668992, -985056360057914442, 5300917398795615079, 6923674402920302299], [8688445117074207453, 7965344034231636428, -903551103194259525, -1626672098958299636, -71962982784339878, -28587331232532036, 1978795054427416301, 4797577514498369413, -1488999838513296199, 8755287476133194606, 8666996781620915071, -6659672850538719164, -8029644453999693744, 2359582984367587177, 4011210675699969670, -578511066720209967, 2937112139353608694, -4883953095616465562], [8688461711175875059, -6054032750400966138, 6917509153542122202, 5943767901104335644, 5072481221220084040, 2347988732431985829, -3689162276905756714, 6357705545057961484, 7895432262673715777, -6070566936074316515, -470642558001434199, 8472364461157165399, -2859409830104125307, -7050324059416268517, -4992299818361238150, -7920054167654498840, 701457889338445060, -4544559083920377613, -279581095798564999, -4248202824564696102, -5390345930023361618, -7011875706766791509], [8688458392364054197, -6939516496567051257, 4335178093859326765, -8804127221337258799, -2976402555258312162, -3138783559162614795, -8363338921675638136, -6976998470266018004, -6068853323781026272, -8054646160809553583, 1513454920244041112, 4422698197072214129, 5544616749498187257, -8312408900626947438, -4986758842681889488, 3942059407248370604], [8688460051764644216, -1140004162961725571, 5635846498138248078, -9181355142281259258, 3280708813464957949, 5630430902591038687, -1393469490721474728, -6868653406943117083, -6706275721855955724, -2293125412003590923, -8141678225270705833, 6114148300312221505, -9027797094402992648, -6533723540997219062, -6325995875335956224, -2135088283682037416, 5199183635159323504, -6252057496637144443, 950099599798582544, 6154423771623349301, 2076810240689499680, 7281137731331407711, -1263041861768424108], [8688466689420208412, 630916865842680033, -3728371006467495332, -6109740818021489078, -2656134694327737526, 840999011624334215, -5196183526529454551, 1975847703248801212, -6477876051332823643, 7198559095084081068], [8688460051764644216, -1140007481800148493, 2107413683553928, -2816661771097552440, 2583823263356199433, 6812083998042099533, -6085370915347388631, 7774251809831947263, -5313799758763246583, -929960183646361396, 8013035219617661065, 7289922520904454757, 2036361134602833256, -7705059399789088792], [8688441798251745767, 7079886838645244797, 4938365650948789334, -4776814459527556530, -450418004947460163, 1687264071755975246, -9212066481328275094, 4365881902458773820, 1473010792391067217, -8030729580977026075, -4651208788457566328, 1310659657888919758, -8193722476106259838, -2083693323899856848, 8709285646754897473, 6215227028039560650, 4207826388869374070, -7465682352307303545, 7655431576386639825, 6033905118486953268], [8688463370597746726, -254546967375333940, 1283179750240420353, -4565376381838515419, 1999644773958925327, 668883559481561032, 5466814500400821189, 2572104397894384042, -1391618115784902025, -1229252046571036155, -580229657249852945, -8986733671087540053], [8688455073544252717, -5379373531301061187, -2708775008852577193, 4266500061176090136, 4428879405682462956, -1423560641487405219, 1286259885812664137, -6808478635842863646, -5570313825004878829, 1601729020644012217, 4292891654750481052, 4130518947881050986, -8770492787407831437], [8688441798251745767, 6702672192969809434, 3789569892235127895, 8168482042279564127, 9121988785214613033, 4686745060491330332, -6987989122517178120, -2797061617920508578, -8610746126641865340, -5305315643519749103, 7253655271474352466, -6425240715046996917], [8688443457652335786, -5567373111455225876, -3708151431673815885, -5490680748772648844, 5784018819866140059, 6757771688198503754, -221360746328101460, 6437953699569335461, 4655457570663196890, 5082220647676285883, -6588699315491703924, -4552113453419920675, 1734457261936180741, 2045002290514881346, 2694019701620993469, -1496887890032925339, -3356102932201334430], [8688455073544252717, -5379371871900471168, -7947530756464575323, -8938887871031499435, 7178965579559941196, 4251229483768938131, 3013082926454492587, 2289970227741286279, -2952497591317701585, 5990496152551051269, 2522552647718307490, 2360193216160005816, -584543531691460339, 3913192038879098253, 1165564284633835197, -4796292545842015606, -2524498217665805323, -2316753957900214673, -1544702927894806198, -8887491383569093964], [8688461711175875059, -6054037728639979079, -3634056144042779846, 5058295770811546014, 5052886812898619171, 4610214716710996439, 8331458343267227194, 5512670904975882583, 8800512076577817020, 1006280903203429157, 9137907760864512448, 5871052543746503770, 4165545820786225471, -7035066757298963256, 2448460678925694373, 7923684421014216754, -8943810449606582213, -2006385751191168648, -6690387508402876274, -1614007786456167836, 3786493842104572055, -1215827099263499302, 3712403532709888751, 8951139367379136147], [8688463370597746726, 1860115267541011249, -5405635527575939360, 8451385144312842600, 7425773275831001901, -4660303135496142653, 4977542851691821523, 786641897696127117, -8814625623200935882, -8977003308285437035, 8894818641946378291, -2379877607875269338, -6747340037968733316, 4288575989145355227, -2632849918646930646, 7682298826201622666, -3430189922776216254, 4450786808832907270, 4658521112128452656, -8727115476458093782, -4732702297711599404, -5667101143423295712], [8688463370597746726, -254532032690217589, -2822675982563884981, -6202206731550729786, 1530594359486758423, -4431264130387022193, -6290475853717008362, 5795595579349841603, 1456494093624690061, -152075800693529320, -240364835783937188, -1502558463022427568, -6568459827752613537, -5732696488325732717, -479745333811209443], [8688460051764644216, -1140004162961725571, -2822685939015308803, -4605206959084589607, -1299779794774294232, -6185824608312237490, 3483980630426864662, -6633917278302043790, -1765136523048696203, -6030102895297213328, 2662240722500958317], [8688445117074207453, 7965339055992623487, 6106124013845496044, 349259118554720865, -5760781649522317408, -6979952327363870937, -1824544914501266624, -3194484989127573539, 6317410029081057632, 2613177011079277085, 5109826067193250911, 2837413210179108598, -4334644570162879417, 8566042541215089170, -1673292457182509417, 7907138619454269858, 364677415059239358, 4703749031390216344, 512839780335707517], [8688461711175875059, -6054037728639979079, -1675133875643716444, -1211490759662604716, -8383536924131297242, -1610311548065808299, -5653043499169373440, 4266506698831654332, -5158214280676697300, -81831239912847588, -8324745402140010686, -3102043966756154652, 1487662840954966780, 3981736394363400572, -1564323886774682907, -4449013801422158143, -9112819215576136476, -2177222792081710576], [8688443457652335786, -5567373111455225876, 2772439712958346957, 2934812419806495375, 698996282609453718, -100063971468686329, -5649341515915454292, -6228129300952603094, 2017376958073787026, 6208314419145822244, -8890558243851491004, 5777819357753633607, 3995311612976859753, 76198489700123696], [8688461711175875059, -6054036069218107412, 1678776637692676286, -3796450423236929223, 698999601426594992, 5229774440566245834, 6069375231590877101, -6016686245024549042, 6445356138359705970, 7979863933263525554, 2755306911349912194, 6946217821842253924, 172980829884848050, -4416747550172274341, -3368925944772606859, -9034439791182622895, -4147276794155114944, -2029199082224568226, 4331460283122966269, -2515860380570898507, 2304005275118216449, -8085213866179609227, 5845885499214599312, 2141650821796267510, -1377566342561997279, -8744729679149398433, 7842809308864449562, 5186376323900374302], [8688456732942182530, 1422715894292616979, -2466289484092579127, 4705750042736510439, -8738691343149790741, 3670875170663606492, -1804325339686305529, -2527429741364639270, -8002611998185691606, -4697198109149281739, -2225054292314253101, 4061529698331695059, -6277074138156062487, -163944937453286421, 3466225981152715771, -2569724477529639198, 8704963475262456276], [8688463370597746726, -254545307980064333, -7101875928125352931, -326015310555334018, -3050494524072206927, -8413021161940571810, -3709385170543179495, -5036277404625368562, 3506641899025406159, -4771744161873728706, -9174103106509195575, 4261083572836876160], [8688460051764644216, -2982435020248183976, 8292257910756322379, 3215874869992472667, 471176081679260105, -3719731509974658703, -3956186229158676004, -2401475453568164991, -9002014971565342138, -898795521760432827, 54744409404553351, -6147869530562613216, 7222503118269685207, -5749062017435955347, 3680599662413410336, -7762471889854743175, 8899129197570844411], [8688461711175875059, -6054037728639979079, -3634067759916075335, 4649411830402099774, 3601571971497514461, -4057133831914258121, -6801830960826880664, -1933036930304967981, -5822058902799812311, 3346919368372224474, 8126944490385123068, -6080590442750419700, 3021073892992197308, 2784644064966001828, -3563696920655682340, 3698203147597612932, 2831858827470926634, 5641381602783919008], [8688461711175875059, -6054041047457120353, -4237245360548793670, -231715382818395089, -1279543625852345119, 2424705986280365300, -3861882982609916213, -6806618071058132143, 7861777784081172565, -5183859407511573256, -6553786206848033427, -1078602290626391072, -8472924361507505627, -5654131944985128693, -6653031813178300378, 5433039619891209793, 8948662825965028454, -163949915686978950, -7085380801696996116, -4591322183002940941, 8758827572199915319, 731382042957799059, -8134914359989363822, -1368310108341542931], [8688458392364054197, -6939518155983602512, 8782768276573698596, -160225467295054258, -8175344319755165976, -8789610641101229299, -2013761639423127317, -6204689144001175417, -2014395102972777758, -2176756193931669451, -4294812333513555004, 7791262418389057677, 1661007053733411044, -4959123553768089698, -545958309206666692, -8014975943054491691, -842928119187869352, 3347992747755896200, -6853236769857810051, 1465754545004537263, -5706303235350751782, 7520457032848303, -6324761369842045944, -152231943017168144], [8688456732942182530, 1422705937841193157, 1396473810981771188, 3325926776254016167, 1717343606645950042, -7997829866172171420, 7049795687863353070, -7206035815958587209, 3432574821374653627, 7950068478590791894, 2474872946479892814, 7900844539403783894, 4595402440387090520, -5261777212012680095, 8666381571594803903, -4348221448198210265, 1166186132294228913, -4795677335815904438, 2605905828986349132, -5437433652998217340], [8688441798251745767, 7079875222755988072, -3634074397550357883, -1704596541114970671, -6291729505534443118, -3664152273042402866, -4085991243826786238, 2761329419867078538, 5506028208201572748, 7375447615543712316, 1829385674991737788, -4678072719455407895, 7990955080033929703, -8448390013900704940, -8610762720770135006, -4419838534987946532, -2412431258162195756, 4940840659135085335], [8688461711175875059, -6054034409822837805, -1789041486989306780, 6829225096688067069, -2144804478381007457, 975258347274332787, -3861881323185384340, 1538612008324521748, 4032665648784884394, 2142404818962069603, -9175954481445768278, 105531557853243738, -7720952591481181183, 637234177674339653, -3462595727795658063, 3709463711960221001, 1112307100663672901, -3469866909888586016, 1680598143211132579, 6566674485567782266, 280088835521244087, 3605758806387771123, -2242830513907800891, 4929232244665219447, 3144099214853960887], [8688456732942182530, 1422715894292616979, -2768196675592334152, 4079142241622409691, 1510999951170613966, 6587376354278899482, 7561140838500519902, -496395709787161733, 5275122893465442822, 6883717678944144230, -923173721490687489, -5999067064099551862, -2799386228646725366, 260639720258707987, -5214559130669332367], [8688441798251745767, 7079891816862976090, -6364562844291890186, 402489751961150909, 638962724676688101, 6999615452371318606, -8953079959095601657, -6618165299777439219, 7785845163425297031], [8688455073544252717, -5379370212483919913, -4425858491312518272, 8662196396105137260, 3335189779829118179, 7360324122332405451, -5931009219676118930, 7040517749576532647, -1544105971378933273, -6620472418033134761, 7028330758305732876, -3666629707256495762, 607134729836293711, 6967827283403124654, 1318654074958810457, -8555488063069715919, -7210236818954637054, 526266387059795625], [8688456732942182530, -2025484590305349004, -5479108967527960241, -6202195115680094503, -226308084327339913, 9149481201528412512, 6729509573403918749, 3310649561196620378, -2725290941018349533, 7938788001277452473, -2450411227093583705], [8688441798251745767, 7079886838645244797, -7250043271640834031, -5433252562950238641, -7041832413738503286, -6868650088125975809, -6478470455637480522, -3098961278991316264, 169277187230338883, -5193264385328462763, -8869129821346269768, -176743058861416617, -7781609656493551977, 1240401821818391282, 4149666670995225464, -1089095714253715420], [8688461711175875059, 4305710450154380009, 3582584476151326957, -6806613092819119202, 8687829907048096285, -2512759439277200434, -6405633798060231974, 2212636104452904591, 3112305301027527736, 7642006760802128294, 4942052699490990071, 7172802624481212260, 2907798085779706158, -4662775591468562402, 2738789319783549835, -1614619677665137730, 6601557593094252885], [8688458392364054197, -6939521474800743786, -4030269900916416554, 1328420944792030785, -6330289836853434326, 8264012390074045804, 2302173813124394480, -3984420133991598944, 3548341338088424211, 4155197821938195008, -2018087129732709788, 4291053423378069565, -7379844967473181549, -4354098663656447840, -163187753185387758, 5872752749045543389, 6035112180603845063, -2008214026090874665]]
\ No newline at end of file
+[[46, 3542118, 4312053, 4313166, 4313889, 4314771, 5854624, 7086755, 8318673, 8319807, 8322649, 8323223, 8328354, 11100438, 11870340, 13256459, 14488389, 14489803, 14490846, 14492022], [6, 154139, 1386048, 1387007, 1388505, 5392589, 5396061, 9246159, 9252690, 9253943, 9255560], [25, 1540153, 1545865, 2315970, 3085907, 3087041, 3089428, 3090114, 3091892, 3092627, 4632529, 10176618, 11562501, 14026557, 14028039, 14028615, 15260538, 15261714], [74, 1637, 3240, 773366, 3235861, 3697994, 5083889, 5084701, 5085296, 5086563, 5394493, 5395011, 5395858, 6781970, 6785008, 6786555, 6787582, 6788319, 8328219, 8329374, 9407311, 9408762, 10486699, 10488022], [32, 734, 770664, 771672, 1849609, 1851023, 1852638, 3546710, 3700675, 7396717, 7704675, 7705809, 7708210, 7709225, 8941120, 12483195, 13099162, 13100763, 14332688, 14333941, 14335411, 15413404], [67, 1490, 3555, 927632, 1081590, 1082563, 1084075, 7090117, 7092994, 7094294, 8172182, 9250287, 10174184, 11714303, 12946219, 12947395, 14487248, 15719248], [6, 154090, 154517, 4312545, 4313854, 5083945, 5084841, 5086255, 5394234, 5395851, 5401276, 5401960, 5403460, 5404783, 6944690, 6945868], [32, 1848097, 1849714, 3235840, 3241727, 3242266, 3704229, 3705631, 3706702, 3708284, 3710979, 7407077, 8638951, 9563021, 9564638], [74, 1665, 925609, 927016, 927455, 928927, 2468822, 2469816, 2472812, 4936882, 4938331, 5554422, 5556970, 9099075, 10330977, 10331803, 10332853, 16646790], [67, 1490, 2988, 4161044, 4164796, 4165167, 4166364, 4167372, 5245260, 5245652, 5248235, 9868298, 10946172, 12486305, 13718219, 13719395, 15259264, 17107250], [18, 398, 951, 1525, 1233399, 1233672, 2311560, 3543644, 3546164, 4778276, 5548197, 5549046, 6318997, 12479039, 12480838, 12482124, 12484996, 12486256, 12486648, 13564760, 14642697, 14644118, 14646484], [6, 154153, 160360, 161321, 161762, 163050, 166361, 4632459, 5864396, 5866013, 7405936, 7407406], [6, 154111, 156323, 618393, 619429, 620248, 621109, 621676, 1699550, 3393634, 3394353, 3395181, 3396509, 3397379, 4629246, 6323365, 6326347, 8174464, 9560361, 9561220, 10639108, 12333201, 16644326], [39, 916, 1386830, 1388134, 1392978, 4781083, 4785906, 4786935, 4792024], [60, 1378, 1387245, 2157385, 2162670, 7860705, 7861601, 12789685, 14021571, 15561552], [46, 1007, 1103, 1233231, 2773098, 4159203, 5083084, 6315196, 6318661, 8782745, 9706689, 9708124, 10478033, 10478586, 11248544, 11250154, 11256041, 11256594, 11259870], [39, 853, 993, 2435, 926363, 927539, 2467429, 2468297, 9396517, 9397693, 10937590, 10938577, 10942077, 16486014], [53, 1187, 3301, 4703, 4843, 5548857, 5550481, 5550726, 6012663, 6013475, 6014959, 6015533, 6021287, 8793399, 10333301, 10334330], [46, 1077, 1540958, 1541651, 1543709, 2621800, 2624012, 4164138, 4169724, 5863822, 5867007, 5868330], [74, 1651, 5130, 6131, 10030, 1396128, 1398823, 4632865, 4633432, 4634160, 6020034, 7252160, 8638074, 8639371, 9563299, 9564330], [60, 1350, 771308, 772897, 1696848, 1698458, 3084346, 3085067, 4316941, 5087046, 5856974, 8937081, 10476941, 10939081, 12478983, 12480124, 13250054, 13251076, 14636941, 15099027, 15406936], [74, 1637, 309588, 2773649, 3389588, 8163670, 9241558, 9241938, 9395924, 9397513, 10321401, 11399506, 12169429, 12170262, 12632171, 13556304, 14942220, 14943522, 16021396], [6, 154118, 924041, 924874, 926335, 2158442, 2163139, 2164280, 2168207, 5864277, 5866979, 5867714], [46, 1035, 616986, 618239, 619247, 1543373, 1548504, 1549218, 2627120, 2627799, 2629276, 5401374, 6479311, 13101367, 13105322, 13106792], [39, 895, 4542, 6138, 1084082, 1085648, 1547566, 2933636, 2934168, 3858315, 8167417, 8167947, 8168983, 8170138, 9248019, 9710161, 11250028, 11250413, 11252044, 13870107, 13871276, 13871983, 14795920, 14797208, 15567096], [11, 616083, 617133, 618309, 2158216, 2159527, 3391422, 3392115, 4008045, 4008920, 5394829, 5395963, 6011891, 6012719, 6320633, 6782719, 6783874, 8015979, 8939895, 8940770, 10326644, 10327064, 11405008, 11406618, 11411714], [39, 2464090, 2464788, 3080923, 4620776, 5544874, 6006846, 14168909, 15400776], [67, 1518, 6369, 7510, 10212, 11171, 11304, 12571, 320550, 322125, 938048, 3864097, 3865007, 3866330], [46, 1014, 2071, 3520, 1081450, 1082710, 1236661, 4162745, 4167099, 4167379, 5399295, 10789330, 10790184, 10790625, 12330492, 14024604, 15102506, 17874478], [74, 1651, 617607, 619079, 2158932, 3699051, 3703151, 3704588, 3708088, 3709682, 4787584, 4788300, 4793256], [18, 398, 1420, 2120, 6486, 6908, 1084817, 1085676, 2163578, 2164259, 2165734, 2166450, 3244359, 3245178, 3245745, 6325850, 6332024], [32, 713, 1875, 2619973, 3543866, 4621931, 4622526, 4623786, 4777751, 4778864, 4779613, 9861627, 9863279, 9864147, 11096070, 11097337, 11099157, 11100564, 11100984, 11101943, 11103133, 11103868], [67, 1476, 2167, 618253, 620164, 1852304, 3238185, 5856255, 5857459, 5858887, 6474831, 10324887, 10327883, 12483995, 13715911, 19567862], [60, 1357, 925278, 926288, 930061, 4010089, 4011741, 4012588, 4015612, 4016907, 4020946], [11, 770153, 776850, 778469, 2318364, 2319372, 3397288, 3398268, 3860238, 3861843, 5093752, 5094760, 6172641, 6172907, 6177562], [18, 924146, 929410, 929781, 931440, 932462, 2318336, 4012462, 5398350, 5399043, 6014952, 7247083, 8786945, 8787183, 8788359, 11868471, 13408385, 13409822, 13412683, 13413714], [39, 2618104, 3080027, 5390109, 6006020, 6006398, 6007133, 6008295, 7240204, 7241233, 8781154, 8782731, 8785431, 8786280, 9556175, 10172292, 11250236, 11251806, 11253248, 12485351, 12486851, 12488251, 12489560], [60, 4004104, 4466027, 4466615, 6006487, 6007021, 6008183, 6008701, 6010234, 6011795, 6013622, 6015202, 6017710, 7249815, 7252223, 7253399, 8793308, 13567364, 14337280, 14337868], [74, 1637, 3252, 3625, 3730, 4442, 7713, 469790, 470693, 472128, 474837, 4940893, 5556793, 6326865, 6327901, 9561985, 10485894, 12025997, 13257866, 14797992, 15875866], [53, 1208, 4493, 2006549, 2007109, 2007653, 2623585, 2624397, 2625587, 6167629, 6168700, 12636735, 12639283, 15719248], [60, 1364, 1079294, 1080568, 1082017, 2006101, 2006941, 2469067, 3700967, 3701851, 3706632, 5246709, 5247717, 6325822, 6328482, 7868629, 9408538, 14336629, 15876482], [53, 1173, 2799, 1850862, 1851772, 1853354, 1856063, 6014091, 6015575, 8017687, 9249589, 11405701, 12945575, 14485645, 14487101, 14949241, 14954946], [6, 154153, 1694041, 5236146, 6622020, 6622447, 7854335, 10010398, 10164363, 10165504, 10167618, 10169193, 10171440, 10172455, 10176984, 10178006, 11563866, 13103943, 13105266, 14337364, 15107287, 15108022], [25, 587, 924468, 1540552, 1541420, 1542148, 2928036, 2928750, 4006638, 4007016, 4007581, 6317646, 6318990, 6320292, 7398208, 11094262, 11556173, 12634313, 14174208, 14175167, 14176651, 14177197, 14793127, 14793974, 15563862], [32, 699, 804, 1469, 1588, 2582, 6992, 8280, 11416, 2013486, 2014065, 2015213, 2017868], [60, 1378, 1387238, 2773378, 4159257, 5545357, 6469294, 6470575, 6473095, 6473319, 6474369, 10170467, 11710362, 11711356, 12481293, 12482448, 13560392, 13561953, 13563115, 14795197, 14797096, 16183096], [32, 769, 1540676, 1541966, 1544227, 8166311, 9706171, 10322304, 10327561, 10327820, 10331285, 14797346, 15259299, 15260468, 16646328], [11, 616139, 1848034, 5390109, 5392162, 6470258, 3702523, 3703678, 4781587, 8015692, 8021166, 8022781, 9562636, 11102720, 11103560], [25, 594, 6215, 7384, 1393291, 1394404, 1394798, 1395197, 1397297, 6479388, 7865290, 11099325, 11100536, 11101794, 11102349, 11102935, 12642839, 12643868], [67, 1532, 1387406, 2003532, 3389420, 3390111, 3391555, 4469646, 4471452, 4472733, 4474686, 9556707, 9558373, 9559542, 9565562], [32, 1848146, 3234039, 3234853, 3235609, 3237065, 4468967, 4469793, 4470675, 4471844, 5857774, 5859335, 5860490, 6784588, 7554483, 8016560, 8017449, 8018611, 8023714], [67, 1490, 3450, 4752, 1082682, 1083991, 1088996, 7403057, 7405915, 11255971, 11871866, 13411985, 14335915, 14337049, 14953000, 14954176], [74, 1686, 1387609, 1389056, 2466993, 2468444, 2473274, 2473960, 2935918, 7863960, 8325911, 8327080, 9712940, 10945038, 10947313, 10948734, 11410699, 11412022], [11, 770090, 924055, 5852111, 5854631, 6624736, 6627004, 6628607, 7860502, 9708556, 9709118, 11865202, 11867561, 11867797, 11868791, 11869024, 11870088, 11871677, 12795593, 15567558], [25, 1386118, 1388379, 1389779, 1391270, 3855347, 4471310, 4472866, 4473424, 4474126, 5244028, 6476119, 7092082, 11404131, 12328063, 12329211, 12332340, 13718410, 13719110, 13719530, 14797439, 19263404], [6, 154132, 1232034, 1232755, 2464657, 2465532, 2472686, 2474002, 3859876, 3860273, 4476177, 5246289, 5249474, 5251049, 5866951, 6945077, 6949102], [6, 154090, 308069, 309469, 310190, 310911, 1542832, 1544136, 2622059, 2623207, 3547088, 4163235, 5703128, 5704152, 7090061, 7091237, 8631111, 11249179, 11557118, 14021209, 14025556, 15257661, 15873556], [74, 1644, 463609, 465016, 466017, 1236122, 2006024, 3392108, 3393886, 5395935, 5396852, 5398448, 6476343, 8478434, 8482802, 8483199, 8485147, 8486176], [67, 1504, 771411, 771938, 772624, 2004743, 2928687, 10012708, 10013156, 16635086], [60, 1315, 1434, 2421, 618358, 619373, 3235917, 3237357, 4161275, 7087359, 8011296, 8012605, 9244507, 9245375, 10477242, 11555389, 13095242, 14173345, 14175118, 14175783, 14177274, 14177960, 14179290, 14180305, 15412172], [18, 924090, 924657, 4158748, 5236650, 8316769, 9856678, 9857980, 10935903, 10937072, 12322953, 13863065, 13868504, 13869225, 15101141, 15102317, 16642170], [53, 1180, 463133, 464267, 1080188, 3698309, 5238183, 7240253, 7241429, 10783485, 11091408, 12015527, 13247408, 14171485, 14173410, 14173802, 14175622, 14177176, 14178198, 17720170], [67, 1532, 1387427, 1388253, 1389751, 1390864, 1391753, 1392901, 2316796, 3856922, 5242817, 5243685, 6475592, 6476560, 6477596, 6478604, 7556478, 8942623, 10482478, 11868604, 12946478, 14332623, 15872478], [46, 2926146, 4312032, 4312762, 5698650, 7546706, 7547756, 7549016, 7549583, 10783660, 10787279, 10788140, 10792522, 14180578, 14642536, 14643838, 15721712], [11, 265, 616181, 2618307, 4158207, 4159369, 4162948, 5087039, 5702976, 5703935, 5705125, 8631223, 7093925, 7095393, 8635276, 8635960, 8637460, 13411544, 14797467, 14798895, 14801716], [46, 3542125, 4466034, 6930132, 8008048, 12320153, 12326355, 14790460, 14795311, 20801248], [74, 1686, 1387581, 1388428, 2158379, 2159807, 2775702, 3853819, 4777751, 9705807, 10321770, 10323319, 10324516, 10325489, 10327139, 10328259, 10329253, 10791367, 10794496, 12180622, 13566515, 13567392, 13573104], [11, 770090, 770650, 2310734, 3080650, 5390706, 5391117, 7547166, 7701147, 7702568, 7703863, 8627940, 8628344, 10014416, 10016677, 10017846, 11403734, 11404427, 12020322, 12944413, 13252348, 13253057, 14176994, 14178282, 14948233, 14949703, 16489556], [18, 1232125, 2156060, 2157336, 2159891, 5855959, 6471863, 7242003, 8781856, 9705996, 9710630, 11404707, 11405925, 16641862], [46, 1063, 1232935, 2003028, 2464972, 7239021, 7241002, 7242598, 8320528, 13556591, 14480542, 20640472], [46, 1028, 462979, 464120, 467410, 1545494, 1546369, 1547545, 3087398, 4473487, 4474476, 5398616, 6784511, 6785323, 6786387, 6787836, 7865759, 7866921, 9098795, 10176928, 11562823, 11563663, 12179579, 14181698, 15567558], [11, 770125, 1694076, 1695663, 2619574, 5083637, 5084953, 7703072, 9089002, 9090619, 9095736, 9096469, 10636331, 10636583, 11252513, 14794604, 15872478], [67, 1469, 1560, 1945, 3576, 2159674, 3237576, 6009688, 7395569, 9397686, 10783555, 11707632, 11708367, 11709515, 11713708, 13407806, 13409612, 13410935, 14950844, 20186788], [39, 867, 1882, 3543943, 3851882, 5699943, 5700951, 5701485, 5702332, 5702759, 5707260, 7709365, 8633260, 8633659, 9249561, 10173694, 10180330], [74, 1644, 3093, 465184, 467277, 468122, 1238068, 1239377, 2471244, 3703377, 4935244, 6167321, 6168364, 6169393, 7709260, 7709685, 7712814, 7713509, 7716484], [67, 1483, 309413, 1849495, 2465427, 2466253, 2467296, 7549357, 8473254, 9551324, 9552206, 9553193, 9555307, 9556763, 9561474, 9563028, 9563560], [11, 770139, 773863, 774150, 2160080, 2161676, 3239613, 3241034, 3702999, 10325013, 10326217, 10327379, 11559246, 13253330, 13253883, 15409862], [60, 3388125, 4312046, 4313077, 5852972, 9549056, 10627000, 10628554, 10782470, 12476554, 12477464, 12479018, 12479466, 12481025, 12482168, 13406299, 14638217, 18950168], [67, 1476, 2015, 926134, 2004015, 2466141, 3698064, 8472141, 9704057, 9705177, 9706479, 10630554, 10784535, 10785935, 10787146, 10788434, 11558364, 11559358, 11562662, 13718711, 13720209, 16800174], [46, 1077, 6369, 7531, 1239459, 1240917, 2472854, 2474429, 3090387, 3091857, 4631759, 4632914, 4638024], [18, 1078137, 1082521, 1083683, 2315571, 5241627, 6627254, 7705366, 8783247, 9553375, 10785242, 11863368, 12941277, 12942138, 12945890, 15871862], [53, 1201, 925119, 925973, 1849903, 7239980, 7244530, 7245783, 7246978, 7247995, 7252174, 8792251, 8793406], [6, 154090, 308006, 462146, 1848034, 4466111, 4468470, 6162615, 6167111, 6167650, 6170478, 7556611, 8788478, 10174569, 10482499, 13100597, 13103782, 13105336, 13106330], [18, 924083, 925707, 1695777, 1696211, 1697352, 1701097, 2317195, 2933111, 2933671, 2938396, 2939978, 3709894, 3710615, 4942487, 5404559, 5405406], [39, 902, 6486, 6873, 314831, 4318880, 4780803, 6320901, 6324674, 6325703, 7865624, 7867180, 7867780, 7869392, 9255266, 10641329, 10642792], [25, 1232125, 1235268, 4161324, 4162073, 9860150, 11246010, 12940150, 14326015, 14326241, 14327732, 17869704], [53, 1173, 2022, 1542113, 2158050, 6470141, 6475860, 7400000, 8785874, 9863979, 9868382, 9869677, 9873100], [39, 2156130, 3234011, 3234258, 3236519, 3237667, 4161569, 5701674, 5706238, 5707785, 5708954, 6787031, 6787899, 6788772, 8174669, 8175542, 9561460, 9562762, 10640643, 14794737, 15410632], [53, 1161, 1238, 1387322, 1387742, 1388722, 1390801, 4316927, 5856850, 5858446, 5863463, 12787977, 13711907, 13713048, 13715778, 13717395, 15257297, 20955248], [11, 462153, 2002013, 2464083, 2465728, 4775777, 4776372, 4777632, 4778353, 4779193, 5395109, 5395648, 8167424, 8168159, 8174704, 14334751, 15258641, 16336634], [53, 1229, 1541154, 1542750, 2620638, 3544736, 3549097, 4319209, 5243111, 5243671, 5248354, 8174422, 8636340, 8636753, 9560676, 9561705, 11101558, 12487677, 12490022], [39, 2926083, 2927574, 5083672, 6161553, 6161826, 7239742, 11705784, 11706169, 12784281, 13708162, 14786253, 14787142, 14788402, 14789417, 16945396], [18, 398, 958, 3389047, 4312951, 4313504, 4317116, 4317837, 5549753, 9245851, 10785718, 11709781, 11710985, 11712091, 11713316, 17103246], [11, 293, 1232167, 2002298, 3388174, 4312307, 5852230, 5853789, 5854946, 6933065, 8164995, 8166451, 9398332, 10938423, 10940677, 10941811, 10945318, 10946870, 10947278, 13411390, 14797283, 14798139, 15722020], [32, 2310146, 3696034, 3696711, 3697273, 3698141, 4930064, 4931345, 5547254, 5547688, 6933618, 6935172, 6935578, 9245627, 9247272, 9247958, 9709888, 9710581, 10326532, 10327785, 10328954, 10329379, 11561297, 11562403, 11563572, 12487698, 13873628, 13875245, 15415098], [53, 1201, 4640, 1082731, 1698682, 6318773, 7858696, 14788722, 15250647, 15251200, 16021088], [53, 1194, 3618, 5221, 1237095, 1699179, 2007151, 2008621, 3548537, 3549986, 4627930, 4629482, 4630072, 4631374, 11247732, 14173809, 14176544, 14178149, 15410016], [53, 1161, 1259, 2619364, 3697252, 3697623, 3698694, 3700276, 4470218, 4471480, 4472516, 7244607, 8476509, 8477349, 9093307, 9094728, 9556700, 9558303, 10790233, 10791682, 10794993, 14491084, 15876944], [46, 1042, 3870, 1235982, 2313919, 2315319, 2316166, 3394313, 4934194, 4934859, 4935440, 4936441, 4940221, 10638256, 10638641, 11254767, 11259254], [18, 924111, 927156, 7087219, 8319142, 8320423, 8936318, 10322430, 10325909, 14945951, 15253902, 15254931, 16794784], [6, 154139, 1386062, 1387378, 2773301, 2774706, 2775156, 8319205, 9243156, 9244731, 9860668, 9861634, 9862019, 10940145, 12172068, 12173382, 13559251, 14483384, 14489626, 14491217, 15415098], [60, 3388104, 3389861, 4005959, 4621901, 4623035, 5238967, 8781058, 9858974, 13093051, 13096061, 18794012], [53, 1194, 3394, 773527, 779092, 2319232, 3705134, 7401218, 7406179, 8022300, 9100230, 14028314, 14035104], [39, 853, 993, 2449, 1234316, 2158421, 2774379, 2775791, 3083737, 3084568, 3546542, 9860556, 9861275, 9862096, 10016061, 13866138, 14944040, 14944717, 15252656, 15253349, 15255127, 17565092], [53, 1194, 771133, 772246, 772652, 773345, 1389296, 1390556, 1391305, 1392740, 1396226, 1397493, 1705423, 1705997, 2937878, 4323960, 4325460, 4326720, 4327560], [39, 2464153, 4004013, 4466146, 5852048, 9702137, 10934062, 10935371, 10940635, 11556775, 13096698, 13098301, 13103005, 13104405, 13105714], [32, 734, 770657, 3696760, 5082636, 6622762, 8008669, 8009777, 8010624, 9242713, 9243618, 9245165, 9246810, 11710915, 12942845, 12944308, 14330238, 8182796], [32, 748, 1078636, 1079077, 1088051, 10781201, 11705098, 11705497, 12321448, 12322729, 12938673, 12939807, 13555735, 15711702], [39, 888, 770846, 772407, 774010, 2468087, 2469760, 2471055, 2474674, 2475645, 2783591, 2784464, 4170340, 5094452, 6172375, 6173488, 6174237, 6175560], [74, 1658, 771602, 6007635, 6008470, 7702568, 7704507, 7705380, 9091298, 9092600, 9096233, 9097640, 9251626, 9253215, 9256484], [11, 770090, 770979, 772141, 2004008, 2620120, 3390048, 3391037, 4006960, 4007672, 5085609, 5087067, 6318997, 6320432, 6323930, 6325493, 6327115, 6327663, 6943598, 6944622, 8330552, 8332022], [67, 1497, 3884, 2776003, 4315877, 6471975, 7395919, 7397375, 8629249, 9245382, 10631312, 16791242], [25, 1694139, 1699123, 4933165, 4933718, 4934103, 4936075, 4937512, 5707433, 5708317, 5713280, 8331329, 8332176], [25, 573, 616501, 617329, 618974, 619996, 2005884, 5547996, 6933868, 6934297, 8166234, 13864283, 14788234, 14789781, 14791272, 14791963, 14794478, 16180478], [6, 154125, 1078060, 1079350, 1083767, 1085188, 1547144, 6013188, 6016086, 6017682, 7095598, 7096620, 7102948], [32, 2618097, 2619252, 2619651, 2621896, 2622913, 3854780, 4470871, 4472516, 4473543, 6013461, 6014861, 6016338, 6016751, 6940681, 6941801, 6943712, 8483824, 9253726, 10177803, 10178641, 10640769, 11872650, 11873035, 11874330], [74, 1637, 2813, 3674, 1081604, 1082920, 2468801, 5086871, 5088068, 5089356, 5859272, 8169370, 8172492, 9558597, 10482492, 12022590, 12792513, 16026478], [74, 1686, 1387609, 1389063, 2620974, 2621994, 4007919, 4009340, 4471275, 4472096, 4472628, 5550775, 7090635, 7706740, 8476633, 9246733, 9862628, 10940712, 10941748, 10942721, 10943729, 10944275, 11560212, 11561197, 12177150, 16335094], [46, 1063, 1232930, 2927014, 2927553, 3389651, 3390806, 5854867, 6162785, 7240876, 7702848, 7704395, 7705261, 7705788, 7706523, 7707629, 7708488, 7708875, 7710651, 7711199, 7713411, 8329516, 9099432, 11255537, 12487444, 12488468, 13874328, 15414328], [67, 1518, 1079448, 1080708, 1081245, 3235938, 3236820, 3237821, 3241412, 3241825, 4165753, 4166894, 4936805, 4937344, 4938842, 4940095, 4940676, 4941635, 4942174, 6482258, 6636244, 6637714], [11, 462111, 464666, 3698729, 3701249, 3701480, 3855396, 4779522, 5857459, 5858929, 7398817, 11864929, 13404817, 13405664, 14175622, 14177176, 14177778, 14179360, 14949290, 12181021, 12182484], [74, 1623, 1721, 2003784, 2004316, 2928407, 3236365, 3237492, 3239457, 3240922, 4626789, 5396887, 5399727, 6631841, 7863757, 11867785, 11868954, 12485038, 12946975, 16026940], [32, 713, 308671, 6006727, 6622622, 7700699, 7701616, 7703175, 7704822, 7705802, 8167718, 8168096, 8169139, 8170273, 8786182, 8786572, 9248504, 12020593, 12944539, 12945974, 13715897, 16949862], [25, 1232118, 1234379, 1235793, 1237130, 1238145, 1241722, 2473855, 4013729, 6015799, 6017745, 6018571, 6020202, 6020923, 6024948], [74, 1665, 925574, 926288, 2004225, 2005695, 3545562, 3545933, 3546493, 6164563, 6165907, 6167034, 6628957, 8015062, 9092957, 11249076, 12634936, 13559046, 14328971, 14329783, 14331309, 14332709, 14334214, 14335187, 14643152, 14644461, 15876328], [67, 1504, 771460, 773016, 926960, 3083037, 3698988, 9859023, 9861004, 9862586, 9866954, 11869073, 11872636, 13412760, 14490690, 14491868], [67, 1497, 617420, 2465525, 3697406, 5699483, 5700638, 7240715, 7548687, 7550143, 8782080, 8783648, 8785587, 13251692, 14637552, 16177552], [32, 734, 4059, 5172, 5564, 1237634, 1238635, 1700726, 1702061, 1703237, 3243127, 6169218, 7247092, 8787204, 9557106, 9557477, 9559115, 12023227, 13255150, 13256459, 14488382, 14489696, 15875558], [32, 2002090, 2003112, 4929231, 6469110, 9087161, 9088652, 9089380, 10475310, 10476871, 10478530, 10479783, 10481113, 10481680, 11559596, 15255678, 16333554], [67, 1518, 1079406, 2773490, 3235427, 6007490, 6469448, 11705504, 11708941, 11709186, 11710334, 13712418, 14174381, 14175825, 15099713, 15869706], [11, 258, 462181, 3080263, 3696174, 3696573, 4312496, 4313222, 5699154, 5700771, 7240652, 10012736, 10015564, 11709646, 11710950, 12789055, 13713006, 13714609, 14946539, 14947993, 16179862], [32, 769, 1540669, 1541838, 2927714, 4467847, 6007721, 6008281, 6932225, 6933674, 8011583, 8012423, 8628358, 8629326, 8629718, 10323816, 10327288, 10328301, 11560205, 11561017, 11562198, 11562879, 11563404, 12949537, 14181439, 14182286, 14952214, 14953203, 15569098], [53, 1215, 1233091, 1849203, 2773084, 4005210, 4009921, 4011370, 5089244, 6321363, 7245272, 10171363, 10175421, 11715507, 11717726, 12949852, 14335773, 14337238, 15723098], [39, 888, 770839, 772267, 774360, 775375, 2007263, 4625340, 4627249, 5089321, 5089928, 5091477, 5092042, 5092716, 5093262, 6633374, 7711255, 8327346, 8789304, 13871332, 13871710, 15103822, 15873710], [39, 895, 924832, 926134, 2004071, 7548155, 9088057, 9089205, 10013093, 11091205, 11094544, 16330474], [11, 616132, 1694041, 5236090, 5390006, 5544111, 5547611, 5549053, 6472990, 6474313, 8014229, 8015685, 9247594, 9248595, 10172546, 10174149, 11406086, 11407682, 11412484], [11, 770132, 774673, 4008757, 4011769, 4013169, 4014793, 5092891, 5095754, 5096727, 5404657, 8022746, 8792692, 8793868], [32, 2618125, 3542062, 3543315, 3543887, 3544736, 3547107, 5549179, 5550852, 12634864, 12635405, 12635629, 12636957, 13869085, 15408938], [74, 1644, 4178, 1236274, 2006213, 5702290, 5705244, 6937349, 7553244, 8785335, 8786516, 8787540, 8793406], [39, 867, 2223, 3632, 157576, 3699653, 4315611, 4317074, 4322961, 5555052, 6325001, 6326445, 6330792], [53, 1161, 1294, 5083385, 6623287, 10935385, 12475301, 18481238], [32, 727, 616622, 1694727, 2310643, 2311196, 3081147, 8471189, 8474038, 12016136, 13094066, 13095319, 13096691, 13098147, 14330035, 14330602, 15408476], [25, 1232104, 1694041, 1694853, 1695266, 1695931, 1696379, 8934393, 8935765, 16173702], [25, 573, 616501, 617322, 618225, 619639, 927548, 1543681, 2775597, 2776717, 2778040, 2778733, 3394670, 6936775, 6942186, 6942569, 6943754, 6944732, 6946176], [53, 1161, 1252, 1651, 4528, 4624584, 5394472, 6934584, 6938854, 6940406, 6941143, 10791185, 11099157, 11100606, 12178536, 12179836, 13257717, 13873810, 14335766, 14337084, 15722944], [11, 251, 1103, 1233217, 2465133, 6469180, 6470379, 3702593, 4626502, 7090593, 8014474, 9092558, 9093095, 9709237, 11249123, 14791237, 16331090], [39, 895, 924839, 926295, 2158174, 3082239, 3082988, 3084262, 3086824, 3087816, 3857706, 4781825, 4785143, 4786291, 4791870], [6, 154125, 1078039, 1078888, 1848825, 1849952, 2311903, 6470001, 8009903, 12167999, 13707917, 13709366, 14787296, 14788605, 16020472], [53, 1201, 925105, 925658, 1695551, 1695798, 1698388, 1700003, 3239914, 3241167, 3241860, 4165951, 4167113, 4167680, 5245575, 6785666, 7555582, 10481673, 10486382, 10487560], [11, 770132, 775417, 3393522, 4471410, 4471844, 5857711, 6781788, 6782635, 7706733, 8322677, 12788766, 14174691, 14176126, 14179423, 15411402], [39, 923, 1540825, 5544895, 6468825, 6469952, 6931861, 7393980, 8471868, 10165938, 10166811, 10167660, 10937548, 11553658, 12323576, 12324241, 12325606, 12326880, 12328343, 12328889, 12944791, 13406868, 13560840, 13562107, 13870037, 15718016], [32, 727, 2932, 1543030, 1545900, 1546901, 2470838, 8784908, 8788541, 8789941, 8791103, 9715208, 10485117, 12487215, 12490330], [46, 1063, 6649, 1392726, 1854649, 4010733, 9552066, 9553319, 9554964, 9555699, 11095559, 11711671, 12635615, 12637027, 12637589, 12638415, 12639290, 12640254, 12794214, 17414172], [67, 1532, 1387406, 3235525, 3240341, 5242397, 5243426, 8015496, 8477419, 10633503, 10635923, 10637374, 10640986, 10641868], [11, 462090, 463105, 2465168, 2466190, 5238260, 5700190, 9242295, 10474204, 10475170, 10476024, 10476444, 11554388, 11555998, 12941858, 14327991, 15559858], [53, 2772139, 4004006, 4158111, 4774006, 4928090, 4929105, 4929623, 4930183, 6932239, 6933093, 7857219, 9089121, 9089973, 10013891, 10014745, 10938654, 12786738, 13556675, 13557788, 13558474, 14636600, 15714474], [25, 566, 2015, 2239, 2386, 4003, 1543856, 2467940, 2468500, 4932598, 6010486, 7242556, 7396512, 7397501, 7400987, 12021078, 13406994, 13408247, 13409591, 16489556], [18, 616097, 617294, 618561, 619702, 1697791, 2005723, 4315835, 5547772, 5549359, 5551594, 8631634, 8632378, 8633694, 10019617, 10021073, 11252940, 12485059, 12488979, 12489714], [25, 1386090, 1540069, 1541469, 1541889, 1542701, 1543086, 2313196, 3083135, 3084304, 3090170, 4784261, 4785871, 4786137, 5710053, 5710893, 5712972, 7869091, 9408972, 11719049, 11721870], [39, 895, 924832, 926120, 1696057, 1697198, 2467121, 2467975, 3391926, 3393494, 3855466, 3857032, 4318936, 5243055, 6166936, 7091074, 8476992, 8478273, 9094194, 9094861, 9096392, 9097976, 9867892, 9868592, 9872946], [46, 1007, 1089, 617196, 1387091, 2157222, 3543098, 4621196, 5391117, 5391973, 6315854, 7085938, 7086540, 7088143, 7093146, 10789225, 10794398, 10795868], [53, 3542083, 3542678, 9086725, 9089261, 9089786, 9090234, 9091816, 9095400, 10789498, 11251428, 11252142, 11255159, 16491096], [53, 1161, 1280, 2265, 3730, 2313849, 3853728, 5701800, 5704061, 5705216, 5709402, 6941491, 11403272, 13867342, 14329249, 14945377, 14949927, 14951390, 14957410], [18, 426, 770314, 1540440, 2618342, 2619042, 3388949, 3389497, 4005432, 4006400, 4160356, 7240421, 7242185, 7242750, 7245860, 8169986, 9247895, 11403958, 11865888, 11866602, 11870550, 11872158, 13258090, 13259560], [74, 1686, 1387560, 2619651, 2622696, 2624257, 2625720, 4011853, 5551776, 5553365, 6477274, 6477988, 6481726, 8021845, 9253712, 10793789, 10795000, 15722944], [18, 1694139, 2926048, 2927035, 3542958, 5545068, 6930958, 6931672, 6936215, 6937356, 6940674, 6941703, 8481612, 8482921, 9714802, 9715215, 9718330], [46, 2926104, 3388020, 4312083, 4313455, 8933483, 8934834, 8936106, 8937585, 11709674, 11712672, 11713673, 12637561, 13099631, 13100982, 16796940], [25, 566, 462510, 463483, 465261, 465807, 468080, 4472096, 4472971, 4473783, 4475253, 5245393, 6785281, 10481330, 10635267, 12175330, 12175869, 13254002, 13258510, 16184482], [25, 545, 678, 1994, 1387901, 1389028, 1850960, 4161037, 4163151, 4164565, 4472488, 5396605, 6628474, 7706600, 7710485, 8326597, 9250478, 10636583, 11252506, 11253171, 11254347, 11254907, 11258484], [18, 1078130, 2156067, 2157504, 2159919, 2161368, 2164684, 5398754, 6476670, 8634142, 9712079, 9713549, 11253470, 11255033, 11256223, 11257392, 12643287, 12644022], [53, 1194, 4017, 928108, 930628, 2008752, 2012177, 3090268, 3092221, 7866305, 9098179, 10176256, 10177131, 10177999, 11409873, 11410097, 11411273, 11411714], [74, 1658, 6054, 7034, 9400, 1703533, 1708020, 3248158, 4634069, 4635231, 5867126, 8485238, 9871140, 9872022], [18, 454, 6075, 7531, 1239403, 1855538, 3241440, 8015475, 8016350, 8017050, 8786994, 14023029, 14024548, 14026102, 14026683, 17722634], [53, 1173, 2050, 3023, 310965, 311821, 1235716, 3237786, 3238794, 4470906, 5548829, 5549942, 5550474, 6628572, 6629923, 6631330, 6632338, 6632742, 6635131, 6635948, 6636503, 6637061, 7561014, 7562484], [25, 1232083, 1233448, 1234729, 1236983, 1238159, 2778019, 3856096, 3856474, 4934621, 6474528, 6475825, 6479904, 6480928, 7866830, 11562907, 12486851, 12488314, 12492948], [74, 1644, 2841, 4290, 1082220, 1083492, 1545445, 1546607, 2778502, 5088551, 5089111, 7399188, 7401155, 13253169, 10485250, 11871334, 11872053, 11872937, 11878950], [39, 881, 616776, 1540923, 1547734, 3395804, 3857762, 3859078, 5244994, 5246275, 5249292, 5250251, 5251285, 5252022], [67, 1497, 617392, 2157497, 2158953, 4161065, 4166231, 4167687, 4171768, 4173042, 4634986, 7869077, 9100993, 14029035, 14030330], [46, 3080139, 4312060, 4313336, 4314645, 6470750, 7548631, 8626722, 9088652, 9089345, 9705266, 9705961, 9708642, 9709027, 9710684, 9711988, 10789890, 10790569, 10791150, 14641178, 14641780, 14643390, 16029250], [39, 2464104, 2465546, 2927644, 3389588, 3390617, 4930484, 4930897, 5854846, 5856409, 6164346, 6165053, 7088941, 8013065, 9244955, 10477039, 10480063, 14946154, 14953271, 14953714], [18, 1078088, 1078811, 1079693, 2619595, 2620764, 4006680, 4007996, 4012938, 5399064, 6476959, 8787050, 9556966, 8945222, 10023103, 10947243, 12487117, 12487684, 13565628, 13567224, 14645112, 15877098], [39, 867, 2792, 1234897, 2158827, 2159989, 3391898, 6471996, 7857863, 8473982, 8478196, 11404245, 11405456, 11406723, 11407871, 11408144, 12486039, 14642130, 15412018], [67, 1511, 925455, 926883, 930082, 931692, 2317601, 2318770, 3704665, 3705484, 3706051, 3706905, 3710041, 3710573, 3711126, 6483180, 6637126, 6637714], [6, 154153, 1694041, 4466097, 4466970, 4467966, 5237917, 11859987, 13091882, 15863854], [60, 1350, 4647, 5200, 775123, 5241207, 6165102, 7859177, 7859711, 8937795, 8939125, 8939965, 9555909, 9557078, 10942994, 17256938], [32, 713, 1609, 5391679, 6623616, 12783686, 12789153, 12790602, 12795453, 12796580, 12798638], [46, 1070, 1386986, 1388260, 1389394, 2159527, 3391436, 6471534, 7857464, 7859011, 7859858, 9245940, 9399865, 10015963, 10631900, 15097963, 15713858], [74, 1623, 1721, 1849840, 3235756, 8317819, 8322068, 8323363, 9247258, 10479335, 10480798, 11404917, 12636812, 12637477, 12638821, 16026786], [67, 1518, 1079462, 1081079, 2621002, 9397037, 10013000, 10014598, 11092507, 11093382, 12479263, 12479781, 12481118, 15099174, 15099552, 16639552], [39, 895, 4675, 5802, 7599, 8719, 9897, 10709, 10819, 2474912, 3552842, 3554137, 3557406], [25, 1540132, 2618048, 2619042, 2622339, 5240430, 6010318, 7396423, 8012325, 9090395, 9091886, 11555991, 5864802, 6942928, 8328788, 9714928, 9721102], [18, 924132, 2002027, 2002573, 2618531, 2619980, 3697854, 4467973, 4471879, 5857935, 5859265, 7245377, 8477293, 12635342, 13097244, 14329340, 14330539, 20798476], [25, 573, 2344, 3030, 5599, 6761, 12235, 13698, 1399600, 4479670, 5249586, 5250319, 6790202, 6790907, 7714853, 16177706], [39, 874, 3457, 4906, 1082801, 1083382, 2469305, 2470775, 4010628, 5088747, 6012656, 6013321, 6014812, 8940903, 9864784, 11096882, 8789563, 8789841, 10021745, 12947787, 12949152, 17569096], [46, 1035, 617000, 618617, 2158526, 2159800, 2162082, 2163669, 3087559, 4011671, 4015248, 5247353, 5250860, 10794881, 10796176], [39, 916, 1386776, 2310867, 2311917, 2313359, 3237245, 4007380, 5393259, 5393842, 5399442, 5400436, 6170324, 7402471, 7408946], [67, 1483, 2967, 3849, 1543730, 4315814, 4319433, 4320252, 4474196, 4474889, 4477472, 4479089, 6018998, 6020307, 6025718], [32, 2618104, 2619301, 2620708, 2774678, 2775975, 3699868, 3700241, 3701270, 3701949, 6471730, 6472400, 6473137, 6474285, 7398173, 8322264, 8784236, 8785804, 8787876, 8788254, 8789136, 8790102, 8944074, 8945390, 8950640], [67, 4004083, 4005742, 4006736, 4776652, 8164755, 9396638, 11090757, 12322645, 14940736, 14943921, 14945377, 14950669, 18338634], [53, 1161, 1301, 2743, 926659, 5392771, 6932645, 6933163, 6934073, 6935543, 8475417, 10015522, 11093396, 12017529, 13249445, 18947396], [6, 154104, 156218, 157541, 1697443, 6317525, 7549401, 8627527, 8632385, 14638413, 14640037, 14640590, 15410478], [11, 462153, 2002034, 4312083, 4313392, 5853539, 7393455, 7394862, 7395856, 8319968, 9089856, 10013996, 11399919, 11401389, 11407556, 12639696, 14025584, 14026291, 12180993, 12182022], [6, 154132, 1232048, 1233026, 1694930, 3389019, 3696965, 3697803, 3699569, 6009695, 7549562, 7549968, 7553405, 8169538, 9555426, 9556133, 10480035, 10480574, 10942488, 12020579, 12636504, 12637232, 12643315, 12644638], [60, 1357, 925292, 926561, 928178, 928554, 928990, 930257, 931622, 933169, 934828, 935794, 936641, 1552781, 3092704, 3094251, 3095000, 6945077, 8176979, 8177714], [53, 1201, 925084, 2157194, 2927105, 4775217, 6007133, 6008246, 6009303, 6010738, 6015160, 6016779, 7556653, 8942709, 8944081, 14642137, 15566018], [18, 447, 1232384, 1233980, 2311903, 2313079, 3852932, 5393044, 6162967, 6163793, 6164694, 6166292, 6170205, 9404296, 9408223, 9409385, 9414950], [67, 4312102, 4774062, 4775378, 6161273, 6162141, 7394043, 10166127, 10169102, 11709165, 11710348, 11711034, 11713309, 11714730, 12176653, 10640888, 11102795, 11872895, 11875870], [39, 916, 1386788, 2310860, 2311553, 2773635, 2774526, 2775798, 3237730, 5701793, 5702941, 6627081, 8167004, 8168607, 9400488, 9400906, 10478794, 10479230, 11865090, 13559237, 15099132, 18487090], [67, 1518, 6383, 7797, 315762, 5859853, 7399725, 7400273, 8016222, 8017512, 8787428, 11867540, 13253426, 13254107, 13562065, 13563192, 13564655, 13565243, 15105131, 15105999, 16337866], [74, 1679, 1233546, 1695684, 3081602, 7701665, 7704339, 7704899, 7709099, 8171188, 8172387, 8173801, 8174977, 12179054, 12948942, 14335054, 15104954, 16336942], [67, 1497, 617427, 618253, 619618, 621186, 1083137, 1084292, 2162215, 2163384, 3549256, 3549678, 4627552, 6167650, 6169162, 12483195, 12485451, 12486620, 13872536, 18646480], [60, 1350, 4668, 5690, 1391599, 1392740, 1396387, 6786408, 6787409, 6787659, 7403605, 7404739, 7406636, 8946713, 8948022], [32, 713, 308650, 309322, 463287, 464421, 467704, 1699809, 1702182, 3704292, 4782168, 5706259, 6014231, 6015666, 6785624, 6787192, 6789425, 6790013, 8329908, 8330937, 9870790, 11410902, 11413870], [74, 1693, 7118, 7783, 7902, 8868, 9713, 471806, 474375, 5094424, 5096944, 6637021, 6638022], [74, 1693, 1541546, 2003679, 2009251, 2933356, 3703293, 3704441, 4628383, 4629813, 5245729, 5246275, 5248065, 5249173, 5250228, 5251406], [67, 1476, 2372, 3688, 8798, 1702917, 1707775, 1709224, 1713410], [46, 1042, 3716, 1389814, 1392817, 1393664, 1396044, 1396730, 1398501, 1399089, 2938963, 2939488, 2940340, 2940762, 2944486], [74, 1672, 1079609, 1081072, 2466965, 2467828, 3545709, 4315793, 4317450, 4318719, 4320175, 4782278, 5552217, 9710280, 9713122, 9713801, 9715124, 11255229, 12487110, 13719222, 13722946], [74, 1630, 2195, 3016, 3443, 4161511, 5085443, 8781506, 8784353, 8785181, 9093123, 9093944, 9094791, 9556894, 9558702, 9560298, 10638186, 10638620, 10643870], [74, 4312102, 4774076, 4775665, 5699602, 10319635, 10627560, 11705693, 13245595, 13246757, 13252084, 13253652, 13256172, 14796261, 14796851, 14798321, 14805720], [32, 755, 1232622, 2310720, 2772650, 2773350, 3543287, 3544421, 4160349, 4161212, 5239086, 6009184, 6471128, 6472094, 6472983, 6474117, 6476833, 6477967, 9863118, 9863811, 10479720, 11403804, 11405750, 15871708], [18, 440, 1078356, 5236412, 5238946, 7241072, 8626932, 10167058, 10170348, 10171034, 10172840, 10174121, 10790079, 16334016], [25, 1386146, 1392054, 1393062, 2470936, 3395069, 4626936, 5551055, 6474999, 6476462, 7862390, 7864009, 7869868], [18, 1694132, 2772062, 2773357, 3697266, 6315334, 6777287, 6778442, 2317860, 3241951, 3242532, 3243853, 4783757, 4784877, 4785745, 8173836, 9251710, 10483794, 10484501, 12794564, 12795439, 15875404], [25, 594, 1078496, 4004566, 4466489, 4467019, 4774944, 5699014, 5699894, 5700876, 5702689, 5704110, 5706630, 7400735, 7403423, 9559507, 9562671, 9563406], [6, 154139, 1386041, 4158153, 5698076, 5699679, 5704957, 8477083, 10016971, 12173027, 12174327, 12944406, 12944833, 12946009, 12952330], [11, 770090, 770510, 4774545, 4775091, 5237175, 5545084, 6777203, 7701133, 7702267, 7705242, 8783366, 9861261, 9861781, 9863466, 9865071, 9869768, 9871033, 10179000, 10180176], [18, 1078109, 1694013, 2156137, 3388034, 6930111, 7546011, 8008111, 8624006, 8778111, 9394034, 11704125, 12628062, 12629322, 12630078, 12631644, 13093604, 13094920, 14480794, 15866780], [46, 1028, 3287, 4421, 620346, 621046, 1390962, 3701016, 3701424, 3702143, 4934012, 6474152, 7860040, 7860747, 7863932, 7865507, 8481423, 8481948, 8482333, 8944452, 10022333, 10792424, 11254347, 13256424, 13718347, 13718935, 15258807, 16798788], [11, 462146, 1848076, 1849686, 3235560, 1851338, 1853730, 1854397, 1855104, 1855496, 2317410, 3549503, 3552051, 3552870, 3553262, 5247367, 5251560], [46, 1007, 1117, 1994, 1387901, 1389009, 1390528, 1391830, 2469774, 2471326, 2471860, 3395958, 3397757, 3398898, 4168800, 11092304, 12478213, 12479368, 13557312, 18639242], [18, 405, 1756, 3058, 1080995, 1082442, 1085440, 1086399, 1087575, 9552129, 10476017, 11092155, 12632066, 12633326, 12787242, 13865333, 14173254, 14173676, 15251564, 16637550], [6, 154132, 1232034, 4158146, 5544048, 9856118, 9860045, 12324136, 12328840, 12330142, 13408044, 15718016], [46, 1049, 924930, 2619070, 4004944, 4005357, 4929245, 5699364, 6777308, 6778918, 8164848, 8166465, 9706386, 9707942, 9708677, 14482761, 15714628], [25, 566, 3457, 4864, 158794, 1852892, 2622836, 2624108, 3086019, 3702115, 3704056, 6938098, 6939141, 6940254, 7094203, 7095045, 7096508, 7097173, 7098825, 9870902, 9873716], [25, 608, 1386468, 2002608, 3388517, 3389637, 3390960, 4931037, 5547002, 5548598, 6626493, 6627053, 7550962, 7551683, 8783557, 9861655, 10477599, 10478754, 11556649, 12942705, 12944063, 12945183, 13253099, 14177190, 9100648, 10794762, 10799718], [67, 1518, 1079427, 4005523, 5237448, 5238722, 5700680, 2629017, 2630179, 3708284, 3711714], [53, 3234109, 3850069, 3851476, 3852533, 8626589, 9550540, 4013652, 4475622, 4477220, 5555115, 7557220, 7562176], [60, 3850083, 3850965, 5853070, 7238944, 8933007, 8934330, 8934701, 8936029, 8936619, 10476479, 10476729, 11092654, 11093368, 12171291, 12172404, 12173412, 13405475, 13406833, 13407939, 13409290, 13410319, 12180944, 13721021, 13722484], [39, 902, 5436, 6467, 12550, 14137, 938083, 6482158, 7868020, 9408139, 9411716], [53, 1201, 925105, 2311182, 2773098, 3697175, 4005119, 7701224, 9087105, 9087637, 9088484, 9704603, 10936533, 10937989, 12169863, 12785940, 12786843, 12788278, 12790665, 12791519, 12795915, 12797077, 12801564], [25, 573, 3093, 927205, 1851128, 1852094, 1852542, 1854103, 1855587, 1856469, 3396364, 3397337, 3398184, 3398618, 4784534, 4785808, 5247766, 5249068, 5254024], [6, 154104, 156041, 2312090, 2312470, 4006547, 4008171, 4008451, 5240325, 5856465, 7396346, 7397074, 8782955, 8783522, 8788016, 10482119, 10484025, 11562095, 11563304, 11564601, 12488487, 13258615, 14490503, 14491028, 14491560], [18, 1694090, 1694930, 3389033, 4004993, 4006435, 4930344, 7702435, 7706332, 7706775, 9246677, 9247853, 10787769, 10789232, 12175148, 12176429, 12792324, 14024401, 14025883, 15411864], [60, 3850097, 3851098, 4467189, 5083112, 8009217, 9241147, 9242568, 9244848, 9246432, 10016334, 11556439, 11560366, 11561339, 11562816, 14488872, 14489271, 17107250], [6, 154111, 770013, 1386153, 2926034, 2926727, 2929100, 4623198, 5393149, 5394584, 6164493, 8474617, 10014500, 10015205, 8634023, 9096135, 10020051, 13254107, 13562044, 16796016], [11, 770097, 1078074, 1079658, 1849581, 1850393, 1851135, 5547210, 6625119, 6625982, 6629594, 6630593, 7554539, 7555995, 8787869, 9249946, 9250814, 9251535, 9256022], [60, 1350, 4318, 1390451, 1394980, 1395939, 1397409, 2475486, 2475885, 5093955, 5095579, 5096111, 5097560], [53, 1187, 2687, 6624729, 6627592, 6628593, 7552535, 7553993, 8785923, 8787365, 9711246, 11405372, 12483295, 12484422, 12946373, 17566324], [18, 1694132, 2772020, 2772412, 2773565, 2774120, 3544036, 3544722, 3546822, 3547830, 4625718, 5703823, 5707708, 7401799, 7403738, 9559815, 10175731, 12331808, 12793738, 12794445, 13718347, 13718914, 14796837, 14797985, 15721866], [18, 412, 462321, 462594, 4620538, 4622155, 6162015, 7240148, 7246378, 12944427, 12947157, 12948571, 12949775, 12951194, 12952484], [6, 154111, 156974, 4931058, 4935881, 4936420, 5398392, 5399946, 5553897, 5554742, 5557159, 5558587, 6174503, 6175077, 6179256], [74, 1665, 925595, 6007656, 6777595, 6778715, 7086629, 7548701, 7550192, 7550885, 8166813, 10630878, 10632537, 17870474], [18, 426, 3569, 2313625, 2314514, 2315536, 3701403, 4471480, 4471872, 5395956, 5397769, 5399239, 6939120, 10481183, 10482786, 11714919, 12946786, 14178898, 14948835, 19260786], [46, 1077, 1540986, 6469007, 6470043, 9550127, 10474015, 10474239, 10475602, 10476906, 11554815, 11555648, 11557300, 16331244], [39, 2618104, 2619581, 2620421, 2622836, 2624122, 3394047, 5704117, 5706525, 5707694, 7093582, 7094294, 8172224, 8173507, 8175880, 8176251, 8177112, 9563245, 11103105, 11873201, 11874638], [60, 1364, 1079287, 1080428, 1083718, 2315795, 2623718, 3855851, 5395767, 10785788, 10786521, 14174614, 15560474], [6, 154139, 1386013, 1848111, 1850652, 3235987, 4467889, 8933950, 8935422, 11707525, 12939394, 13709513, 13713893, 13714735, 14330679, 14331827, 14335453, 14336559, 14338022], [67, 1490, 463399, 1079539, 2619448, 2620715, 2621310, 2622899, 3546829, 7242878, 7244992, 7246294, 8324196, 8324903, 9248812, 11712929, 13252819, 16640784], [60, 3850097, 3851462, 3853037, 4468974, 4469989, 5701912, 5703184, 5704782, 6782873, 6783909, 10787972, 11557893, 11558714, 11712686, 17256630], [39, 2464104, 2926055, 2927224, 4313089, 4775210, 5853147, 11089168, 11089567, 12629651, 13245616, 19251546], [46, 1070, 1386986, 5699028, 6160979, 6162127, 6165744, 6166775, 7706691, 7708105, 7710023, 8326154, 9712086, 15872016], [11, 462090, 616013, 1540139, 2772076, 2773663, 3697553, 3697838, 5083721, 7701826, 8779700, 9241819, 10165705, 10781847, 12321768, 12323380, 12329293, 12330462, 13716394, 13718004, 15103911, 15105045, 15106804, 15107236, 16493098], [46, 2310097, 2311266, 5237315, 5238321, 6008393, 6009905, 6011067, 7242941, 7705081, 9244934, 9861046, 9865463, 9866905, 9871154, 9872330], [46, 1007, 1124, 2465196, 3235131, 3236239, 3236932, 4777030, 4778192, 7704302, 9090178, 9090549, 9092052, 12326143, 13558047, 16946012], [53, 1208, 1079103, 2311224, 2316509, 2317384, 3703286, 3704306, 5090217, 5091323, 5091883, 5092408, 5093106, 6017192, 6479143, 6480284, 7250226, 11100270, 11102209, 14490265, 14798181, 15568174], [74, 1679, 1233588, 1234575, 1850496, 1851219, 1855769, 1857183, 1858345, 1858863, 1859612, 1860886, 1862972, 4635042, 5097014, 5098484], [67, 1539, 1541427, 1542274, 1546663, 1547482, 1548483, 2318565, 2626518, 5706588, 6476532, 6477818, 6479738, 8327787, 8328641, 9406767, 10638683, 10639824, 11409761, 11410923, 12642797, 13566888, 14028839, 17724790], [6, 154111, 770041, 4158083, 4159271, 4160155, 5700036, 7548085, 7549548, 8165639, 8166834, 8168110, 8630068, 8631321, 8632959, 9865043, 10480992, 10482268, 10944233, 10945661, 10947726, 12333824, 13103733, 13104272, 13106022], [32, 734, 770685, 772148, 7700839, 7702309, 9242232, 9243805, 9859744, 9860745, 9864035, 9864607, 11096476, 12020572, 12022030, 12022422, 12484338, 13716429, 13718809, 15720788], [6, 154097, 155112, 2465203, 3389091, 3851203, 4775112, 6931224, 8317140, 13245217, 14477133, 14478274, 14481613, 14483062, 15560936], [53, 4466090, 4466503, 4467357, 5391301, 5392729, 6008624, 7240764, 8626694, 8628262, 8630838, 8632133, 8635465, 8636893, 9252844, 9254118, 9256176], [6, 154125, 1078046, 1079028, 1080645, 1081198, 1084479, 1084726, 1546628, 2624733, 2626637, 2626910, 3704798, 5706910, 5710949, 6173089, 6179256], [32, 699, 846, 2442, 6320, 1084446, 6316176, 8010295, 9242176, 11244295, 12476211, 12477387, 14017240, 14787324, 14787877, 17405856], [53, 1215, 4794, 5200, 8231, 9631, 9748, 10737, 626660, 627337, 935248, 2167381, 2172946], [46, 2926090, 2926671, 2927847, 4467749, 10165796, 10166981, 14941072, 16326932], [11, 462139, 1694069, 1695539, 3235448, 3236708, 3237273, 3238108, 3240684, 3241958, 3703902, 3704861, 3705897, 6169960, 6172543, 6174013, 6182028], [32, 727, 616622, 1694720, 2156671, 2157784, 2158778, 3544918, 4930848, 11860925, 13400832, 13402094, 13403102, 15097193, 15099433, 15100259, 15101099, 15101351, 15104207, 18646172], [67, 1525, 1233427, 1234253, 1235443, 1236584, 2006533, 6164556, 6318512, 6319536, 6325724, 7249843, 7252965, 9255035, 9562993, 9564022], [6, 154118, 157618, 159179, 160332, 160761, 1392677, 1393804, 1396338, 2628413, 2936359, 6170450, 6174552, 16022166], [46, 1063, 1232977, 1234111, 1850050, 5700106, 5702346, 8012416, 8014488, 9400551, 9402189, 11404252, 11558175, 12482294, 12486242, 12487803, 12489714], [18, 461, 1540384, 1541931, 1542330, 1542750, 2620659, 7086741, 7089863, 7859942, 7860642, 9246719, 9554668, 9555692, 10941622, 10943225, 12175120, 12175813, 12791757, 17103708], [53, 1194, 771140, 772428, 1542344, 1543009, 1543429, 1544297, 1549883, 1550434, 1552506, 4170627, 5710480, 7096578, 7098529, 7099560], [74, 1651, 617579, 618449, 1850351, 5084442, 6162379, 6163800, 6625744, 6626766, 8012675, 8013830, 9091725, 5709353, 5712090, 5713560], [25, 1232083, 1233413, 1233945, 1234540, 2473482, 2627470, 10936743, 11860680, 11861954, 12323917, 12325389, 13865291, 13866432, 13869120, 16333092], [60, 1357, 4486, 928554, 928955, 4931625, 4932192, 4932904, 6010785, 6011032, 6012481, 6936621, 6941619, 6943019, 6943887, 8330006, 9715887, 9716475, 11256363, 11257238, 12643147, 17571098], [25, 545, 671, 5390741, 5393877, 7395975, 7399601, 7400707, 7402023, 8326093, 8327010, 8328564, 8328970, 11101082, 12487012, 12488613, 13720552, 20034482], [46, 1035, 4059, 5179, 6376, 7655, 623601, 4935664, 5705615, 11095664, 11865552, 13405685, 14637559, 15407552], [25, 552, 1546, 463637, 464932, 2005023, 2006332, 2006703, 2007305, 2008705, 2009293, 2010413, 2012016, 3706156, 5092077, 5093549, 6633416, 7711486, 7865458, 7866716, 7867096, 9253229, 10485159, 10486580, 10948517, 10949399, 12489259, 13105329, 13106638], [25, 559, 2498, 3198, 7620, 4627678, 5705566, 7091643, 7093281, 7094163, 10018658, 10019365, 10943253, 11559379, 12791267, 12791827, 12794984, 12795978, 12798946], [74, 4312151, 5852027, 7854118, 7856827, 7857975, 8781905, 8783060, 9860962, 9861669, 10785592, 14789634, 14790383, 14791839, 16023706], [67, 1497, 3252, 3667, 927583, 928444, 2006339, 4776141, 6008071, 6009527, 7241450, 7242743, 8166682, 12786724, 13248661, 13249508, 13252833, 13253988, 14331897, 14332772, 14338176], [11, 462146, 1848041, 1848923, 1855914, 4935937, 4936518, 4937547, 6477435, 10019477, 10021143, 10022312, 11408186, 13410305, 13415870], [67, 1511, 5571, 2315697, 3855550, 5549676, 6627606, 6628901, 6632658, 8634744, 9404646, 9405038, 9866996, 9868305, 9873100], [46, 1042, 4815, 2314892, 2318630, 4012735, 4628630, 6322770, 7708630, 9402742, 9405444, 9406452, 10484396, 16490326], [39, 860, 1889, 4467938, 4468813, 4469639, 4777548, 5393667, 6317611, 11399667, 12323569, 12324101, 12632038, 16174010], [53, 1194, 771147, 772552, 773128, 774150, 2160073, 2161492, 2623445, 2624551, 2625741, 6321830, 7399774, 7401358, 7405250, 8791376, 8796794], [53, 1194, 771084, 2003231, 3543091, 4313201, 5237112, 5237826, 6315728, 9703840, 11089756, 11091021, 11398939, 11399191, 12015140, 16173086], [11, 616104, 1078006, 1232125, 2156006, 2310083, 2310942, 3235014, 3388991, 3390463, 4930323, 4930582, 5700498, 5701177, 5703107, 7089186, 7551158, 7552768, 8938677, 13558705, 13560082, 8027256], [46, 1021, 2540, 4129, 8210, 9169, 9281, 10121, 626037, 626604, 1704513, 6170590, 6940485, 8018555, 8019463, 8020900, 8790856, 8792426, 9254377, 9255406], [60, 1378, 1387294, 1388582, 2158491, 4160575, 4163569, 5395676, 6473578, 9245627, 9247300, 14945342, 14947902, 14948926, 16334786], [53, 1215, 5088, 621228, 2007137, 2008313, 3548192, 3548873, 3856845, 3858301, 5090231, 5091680, 6169568, 7709657, 7711472, 7713040, 7715560], [53, 1222, 1387098, 2619210, 3697119, 3697973, 4621873, 4622428, 4625128, 4626159, 6166047, 9554117, 10170052, 10171034, 10172222, 10173491, 10481407, 10943491, 10944982, 10946004, 12331878, 14179941, 14181411, 15259488, 15260342, 15260762, 16338636], [32, 1540139, 2772055, 2773224, 4159098, 4159539, 5699399, 6777539, 8317432, 11089511, 12013448, 16787392], [32, 2618104, 3080006, 3234095, 3234664, 7700713, 7702680, 7703989, 8935919, 15557856], [25, 1386104, 1848069, 8008146, 9394027, 12320097, 1244389, 1245796, 1246188, 2940314, 4326230, 4327406], [6, 154118, 924062, 6006153, 6010640, 7088724, 7090817, 10170922, 11556787, 12326887, 12942803, 15252929, 16792782], [46, 1077, 1540944, 2773014, 2926930, 4621070, 6006979, 10319042, 11089000, 11090589, 12014505, 12015352, 12018782, 13096894, 13100065, 13101220, 14179094, 15411094], [53, 1187, 617154, 618762, 2004638, 3082729, 3698666, 3699660, 3704014, 4628105, 4629274, 4629974, 4632688, 4633992, 4637254], [74, 1672, 1079616, 9241649, 9857581, 9858456, 11244358, 15094414, 15556316], [74, 1686, 5550, 1699634, 1700691, 6628775, 8168649, 8169216, 9247097, 9247370, 9252088, 9253705, 10793600, 10794566, 10795406], [60, 1322, 1868, 2244, 2638, 1234736, 2004687, 2006087, 2006640, 2930771, 4470654, 6780738, 6782544, 6784105, 6785904, 10635972, 10638079, 10639551, 10644486], [53, 1222, 1387126, 5545224, 6931126, 1088875, 1089717, 1705801, 1707458, 1708720, 1709406], [32, 2618090, 2618972, 2619966, 3389903, 3391044, 3395431, 3396252, 3550196, 6476287, 7400189, 8940273, 9556231, 9557694, 9564022], [53, 1229, 6796, 1084880, 1086322, 2010420, 2012352, 4938471, 6478373, 6479535, 7711430, 11253526, 12331456, 12332718, 12333250, 13719388, 15105257, 15721250], [6, 154153, 159606, 160922, 1546789, 2470915, 3702845, 9246929, 10786817, 10787662, 11557587, 14945629, 14947120, 14947799, 14949094, 16181094], [46, 2926118, 3696069, 9702083, 9703770, 9705385, 11245240, 12015373, 13247282, 17405240], [74, 1623, 1756, 3072, 1388965, 3853072, 5238974, 9705051, 10628932, 12169070, 13554953, 13555541, 13562954, 13563330, 13564081, 13565500, 14027425, 14028006, 15413866], [11, 616139, 1848027, 3388097, 3696006, 3850090, 3850993, 3852421, 3854848, 3856446, 3860224, 3861514, 3864195, 3864755, 4788704, 4790176], [53, 1161, 1273, 2085, 2188, 2918, 1388799, 1389373, 2621289, 8319324, 8319863, 9089966, 9859856, 10783940, 10784386, 10785977, 11709872, 13249935, 13251249, 13713391, 15253272, 15253972, 16023860], [74, 1623, 1700, 463803, 1079763, 1081205, 2005121, 2005982, 2009132, 6013209, 6937123, 8785167, 8786364, 8787386, 10173258, 10173694, 11559624, 11561176, 11561752, 11562725, 11563318, 11564916, 11570334], [67, 1511, 925420, 3697497, 4313441, 4314582, 4317592, 4318563, 4319578, 4320294, 4323563, 5247682, 6325577, 6326107, 6634074, 6635327, 6636328, 8176475, 9716328, 11256447, 12180356, 15414328], [46, 1042, 770972, 771938, 772624, 2004708, 2005744, 5855842, 5861400, 7555533, 8787470, 8789024, 8789437, 12331533, 13563465, 13564865, 13566237, 14187872], [46, 1063, 1232998, 1234596, 2312526, 2313807, 2316012, 3856096, 3856488, 3856922, 5242789, 5243062, 6320964, 6321643, 6629601, 6630707, 6631771, 6633178, 6633764, 6635089, 8175012, 8176606, 9254536, 13566606, 13570332], [39, 888, 770839, 772288, 1850225, 1851625, 1852332, 3546423, 4162346, 7550414, 8012388, 8013970, 8783879, 8784451, 10016334, 10016754, 11094677, 11095790, 11249706, 12173797, 12481776, 12483344, 12945316, 12946910, 14024805, 15872786], [25, 1540111, 1542498, 1543170, 1697149, 1698584, 2468542, 2470089, 2471713, 3241832, 4319706, 5243830, 6321725, 6322259, 6630203, 10326252, 10480203, 14946245, 14947743, 18027708], [74, 1637, 309567, 2311693, 2317438, 5243510, 6013405, 6937475, 8322985, 8324098, 8324490, 9710595, 9714975, 9715845, 10947740, 13565852, 14951775, 14953217, 15877098], [11, 770104, 1232069, 1233511, 2157448, 2158771, 3698652, 3699373, 4931303, 4932759, 6164673, 9090731, 9706633, 10476722, 10938647, 10939165, 10940360, 10941321, 10942495, 10943064, 12020959, 13869036, 14330938, 15716938], [67, 1532, 1387413, 3235469, 3236223, 3237695, 4777555, 5239667, 6163574, 6164283, 7088213, 7089354, 7859263, 9399326, 9399737, 9400579, 10016523, 10017629, 10019267, 12637358, 12640240, 12641789, 12643140, 12644022], [18, 461, 1540356, 1541315, 1541726, 1542449, 1547151, 1548581, 2164504, 4320609, 5552530, 9707627, 9709293, 9710413, 10018376, 10019687, 10025119, 12027203, 12643098, 14183224, 15261133, 15261868], [6, 154132, 158190, 158892, 928801, 3084885, 3700815, 3701662, 4471557, 5241660, 6011557, 6627697, 6633472, 14025486, 14026074, 14027362, 14797290, 14798265, 15106223, 15107378, 15111718], [18, 454, 5732, 6439, 11101, 473241, 2013115, 3399185, 3400242, 3401789, 3402552, 3404022], [6, 154104, 156225, 157667, 161594, 4165636, 4166518, 4167484, 4168380, 4169661, 4785556, 6017675, 6941598, 6942562, 6942942, 8329047, 8331868], [25, 1540097, 1541560, 3389672, 4467546, 4929677, 6161553, 7085623, 7087310, 7088904, 7091727, 9709832, 10787713, 11249783, 11250973, 14177064, 15254994, 15256310, 16642170], [25, 587, 924489, 3234559, 3235462, 3237016, 3237436, 3238463, 4778367, 4779515, 5703424, 5704138, 6782026, 8168152, 9554075, 9555531, 10787447, 15715398], [25, 1540139, 2772034, 4620104, 5082076, 5083658, 5853546, 6315644, 6317303, 6318759, 7550696, 7552264, 7553762, 12173818, 12177710, 13409829, 13412669, 13413406], [60, 1378, 1387238, 2773371, 4005238, 5391378, 6777266, 9857329, 9858680, 9859989, 11091870, 4169171, 4170347, 6788466, 8174331, 8174606, 9252508, 9253194, 9715117, 12025201, 12027868], [53, 1180, 2960, 3646, 465548, 1081667, 1086084, 7092124, 7862014, 8786154, 10172021, 10634105, 10635449, 10636604, 10640636, 12180720, 12181714], [74, 1693, 1541546, 2003686, 2009412, 2009837, 3241748, 3242712, 3243281, 3244093, 3244798, 4322896, 5092821, 8018919, 9250828, 14024931, 15564786], [11, 265, 616209, 617371, 6160636, 7854727, 7857093, 7857317, 7858213, 7859375, 9091242, 10169333, 10170992, 10172306, 11558168, 12482259, 12790238, 12791785, 12793136, 17259094], [18, 391, 475, 1078615, 2618468, 3234601, 4466489, 4467007, 4468526, 4469807, 5085765, 5087214, 6165137, 9861207, 10785116, 10785837, 12017704, 13249816, 13252700, 19874630], [46, 1070, 1386944, 1387322, 1387887, 1388729, 2004652, 2005331, 2313296, 2314563, 2316026, 3702157, 5242061, 10170143, 11402061, 11403167, 11404336, 13098420, 13100177, 14178275, 14181747, 14182587, 14798545, 14799868], [60, 1364, 1079273, 4467357, 4470661, 7242729, 7244829, 10940866, 10941244, 12173375, 13405293, 13406462, 13411264, 14643383, 14648178], [32, 720, 2967, 3083016, 3083765, 3085165, 3085914, 8475998, 9861921, 15867858], [46, 1007, 1089, 1315, 1406, 1840, 1387756, 1389056, 2466986, 2468241, 2469858, 3855947, 3856852, 3858462, 5244322, 6168455, 6174237, 10948279, 10950484], [6, 154097, 462027, 462608, 1848538, 1850134, 1853893, 1854754, 2932642, 2933069, 4164936, 5089034, 5550978, 9555027, 9556665, 9557533, 10789463, 10790868, 10791605, 10792739, 10794223, 10795364, 11565287, 11566022], [53, 1201, 4059, 5207, 929116, 3855228, 5241116, 5241844, 6627725, 8783781, 8784957, 8785515, 9709433, 13405475, 13406784, 14638882, 14640975, 14641836, 15719710], [39, 2310111, 2311896, 2312918, 3698790, 3699177, 4007100, 4007541, 5547401, 6317483, 6318505, 9090563, 9092495, 10324572, 10326357, 10327223, 11559106, 12791239, 14331106, 16333092], [53, 1201, 925098, 925483, 927275, 928150, 2314073, 2315522, 3393452, 3394747, 4318691, 4320112, 4782021, 5706112, 5708525, 5709673, 6633619, 11561640, 11562205, 14488249, 14489733, 14490279, 15106230, 15107406], [32, 748, 1078671, 1079791, 1080848, 1082421, 1698374, 1699648, 2161557, 2623641, 2931578, 2932278, 3702215, 7706250, 7860192, 7860873, 7861734, 9863811, 10479748, 10480728, 10481911, 10483038, 10484795, 11562921, 12794837, 12796006, 14181913, 14183089, 15722944], [32, 713, 2022, 2456, 9610, 5091673, 6015568, 7709657, 8325610, 8326863, 8327731, 9867820, 9870069, 14028151, 15260034, 16184020], [60, 1322, 1707, 771826, 1849700, 2311847, 3851714, 5237791, 5239121, 5239982, 6317926, 6319473, 6320481, 6320766, 7706698, 7708245, 7709106, 7709519, 8633470, 14023484, 14024520, 14025479, 14026975, 14027796, 14028349, 14028916, 15106790, 16646790], [11, 616132, 1694048, 5544153, 7084013, 7084244, 7084685, 7086113, 7088675, 7089802, 7092392, 9863195, 9866686, 9867955, 9869285, 12795362, 12797714], [46, 1049, 6628, 1084705, 1085902, 1086924, 2472819, 4628931, 6168819, 6169680, 6173297, 6174445, 7098391, 7099714], [39, 888, 770839, 772288, 1850176, 1850566, 2312505, 2313373, 3545289, 8165366, 9243247, 10167345, 10783308, 10784906, 11862836, 11864096, 11864500, 11865195, 12481111, 12481629, 12482952, 14177029, 14177918, 20337862], [6, 154139, 1386055, 1387161, 1388666, 6162708, 6316624, 7548729, 7551571, 7552152, 8938068, 8939340, 9401293, 9402413, 9404021, 9404303, 10636205, 10637017, 10638501, 10639082, 12025012, 12026594, 12796524, 16492482], [67, 1539, 1541462, 8163532, 9549462, 9551009, 9552696, 9554278, 9558394, 9559948, 9713890, 11715983, 12639927, 12641339, 12642354, 12643028, 12643560], [67, 1525, 1233441, 1234561, 1235926, 3858159, 5398042, 5398712, 5552686, 5554009, 9863153, 9864614, 11250490, 12174588, 12178970, 12179635, 12181133, 15261182, 15261560], [74, 1630, 1540181, 4004293, 5236214, 5237476, 5391427, 5392251, 5700176, 7086302, 7090530, 7091783, 7093463, 7094877, 7096200, 7096907, 8020802, 9406893, 10022802, 11408921, 11414486], [53, 1222, 1387098, 2927196, 3697126, 3698155, 5238022, 6624153, 6628054, 6629062, 7706999, 12789013, 12790336, 13868399, 13869895, 13870779, 15410632], [11, 462111, 1078039, 1078860, 1079308, 1080855, 1082010, 2776087, 2777452, 8475529, 9707436, 12325522, 13403417, 13403935, 13405307, 13406749, 13409577, 16335556], [11, 616104, 1078046, 4620125, 5544006, 5698083, 5699266, 8317329, 8625252, 10319322, 10319854, 11089964, 11859861, 12475938, 12476636, 12477009, 12478339, 14326430, 15096351, 15097235, 16637088], [11, 279, 3294, 4612, 1390542, 1392138, 1397717, 1397969, 1400830, 1401714], [6, 154111, 770034, 770727, 1386692, 1388260, 1389555, 2005688, 3391562, 4777681, 4781727, 6937811, 6940177, 6940413, 6941619, 6943075, 8174949, 9099026, 9252998, 9254307, 10486216, 10487238, 11873124, 14029222, 15107117, 15107560], [18, 405, 1238, 1387357, 1391249, 2469375, 3701242, 4779326, 4779704, 6011837, 7243730, 7244418, 7246224, 7247533, 8479456, 13253510, 13256347, 15412326], [11, 462125, 1386048, 1387007, 1388512, 1389541, 2929408, 4161483, 4162353, 7858395, 7859249, 8937354, 9707270, 12017352, 12787256, 14481347, 15097284, 18793242], [67, 1539, 1541455, 1542881, 2158806, 5546883, 6162792, 8010874, 8472792, 10166916, 11552806, 11553492, 11556061, 16484012], [60, 1357, 5249, 621347, 623755, 624875, 626548, 628151, 1860046, 1860746, 1864638], [18, 1232104, 1694055, 8008139, 9240034, 9240762, 10626629, 11242699, 11243917, 11245373, 12477310, 12478869, 12480544, 12482091, 12483414, 12483827, 12488377, 12489406], [25, 1540111, 1542988, 1544262, 2006227, 2007688, 3393585, 3394416, 3395762, 3397057, 4320987, 4322163, 5862037, 7864149, 9096030, 10328093, 10329281, 12793360, 12797714], [53, 1187, 2946, 1697023, 1698472, 3238563, 3240012, 4780101, 4781755, 4782875, 5090826, 5091813, 5707778, 11247830, 11251778, 11253332, 11253878, 12485948, 12486662, 12487383, 13719297, 16953250], [46, 4466118, 5236076, 5237630, 5391595, 11089630, 11090372, 11091646, 11553581, 11554437, 12478367, 12479473, 12480817, 15252880, 15255615, 19567554], [46, 1007, 1096, 925161, 926827, 5700862, 5701282, 9551345, 10167240, 10937366, 12015310, 12016871, 12324787, 13248913, 14480780, 15096892, 15866780], [53, 1161, 1245, 617336, 1079273, 1080120, 1083116, 1083802, 1085867, 1856005, 3395874, 4935958, 5397860, 6321965, 6937902, 6938861, 6939764, 6941087, 8480994, 8482319, 10022193, 10022765, 11254676, 11255696, 12641614, 16491558], [46, 1042, 4358, 5382, 1391284, 3855347, 4471254, 5703368, 6781270, 10323375, 11555256, 11555655, 11558035, 13560145, 14792014, 15716014], [46, 1077, 1540951, 1541483, 1542995, 1544416, 1546327, 2470467, 4010348, 6474460, 6480662, 8482711, 8483628, 8485217, 9409168, 9410638], [53, 1208, 1079096, 1079476, 1080526, 1081821, 2005723, 2006283, 2009608, 2010887, 2626847, 8170924, 8176958, 9563056, 10332951, 11411063, 12334944, 13875084, 15260991, 15262022], [53, 1194, 771147, 772573, 773870, 1852003, 3391870, 5393982, 6471870, 8166003, 9705870, 10937968, 10942343, 12482427, 13098371, 13099512, 13869456, 13870758, 14948688, 19260632], [18, 433, 924370, 925693, 2465574, 5237637, 5238841, 5240248, 5241116, 5241809, 5857711, 6319830, 7397767, 7399223, 8631153, 8632616, 8637103, 9407229, 10639108, 11717241, 13257096, 14643236, 16029096], [25, 1386111, 2002069, 2003497, 2619462, 2621079, 4160939, 4161170, 4162080, 4163646, 4165153, 4166623, 5706504, 8170623, 9710511, 12944623, 14484483, 14484770, 15870630], [11, 616125, 619415, 2467492, 2929450, 2930771, 4470640, 4471018, 4471774, 4473335, 4781279, 4782147, 6014040, 6014742, 6018214, 6019194, 6021098, 7561208, 7563408], [25, 566, 462538, 464092, 464811, 465660, 468052, 469083, 476041, 476615, 1708515, 3864627, 5404503, 5405049, 6020944, 7561028, 7561560], [6, 154083, 154517, 4004615, 5544538, 5546097, 5854015, 6316141, 6319872, 6320313, 6325759, 6326893, 6942844, 6944153, 8176090, 8177560], [25, 559, 1763, 6777812, 7547721, 9087831, 10319728, 10320449, 11552323, 12630393, 12631723, 12632269, 13248192, 13248920, 14634799, 14635319, 14636824, 18640782], [6, 154090, 154664, 4312741, 5236692, 5238302, 6624232, 6625793, 6626647, 7858731, 7860803, 7861326, 8015300, 8016553, 8017414, 8941538, 10327470, 10329080, 11714945, 12331066, 13408989, 12025551, 13565404, 14951523, 14954330], [74, 1630, 2687, 4087, 4220, 5513, 929459, 930880, 1392810, 3240922, 4626796, 6628866, 6782852, 6784439, 6786849, 11406926, 11412792], [11, 244, 154230, 155777, 156176, 1388295, 2620211, 2621324, 2622073, 2623515, 3547459, 3548908, 4626845, 4628308, 6014238, 6015806, 6017302, 6018557, 6020083, 6021406], [25, 559, 1084, 1233196, 2003147, 2004582, 2774470, 4468589, 5392526, 11090568, 11092836, 11094138, 12172040, 12172768, 13558635, 14020733, 14023127, 14024009, 15563862], [60, 1364, 6796, 7167, 7272, 7986, 1085881, 1086413, 1088030, 2936161, 4476037, 4476618, 5862534, 10482555, 10483878, 11715997, 12947883, 14949969, 14952664, 14953390, 16339252], [53, 3234144, 4620048, 4621063, 5852958, 5853630, 6007607, 6009023, 6316946, 6317317, 6318367, 6319529, 7551408, 8629478, 8630222, 8631524, 9709426, 13251496, 13253582, 13254303, 14486233, 19106170], [18, 405, 1455, 2869, 310806, 2620881, 2622374, 2623690, 4009550, 5703627, 5704782, 6782901, 7706796, 9400906, 10478787, 10940866, 10941587, 14175643, 14176945, 14177190, 9100669, 9101406], [18, 412, 462377, 463796, 925714, 2619824, 2622689, 2624101, 2625272, 5089321, 5089872, 5705944, 5859930, 5861491, 5862632, 7402737, 8018702, 14332772, 14338638], [11, 770139, 2002013, 3080083, 3080832, 3082155, 4622078, 4623632, 4777576, 4778255, 5086220, 5087536, 5092646, 5093024, 5093780, 5095360, 5865285, 5866139, 6790083, 6791406], [39, 1848139, 3080013, 4158104, 4160377, 4161779, 4163004, 4164607, 5396507, 7706551, 7707466, 7709057, 7712081, 7713537, 8945474, 8947056, 9716951, 10641084, 10646950], [32, 713, 2351, 3544393, 3544979, 3546092, 3546626, 4162766, 5548640, 6780738, 7550696, 7552271, 8168236, 14482299, 14486989, 14488109, 14488977, 17876942], [74, 1686, 6656, 7321, 7447, 8588, 778532, 5552586, 5555451, 5556564, 5557117, 7713222, 8791145, 8792279, 8795100], [32, 1848153, 3388048, 7238083, 7239294, 7240547, 7241709, 8165840, 9551723, 10783786, 10784661, 13710771, 15250633, 4635868], [11, 616090, 617133, 6315161, 2162376, 2163655, 2166170, 3860280, 3863145, 3864314, 5250174, 6790293, 7714223, 12796291, 13720188, 13720573, 14028531, 14029560], [46, 1042, 770972, 771945, 773156, 774708, 775291, 776432, 1546383, 1547811, 2163706, 3087851, 4627720, 4628126, 5398070, 5399330, 5400023, 6324135, 6328174, 7868307, 9100230, 9101406], [46, 1077, 1540979, 1542155, 3082064, 3083338, 3084822, 7550864, 7551620, 7553216, 8631160, 8632747, 9556700, 9558296, 9562377, 9563406], [6, 154097, 1540223, 1541693, 3081616, 3083205, 4007100, 5855198, 5858017, 6320103, 6321419, 6321993, 6328510, 6329238, 6334026], [6, 154111, 156960, 1697016, 1697611, 1699060, 2776934, 3393074, 4778995, 4780432, 5550367, 5551501, 6167398, 7553503, 7556373, 7557486, 7711451, 11253540, 12639458, 17413402], [11, 770118, 1540048, 5852111, 5854818, 5855779, 5857088, 6473165, 6474166, 7552313, 9092180, 9092579, 9096037, 9096555, 9098053, 9098879, 9100356, 9101035, 9408979, 9409714], [60, 4004153, 4010334, 5242418, 5704327, 6474418, 6476532, 6477797, 6478681, 10174758, 10178356, 10179091, 11718965, 13721056, 14490972, 14491560], [53, 1180, 463140, 464421, 1080316, 2004433, 2928351, 2929177, 2929702, 4007786, 4008780, 4624927, 6164801, 9090871, 9398780, 10014857, 10016502, 10017230, 11403153, 11404574, 11866532, 11867790, 12021708, 13715799, 13716786, 14948877, 15256821, 15257689, 16489556], [6, 154132, 1232076, 1233651, 1849560, 2773623, 2774932, 4315065, 5546960, 5547688, 9707599, 9708775, 11248677, 11249839, 11254697, 11256118, 11258176], [39, 888, 3597, 5085625, 5086206, 9090241, 9091760, 9093027, 9094840, 14176931, 15716784], [18, 924132, 2002041, 2002881, 2618839, 2620253, 2621436, 2622458, 2627876, 4014002, 5399890, 7248009, 8787932, 8789549, 10329402, 11561549, 13101416, 13101841, 14333731, 16951710], [53, 1229, 1541147, 1542575, 2158491, 4160582, 4164215, 4165321, 4166490, 4166929, 5706791, 6784868, 6785568, 8479673, 9403561, 9865636, 9866079, 9867493, 9868536, 9869831, 10793719, 11255831, 12179773, 12181175, 12182638], [74, 1665, 925595, 926729, 929396, 1853508, 2623466, 8475480, 8476054, 12634159, 14174040, 14174726, 14177316, 14178898, 14948814, 17258786], [60, 1343, 617301, 618713, 620346, 2160395, 2161408, 3855487, 3856852, 3858427, 4474357, 4475204, 4478060, 4479019, 4480545, 10486580, 10488484], [67, 1532, 1387413, 3697525, 4929434, 8625504, 9395418, 9396134, 10474064, 10475317, 10476673, 10477849, 12017739, 14327823, 14330679, 14331848, 14338330], [6, 154132, 1232013, 1694097, 1695586, 1696603, 2928496, 2929198, 3699093, 4777198, 4780663, 7090726, 7092182, 8786308, 10172222, 14176273, 14792175, 15870168], [25, 1694146, 3080006, 3234088, 3234804, 6776893, 777762, 779015, 779897, 780709, 781570, 781983, 1705885, 3092004, 4477885, 6941990, 8019913, 8021061, 8024792], [53, 1187, 3597, 4717, 6187, 2624250, 2778187, 5088271, 5704220, 5705496, 5707419, 5707939, 5709150, 5710473, 7250396, 7251950, 7252832, 7253714], [67, 1469, 1574, 2300, 1388204, 5084274, 5854176, 6932253, 6933436, 11245499, 11247410, 5709381, 6941269, 8327374, 8332176], [6, 154090, 308006, 462118, 1232006, 1386139, 1390388, 1391991, 2623886, 2624572, 3086474, 4164607, 5396514, 5397496, 5400086, 5401689, 6633563, 6633834, 7711722, 7712095, 7712956, 8637019, 8638706, 8640176], [18, 1078116, 1848034, 1848762, 1854334, 1854761, 3086640, 3087020, 3087916, 3089239, 4629155, 4630595, 4632844, 4634097, 4634657, 4635231, 4640642], [32, 1540083, 1540538, 1542127, 2466043, 5546085, 5547702, 6625800, 6627606, 12941662, 13711592, 13712579, 14328523, 18486474], [46, 1063, 5746, 6719, 314677, 315832, 1393720, 3395832, 4473734, 7399802, 7861769, 7863197, 7865451, 11253533, 11257168, 11258638], [53, 1194, 771133, 772295, 2004197, 4930239, 4930841, 4932290, 6010199, 6011018, 6012054, 6013074, 7398978, 11711062, 12788978, 12789979, 12793122, 12793794, 12794522, 12795502, 13257460, 13258748, 14028685, 14029714], [67, 1525, 1233413, 1233973, 2157882, 2158575, 2161592, 2162556, 2163160, 9093179, 9094819, 9095645, 9097612, 9098935, 10638802, 12178865, 12180335, 12796426, 13258328, 14798459, 16030328], [32, 727, 616664, 617635, 618498, 619184, 1081093, 1697163, 1697569, 4315632, 4316626, 4932766, 6318661, 6319529, 7551396, 8475494, 8477608, 8478894, 8481248, 9713353, 9716216, 12796270, 13258209, 13259091, 13266182], [74, 1686, 1387581, 1388428, 1391858, 2777968, 2780075, 2781484, 2781911, 2783052, 2786391, 2787714], [6, 154132, 157450, 158710, 159459, 6473527, 7705396, 8629492, 8630796, 9862873, 10170824, 10171797, 10172959, 10173484, 10174534, 10175808, 10637745, 14179820, 14949745, 18491710], [6, 154083, 154475, 1232580, 1235772, 7703800, 8165756, 8167081, 9706983, 9708096, 9708845, 9710294, 10788238, 10789853, 12329750, 16795708], [46, 2310132, 3388076, 3389651, 3392514, 3393522, 3399129, 6787241, 8327106, 8327486, 8328018, 9714158, 11100039, 12486165, 12492332], [60, 1378, 1387301, 1388722, 1390178, 1390584, 2160514, 5856584, 6626507, 9860549, 9862215, 9863356, 10633286, 10634266, 11096196, 13868252, 14022189, 14022740, 14792686, 14793988, 14798069, 14799217, 15723098], [32, 1848097, 1849714, 3543847, 3550686, 6938735, 6940954, 8173066, 8176804, 8177203, 8793147, 8794176], [60, 1322, 2365, 5700393, 5701569, 5702141, 6934045, 11246143, 12478024, 12478458, 13864318, 15250451, 16482318], [11, 616104, 618692, 620248, 620806, 621515, 1545438, 1546404, 1547006, 1548574, 1550639, 2012716, 2013115, 2013696, 3399570, 4785654, 4788174, 6328298, 7406200, 7406923, 8638790, 10178888, 10181562], [46, 1014, 1770, 5853789, 5854825, 5855945, 6163898, 6164906, 7242794, 8936857, 8938178, 8938614, 10324502, 12634621, 14174502, 14175181, 14483123, 14483972, 14486191, 14486723, 10640846, 10642022], [18, 391, 531, 1987, 1233868, 2311980, 3389868, 4775938, 4929917, 4931317, 4931856, 5855959, 6471856, 7395996, 7401610, 7402933, 8942814, 11098891, 11714856, 11716417, 11717866, 13257950, 13258809, 13259343, 13260946], [53, 1180, 2078, 3632, 4486, 928561, 929438, 930432, 933421, 3551524, 4629405, 5399477, 5400324, 6632422, 7094380, 13408441, 14332380, 14333701, 15873556], [46, 1063, 1232977, 1234085, 1235450, 1236724, 1698675, 1699795, 1700803, 3240894, 3244044, 5862100, 5862849, 5864319, 7404242, 7405810, 7408022], [25, 580, 3590, 4623695, 6163616, 6165186, 6627137, 11401193, 12017130, 12018152, 13404073, 13405489, 13407113, 16025092], [39, 860, 1245, 925315, 926974, 927961, 930033, 3548124, 3550539, 3551974, 4321911, 4323024, 4323423, 6171507, 6787472, 6789033, 6790202, 9254321, 10794223, 10795350, 11257315, 15261343, 15262792], [53, 1222, 1387140, 1388435, 2312323, 3082412, 3083751, 3084920, 3091283, 5555346, 5557138, 8791187, 9099124, 9099796, 9100216, 9101175, 9102638], [18, 1078109, 1694020, 2618118, 2621730, 4469779, 4471282, 7243326, 7243765, 7245209, 8169139, 8170266, 8172345, 8172863, 8173738, 8174457, 9406326, 10792403, 10793628, 10795180, 10795714], [11, 616104, 617448, 618701, 619702, 1697826, 1701615, 1703078, 3088959, 4937071, 6168964, 6169701, 7709594, 7710618, 7715868], [39, 860, 1448, 2722, 4934, 621074, 2006997, 2008404, 2009314, 2010894, 2780826, 7092924, 8478852, 8480457, 9712387, 9713843, 10945778, 10947397, 10953102], [46, 2926111, 2927861, 4005994, 5391854, 6161994, 7547889, 7548708, 7549443, 7550612, 8936479, 9860556, 9860983, 9862145, 11094033, 13712089, 13713587, 16793552], [18, 433, 4479, 1082619, 2622486, 4008556, 4009452, 4010747, 4934635, 5704754, 5708961, 5709542, 7095416, 7095857, 8635731, 8636263, 8637152, 8638412, 8639406], [60, 1336, 3086, 773177, 1081156, 1082766, 2468661, 2469508, 2472383, 2473834, 3551764, 3553073, 3558484], [60, 1350, 771280, 772267, 774794, 1698897, 2622801, 4624871, 4626803, 4627375, 5859286, 8631356, 8635122, 8635801, 8636788, 10022879, 10023866, 11563950, 11565000, 11566176], [67, 3696139, 4928027, 4928592, 6006515, 6007656, 6777574, 6778295, 8010232, 8011800, 8013606, 8014894, 8784838, 8786140, 9864049, 9864861, 9866506, 12792611, 14024513, 17566478], [25, 552, 1089, 1315, 1406, 1233476, 1234330, 1234715, 1542666, 5238736, 6008664, 6009688, 7395597, 11707674, 12785569, 14633653, 15249583, 18483548], [53, 1166, 155147, 156596, 162217, 163379, 1395260, 1395645, 1703589, 1704471, 3244324, 4476429, 5092373, 9404408, 9405003, 16026940], [32, 762, 1386678, 1387971, 2311854, 3081959, 3084822, 3085809, 3087601, 3088721, 3090023, 3090247, 3090952, 4323066, 5400975, 5401843, 6633750, 6634767, 7866653, 9252753, 10176641, 11254718, 11255138, 15413096], [74, 1686, 8630, 1702756, 2780679, 6630742, 7400644, 7401043, 7403311, 7404760, 8482641, 8944765, 8948792], [6, 154090, 154783, 616881, 618799, 2774869, 2776332, 3700423, 4316379, 4317802, 4779718, 6165842, 7551739, 7552577, 7554336, 7554707, 7556226, 12638261, 12946240, 12947787, 12949124, 15259243, 16799096], [18, 1078151, 2618034, 4466097, 4774027, 4774587, 5698524, 5699840, 7085749, 7086897, 8010797, 8011352, 8781268, 10629380, 12015289, 12016395, 12017767, 12019237, 13559111, 13559657, 14175615, 14177029, 14179003, 14180410, 14180942, 15566942], [46, 3542118, 4312046, 4313042, 4317457, 4318859, 4320203, 4321064, 5398959, 5399477, 5400366, 9866415, 9867563, 9867799, 10175773, 10177236, 11563138, 11564104, 11564671, 11565406], [53, 4466146, 5852041, 9394132, 9399744, 9400775, 10940684, 10942000, 12327923, 12329342, 12791309, 16795246], [39, 867, 2330, 1388414, 1850365, 6008442, 7086372, 7087625, 7089284, 7090278, 7093281, 7094093, 7095731, 8635829, 8639406], [32, 1848090, 1849112, 1849812, 2619719, 2620302, 4006183, 6162239, 6163289, 11861364, 12939273, 12940115, 13556066, 13557333, 13865270, 16329242], [32, 2002083, 2002678, 2004001, 3543901, 3545063, 4776967, 4777821, 5701709, 6317786, 6318675, 10322703, 10323912, 10325202, 10328051, 13254093, 13255409, 13871514, 14641423, 14641976, 14644216, 14645182, 14645868], [32, 699, 818, 1826, 6845, 8259, 9414, 1087533, 1092335, 2170468, 3556356, 8022405, 8023308, 8024484], [11, 616111, 619289, 620402, 774388, 775956, 1237921, 1239384, 2625307, 2626721, 2628226, 8326268, 8327780, 8329339, 8330361, 8331238, 8337412], [6, 154153, 1694041, 5698104, 5699280, 5700239, 5701464, 5703053, 5707288, 10481323, 10482688, 10483962, 10485873, 11563971, 12179894, 12180573, 12182176], [67, 1532, 1387462, 1389063, 2620946, 2621324, 2621861, 3237989, 4469863, 5393933, 5394808, 5395506, 6165452, 6166726, 6628684, 6629951, 6937923, 6939384, 8325260, 9711344, 10173286, 12945379, 14177246, 15871246], [67, 1511, 4654, 5319, 5464, 7041, 9869, 625946, 626394, 627948, 628837, 630013, 2169873, 2631971, 2634638], [6, 154097, 155700, 617826, 1695770, 8163833, 9395700, 9857805, 9860073, 9861543, 11401452, 11402761, 12634649, 12635223, 13867111, 16177090], [11, 462118, 1232027, 1232601, 2464475, 3542608, 4928473, 5390566, 5391910, 5393205, 6317149, 11245177, 11553114, 14941226, 16327086], [46, 1028, 462986, 464295, 467914, 469235, 2009090, 3703186, 4165118, 4165830, 5243718, 6937832, 8015748, 8016707, 8017596, 8018597, 8021313, 8022767, 9254699, 9256022], [53, 1194, 771084, 2003203, 2927133, 2928253, 3236230, 3237793, 3238626, 3854717, 3855550, 5549676, 5554380, 5555675, 5559560], [53, 1229, 5422, 6152, 12954, 13327, 13460, 14776, 1400678, 5250720, 5251714], [39, 909, 1232783, 2310881, 2926818, 6930916, 8316797, 8317343, 8319765, 8321172, 8321907, 6938441, 6941570, 8327647, 8329297, 8330473, 9870356, 9871026, 10024951, 10487070, 10489716], [67, 1497, 617441, 618575, 1234491, 3698568, 3700472, 5240589, 6164542, 6166159, 7706019, 8168145, 8173010, 8174627, 9714515, 9715362, 9718792], [74, 1672, 6635, 776705, 777552, 2317643, 2625594, 2626560, 2627568, 2627974, 3397904, 3398870, 3399743, 3400585, 4016543, 9098569, 9406487, 10484592, 11254534, 15720480], [18, 1694146, 1698661, 4470738, 5240675, 5241851, 5247290, 5248312, 5253870], [39, 853, 958, 1686, 1387567, 3389686, 4775574, 4776239, 4776846, 4778444, 5856381, 5857816, 6627704, 7859823, 7863596, 7864588, 7866851, 7868258, 7868650, 9870741, 9873100], [11, 770132, 773107, 773644, 774801, 775319, 776187, 776775, 782844, 784111, 785266, 785560], [18, 412, 2491, 1234617, 2774477, 3698610, 3704392, 3705960, 3708389, 3709831, 3714178], [74, 1658, 771581, 772428, 1542351, 1543212, 2621086, 3391175, 3699121, 7395191, 8011128, 8012101, 8013718, 8014108, 8476012, 10016138, 11094040, 11094712, 11095263, 11095790, 11096217, 11097358, 11867281, 11868142, 11873714], [60, 1364, 1079238, 2465385, 4005252, 4005665, 4008843, 4010257, 4011860, 4935937, 4936532, 10172560, 10173400, 11867519, 11871600, 16337558], [11, 770132, 1848048, 1849077, 3388942, 4467040, 5236937, 6161049, 7084993, 7086442, 8164316, 9088400, 9242365, 9243471, 9245130, 9246124, 10016061, 16176012], [18, 924125, 1848076, 1849686, 3235609, 3237044, 3240479, 3240761, 4472670, 4473692, 5859580, 5860264, 6322217, 10172245, 10173911, 10175087, 11714966, 11715640, 11716536, 11717845, 12949733, 13721189, 13722638], [67, 1497, 3891, 4717, 312682, 313963, 929907, 5858005, 5864361, 5865173, 5866489, 5866725, 6174706, 6176176], [6, 154125, 1078074, 1079637, 1080799, 1081385, 2621254, 4007359, 4931282, 4932269, 4934691, 11556712, 11557307, 16177244], [25, 1540090, 1540846, 1542393, 1542839, 1544241, 1544654, 4162745, 4166357, 4167232, 5553127, 5553988, 6631897, 6632756, 7710679, 7711813, 7713250, 9099369, 10023306, 10024559, 10026176], [46, 1014, 2022, 1234104, 1696022, 2928134, 2933776, 2935386, 4321274, 6477344, 6479318, 6480935, 8020788, 9406886, 9868835, 9869943, 9871560], [46, 1007, 1103, 1233168, 1387084, 2619217, 2623711, 3547795, 3549552, 5089643, 5091400, 6785510, 7555456, 7556744, 8326674, 12792744, 13562639, 13562898, 14332842, 14334109, 14336062, 14337056, 14340486], [6, 154097, 155427, 156274, 926211, 5700246, 5700932, 7241051, 7244194, 7244859, 7246056, 11712154, 11718076, 11719334, 11719714], [53, 1187, 617091, 1695175, 1696372, 1697653, 2313555, 2313793, 2315261, 2315851, 3855725, 5395781, 5396691, 12018754, 13096684, 13097951, 13099281, 15563246], [32, 748, 1078685, 1080120, 1850064, 3235980, 4313875, 4314407, 4315394, 5085527, 5089608, 5090924, 5097126, 8023189, 8331147, 8332176], [74, 1693, 1541595, 1542750, 2620666, 2621646, 3083583, 6471681, 7703611, 7705067, 7709750, 7710714, 7711276, 10175395, 11715311, 11716760, 11720946], [25, 573, 2386, 5854442, 6932330, 7548393, 7549884, 7550619, 9090542, 15712472], [67, 1483, 2631, 618755, 1850631, 2928715, 2930017, 2930276, 3700220, 3701480, 3701907, 3703055, 4627006, 4628567, 4630030, 6324093, 6325122, 7865178, 7866207, 7867054, 8636954, 9715080, 11100977, 11101850, 12487747, 12488627, 14028538, 14029714], [25, 580, 4372, 5655, 621585, 3855669, 3859463, 3860877, 4168856, 4170445, 4174792], [6, 154083, 154538, 156125, 1080050, 2006913, 3238850, 3240425, 3856376, 3857650, 4319571, 4320119, 4322639, 5246723, 5554672, 5555661, 6171591, 11558931, 13098826, 13099785, 13101122, 13101827, 14025710, 15257806, 15259271, 17261250], [32, 734, 3436, 4400, 4801, 4776155, 4782980, 4784002, 4788797, 5404874, 5405868], [39, 2310146, 3696055, 7700132, 7704633, 8474752, 9552633, 10476708, 10477438, 10478446, 11556327, 12018444, 13096388, 17870320], [39, 895, 924776, 1848909, 3080825, 3081931, 3082645, 5700701, 5701919, 5703340, 5704824, 5705783, 5706959, 5707496, 6169442, 6170429, 6786366, 6787374, 7865318, 7866879, 7868076, 11872109, 11872993, 15568944], [39, 2618132, 3696020, 3696398, 3697462, 3699009, 3700080, 3701627, 3702649, 5550768, 6936642, 6937020, 6938070, 12020126, 12023304, 12024557, 12025892, 12026559, 12027868], [32, 720, 462622, 1540753, 2772643, 5390748, 5394822, 5395802, 5397279, 8939389, 10479293, 10480420, 10482177, 11560317, 13100184, 15102275, 15718170], [32, 734, 770622, 1848720, 2310692, 2312253, 2313436, 2314444, 3392346, 3393025, 3394325, 3394586, 3396644, 4628728, 4631108, 6479241, 8019108, 8019547, 9559430, 13101500, 13103467, 19417404], [60, 1336, 3583, 4442, 1082318, 2468416, 2930339, 2930864, 2931585, 2932432, 3702334, 5088467, 5094949, 5557026, 5557628, 5559196, 6021112, 7253189, 7255100], [39, 881, 3128, 3853170, 4007135, 4008304, 5394192, 5394913, 6626794, 8166862, 8167305, 15405242], [11, 462104, 924041, 3850111, 3853562, 3853954, 4315856, 5239940, 5393856, 6317996, 7703877, 7704409, 7705767, 7707216, 7711276, 7712004, 7716792], [53, 1173, 2029, 2158141, 2162663, 6627319, 6628388, 6629972, 7399860, 8323956, 8785860, 9709986, 10787916, 10789211, 10792354, 10793031, 10793873, 11717950, 11718650, 13258762, 14336671, 17108636], [6, 154097, 155455, 156876, 618827, 4930925, 6470799, 6471385, 8011247, 9089331, 9397303, 9398722, 9860633, 10476708, 10477123, 10477977, 11401891, 13865942, 14019872, 14020250, 14020845, 14022273, 14024989, 10952024], [74, 1686, 1387595, 1388771, 2928687, 2930101, 2930934, 4931653, 4934012, 6474145, 6478667, 6479521, 7403423, 7404004, 8789864, 10021969, 10024083, 10025406], [74, 1644, 4379, 5809, 621774, 623363, 1547293, 1548448, 2626322, 3550425, 3551897, 9863195, 9865622, 9867192, 9869411, 10947544, 12333446, 12334440, 13104349, 15722328], [18, 447, 5291, 6446, 1084355, 1085202, 1855146, 1856448, 2934357, 2935211, 2938984, 2939950, 2940818, 2941406], [67, 1469, 1588, 2617, 1542519, 1543646, 1545739, 1546607, 1551157, 7403171, 7404522, 7405544, 8791446, 8792419, 9100370, 13258433, 13260638], [25, 559, 1721, 2003826, 3081728, 5391812, 6161714, 8163784, 8164386, 8165989, 9397863, 10321982, 10325867, 10326091, 10327274, 10327981, 10332020, 11872123, 11873868], [11, 616104, 618664, 619632, 620640, 2314738, 3084682, 8320729, 8322801, 8323335, 8631314, 15253356, 15256331, 16026324], [32, 734, 3744, 3853826, 4931728, 6933779, 6934668, 9706717, 10014640, 10938710, 10939431, 15405396], [67, 1483, 2652, 3236771, 3244548, 3246095, 3246788, 4632928, 6018830, 6019845, 7251726, 7252153, 8484069, 14182104, 14182517, 16338482], [67, 1532, 7713, 623783, 624798, 2626868, 2627463, 7863510, 8633442, 12329484, 12483435, 12484280, 12486956, 14027052, 14797012, 14798566, 14798951, 15261047, 15263100], [53, 1215, 1233098, 2465182, 2467093, 3391196, 3393620, 3395188, 3857146, 3858455, 5090343, 5090882, 5093437, 8173549, 9713409, 10637486, 10638018, 12024165, 12029716], [67, 3850083, 3850993, 8933042, 9702965, 9703784, 9704533, 9705954, 9707422, 9708110, 10170066, 14020159, 15560012], [67, 1483, 2792, 618869, 620227, 5548309, 7088220, 7089543, 8629396, 9553522, 10631452, 10632705, 10634168, 11558273, 11560807, 13716926, 15102847, 15104319, 16644172], [74, 1693, 1541588, 1542547, 1542939, 2159023, 2159926, 2161541, 3701424, 5857473, 5858838, 5860112, 5862170, 7556275, 8172189, 10174317, 11714191, 13254268, 13716170, 15410170], [46, 1063, 6061, 7188, 469116, 469783, 470350, 471029, 471918, 473227, 1705143, 1706256, 1706998, 6327089, 7867005, 13411068, 13415254], [46, 1063, 1232984, 1234253, 1235548, 1851637, 1852808, 1853529, 3085445, 7859515, 7862630, 9556756, 10634630, 12328707, 12330044, 14486107, 14487766, 20031710], [18, 924153, 2464034, 2464727, 2467863, 3083954, 3545919, 3547389, 5087277, 5088159, 5095311, 5096720, 5097714], [60, 1322, 1882, 2003952, 2005863, 2006087, 2006689, 2008089, 2008640, 2009076, 2014858, 2016433, 2019100], [25, 1540104, 1542673, 1543807, 2159744, 7087819, 8011744, 8012752, 9090640, 10784724, 11246675, 5709388, 7095267, 7095850, 8481731, 11099787, 11100970, 11101698, 11107410], [60, 1329, 2230, 3828, 1081751, 1082864, 1083753, 1084880, 1086791, 2164910, 2167904, 2168914, 3246795, 4170914, 5248837, 5249971, 5865887, 7714004, 9099915, 13873964, 13875406], [39, 895, 4934, 621025, 6160629, 6160902, 7238811, 7239665, 7243751, 7244871, 7245748, 11403853, 12943713, 13713832, 13716653, 15718632], [25, 1386139, 2618069, 2619518, 3697434, 7547525, 8779448, 8780708, 8781562, 8781996, 10167910, 10169179, 10477123, 10477935, 10479307, 15099370, 16177244], [39, 881, 616776, 1540874, 1543709, 2005821, 2929716, 4931812, 5701744, 5702759, 5708058, 9096142, 10174051, 12946121, 12949166, 12950769, 14182657, 14183189, 14491140, 17571098], [53, 1194, 3252, 3660, 773574, 774311, 2314169, 2776241, 2777613, 2779074, 4165006, 4166602, 5244518, 5245491, 5246646, 6478772, 7864660, 7865339, 7866984, 7868006, 9253866, 10793950, 10794965, 14950270, 14953140, 14954022], [46, 3234130, 4312018, 6006125, 6930006, 7084118, 7854069, 7855490, 8317404, 9549497, 9551562, 9551982, 10629884, 10630603, 11862535, 11863963, 12479870, 13095977, 13099302, 13100576, 13102172, 14642284, 15412172], [18, 924090, 924643, 925182, 927420, 928108, 1390057, 4470087, 4471613, 4473048, 5242936, 6167027, 6167608, 6168931, 7708791, 8170924, 9556845, 9558275, 10174233, 10175647, 10483570, 11869703, 13409584, 13410277, 14026193, 16490172], [74, 1679, 1233609, 1235044, 1237872, 2931935, 2933433, 2934245, 2935715, 4013855, 9707613, 9709013, 9710656, 9711351, 9714858, 9716440, 9718792], [39, 916, 1386837, 1388281, 2312204, 2313210, 3391119, 3391982, 3397608, 3398919, 4630828, 4631843, 5863752, 5864746, 5867868], [67, 1525, 1233413, 1233973, 2157854, 2927980, 2933566, 4781629, 4782236, 4783792, 4784499, 4785017, 4785584, 7095654, 7557626, 7559187, 7560993, 13259049, 13874986, 13875868], [74, 1672, 1079609, 5699630, 5700022, 7394113, 7396325, 7858465, 9398367, 9399501, 10015417, 10015963, 10631928, 10633503, 11249454, 16639398], [46, 1021, 2351, 3170, 4227, 5683, 1237613, 1239041, 1854957, 4473083, 4478828, 7712891, 7715406], [6, 154090, 308006, 462153, 468544, 470091, 470679, 471806, 933715, 1703834, 2781729, 4783841, 4790022], [18, 1694104, 1695399, 2465511, 3389434, 7547476, 7548498, 10320610, 11706533, 11707940, 11708519, 11709639, 12017606, 16329550], [32, 762, 1386671, 5082699, 5083273, 5084127, 6008064, 6009317, 6010806, 6011501, 6627452, 6628712, 6629594, 6630593, 7554504, 11096588, 11100487, 12024564, 12025138, 12026118, 12028176], [46, 1063, 1232963, 1233833, 1240035, 1240586, 2010490, 3396593, 4320511, 7246588, 7248940, 8481029, 8788947, 9405045, 10021003, 10022410, 10023418, 11563495, 11871460, 11872769, 13104664, 13105378, 14183322, 14184792], [18, 924083, 925742, 926708, 927413, 927933, 929550, 2623676, 3701613, 9091683, 10323613, 10325067, 11556964, 11557678, 12635601, 12636756, 13714630, 15408630], [60, 1378, 7111, 2317202, 2320170, 4014296, 5092191, 7710261, 8018219, 8019325, 8020200, 8020921, 9252851, 15258877, 15259404, 16645404], [53, 1180, 3128, 4157, 1544038, 1544724, 1546017, 2316103, 2318056, 2319071, 3550987, 3552107, 3860016, 5554114, 5556655, 5557180, 5557586, 5558258, 5559308, 5560484], [6, 154118, 158535, 160005, 1699870, 1700243, 1700684, 1701951, 1703309, 1704737, 2320672, 2321682, 3399619, 3401033, 3402706, 3404176], [46, 1056, 1078979, 1080085, 1081240, 3235994, 4621901, 4623070, 4626992, 4628273, 5244217, 5245358, 6015274, 8325351, 8327773, 8329201, 13099001, 19104938], [32, 1386132, 2464013, 3080132, 4158006, 4312102, 4313301, 9703350, 10473266, 13707343, 14323273, 17095238], [53, 1161, 1259, 1819, 5436, 6446, 1084383, 1085811, 1701706, 2625797, 2626945, 3705043, 3707269, 3707815, 3710069, 3711231, 4943126, 7407203, 8023168, 8024638], [18, 433, 3280, 4290, 8021, 1086140, 1090039, 2476151, 3708046, 5864165, 7404018, 8790158, 10176060, 13256137, 14180025, 14796130, 15566018], [18, 461, 1540335, 1540888, 1544388, 1545935, 1546334, 2778425, 3394367, 3395522, 4473410, 6167482, 6168224, 11404280, 12174217, 16948168], [60, 1329, 2687, 4115, 620045, 620876, 622852, 624434, 627759, 628865, 629915, 631077, 1862986, 1863868], [32, 2618125, 3542055, 8624144, 10010034, 10010699, 10012316, 10936449, 12168344, 14632463, 16172316], [11, 462132, 1540076, 7546137, 7550010, 9244122, 10014064, 10015326, 10169291, 10170439, 11094376, 15714320], [60, 4158097, 4466020, 6006083, 6007607, 6009065, 7240995, 12785058, 12790651, 14792707, 14794191, 16642170], [6, 154132, 1232062, 5544139, 6776013, 7546151, 9086013, 10164118, 10934006, 11088083, 11089287, 15093315, 15094834, 20484778], [74, 1623, 1700, 463817, 4620531, 10318613, 11858510, 14784573, 14787247, 15557240], [39, 916, 1386802, 1387532, 2773427, 2774288, 3852218, 3853527, 5085422, 5086115, 5088957, 5089538, 6475433, 6476252, 6477134, 9711204, 10481120, 10481785, 10483162, 10484753, 10488484], [39, 2464139, 3696034, 3696739, 4620664, 4621630, 4622638, 6316771, 7856673, 7857800, 7859921, 7861361, 7864240, 14024310, 14031408], [6, 154132, 157744, 4161807, 4777709, 5239793, 5240983, 5242131, 5246065, 5247241, 6787150, 6788424, 6789936, 6791406], [32, 2618132, 3696027, 5852153, 7392048, 7393049, 8316965, 8317812, 9087747, 9088895, 10012806, 10013492, 10475443, 10476563, 10784493, 12324577, 12327608, 12328924, 12334641, 13104734, 13107254], [67, 1525, 1233434, 6931476, 6932323, 7702463, 9242344, 11552421, 12168337, 12168869, 12170171, 13248241, 13249613, 13251055, 14174957, 14175543, 15715398], [60, 4158146, 5544027, 5544566, 6006515, 9240571, 9856538, 9858111, 9860374, 9861627, 9863307, 9864756, 10942651, 13560756, 14638700, 14640301, 14644055, 14644874, 14645868], [32, 734, 770636, 771042, 774815, 3854883, 3856355, 3857237, 5397111, 7553174, 7554042, 10172140, 11250021, 12020161, 13560033, 15254112, 15256058, 19106016], [46, 1028, 462930, 2157042, 2926944, 4005056, 5082930, 6777014, 6777567, 9703665, 10627574, 14169644, 14631593, 14632741, 14635158, 14636747, 14640359, 16796324], [25, 552, 993, 2393, 2484, 1388568, 1390521, 1391662, 1396058, 1397059, 1400685, 1401714], [53, 1173, 2050, 3058, 1080953, 3083072, 3089092, 4629225, 5861113, 5861645, 5863010, 5864618, 7250536, 7251796, 7252643, 8022767, 9254636, 10794734, 11256669, 14182741, 14798650, 14799049, 14802486], [6, 154153, 1694055, 1695224, 3081119, 6623217, 7855091, 8317175, 8319086, 9089198, 9859112, 9859807, 9862360, 9863377, 11095249, 11865370, 12943307, 12944707, 12946079, 12947507, 13563465, 13564914, 14642851, 14644272, 15106216, 15107208, 15877098], [67, 1476, 2202, 3544309, 5084190, 7548300, 8934176, 10628295, 10634539, 10635993, 11867897, 11868772, 13254660, 16334632], [11, 272, 770181, 3080277, 4004188, 6468251, 6776202, 10780272, 11550188, 11550853, 11552008, 12168134, 12172971, 12173825, 12178543, 12179957, 12487901, 14951957, 14953868], [6, 154146, 1540041, 1540867, 1848804, 4620886, 5390839, 5392286, 6470202, 6471219, 7703091, 7703345, 7706047, 7706866, 7707916, 7709190, 8171153, 8172604, 9250527, 13870604, 14948541, 14950011, 16489864], [67, 1532, 6985, 8105, 316056, 317064, 1394994, 1396254, 1396849, 1398319, 2938172, 4478256, 4479320, 4480874, 4481406], [67, 4158146, 4163928, 10477984, 11555900, 11556878, 12018810, 12019501, 12635419, 12636005, 14175916, 14177204, 14180634, 15566634], [18, 1078137, 2310069, 2311490, 2773427, 2774260, 2776017, 3392108, 3394516, 7860614, 7866368, 12332403, 12333747, 12334580, 12337100], [11, 770097, 771294, 772580, 775158, 776740, 779750, 4321853, 5861750, 5862716, 5863402, 7095500, 7557430, 7558095, 7559572, 9099696, 9103870], [18, 461, 1540321, 2156426, 2159408, 3853520, 3857860, 4781951, 4783617, 4785038, 4786648, 5864753, 5869408], [67, 1504, 4654, 5333, 6500, 7216, 1085104, 2471230, 3857132, 8012001, 9551919, 9553375, 10785284, 10786278, 11556201, 14636313, 16176166], [6, 154153, 1694076, 8470125, 9394027, 10934146, 12320027, 12320587, 13244468, 13860545, 13862022, 14786113, 15402008], [67, 1532, 1387399, 2465469, 2467093, 3545170, 3545730, 3702565, 4010509, 4011356, 4781314, 4782931, 6322784, 7554917, 8786819, 8787671, 9711589, 9712415, 9713423, 9713974, 9716032, 10948132, 11718069, 11719175, 11720330], [74, 1651, 617558, 617959, 1233889, 1234708, 1235147, 1236563, 1237613, 7089669, 7093400, 8787540, 8793406], [67, 1504, 771418, 3389525, 3394691, 3396119, 4012014, 4936117, 5552084, 5553636, 5554345, 7402443, 7405558, 8791677, 8794792], [25, 601, 1232489, 3080594, 4158517, 4159637, 4467574, 6315644, 6316988, 6318304, 7704197, 10014255, 10322178, 11246241, 11247417, 13249501, 13253904, 16641862], [46, 1070, 1386958, 4159056, 5236937, 5853021, 6160986, 6162239, 6163310, 6164927, 7704829, 7705935, 7706817, 10478913, 11710845, 11712245, 11713456, 16487400], [39, 916, 1386844, 1388456, 1394693, 7400707, 7402037, 7402597, 8326478, 9712562, 9713570, 11715668, 11718370, 11719334, 11719714], [32, 762, 1386678, 1387943, 1695896, 5545987, 5551314, 12173389, 13713300, 13714595, 13718676, 13719663, 14335593, 17723558], [18, 405, 1588, 2568, 3905, 4007968, 4777917, 4779354, 5549242, 5242759, 6474691, 6476091, 6477099, 7401211, 7405565, 7405817, 8021740, 11101857, 12641726, 14489810, 14492176], [60, 3080083, 3080832, 3082155, 3088852, 3090422, 3552352, 5708401, 5709589, 5710466, 7096394, 7097978, 7101408], [53, 3234130, 4312018, 5390137, 6622027, 6622580, 7392524, 11396557, 11397614, 11399170, 11399583, 11400409, 11708353, 16174318], [53, 1187, 617126, 4313166, 4467105, 6777168, 6778015, 7240120, 7243312, 7244899, 8168810, 8169489, 8170994, 8172247, 8173108, 9559234, 10945101, 11869192, 11870669, 15874634], [25, 615, 1540482, 1540909, 1545571, 1546108, 2008054, 2009062, 3086936, 4011048, 4014380, 4015661, 4631561, 5093696, 6479577, 8635696, 10021596, 10022585, 10638522, 14334571, 14642543, 14643943, 14645406], [67, 1476, 2223, 4314300, 5700183, 5700736, 6470652, 6471378, 7857303, 7858703, 7859585, 11093627, 11094796, 12018915, 12024368, 12025334, 12026356, 12027068, 13105005, 13106330], [25, 1232139, 2464013, 3388153, 4928020, 4928405, 4929728, 4930463, 6470358, 6471378, 7857282, 11091387, 12631261, 12631842, 14017723, 16481702], [74, 1679, 1233546, 1695663, 2619546, 3081658, 3851614, 3853226, 3858938, 5245078, 6630966, 6631657, 7247589, 7248422, 7710331, 8326429, 8942387, 8943794, 9097745, 12793794, 12794221, 12795348, 12797714], [53, 1208, 1079089, 1541231, 3081140, 3082433, 4006379, 4007835, 5239723, 7857793, 7859466, 7861055, 7864989, 7866130, 8636053, 8636865, 8638489, 9254571, 9256176], [18, 447, 6208, 7167, 7293, 8399, 8539, 6014623, 7554546, 7556142, 7560067, 7561229, 8793133, 8793868], [39, 1848153, 3388048, 3389033, 4004944, 5699056, 6776986, 6778295, 8010183, 10166302, 10173001, 10174434, 10944331, 11406429, 12022352, 14640415, 14948380, 19876324], [60, 1378, 1387294, 6007350, 6011725, 6012292, 6016373, 10944443, 10948531, 10949560], [25, 2002125, 2926020, 4158139, 5390053, 5391201, 6315154, 13091161, 13092533, 13093954, 13095254, 13095648, 13557571, 15867550], [25, 559, 308531, 309999, 1849868, 1851380, 3237273, 5855331, 6163240, 6933324, 6933882, 6934549, 6935424, 9861494, 10323445, 10324572, 10326350, 10327043, 10942938, 12329050, 12331899, 12332767, 13564634, 14950781, 16490634], [11, 462118, 465457, 466878, 468334, 1700411, 2008390, 2009951, 2011008, 2012590, 2014949, 2785089, 4324989, 4326165, 5866027, 6482097, 6483124, 9101203, 9103716], [53, 1173, 2036, 1542113, 1544185, 3546276, 3549461, 3550861, 3551405, 4167505, 4783407, 4783701, 6323610, 6324863, 6325864, 7557946, 7711913, 12178011, 12183254], [32, 706, 1096, 1504, 771432, 4159504, 4163900, 7705956, 7707734, 7708448, 8786371, 8787477, 8788651, 8789220, 9867094, 11099192, 11561113, 11561689, 12793577, 12794121, 12025432, 12026111, 12334041, 14952146, 16030020], [60, 1371, 5429, 2161485, 6316197, 8626265, 9242218, 14478246, 14478818, 14479814, 15249758, 15251060, 15256226, 15257500, 15259467, 15260867, 15262330], [46, 1063, 1232942, 2157063, 3388949, 3389532, 4775448, 4776708, 4777758, 4779079, 6318990, 6320264, 6782166, 7860304, 9246173, 10016248, 10170173, 11094276, 11096805, 12636917, 13868784, 15100882, 15102373, 15103535, 16335402], [39, 2156109, 2772006, 2926132, 2930045, 2930892, 3700829, 3701984, 4779921, 4781370, 5859300, 5860574, 5862364, 5863360, 6633248, 7865381, 9097248, 10329337, 10637297, 10638459, 10643716], [46, 1049, 4941, 929074, 2314997, 2316402, 2470327, 3086446, 4164362, 8322453, 9554390, 9555944, 9556994, 9558296, 9562993, 9564022], [32, 1848104, 1850694, 1852311, 3392232, 3393851, 4933739, 4934621, 4941166, 4942734, 4944792], [32, 720, 462669, 4928713, 4929586, 4930610, 6316498, 6317233, 7857107, 9243219, 10475114, 12323184, 12325256, 14019361, 14023769, 18335708], [46, 2926111, 2928666, 7240771, 7247918, 7249204, 8019122, 10483204, 11253164, 17875094], [53, 1208, 1079117, 3697182, 3699275, 3700129, 4624057, 4625233, 6165123, 6165935, 6166992, 6168308, 7554224, 7555540, 14483552, 16023552], [67, 1497, 617392, 2157469, 2158470, 3852603, 5084517, 5085672, 6163553, 6625695, 6632835, 6633976, 6637266, 7561336, 7562176], [67, 1518, 1079392, 2619504, 2622367, 7550456, 8936325, 9552402, 9553396, 10477522, 11555396, 12479473, 12480803, 12481349, 13097251, 13559328, 13713279, 17409244], [11, 462111, 1078053, 1079187, 1695119, 1695938, 1696323, 2620456, 4006372, 4007644, 4008808, 7242892, 8012836, 13402871, 13404229, 13405692, 14791608, 14792868, 14793624, 14795183, 14796795, 15720788], [6, 154125, 1078053, 1079187, 1080687, 1082115, 1085153, 7245237, 8785146, 13867174, 13867881, 13868434, 13871934, 20493864], [6, 154146, 158955, 2007046, 2010238, 2011785, 2012324, 3244408, 3245122, 6479213, 6482328, 8022454, 9100384, 9101560], [53, 1222, 1387098, 3389203, 3392822, 3393788, 3547718, 5395830, 6473753, 11863802, 12325753, 16945704], [18, 419, 2666, 3632, 4668, 5634, 6208, 7188, 9316, 10931, 1550828, 1551787, 1552193, 3862277, 4478172, 6018249, 6019754, 6020713, 6022176], [60, 1329, 2365, 3520, 1081408, 2775513, 3699457, 3700899, 4624801, 6780906, 7858780, 8474878, 8477739, 8478560, 8479407, 8941510, 9711400, 11405540, 12791428, 15409400], [11, 616083, 617140, 6315168, 2162390, 2163972, 2933921, 2935337, 2936492, 3552616, 4938499, 6786595, 7710541, 7711962, 8173934, 8175507, 8791474, 14181516, 14951453, 14952601, 15876482], [32, 755, 5585, 6446, 1084348, 1085048, 1088527, 1089675, 2013577, 3553680, 3557014, 10795056, 10797716], [18, 433, 924363, 5852419, 5855896, 5856857, 5858180, 5858621, 7398544, 7400161, 8940084, 8941673, 9865580, 12021678, 13099594, 13100569, 13101150, 13102445, 14026347, 15874326], [67, 1539, 1541441, 1542547, 1542967, 5085051, 6008946, 8011058, 9088960, 9089646, 9551548, 10167660, 10170817, 10171692, 11557573, 11558147, 11563460, 11564748, 12334636, 13874713, 13876176], [25, 566, 462531, 463938, 464505, 465317, 465861, 1081968, 1851877, 3853961, 4469891, 8935975, 9859926, 9861501, 10477445, 15405396], [32, 727, 3408, 1697534, 3083448, 3084773, 3091115, 5093197, 5709164, 5710744, 6480697, 6482137, 7406069, 7407245, 8947168, 8948638], [67, 1469, 1546, 463686, 1849595, 1850736, 2620659, 2621534, 2626490, 4628616, 6014511, 6015351, 6631316, 6632926, 8018842, 12330884, 12792786, 14024896, 14794842, 14796095, 14797586, 14798286, 14801100], [39, 860, 1406, 925469, 927128, 928122, 1698010, 3392101, 3393606, 3394887, 4010801, 5550894, 5554233, 5555668, 6325563, 7403682, 8481626, 8483220, 9561101, 10023243, 10029102], [53, 1208, 1079103, 2619210, 2623158, 2624754, 3702642, 3703041, 4319006, 4320567, 4628546, 4630107, 4630653, 7248779, 8788700, 8790256, 8944179, 9406289, 10330221, 10331341, 10639285, 14027334, 14181271, 16799250], [46, 1056, 1078958, 3697056, 4774993, 4776435, 4780845, 12018894, 12788838, 12790119, 12791568, 12791979, 12795404, 14181523, 14185562], [60, 1343, 617308, 618862, 619555, 1543674, 2621597, 6933625, 6934528, 6935809, 6938644, 8478770, 9864630, 11558742, 12328658, 14792714, 14793617, 14795073, 16026940], [60, 1378, 1387294, 1388610, 2774498, 6008610, 7394540, 7396129, 7399888, 7400595, 8324546, 13560595, 13563316, 13564879, 13566076, 13567399, 15107315, 15108638], [46, 1021, 2337, 1850463, 3390330, 4930421, 4933242, 6011361, 6015442, 6016422, 6019306, 6020564, 6021294, 6022176], [46, 3542153, 3548936, 4473013, 4474516, 4475519, 5399428, 8325484, 8325890, 8326569, 8327148, 11715199, 12331136, 12332165, 13872072, 17106018], [53, 1229, 1541126, 4929203, 5853091, 6623210, 7701098, 9087175, 9088839, 13708855, 13710381, 19100318], [6, 154097, 462062, 463350, 467002, 468586, 1238530, 1239818, 1243143, 6171218, 7249113, 7249654, 7711605, 7712746, 8482676, 8483642, 8484356, 11102468, 12488391, 17262328], [74, 1686, 6992, 8301, 1240224, 1241526, 1244856, 1246412, 1247406], [25, 580, 3548, 619688, 2005569, 4007651, 4623597, 4624738, 4627902, 4628896, 5398840, 11250875, 11251876, 11252254, 11252996, 16334940], [60, 1378, 1387294, 1388582, 2158498, 4776582, 5546484, 6778617, 8318510, 8319520, 9397429, 9398304, 10784171, 11246255, 11247403, 12017487, 12325452, 12326733, 12942635, 13866752, 14944633, 15560628], [67, 1511, 925448, 926743, 1850652, 4468729, 5084680, 5085996, 5090950, 5091337, 5092513, 5093381, 6325255, 6325514, 7095416, 7095801, 7097306, 7098620, 8484552, 8486022], [74, 1630, 2330, 1696393, 1696785, 2158918, 3544785, 3545028, 3546801, 3547340, 4009291, 4010432, 4780376, 4781657, 5397585, 5398406, 5399001, 10481015, 10482394, 10483976, 10488330], [67, 1504, 4668, 5683, 1237606, 1238880, 1240168, 2164245, 2165274, 2165967, 2781876, 4167951, 4168842, 4170107, 4171136, 4172167, 4178026], [74, 1686, 1387574, 1388274, 2158223, 2159653, 2162033, 2162605, 3394523, 3395650, 3398506, 6170583, 6786490, 6786912, 7864842, 7866151, 9098018, 10484144, 11562039, 11562627, 13102508, 15566480], [39, 860, 1245, 771378, 2157259, 2157784, 2311763, 2313210, 3391119, 5701226, 5708170, 7402247, 7403591, 10945689, 12177556, 13409696, 14795570, 16181556], [6, 154146, 1540027, 1540580, 2310475, 2772613, 4312524, 4313777, 4315093, 5393177, 5701142, 5702430, 6472330, 8166423, 8782346, 8783053, 9706955, 9707520, 10785408, 12479543, 14019408, 15097473, 15098971, 19564936], [11, 265, 3093, 465226, 1851156, 1852764, 3238696, 3240285, 4164236, 4165851, 5705748, 9401825, 9405752, 9406711, 9408328, 10948468, 12334391, 12335714], [32, 748, 5242, 1083326, 1083921, 6319984, 7397879, 9707970, 9710959, 9711512, 10481435, 10482317, 12022170, 13716303, 13720496, 13720902, 14490804, 15722790], [39, 895, 924825, 925952, 1387908, 1389205, 2313098, 2313478, 2313870, 3699994, 5085856, 6009940, 6010486, 7088619, 8628500, 8629186, 8631440, 13097494, 13559454, 13560763, 14792679, 14793841, 14798699, 14800022], [74, 1693, 1541588, 1542561, 1543100, 3237170, 3237891, 3238752, 4316675, 4317851, 4322387, 9404422, 9866366, 14640401, 14641892, 16797864], [6, 154111, 770027, 770566, 1232496, 4158587, 5082517, 5083672, 6161588, 10627644, 10629590, 10630603, 11862486, 11862878, 12324836, 12326094, 12326523, 12327671, 13251559, 13251853, 14791741, 14792616, 16178476], [18, 1694125, 2618048, 2619049, 3542993, 3544449, 3548026, 4934096, 5088047, 5088859, 5089468, 5091027, 5092016, 6786163, 8326077, 8327479, 8328326, 9714431, 10330331, 11100452, 12178347, 13718466, 15104375, 15105551, 16645404], [67, 1483, 2848, 5854888, 6624806, 6625534, 6631729, 7863806, 8325715, 9095848, 10481708, 12175848, 12180650, 14950284, 15720172], [46, 3080139, 4312039, 6468151, 8008048, 12474097, 12475084, 13707168, 13708022, 14940106, 14942353, 18022318], [46, 1021, 2174, 1696295, 1702047, 4012098, 4012812, 4013491, 4321421, 6477505, 6480942, 7867075, 9099005, 9100461, 10332363, 10333210, 11103133, 14645231, 14650334], [32, 727, 616636, 617077, 2156951, 3851056, 4928958, 4929642, 5391574, 5392307, 6932162, 8010281, 8934183, 10936288, 10940026, 12326129, 12328525, 12329673, 13253589, 15717554], [60, 1371, 1233245, 1695315, 1695700, 2157791, 2465742, 2466750, 3544694, 9704701, 9706344, 11092402, 11092850, 17868780], [18, 1078151, 1082962, 1083676, 2161585, 5241639, 5549557, 6627676, 7705585, 10785683, 12017571, 12018096, 12019132, 15407090], [18, 1078116, 1848055, 1849161, 1849854, 2619945, 2620818, 2621842, 4007709, 4469828, 4473438, 4474434, 5244343, 5244901, 6168812, 6169533, 7401442, 7402464, 8788352, 10636450, 10329738, 13717857, 15257729, 16643710], [46, 1021, 2631, 2904, 1080827, 1081975, 2005926, 2007487, 2008369, 2009531, 3241398, 4627538, 6013419, 8477496, 8939398, 10325496, 10326952, 11713078, 8945159, 8946594, 9716489, 10794615, 12026531, 16800482], [32, 699, 839, 5698914, 7084825, 7085945, 7393889, 7394701, 7396073, 7397480, 7398334, 7398724, 7400658, 7401379, 8633288, 8634289, 8638706, 8640176], [6, 154083, 154517, 1540237, 1540655, 1541539, 3081399, 3697490, 3699597, 3700752, 4778647, 6164750, 7242680, 7243949, 7245706, 8169804, 8631720, 8632091, 8633769, 8635178, 8636235, 8637663, 8640176], [6, 154097, 462069, 4774090, 4775147, 4776603, 6008505, 8318608, 9704526, 9705800, 9707291, 14019340, 14021902, 14022931, 15562784], [46, 1077, 1540986, 6931021, 7238958, 7239686, 8625546, 9087637, 9395616, 9397191, 10013121, 12785163, 12786498, 12787235, 14327107, 14327690, 14333759, 19723710], [25, 601, 1232496, 1233224, 2619126, 7085182, 7086946, 8473072, 9858974, 9859975, 9863727, 9864266, 9866205, 9867087, 11406968, 13255045, 13870945, 14487080, 15872940], [74, 1651, 617565, 2003623, 2004162, 3082309, 4622232, 4623800, 5085702, 6163814, 6933723, 8935835, 10167709, 10783849, 10791115, 10791696, 12177603, 12178711, 12180195, 14028321, 15568174], [25, 1540125, 2464027, 5082083, 5082678, 10472720, 10934636, 12628727, 12631457, 12632864, 12633893, 12634726, 12636637, 13098770, 14484679, 19104630], [18, 1694132, 2772006, 2926118, 3696027, 5852111, 6468032, 9086090, 9240041, 9240923, 9247755, 13867816, 14637755, 14638924, 16024784], [6, 154146, 1540055, 1541231, 3081126, 3082099, 3390027, 2006906, 2012513, 2013339, 2014207, 2015054, 2784949, 3555054, 3559408], [32, 734, 770664, 4312755, 5544685, 11088706, 11089434, 11090442, 11095419, 11095979, 11099575, 11100095, 11101278, 11101971, 11103868], [46, 1049, 924972, 5545012, 5699000, 5700547, 5701765, 5703233, 7243151, 7244579, 7860537, 7861972, 7864539, 7865941, 7866830, 12332928, 13718809, 15874788], [6, 154104, 155238, 1541322, 1541754, 1543037, 2158988, 2160241, 2161256, 3239326, 3240355, 6320404, 6474327, 7244439, 8168320, 9246467, 10786390, 10788000, 12173860, 13097937, 13099309, 18181246], [18, 1694132, 2772006, 2926090, 2926657, 2927509, 3851462, 10473537, 12013427, 12014239, 12015597, 12016703, 12018061, 16638012], [67, 1539, 1541448, 6469476, 6469875, 6470442, 7548351, 12014421, 12630323, 12630566, 12631905, 12633074, 14018990, 14020250, 14021244, 15253391, 16793244], [53, 1173, 2008, 618155, 2158008, 2774120, 2777606, 2778901, 3702831, 8476894, 9246810, 11402929, 12942824, 16484782], [46, 1063, 1232977, 1234090, 1234806, 3544883, 3547592, 3548607, 4780530, 4781853, 6321732, 6322427, 8322971, 8323804, 8325134, 12329169, 12330541, 12331983, 13255934, 13257488, 13257908, 17107866], [6, 154118, 924013, 924284, 2002186, 2002923, 3542781, 3543042, 4312951, 4313483, 4314533, 4315961, 4318019, 5396124, 5399400, 7093533, 8325442, 8326436, 9096343, 9096877, 9098340, 10022410, 10023264, 11563353, 11564825, 11565560], [32, 713, 1770, 5853789, 5854631, 6932722, 7394673, 7395800, 7857709, 8935821, 9859737, 9860605, 11092486, 11092899, 12016829, 12017984, 13095921, 13097349, 13713293, 13714406, 13715449, 13716604, 14794520, 14795486, 14796184, 14796592, 15566480], [53, 2772132, 2776792, 3854911, 5086836, 5088103, 5396019, 6012159, 7552068, 7553356, 7555741, 7556604, 8634513, 8635339, 8943283, 8944116, 8945432, 8946167, 8953258], [18, 1078151, 2618034, 5698132, 6776006, 6930139, 8162055, 8163161, 8164029, 10012155, 11552064, 11553324, 11554192, 11554913, 12786808, 14634869, 14635858, 16021858], [11, 462083, 462648, 463357, 1387238, 2773329, 2773917, 2775331, 3083261, 3083779, 3084519, 3085681, 4317564, 4317963, 4320649, 4321225, 4325768, 9099789, 9101259, 10179371, 11103315, 11104638], [11, 770139, 2002055, 2003217, 3235138, 3236393, 3237114, 5701177, 5702071, 5703522, 6781438, 6782467, 8322341, 8322885, 8938831, 13096887, 13100359, 15564324], [39, 895, 924804, 3234860, 3235392, 4775525, 6007441, 6008617, 7548512, 7549485, 7857464, 7859011, 7859858, 9245940, 9246390, 16484320], [67, 1518, 5422, 6103, 8056, 9078, 15287, 16022], [74, 1686, 1387567, 1388127, 1392810, 1393482, 1394539, 1395953, 1397164, 1398779, 2938648, 4016767, 5248697, 5250146, 6328041, 7868125, 8484055, 12950097, 12951406], [53, 1229, 1541084, 2773231, 2779909, 2781050, 2783626, 2785208, 2788638], [74, 1637, 309567, 2773691, 4313560, 5237686, 6623574, 6624281, 7548181, 7548722, 7550808, 10476927, 12016815, 12017627, 12018985, 16176936], [18, 1078095, 1079728, 1080463, 2620316, 3544414, 3546213, 3547354, 4317242, 5395389, 6935291, 6936460, 8322327, 8784430, 9554369, 13250446, 14328369, 18640320], [39, 853, 937, 463049, 467704, 1699844, 3085774, 3087370, 4165286, 4166294, 5244168, 6168252, 6168950, 6169372, 6173145, 6174314, 7560230, 7561406], [11, 770104, 1232013, 1848083, 1848825, 7546888, 7549744, 11553807, 11556670, 11557629, 8789591, 8790445, 9714396, 9716006, 11101873, 11102111, 11410090, 11411560], [53, 1229, 1541147, 1542547, 1542939, 2313023, 2314031, 2314584, 3084526, 3085781, 3086488, 4318584, 5088544, 11402586, 12172474, 13250607, 13255766, 13257075, 14489005, 18646942], [6, 154097, 155259, 155812, 925714, 2927805, 2931305, 2932740, 3702670, 3703650, 4165566, 5859664, 6629559, 7707650, 7710205, 7711066, 8788940, 10021038, 10483010, 10484627, 12024529, 12025677, 12949593, 12950426, 13412328, 14952419, 14952944, 16492944], [18, 924146, 929305, 930759, 2162642, 2163069, 3394936, 4319076, 4325299, 9253383, 13254478, 14640604, 14644508, 14645196, 14646946], [32, 699, 811, 1644, 3604, 4899, 928850, 930418, 932231, 933701, 939868], [74, 1651, 2939, 1081051, 2004988, 6163037, 6778937, 7395065, 8627002, 8628619, 10168486, 11862605, 13094500, 14942561, 14944180, 16638166], [46, 1070, 1386965, 1387798, 1390022, 2622108, 2623585, 2624397, 2625594, 2626581, 10936659, 10937485, 10938010, 12632115, 12634530, 12635825, 12640191, 12640767, 13872676, 17414634], [6, 154146, 160068, 4934131, 5858073, 10016089, 10017748, 8634121, 9250058, 9251080, 10637008, 10638620, 10643100], [18, 924097, 925742, 926715, 928332, 2314395, 2315310, 2316866, 2470796, 4472922, 4478382, 4479635, 4481105, 5405194, 5406638], [53, 1173, 309140, 5391166, 5391924, 5393478, 5394521, 5395669, 5399876, 6785967, 7401930, 7403542, 8789472, 8791026, 8791927, 8793364, 9563252, 11103357, 11719313, 11720638], [11, 462097, 463441, 5237518, 6315406, 7855497, 7858381, 4324718, 4325579, 5865661, 6481600, 12179698, 13565572, 14181642, 14182678, 14183560], [32, 706, 1462, 3009, 3135, 4241, 4379, 5788, 6514, 7482, 8063, 5706105, 6014019, 6476105, 6478044, 9096121, 9712023, 10790128, 11560016, 13254121, 13256340, 14950431, 14952643, 15722636], [18, 616132, 1694034, 1694720, 1697247, 2621324, 2622206, 7550255, 7551242, 8629354, 8632691, 10018770, 11404637, 12482749, 12486394, 12488006, 13873873, 14489957, 14491868], [6, 154139, 1386013, 2156109, 2772048, 7546088, 7546629, 8624727, 8626778, 10012862, 10013562, 10013975, 10018056, 10019085, 11558971, 11559841, 12791722, 13869785, 13871318, 13872935, 15412788], [32, 699, 776, 924895, 1848846, 9548895, 10472783, 11088921, 12628783, 13552888, 14322802, 14323483, 14325121, 14325947, 14326829, 14327935, 14329440, 14330399, 14331904, 17565862], [74, 1658, 4822, 4008857, 4010495, 6012607, 7244495, 7245048, 8015006, 8016581, 8018534, 8019829, 8943710, 10175801, 10483745, 13717829, 13721406], [32, 1848083, 1848811, 1849644, 1852220, 1853522, 2931431, 2932285, 3856208, 8014257, 8015144, 8016413, 8018212, 8019206, 8789101, 9867199, 10483148, 10484417, 10792347, 10792907, 11716851, 11718291, 12642230, 17416174], [32, 699, 825, 5236916, 6622818, 6623798, 7085742, 7086713, 7394694, 13862722, 14324638, 14325014, 14325548, 14941639, 14942808, 17252780], [46, 1070, 6082, 7697, 1547566, 1547993, 2779923, 8477972, 9247888, 12327993, 12332655, 13872718, 13873278, 13873957, 13875320, 16799866], [53, 1166, 1609, 3079, 1542946, 2775065, 4006939, 4623042, 5392974, 5393940, 5394493, 7704584, 8474484, 8474885, 8476978, 12943055, 13866992, 13868266, 13869722, 13870149, 15102030, 16334016], [39, 902, 1078818, 1079819, 1083571, 3085674, 4163590, 4164621, 5704544, 5706161, 7246077, 7247519, 8171414, 9403505, 10019461, 10020933, 11560807, 13562884, 13564326, 14950403, 14951922, 14953217, 14956332], [32, 1386132, 1390787, 2468899, 2472231, 2473687, 3705561, 4321694, 4328792], [6, 154146, 159254, 159697, 1699620, 1701209, 2625095, 3241188, 3242021, 4320161, 4324228, 4325502, 4787404, 6173488, 6174503, 8022559, 8023406], [39, 881, 3287, 4449, 1236332, 3084465, 4624360, 4625347, 5241263, 7243368, 8321270, 8321977, 8326667, 8327542, 9713416, 11099521, 12023472, 12025054, 12795005, 12796412, 12796951, 13259042, 13261254], [53, 1208, 1079138, 1080449, 2312351, 2313189, 2929107, 2929651, 2931758, 2933013, 2934518, 2935547, 2942176], [39, 2926083, 2927574, 2928281, 2931599, 7859662, 8629620, 8631188, 10018693, 10020163, 11560049, 11560877, 11868791, 12638933, 14178793, 14794926, 14801100], [25, 545, 657, 2618704, 2619455, 2620860, 2774799, 2775331, 2776955, 2777501, 3393403, 4163508, 4933417, 7243508, 8013424, 8014157, 9554054, 13250117, 13251923, 13253351, 13256550, 13258118, 13720027, 14182118, 14644062, 14645042, 14646176], [32, 741, 924678, 925966, 1695896, 1696876, 1699256, 2623319, 2624495, 4780558, 4781587, 4782469, 6322350, 9248413, 9556343, 9556866, 9710805, 12174931, 13714805, 15870784], [53, 1201, 925105, 2927210, 4005147, 4006601, 4010964, 4011678, 5089622, 5091225, 6323106, 6939183, 6940072, 6941325, 6942200, 6942872, 6943411, 8021502, 8022676, 8023560], [60, 1329, 2946, 3350, 773261, 2313345, 2316474, 3394607, 4626495, 4627069, 5858999, 5860413, 5862385, 5863857, 7403752, 7404760, 8482704, 8484263, 8792237, 8793560], [32, 706, 1427, 3389532, 4775413, 6161495, 6164024, 6164437, 7088367, 7089529, 7094231, 7095640, 7096669, 7097500, 7098636, 8638762, 9716657, 9717229, 10949105, 11719196, 12181147, 12182176], [11, 770125, 772806, 773471, 774360, 775333, 776822, 7700916, 9086818, 12474909, 12479858, 13865942, 13866628, 14944710, 14945097, 14945321, 14946796, 15870784], [18, 924083, 925714, 2465812, 2468528, 6472556, 6473305, 6474705, 6475776, 6477330, 6477713, 7247785, 7249003, 7250431, 7252811, 7253350, 7255100], [60, 1343, 3555, 773658, 1543604, 6625660, 6628663, 6629494, 7091454, 11865482, 11866196, 14484250, 14638203, 14639078, 16024938], [46, 1070, 1386972, 1387964, 2157889, 2158729, 2161242, 3239347, 3855312, 3856922, 5242817, 9708873, 10016817, 13250894, 14020803, 14021335, 14329305, 14330728, 14332695, 14334095, 14335621, 20803558], [6, 154146, 1540013, 2464083, 2465770, 2467338, 2468822, 2469795, 2471090, 4165209, 4169416, 4169787, 4170998, 4172251, 4173406], [74, 1651, 617614, 619226, 623930, 625498, 627619, 629054, 1398977, 5865089, 12943461, 12944931, 14484826, 14485799, 14486989, 14488151, 15720018], [46, 1077, 1540979, 1542155, 3082022, 5084141, 6316043, 6316890, 7086841, 7088262, 7090047, 9554103, 9862082, 9863650, 10325552, 11865662, 12635580, 14945678, 16023552], [11, 272, 770230, 771847, 2311735, 2312568, 2314948, 2315345, 2316852, 2318462, 2323712, 3863824, 4633773, 4635196, 5097098, 6637182, 6791154, 6792330], [67, 1497, 3604, 4871, 312822, 313795, 621732, 622460, 2008341, 4626404, 4780348, 4781020, 4934936, 5859083, 12787928, 12789496, 12790952, 14023057, 14946959, 14947526, 14952664, 17108636], [60, 1357, 4514, 5534, 11143, 11092290, 12170192, 14172288, 15250183, 16790164], [46, 1042, 770951, 2619035, 2621716, 2622122, 2625468, 2627064, 2632083, 2633406], [25, 559, 2036, 2757, 1234680, 1235961, 1238985, 5397020, 5398042, 8940105, 8942044, 11406121, 12022072, 12023325, 12024669, 13410151, 13414638], [25, 608, 1386524, 1387812, 1390647, 3700738, 3702943, 3703179, 4011097, 4473237, 6013146, 10325216, 11403132, 11404124, 12174021, 12790126, 13560047, 16024014], [18, 1232146, 2618041, 2618916, 4004832, 8624860, 8625742, 8626708, 8627548, 9243660, 10013597, 10014773, 11554659, 11555487, 11557139, 11558301, 12790196, 12790929, 14330826, 17410784], [60, 1350, 771294, 772601, 2004533, 2006003, 3545919, 3547326, 3548369, 3549503, 3551932, 3553479, 3554067, 7404095, 7405411, 8483481, 8484370, 8485348, 8947315, 14953355, 15569252], [25, 559, 308482, 308921, 1848797, 1849322, 2003278, 2004281, 2928197, 2929051, 3852995, 3854465, 5394337, 5394913, 6626780, 7242864, 7243928, 7245482, 7399412, 8939545, 10479405, 11403482, 11404033, 12944147, 14176077, 14177533, 15409400], [32, 720, 462655, 2926755, 4158678, 8008760, 9394643, 9395210, 10473126, 14323224, 15709084], [32, 2156123, 3080069, 3081525, 3087706, 4011839, 4016354, 4017033, 4018223, 9716300, 10794195, 10794769, 12026636, 13566769, 13570640], [25, 580, 770538, 772148, 2158022, 4160113, 2006850, 2008411, 2010336, 2010714, 2011561, 2627666, 3397573, 3398093, 3398835, 7094891, 7710842, 7712165, 9252046, 12332144, 12335714], [46, 1007, 1138, 2456, 1388351, 1389198, 1392390, 1393965, 2009888, 4165958, 4168037, 6786128, 7556079, 12792149, 14024016, 15718016], [32, 741, 4640, 5032, 466939, 929018, 929403, 1699536, 3085403, 4009536, 4015920, 4017194, 4018524, 7868580, 7870330], [11, 272, 3002, 4577, 7244, 1239356, 2009265, 3549361, 4473244, 5705375, 5708546, 5710158, 7096088, 7097684, 8175607, 12949670, 13719579, 13720153, 14952090, 14953560], [11, 300, 1386167, 2310258, 2311763, 2313210, 3391147, 3392612, 4778500, 7550563, 7551415, 8783473, 8784663, 8785508, 9555419, 9555951, 9557141, 9558247, 9559906, 9560900, 10330851, 10332265, 10333315, 10334638], [32, 2002090, 2002993, 2004461, 3544351, 6778463, 8318386, 8319961, 8935905, 8937053, 9860969, 9861781, 9863466, 9865036, 9867626, 16643556], [53, 1173, 309091, 771189, 1387126, 1388106, 1390675, 1391830, 1395750, 1396723, 1398396, 13861483, 13863142, 13864444, 13868385, 13869827, 14793743, 17257708], [67, 1532, 1387392, 2927488, 2928638, 4160722, 4622624, 5854708, 5855086, 6625224, 8011128, 8012122, 8782017, 9860150, 11246059, 11247165, 11248355, 14174465, 15714320], [6, 154132, 1232069, 1233490, 1695427, 1696288, 1701923, 1703393, 3243288, 8017377, 9249267, 9249834, 10327736, 10328401, 10329584, 10330270, 10792200, 13256284, 13259273, 13259714], [39, 860, 1595, 4621658, 5391616, 5393177, 5393744, 9089814, 9859772, 9861373, 11093249, 11863347, 11866336, 13098462, 14484343, 15870322], [74, 1637, 3259, 3842, 1389730, 1390416, 1391557, 2315634, 2316332, 4010453, 5242390, 11556418, 12018320, 13096430, 13866362, 13867363, 14791258, 14791692, 16177552], [60, 4774104, 4775882, 4776561, 5084517, 5085637, 5393569, 5394108, 5396334, 5396747, 6320654, 6321391, 7861270, 7861965, 8477888, 8478595, 9402476, 10326609, 11558504, 11559211, 12483104, 12483519, 13407456, 18643400], [39, 881, 3716, 927842, 2313751, 2314857, 2315725, 3855802, 3858168, 4782299, 6014182, 6014602, 7092497, 9248567, 9249932, 9251535, 10483458, 10484725, 10485866, 12025990, 13103892, 13104566, 13105560], [18, 924083, 925742, 4621791, 4929742, 8317805, 8933707, 9703819, 10627735, 10628554, 10629100, 12015175, 12016850, 12018416, 12480383, 12481797, 12482350, 12483043, 12485591, 15411556], [53, 1166, 155154, 156736, 160388, 161951, 469888, 2933942, 2934329, 4012406, 4012978, 4013953, 4321862, 6016002, 7401895, 7402709, 7404037, 7404571, 7712522, 11408585, 11412022], [6, 154153, 160978, 161993, 1393888, 4166007, 5705874, 5706259, 5707911, 5709017, 5710242, 5711850, 7097768, 7099042, 7561007, 7562330], [39, 867, 1868, 1387936, 1541896, 1542923, 3082827, 7394897, 7399412, 9093531, 10325398, 11711538, 11716970, 14797075, 16028942], [18, 1232111, 1848069, 9086146, 10472020, 12166097, 12167252, 13553385, 15093266, 18019238], [32, 762, 6514, 7517, 931433, 932280, 1702217, 1703337, 1704506, 1705185, 1706331, 2476473, 4016382, 4017691, 4021562], [67, 1469, 1616, 6315644, 6317569, 6318129, 6323141, 6324261, 6325934, 6327544, 7713432, 7714104, 7714531, 7715560], [18, 1232097, 1232930, 2927035, 3542965, 3543833, 4775705, 5391847, 6931705, 6932001, 8471861, 8472127, 8475095, 9245165, 9246838, 9248152, 10634063, 10635218, 11713134, 11714149, 12946079, 12947549, 14487414, 14487822, 15257771, 15259180, 15413096], [32, 769, 1540622, 2618746, 3696641, 5082713, 5390650, 5391322, 5392064, 5393336, 5395312, 5396866, 5397251, 6167335, 6169253, 6169505, 6172081, 6173537, 7405439, 10485516, 11255460, 11256781, 12796678, 17724636], [67, 4774125, 4777924, 4779501, 5395464, 5397027, 5398546, 12328595, 13252546, 13254142, 14332079, 20800016], [53, 1187, 617147, 618575, 621102, 1853179, 2161130, 2162159, 2167318, 8789325, 8790522, 8791530, 9869453, 13719537, 14951411, 16029404], [6, 154104, 155861, 925945, 927149, 928589, 1852493, 3700619, 5240477, 5240773, 5247731, 5248312, 6634186, 8328261, 8329290, 8330265, 8332176], [32, 713, 2505, 3343, 619261, 619784, 620388, 621940, 622670, 623657, 625876, 626280, 1396226, 1397493, 1398382, 1399635, 1401105, 1401357, 2017299, 2018330], [6, 154118, 924013, 924242, 1078174, 2310307, 2316040, 5396089, 5396936, 6321020, 6321405, 7245503, 7861398, 9247475, 9249104, 9249484, 9250513, 12638576, 12639878, 13871941, 13873453, 13874566, 14028552, 14030022], [67, 1511, 5256, 1391361, 2315247, 3085319, 3086075, 9246110, 9248630, 10942728, 10944786, 12176891, 12792849, 12794312, 14180186, 15412172], [32, 741, 924678, 925931, 927618, 929200, 1699109, 1699655, 2315585, 4779655, 4781468, 4783029, 4784681, 4785801, 4787005, 4788419, 4789868], [67, 1490, 2939, 3226, 1389114, 1389828, 2467730, 5239793, 5240990, 5242313, 6782220, 6783517, 7707417, 7707937, 7708840, 7710100, 7710856, 7712417, 7713628, 7715189, 8023119, 8023560], [46, 1077, 1540972, 3697014, 3697733, 3698603, 4930505, 8010554, 8011100, 10013170, 10013758, 10015081, 11554969, 11555807, 11558371, 11559526, 11564083, 11565406], [67, 1504, 771446, 772757, 2004673, 2005821, 2009433, 5705517, 5709927, 5711397, 7251283, 7252111, 7253315, 7254638], [6, 154090, 154629, 616734, 1386671, 1387819, 2311721, 4929826, 6007742, 6008755, 7240680, 12014764, 12020238, 12021820, 12024501, 12025082, 13411005, 18338942], [39, 888, 770832, 6468867, 6776781, 6777014, 6777609, 11551672, 11555723, 11556271, 12172166, 13250283, 14174236, 20950166], [6, 154132, 1232069, 1233483, 1235154, 1236703, 1238054, 5396089, 5396992, 8167487, 8169419, 9709510, 10479468, 10481015, 10482324, 10329815, 10332685, 10333714], [11, 616104, 617607, 619009, 620059, 6010157, 6016373, 6017479, 6019005, 14328138, 15406012], [46, 1070, 1386958, 1387637, 1388498, 1389170, 1543149, 1544619, 3084498, 5702605, 6934486, 6934913, 8166792, 9244862, 9245424, 9246089, 9247748, 9248763, 10480637, 11096728, 11098996, 11100312, 12486221, 18184172], [32, 699, 846, 2393, 2505, 4468547, 4470073, 9706143, 10938017, 11708122, 12478052, 12479032, 12940976, 12941970, 12945309, 19413246], [25, 608, 1386489, 4312573, 4928494, 7238601, 8470489, 8471035, 9086930, 10781049, 11704958, 11705637, 12013560, 13399623, 13400939, 14325070, 15710932], [67, 1490, 3259, 2005331, 2313275, 2314157, 2321402, 3553514, 3557140, 7253245, 7259104], [53, 1194, 771133, 772260, 775130, 776117, 778322, 1702413, 2010322, 2934462, 4320364, 7400448, 8478392, 8479986, 9557888, 9558583, 10174499, 12330611, 13562548, 13564109, 13872086, 13873705, 15413558], [32, 2002104, 2004370, 5700407, 5701737, 5702570, 5704327, 6474425, 6476812, 8632868, 8633302, 12945358, 13715281, 16487246], [60, 1364, 1079301, 1080722, 1542659, 1543485, 1544696, 1546271, 2162166, 3240292, 3243554, 4937631, 4938182, 5862317, 5870332], [39, 853, 972, 4159035, 4774965, 7855007, 7855859, 8625952, 8628500, 8629200, 8632182, 10018245, 10019904, 10020891, 10636835, 15410786], [39, 888, 770832, 772141, 2004022, 3390104, 3852036, 3852741, 4776694, 4778255, 5086178, 5086556, 5087417, 5088005, 6627872, 6628306, 6633757, 6634905, 7558788, 8944921, 10176823, 10177640, 10178398, 10179868], [32, 762, 1386671, 1387791, 1389744, 1390717, 1391711, 1853828, 1857750, 1858744, 2628653, 4938709, 4939302, 4940606, 6018487, 7096606, 8174487, 9098576, 9560501, 9561047, 10176963, 10177544, 10182178], [67, 1476, 2036, 1850099, 2158036, 4622148, 6008064, 11860155, 13400029, 15402008], [39, 867, 308816, 309791, 311464, 7549485, 7551305, 14019375, 15251303, 15252775, 15259285, 18955250], [60, 1329, 3294, 4605, 9911, 4937946, 4938800, 6786919, 6791147, 11565203, 11567408], [53, 1201, 925147, 926589, 1850503, 4006587, 4930519, 3547046, 4316934, 4933011, 4933592, 4934579, 5550495, 5551027, 5858957, 8015020, 8015923, 8017363, 8941288, 12329349, 12945260, 13869323, 13870835, 17104786], [67, 1511, 4822, 5830, 10079, 6324163, 6329406], [74, 4774090, 4774648, 4775350, 5545273, 5546125, 6470071, 11090155, 12630029, 12630573, 4324676, 4325635, 4326986, 4327868], [39, 909, 1232825, 1233994, 2619889, 2620771, 4160694, 4162283, 5086213, 5087354, 5857263, 8013382, 8018357, 8019206, 8022636, 9562776, 9568026], [67, 1483, 2645, 1850736, 2620652, 5546736, 6316666, 6317681, 7549590, 7550605, 8782493, 8783067, 10014934, 10631046, 10633146, 15561090], [74, 1651, 617546, 1079623, 1080792, 2774897, 3698839, 3700297, 4932171, 4932465, 6472372, 6473669, 7397618, 7399209, 7402952, 8327017, 8327892, 8328592, 9098499, 10484620, 11870501, 14180592, 14184176], [53, 1215, 1233126, 4929182, 4931254, 6317345, 6320026, 7398089, 7399447, 12481503, 13097452, 13098756, 14176630, 15870630], [11, 279, 924207, 925376, 2311259, 2311812, 3081721, 5237791, 5239709, 5701786, 5855758, 10475849, 12015702, 13093779, 13095116, 13095844, 14481711, 14943837, 14948667, 14949521, 15873402], [18, 454, 1386356, 1387322, 1388015, 2466120, 3236078, 9242092, 9242785, 9858918, 11244818, 11245842, 12631751, 12632906, 12638534, 17104478], [60, 1364, 6082, 6628103, 6936066, 6937342, 6939869, 7863967, 7866361, 7867208, 8637138, 11871215, 12795164, 12796762, 13874650, 15414636], [46, 1014, 1896, 2897, 926827, 5700876, 5702325, 6164416, 6166348, 6167055, 6170681, 6171857, 7711757, 11099857, 12639773, 12641208, 13411096, 14797173, 14798650, 15722636], [46, 1049, 924958, 925672, 2003602, 2004904, 3082848, 3084465, 4624381, 4625844, 6011746, 6012719, 6013867, 6783937, 6784980, 6785939, 6786982, 11099066, 12176940, 13409017, 13410326, 14796417, 14798041, 16030020], [60, 1329, 2834, 4101, 5312, 6901, 930803, 931328, 932014, 1856091, 1856826, 1857813, 2473715, 3089806, 3551743, 3552567, 3553472, 3555075, 4786984, 4787971, 5403894, 5404559, 5405406], [18, 1694146, 3080034, 5544097, 5852041, 8778139, 10010006, 10164118, 10167457, 10168906, 10173911, 10175066, 10179714], [53, 1173, 2386, 3968, 773884, 774577, 777090, 2471223, 3703144, 3704434, 4474371, 4475540, 4481714], [53, 1215, 1233091, 1233315, 1234694, 1236246, 1236696, 1238313, 2778222, 9092285, 10016171, 10016439, 10940360, 10941391, 12481265, 14637335, 14638336, 16178322], [32, 2618083, 2619294, 2620589, 3544470, 5238603, 6470491, 6471044, 6474334, 8476418, 8938334, 8938726, 9400684, 9401998, 10787874, 12327958, 12789916, 18487860], [67, 1511, 925448, 926771, 2466624, 3698764, 5084631, 6008701, 6010234, 6011795, 6012691, 6014124, 6784077, 6785503, 7401428, 7402114, 7864023, 8326098, 8326485, 9096611, 10328513, 14332602, 15410478], [74, 1665, 925616, 927191, 1543149, 1544577, 1547412, 1547832, 2625762, 7707839, 7712333, 7712620, 9098513, 11408564, 11562501, 12794599, 13718515, 16182480], [6, 154118, 157254, 2005380, 2011617, 2013085, 3552982, 7095059, 7099406], [67, 1497, 4351, 5172, 159137, 160271, 163722, 1087797, 1088674, 5092744, 5862660, 5863374, 6941276, 8943374, 8948330], [67, 1539, 1541441, 1542603, 1547559, 2317685, 3549580, 3550315, 5090238, 11096252, 11096987, 11098093, 11099276, 11100004, 12485913, 12487075, 12492486], [39, 860, 1763, 3205, 7592, 8602, 1086525, 1087666, 1090326, 2476466, 3862331, 4324403, 4325726, 5711829, 6635719, 7713852, 9099775, 15721712], [46, 1077, 1540965, 1541789, 1542673, 1543807, 1546222, 1547503, 2163405, 3241545, 4781440, 9555503, 10171426, 13713489, 14021419, 14022007, 15561860], [32, 713, 308685, 310134, 314320, 1392418, 1854348, 4318446, 4323003, 10329024, 10329871, 11099997, 12331871, 12793962, 12795143, 12796270, 12797868], [53, 4004125, 4006932, 5547030, 5549592, 9091683, 9096947, 10175031, 10176333, 11254431, 11257266, 11257560], [46, 1049, 924972, 925966, 1695882, 1696617, 3236477, 3698603, 4930505, 8010596, 8016215, 8017342, 8018492, 9250590, 10020504, 10021192, 10483141, 10484261, 13254532, 13255787, 13257145, 13258251, 13259560], [25, 1540153, 3080006, 3234116, 4004013, 4466104, 4467574, 6777693, 6785113, 6785666, 7555589, 10327701, 11867575, 13253680, 13257908, 13258935, 14798797, 15568790], [18, 616111, 1232020, 2156088, 2156503, 4466566, 4928501, 4929350, 5699259, 5699784, 5700470, 7394589, 8318517, 8319693, 9859618, 9861214, 9866205, 9867052, 10636966, 10637647, 10945598, 10946578, 11408508, 13718613, 14950543, 14951985, 14955254], [67, 1490, 463399, 1541469, 1541889, 1542729, 2158652, 4930713, 4931702, 6009840, 7395730, 10783807, 11399721, 11400297, 12632220, 12633515, 13557410, 15251522, 16329396], [74, 1672, 1079595, 1080701, 1081870, 2775961, 3391863, 3392101, 3392934, 4009060, 5086997, 5088397, 5088985, 5090119, 5706028, 5706460, 7092329, 7862439, 7864646, 7865059, 8789010, 8790578, 8791913, 12333943, 12335322, 12336792], [46, 1056, 1078972, 1079959, 1695903, 1697023, 2004967, 4623009, 4623597, 8781674, 9859611, 15711548], [74, 1630, 1540195, 4004286, 5082167, 5544272, 6314172, 7238251, 7239460, 7241058, 8318995, 8320409, 8322054, 12326108, 12327762, 12329057, 12332662, 12333341, 12641290, 12642300, 13720209, 17416174], [46, 1042, 3765, 5214, 1083130, 1084124, 1854047, 1854927, 3394803, 3395363, 4319293, 4320427, 4936364, 9402399, 9404056, 9405038, 9407432, 12179488, 12179929, 12181357, 12797285, 12798022], [18, 1694104, 1695924, 8317973, 9241861, 10165931, 10167611, 10169030, 10630976, 10632005, 12171886, 14635940, 14636523, 6487102], [6, 154097, 154935, 925063, 2156951, 4005077, 5544935, 6315014, 6315546, 6777672, 6783263, 6783832, 6789446, 9869523, 10793446, 10794475, 12334349, 12334881, 12642832, 12643714], [74, 1672, 6628, 1084761, 2316663, 5704775, 7244628, 8322775, 8329012, 8330615, 9562538, 9563714], [53, 4466097, 4467420, 6777504, 7547413, 9857504, 10627448, 14785474, 14786057, 14787184, 14788990, 14790299, 14796501, 14797089, 16336942], [39, 902, 1078832, 1080155, 1087120, 2935169, 2936660, 4938723, 4939570, 6017668, 14328068, 14329389, 15869244], [11, 770146, 2156046, 2157014, 2157399, 3235525, 3240383, 3241804, 3703748, 7553783, 7555302, 13869365, 13873012, 13874608, 14952552, 14954022], [18, 405, 308335, 308879, 310972, 311996, 317918, 319185, 320235, 321670, 1091614, 1092916, 2170853, 8484895, 8487562], [46, 1021, 2358, 3357, 927240, 1697373, 2929247, 3853373, 5085247, 5701366, 6779275, 10475373, 10480196, 13098308, 14484208, 17564168], [53, 1229, 1541126, 1542113, 2158015, 2774148, 4160036, 4160708, 4161135, 9243177, 9245151, 9246614, 10632523, 15560474], [39, 2464153, 4004055, 4005182, 4006932, 5547065, 6778958, 8627072, 10012979, 10014092, 10014647, 12632764, 14018696, 14020243, 14021762, 14023050, 14792999, 14794422, 14795913, 14797047, 14800484], [53, 1161, 1266, 1938, 2323, 772442, 776054, 777069, 2008992, 2010252, 2010987, 2012114, 2014690, 6326781, 7866639, 8328739, 8944688, 8945950, 8946795, 9408916, 10486832, 10487714], [74, 1658, 771581, 772400, 773268, 4315317, 4316696, 4318243, 4319592, 4320567, 4322240, 4323815, 4325264, 6019327, 6020797, 6482888, 6944797, 7714916, 8792825, 11718902, 11721254], [32, 720, 462676, 463931, 464540, 466143, 471750, 472765, 1704632, 3244730, 3246018, 4632095, 4632681, 4633822, 4636022], [67, 1525, 1233406, 2619539, 4159455, 4160883, 4776804, 4777527, 6009464, 6011081, 7550962, 7551676, 8629564, 10169690, 10175584, 12639675, 13563598, 17567556], [74, 1630, 2540, 4150, 1390010, 3084150, 3089582, 5091659, 5707568, 7093645, 7095248, 8327367, 9251248, 10483346, 10485110, 10485544, 10488484], [39, 2310104, 2772034, 2772706, 2773420, 4929490, 5391399, 6007497, 6623427, 6624246, 6624995, 6626402, 6627109, 8013186, 8016028, 9248138, 10326026, 10942112, 11404019, 12174112, 12175764, 12177017, 12178529, 12179642, 12180636, 13720776, 15106699, 15108022], [25, 2002083, 2002657, 4466769, 6006629, 6622727, 6625133, 9705198, 10475107, 12939163, 12940500, 12941221, 14173123, 14173963, 14789879, 16945858], [67, 1525, 1233434, 6007483, 6008008, 6624132, 7702041, 7702904, 8780799, 10782904, 11860778, 13246918, 14632834, 14634101, 14942080, 14943667, 15867550], [18, 924139, 2156011, 2926153, 4466020, 5390095, 5390958, 7547021, 7548337, 9704442, 10782323, 11860407, 11862052, 11863081, 13402967, 15558934], [39, 923, 1540832, 1542127, 1545144, 1546404, 1546950, 3087013, 3087706, 4011811, 4627762, 4629036, 4630842, 4632130, 5402060, 5403031, 5404657, 7714762, 7718948], [67, 1511, 925427, 926309, 2466225, 2467695, 4007602, 4008857, 4010516, 7706572, 7708679, 7709855, 9249722, 9250163, 10790072, 10791339, 10792837, 15720788], [39, 2926090, 2926692, 2928281, 3852183, 3852706, 3853254, 5239387, 6779310, 12785324, 12939266, 12939968, 13709856, 14633982, 15711856], [53, 1161, 1238, 1387343, 1389555, 1851658, 2621611, 2623065, 3854948, 4933060, 4937603, 4938744, 4941444, 4942461, 6174354, 6175021, 16022166], [11, 462104, 924069, 925490, 926785, 2004855, 2005462, 2007039, 2009272, 4011342, 4013155, 4014562, 4015283, 7403325, 7404634, 8790746, 9560634, 10946718, 11100702, 11102258, 11256202, 13720293, 14644209, 14645021, 14646484], [74, 1658, 4689, 6089, 6208, 4472292, 4475622, 4477227, 5709136, 10021241, 11561141, 11562275, 11564853, 18956790], [32, 706, 1145, 2547, 2694, 4290, 1082192, 4624304, 6010185, 8628290, 9706206, 9707193, 10323095, 11401221, 12633116, 12633814, 13403711, 14019823, 14023470, 14025024, 14179010, 14180606, 14185100], [46, 2926139, 2931123, 5703198, 6473123, 6473956, 6476476, 7400567, 7402219, 7403360, 8173288, 8174249, 8175103, 8791229, 10023152, 14797208, 14800484], [32, 755, 1232685, 1234104, 1696022, 3698141, 3703461, 9555475, 9557162, 15409092], [18, 1232090, 1233112, 1233826, 2311700, 2773840, 4159756, 4161030, 4163270, 4163956, 4165732, 6783818, 7553713, 7553979, 8477881, 8478434, 9248350, 9249036, 9250646, 9251073, 10483003, 10484417, 10792396, 10793964, 11255929, 11257336, 11411280, 14337371, 14340332], [74, 1672, 1079595, 1080708, 1234652, 1235373, 2467310, 2468906, 2472637, 2472861, 2474483, 3244625, 4784485, 5246562, 5247472, 5249082, 6634942, 8021061, 8944998, 14181075, 14187102], [60, 1315, 1441, 2589, 926470, 2620582, 3390533, 3391933, 3392696, 3394250, 3395111, 3395699, 4935559, 4935790, 4936651, 6322707, 6323778, 6325339, 6326977, 6327845, 7559712, 9099859, 9107874], [74, 1672, 5305, 6712, 7762, 9043, 624959, 625477, 626548, 628144, 1706060, 4632116, 4633717, 5403796, 5557768, 5559026, 5559406], [32, 706, 1567, 1541630, 1542386, 8780421, 8782640, 9706738, 9709132, 9710126, 9713626, 15565556], [67, 3850111, 3852197, 7702253, 8010197, 8011072, 9396946, 10937065, 12168972, 12169989, 13401882, 13402598, 13406546, 13408156, 14794077, 14795493, 15103451, 15104578, 15566480], [67, 1483, 3142, 4395, 4472, 1544619, 1550674, 5708730, 6170674, 6171689, 7403626, 7405234, 8791159, 8792608, 9870538, 9871714], [60, 1378, 7557, 7797, 9316, 10931, 1550821, 1551647, 1552802, 2784907, 3708844, 3710111, 4018083, 4019406], [32, 720, 2792, 3212, 8175, 470271, 1086231, 1087673, 2011610, 2012884, 2014214, 2015241, 3555166, 3556776, 4942664, 8022767, 9254706, 15876636], [11, 770090, 924006, 1078116, 1848076, 1849637, 1850482, 2774575, 3390540, 3392157, 4932066, 9860150, 11246080, 11247648, 11709576, 11710313, 13250178, 14944285, 15868166], [25, 559, 308524, 309812, 312948, 313375, 1545242, 2623389, 4163256, 4163653, 4779557, 5549641, 5550796, 6166871, 6474782, 7552922, 8938782, 10016880, 10478850, 10480434, 11250385, 11251806, 11253108, 12331234, 13717094, 14949171, 14950704, 14952263, 14953868], [32, 699, 797, 1329, 2687, 4101, 5858, 1391998, 2777926, 2779531, 4011398, 5397524, 6475405, 7091475, 7093153, 7094569, 7402527, 7403633, 12943468, 12945036, 13406945, 13407169, 13408485, 13870625, 15410478], [60, 1322, 1896, 2876, 5088, 621172, 621774, 623356, 626646, 2012779, 3552702, 3554312, 4940235, 10484254, 10638235, 10639691, 11871607, 17107558], [25, 1540125, 2464076, 9702102, 10164048, 10165070, 11550944, 13245035, 13248043, 15404010], [67, 1525, 1233406, 1233784, 1234785, 1235044, 1236815, 4624899, 5548829, 5549984, 6627907, 6629083, 8168948, 9247013, 9248651, 9249188, 9711120, 12637218, 13715113, 15101190, 15103904, 15104914, 16182788], [46, 3542132, 4620069, 9240153, 10780067, 10781532, 12167455, 12168869, 12169422, 12170134, 12173118, 12173804, 12176380, 12177694, 13563626, 13565180, 13719131, 17569096], [60, 3850104, 3852057, 9550127, 10474022, 10474463, 12014330, 13708421, 13710990, 13712243, 13713776, 13715337, 13716975, 16026940], [53, 1187, 617140, 6623210, 7701154, 12937222, 14323126, 14324106, 14326178, 14326598, 15404472], [11, 770083, 770937, 1849063, 3080958, 3081658, 3851558, 3851959, 3854535, 3855968, 4625921, 4627389, 6167286, 9863391, 7249409, 8019526, 9097456, 9098760, 10176655, 12332725, 12334195, 13720293, 14644244, 21112174], [53, 1194, 771119, 771938, 772694, 774297, 2006206, 2007228, 2012632, 3552716, 3553297, 8173344, 8175285, 8176167, 8181564], [25, 1540153, 3080041, 7392132, 7395254, 8319345, 8935275, 8936113, 4013554, 5707638, 5708688, 5709976, 6479897, 8635988, 9713897, 9714718, 9715292, 13257369, 14181285, 14182160, 15568020], [74, 1637, 3240, 773373, 778035, 2626119, 2628364, 2629367, 3553311, 3554758, 4632646, 6326760, 7404648, 8482760, 9560655, 9561234, 10947096, 12333180, 12333901, 12334760, 12337870], [39, 916, 1386823, 4774888, 5544839, 5546274, 2162348, 5704397, 5705552, 7245657, 7249155, 7250599, 8174529, 8175691, 9407600, 9408615, 9412178], [67, 1476, 1917, 3364, 1081273, 1082101, 1083718, 2777816, 3547718, 3548117, 4164040, 7860103, 7861291, 7862460, 9248378, 9249659, 9251913, 9253061, 10176977, 14643054, 14647408], [32, 706, 1301, 2722, 4227, 5690, 1391550, 3085646, 3087090, 4781228, 6167146, 11865174, 11866056, 11867064, 12944945, 13407015, 13408371, 13409479, 13410844, 13412097, 13413406], [67, 3850090, 3850832, 3852127, 2006836, 2008145, 3240047, 3240873, 3548782, 4626908, 5704796, 7706880, 7708812, 7709547, 7715868], [46, 3542139, 4774076, 4775693, 4781109, 4781692, 4786172, 6326305, 7558172, 9098298, 10176221, 10177383, 11409299, 11410454, 12488328, 14028412, 14029308, 14030484], [25, 924118, 1694034, 3234102, 3235441, 3236561, 3237758, 3239081, 4778988, 4780250, 4781090, 6475216, 6478812, 6479528, 7557472, 7559031, 7866977, 7867822, 8637775, 8639243, 10179168, 16185098], [53, 1173, 2344, 2466449, 3698386, 3699933, 3700995, 3702467, 5242341, 6628437, 7552376, 13866439, 13869127, 13869993, 15101911, 15103038, 15104809, 15105355, 15107406], [53, 4466132, 5544048, 5545040, 6315000, 6316568, 6778491, 6779049, 7702988, 7704309, 9244199, 9245074, 10631004, 16790934], [46, 3542118, 4312032, 5698097, 6006027, 7392132, 8470034, 8470713, 8472232, 8473849, 10013765, 10015184, 10477102, 10477487, 10478684, 15406628], [6, 154111, 156673, 157814, 927772, 7857779, 7858668, 7859669, 8783599, 15097655, 15713550], [39, 916, 6642, 7069, 1238992, 1240273, 1243743, 1244627, 12476785, 13554897, 13557863, 14327942, 14328978, 18024936], [32, 741, 5298, 6612, 1392537, 7244593, 8168544, 8170096, 8324077, 8325540, 8331560], [67, 1525, 1233413, 1234001, 2773875, 2774456, 4160370, 4161646, 4163711, 4163942, 4164943, 5243076, 6628999, 6630413, 8322943, 9247053, 10170957, 10171531, 11403454, 11404742, 11406499, 12638583, 10485276, 10485943, 10487273, 10487714], [18, 461, 1540349, 4312447, 5544363, 5545539, 7085399, 7547490, 7549730, 11091828, 11095895, 11096749, 12020672, 16178630], [39, 860, 1259, 925348, 927420, 928122, 930544, 932154, 937264, 2631390, 2636332], [11, 279, 3737, 3391849, 4931702, 6009833, 7241737, 7242549, 7243730, 9861781, 9863424, 9864098, 9865141, 9866282, 10636198, 12792303, 14024226, 14025500, 14027607, 14028713, 14030176], [18, 391, 524, 5082594, 5088173, 6012250, 6013251, 6937321, 6938222, 6939505, 7555470, 7557017, 7558515, 7559390, 8945257, 9715348, 9717138, 9718022], [53, 1187, 3765, 5221, 1237137, 1238278, 1241573, 1242121, 1858077, 1859486, 1860382, 1861642, 2015565, 2015845, 3247712, 4787845, 6019747, 6020592, 6790552, 6792022], [60, 1350, 771259, 771819, 1695742, 6007777, 6009254, 7703338, 7705109, 7705683, 8937571, 8938159, 10478082, 10479699, 10485439, 10486272, 10488330], [60, 1315, 1427, 3697518, 4775399, 5853490, 5856325, 6780444, 6784637, 7554768, 8940686, 8941995, 10173897, 13715988, 14793869, 15255953, 15257290, 18337248], [74, 1644, 3429, 4290, 1082192, 3546311, 5086192, 5086927, 6626822, 6627788, 6628215, 6629328, 6630063, 6631239, 8171146, 8172415, 8173752, 11561794, 11715738, 11716445, 12640340, 13256452, 14334326, 15720326], [32, 1232146, 2618062, 2619343, 3235273, 3236148, 3242329, 3858427, 4474364, 4475337, 4476632, 6016716, 6017451, 6018599, 6022330], [6, 154083, 154496, 155182, 157296, 5239380, 5245302, 5246569, 5247878, 5248319, 6788172, 8328289, 9252207, 9253054, 10022998, 10024286, 10028024], [39, 867, 308837, 310267, 313107, 1545165, 1545550, 3239641, 3547585, 5703669, 6627599, 6628726, 6630357, 9556441, 10480385, 10481799, 10483094, 11715199, 12331115, 12331689, 13563605, 17721556], [60, 1336, 463259, 463831, 1695721, 4005847, 5545707, 6007805, 6009919, 6011389, 7551312, 7552915, 7558543, 7559957, 7561560], [60, 1343, 617280, 4005350, 4008976, 4009935, 4011566, 4011963, 4013764, 4015031, 4322975, 4323843, 4329100], [11, 770118, 1540020, 2772104, 2773917, 8163938, 8317903, 8319030, 8320815, 8321655, 8323727, 10325783, 10326994, 10328266, 10790198, 14332268, 14334956, 14335397, 14340178], [39, 860, 1924, 3534, 1389408, 2775527, 4007457, 4008864, 4009571, 6627655, 7243620, 7245202, 8015144, 8016399, 8017272, 8017981, 8941904, 8942919, 8946951, 9563063, 9566178], [18, 454, 1386384, 1387957, 1390192, 3700290, 3704194, 3704903, 3707563, 4785654, 4787936, 4789406], [18, 924083, 925721, 926302, 931711, 1701846, 3087753, 3088922, 4474812, 4475484, 4476191, 7094287, 8018205, 12484247, 12485563, 12485857, 14025717, 14949794, 14950690, 14951964, 14953306, 14954484], [67, 4312095, 4313707, 4775845, 6315728, 6316447, 7548358, 11706393, 11707576, 11708276, 11710640, 12942705, 12944070, 12945379, 12949901, 16491866], [53, 1187, 617105, 2619217, 3851084, 5083175, 5084673, 5085849, 6625772, 5242717, 5244364, 5245323, 5246380, 10636436, 11406394, 11408011, 12947904, 12948935, 14488858, 14490433, 14493100], [6, 154125, 1078067, 1079525, 1084173, 1700250, 1701293, 1702462, 3088343, 5706467, 7246329, 8016427, 8019115, 8019668, 8024022], [53, 1201, 925105, 3389168, 3390190, 3390855, 3391604, 8627695, 10167604, 14787679, 16019548], [39, 881, 616839, 618239, 619282, 620262, 1082199, 1083067, 2314969, 6781011, 6782061, 6783202, 7553146, 7554434, 7557444, 7558459, 7563562], [6, 154083, 154517, 4466608, 4472033, 6012096, 6013125, 6013979, 6937930, 6939491, 6940336, 6940737, 6943257, 7559362, 8329269, 8329831, 8333408], [11, 258, 2470, 1696575, 2312498, 5238554, 5392491, 8010617, 9550470, 11244547, 11245744, 11246738, 12016626, 12632708, 12633144, 12634397, 12635734, 12636420, 12638331, 13408434, 14178394, 14179983, 14183301, 14184330], [18, 391, 517, 1679, 1233581, 1234407, 1236059, 1237200, 2007144, 6165179, 6166808, 6167517, 6171577, 6172144, 6176484], [11, 770083, 770986, 772281, 1696232, 8626239, 8627919, 8629368, 9707263, 12017319, 12018642, 13404754, 14482656, 14483356, 14486086, 14487675, 15411556], [18, 1232153, 2772027, 5082153, 6622027, 6622594, 7700503, 7701385, 7706810, 7707522, 8785417, 10633524, 11711468, 11713057, 12636978, 12637939, 12639269, 14179374, 14184022], [74, 1630, 2631, 2904, 1080792, 2774911, 4006827, 8626890, 9396799, 12014918, 13400783, 13862904, 14940785, 15864778], [11, 616083, 617098, 617504, 1387441, 1388617, 2928524, 2929849, 2936035, 2936555, 2938039, 5556151, 6788067, 11408137, 12332053, 12332900, 13102814, 14950914, 16028788], [32, 2002111, 2004841, 2006304, 3392169, 4008290, 4012203, 4013048, 4782966, 7555064, 8632952, 9557064, 10634952, 10635393, 10640363, 10641238, 12027168, 12028638], [46, 3542111, 4158048, 8008146, 9394013, 10318132, 10322346, 10323011, 10324180, 11864306, 13250171, 13250397, 13251769, 13253183, 13254345, 15872324], [46, 1042, 770937, 1695049, 1698827, 1699954, 2161900, 2162894, 2932782, 4010871, 4318803, 5858894, 5862385, 5863815, 5866062, 5867028, 5868022], [39, 916, 1386809, 1387651, 2003609, 2005058, 3082988, 3084283, 4008192, 4008885, 4624850, 4626446, 4631150, 4632424, 4634685, 4635714], [60, 4466097, 4466977, 4468097, 2006808, 2007487, 2008810, 2009531, 3241433, 6629508, 7399447, 7400560, 7401274, 7401939, 7403283, 7404135, 8328060, 8329040, 8790998, 8792321, 10332216, 10333245, 11873152, 11874330], [25, 573, 616536, 618092, 619002, 6317023, 6318689, 6320117, 6936073, 10940124, 10943622, 10945178, 10946088, 17722018], [39, 860, 1581, 3081651, 3697602, 8471686, 9857560, 11551658, 12321609, 12323037, 12938967, 16172932], [74, 1630, 2631, 926750, 931867, 2009958, 2012506, 4476597, 5400527, 5401696, 6787556, 8019661, 8635570, 10483654, 10486062, 10487056, 11256979, 14645084, 16030944], [67, 1504, 4213, 3392246, 3546220, 3547543, 5087396, 6011501, 6627424, 8937501, 9553431, 9554243, 9555923, 9557337, 9558856, 9560459, 10792382, 10793635, 10794811, 12334937, 13874832, 17724790], [46, 1056, 1078930, 2773049, 2777424, 4933501, 5549396, 6473534, 7859403, 8937508, 8940504, 8941218, 8945411, 9561509, 10177460, 14335488, 14336055, 17108020], [6, 154139, 1386027, 1386573, 1388993, 1390402, 1391452, 1392726, 1394700, 1396268, 1858170, 3552289, 4476170, 6170261, 6478240, 12792275, 13408219, 17258170], [53, 3388132, 4466048, 4467061, 5698958, 7855021, 7856512, 7857534, 9243394, 10013506, 10015718, 5709367, 6633248, 7865339, 7866998, 7868321, 7874642], [18, 426, 770347, 771231, 2311112, 2311798, 2773756, 2775065, 4006995, 4008444, 5086318, 6472456, 7858360, 10630423, 10633300, 10634574, 11096539, 11097946, 11098968, 11099633, 11100858, 11102447, 12026335, 12488440, 12491254], [25, 580, 770524, 771840, 2157728, 4929833, 6161707, 6777833, 8009747, 8010881, 8626813, 13092862, 13093723, 14941786, 14942381, 14943837, 16175704], [25, 552, 154489, 155040, 924958, 2927028, 2928988, 2930255, 2931417, 2931963, 3547872, 4625942, 4626810, 6782894, 7552817, 10940929, 12480824, 12481818, 13251713, 14329839, 14333738, 17567710], [6, 154111, 156176, 1542288, 2620218, 2621478, 2621875, 2622402, 2623424, 2624122, 3394040, 6936089, 6936992, 6938250, 6938798, 6939232, 6945322, 6946792], [6, 154125, 1078046, 3388083, 3388783, 3850923, 5390776, 6314881, 6930839, 6932260, 6934017, 6934297, 6939272, 6940002, 8325918, 8327183, 8328053, 11408158, 11413408], [18, 616132, 1694034, 1694720, 1697100, 3391224, 4777093, 5239177, 5240353, 5241214, 6319130, 6320159, 6327299, 6328454, 7406335, 8484426, 8485868], [46, 1042, 770972, 771952, 1233910, 6932001, 8471854, 9241945, 9242778, 10628897, 11552841, 11554255, 11555704, 12787816, 13557774, 19563704], [74, 1686, 1387602, 1388925, 2928785, 3698923, 5238799, 5239324, 5393273, 5394143, 6626017, 7242136, 8320045, 11554143, 11559302, 11560625, 11566176], [32, 741, 924643, 2464727, 2467905, 2469081, 4008976, 4009942, 4010495, 5242565, 5243923, 5245386, 6631309, 6632714, 6633150, 6634403, 6635460, 6636769, 7868678, 11718713, 11719868], [18, 924090, 1078039, 1078923, 2618776, 3542858, 3543287, 3544435, 3548390, 3549979, 4473860, 5398007, 6937923, 6939377, 8171302, 8172562, 8173003, 8174471, 8180024], [39, 874, 462818, 4620893, 5544811, 5545672, 5550166, 6628271, 6630637, 7708714, 7862637, 8786763, 8634030, 10328142, 11406072, 17104016], [25, 566, 2848, 4442, 1082330, 1698402, 1699270, 3701361, 4625242, 5703326, 5703725, 8321800, 8783767, 8785181, 9093095, 7093939, 7095556, 8327696, 8333870], [32, 1848111, 2464069, 2465525, 3697441, 3698575, 3700934, 4317039, 4932934, 5549053, 6472941, 6935037, 6936495, 6937076, 6938322, 7862411, 7863274, 7863939, 7864786, 9096919, 10328828, 11714429, 11717115, 13257187, 13258181, 13720272, 13722792], [25, 1386090, 1387112, 1387798, 1389912, 7087975, 3858019, 3858315, 8167452, 13095487, 13403410, 13403830, 13407708, 15101804, 15102975, 18182940], [25, 2002097, 2310041, 6776083, 6777126, 10473203, 10476836, 10478124, 11248024, 11248397, 11249615, 11251029, 11252828, 11253815, 11869766, 11871087, 13410949, 13873082, 13878178], [74, 1658, 771588, 772615, 2312540, 2314087, 2314969, 2315823, 2318952, 3397085, 4936952, 6939071, 8170987, 8172163, 9712044, 9712737, 10328639, 11252730, 11255271, 11255831, 12179752, 12180713, 12182176], [25, 545, 629, 924699, 926342, 927009, 928668, 929681, 2161613, 2163041, 2165260, 2165701, 3705575, 3706135, 4630086, 4631666, 4633780, 4635392, 6021280, 6021868], [32, 1848104, 2310027, 2310559, 2311721, 2312246, 2313289, 2314465, 2320835, 2321969, 2324524, 2325406], [60, 1371, 1233245, 2311329, 2312939, 3391009, 3391723, 5393828, 3702474, 4780607, 6012530, 6013783, 6015302, 11097351, 11099724, 11100116, 11562088, 11563691, 11568178], [53, 1180, 463084, 1695203, 1698841, 5856871, 6164829, 6165949, 6167118, 8169230, 8173302, 8174606, 9252508, 11254625, 12794494, 14026578, 14028046, 14028713, 14030176], [25, 580, 770503, 771315, 772211, 773345, 776047, 776864, 777244, 2009363, 2012688, 2013990, 2017868], [74, 1630, 1540223, 1541658, 1545291, 1546467, 3086390, 9554418, 10016369, 10017475, 10019162, 10020744, 10790674, 14178777, 15718632], [60, 1371, 1233294, 6469364, 6474082, 6475683, 7707580, 10325643, 10326784, 8789689, 10021596, 10022578, 10484543, 10486006, 10490640], [39, 853, 1000, 2554, 2981, 4143, 1236059, 1237200, 2007109, 4009214, 5087102, 6319214, 6323295, 6324457, 6329257, 6945399, 8485271, 8485714], [67, 1511, 4521, 5676, 1083557, 1853697, 3393613, 3395062, 4472999, 4474469, 6014336, 6014735, 6630693, 6632093, 6633115, 8481241, 10021108, 10637171, 10638676, 10639663, 11255558, 12641698, 14027593, 17261558], [53, 1194, 771119, 771980, 776488, 776864, 777286, 778273, 1394217, 1395323, 1396800, 2782898, 3552856, 10174905, 10178636, 11718776, 13104699, 13106022], [6, 154090, 154475, 924545, 926204, 927205, 1851156, 1852736, 1854829, 1855963, 2471888, 2472623, 2479112, 3711175, 3712176], [53, 1166, 1595, 3235693, 3240208, 7706299, 8938199, 8939055, 9862964, 9863664, 10633559, 11249678, 12327615, 12329029, 12329589, 12330420, 12331591, 16181556], [67, 1483, 2652, 3364, 6355, 7174, 7727, 2471832, 3549769, 3551204, 4321148, 9095218, 10173120, 13099190, 13561125, 13561967, 13565437, 13566300, 14644202, 14644867, 14646330], [32, 762, 1386671, 1387777, 1389254, 2621366, 2625930, 2627505, 3243407, 3705533, 3710195, 3710725, 3711273, 3711714], [60, 1315, 1462, 3016, 3422, 4143, 1236059, 6934129, 7858071, 7859529, 9091396, 10015543, 10020989, 10022165, 10029872], [60, 1336, 463308, 464867, 772848, 774458, 2160318, 3546437, 4470346, 4471039, 5086955, 5087529, 6319396, 7243529, 8475424, 11247522, 12325424, 14943515, 14947582, 18181554], [53, 1229, 1541126, 4621196, 5391096, 6469166, 6469616, 11859693, 13399567, 13400155, 14940064, 14941338, 14943249, 15405242], [32, 713, 1917, 3336, 465240, 1235366, 2313247, 3391324, 3392360, 3393359, 4317263, 6473389, 8013298, 8014607, 9246509, 12634593, 12638639, 13562730, 13565278, 13566006, 14951915, 18801866], [32, 755, 1232678, 1233945, 1235450, 1236731, 1852626, 2468717, 2470227, 2471699, 4011601, 4012728, 4015612, 10637633, 10639157, 10640559, 10642022], [6, 154097, 156062, 3390153, 4930050, 4931030, 4933312, 11555389, 13095275, 15867242], [11, 616146, 619912, 621193, 624658, 625386, 2011302, 2012590, 2016041, 3402153, 4634069, 4635245, 6175140, 10333217, 11257154, 11258330], [32, 755, 1232664, 1233644, 1235086, 2005219, 2010845, 2012310, 3398191, 4784247, 4784828, 8788912, 9866800, 9867227, 9872176], [53, 1201, 925119, 925959, 928318, 2314416, 2316353, 2317230, 3703137, 3704264, 3705582, 6631643, 6632485, 7710569, 8018485, 9096562, 9250485, 9866611, 11098497, 11099024, 11100046, 13564123, 13566853, 13568176], [67, 1497, 617455, 618897, 621760, 623025, 623874, 7856421, 7859865, 8321998, 8328060, 11408102, 11408494, 12948585, 13564536, 13565810, 13567868], [11, 251, 308167, 1078244, 1079089, 1541203, 2465084, 3697231, 3703293, 3704434, 4474364, 8016455, 8022048, 8022753, 8946657, 10794727, 10796022], [32, 699, 818, 1819, 925756, 927051, 1850974, 1851996, 3237870, 4316003, 5855882, 5856556, 5857417, 5857956, 5859272, 8477356, 8480994, 8482319, 10022221, 10023397, 11563283, 11564153, 12796055, 12796937, 14336823, 16800790], [60, 1315, 1427, 2927502, 3697455, 3698867, 4006799, 4007352, 4777296, 4778605, 6010472, 7550584, 8320486, 8320892, 9090829, 13556862, 13557459, 13558887, 13560805, 13561358, 14331281, 14332107, 14640058, 14641017, 14642536, 14643810, 14645560], [18, 419, 2932, 1543023, 1850967, 4931037, 4933410, 6165536, 7551408, 7551816, 7554511, 11096581, 11100053, 11100914, 12178802, 13410900, 14180835, 14181969, 14797894, 17877866], [32, 762, 1386664, 5082748, 622222, 623545, 2163412, 3549510, 4319433, 7553503, 8169461, 8170917, 9402791, 9864931, 9870657, 9871189, 9873100], [25, 580, 4213, 5340, 6817, 7662, 777559, 1701678, 2779573, 4165678, 5243559, 6013678, 7091587, 7092420, 7554322, 8478448, 9556364, 9557386, 10943295, 10944457, 12176366, 16026324], [60, 3388097, 3388629, 4466741, 4471466, 4473013, 4474476, 5398588, 6168539, 6169939, 6171003, 6172403, 6173439, 6174314, 7560223, 7561399, 9101273, 11257371, 11261718], [32, 734, 2540, 4108, 5858, 1391942, 1392985, 1394140, 1397934, 1399537, 1404486], [11, 237, 363, 1497, 617427, 4159532, 5545448, 5546708, 5547154, 5548752, 6626626, 7242757, 8474689, 8476159, 10016019, 10478138, 10482989, 10484109, 10485628, 10487224, 10491256], [46, 3542083, 3542636, 4466713, 4467903, 4469079, 6008946, 7549016, 7549877, 7550435, 7553118, 10633195, 10636044, 13562107, 13562961, 15718940], [11, 616125, 620500, 4162575, 4778521, 4779627, 4780215, 4781391, 4787411, 5403537, 6635453, 10023516, 10793432, 10794130, 10796176], [6, 154104, 616020, 2310125, 2314066, 2315380, 3701277, 6473361, 7397291, 7398439, 8322320, 9400460, 9405584, 12177687, 13409591, 16489556], [67, 1497, 3877, 4449, 1236388, 1237942, 1238936, 2163027, 2164196, 5706259, 5707092, 7247239, 8787113, 11405195, 11407430, 13871521, 13876022], [39, 2464125, 2467702, 3545814, 4315716, 5701842, 7087714, 7088115, 7091125, 7091937, 7093568, 9863167, 9864847, 9866247, 9867892, 12793990, 13871871, 13872135, 14796053, 14796900, 15566788], [25, 615, 1540517, 1541623, 1542057, 1543226, 2929093, 3699163, 3700164, 4932304, 4938231, 4939703, 6479591, 6480431, 7096373, 7097507, 7713425, 9099495, 9407453, 9408594, 9412332], [32, 2618104, 2620519, 2621632, 2622500, 2623172, 2624073, 2625517, 3549426, 3550154, 4936019, 5552091, 9707599, 9708761, 9713276, 9713960, 10175934, 10177523, 11101404, 12487500, 12489098, 14029194, 14491154, 14492330], [67, 1497, 617434, 4467469, 4468974, 4469961, 4472374, 4473657, 4476065, 4477206, 5247101, 6171204, 6941164, 13255213, 14179115, 14179682, 14184022], [39, 909, 1232825, 5082902, 6160825, 6161952, 6163247, 7087359, 8011261, 8011779, 8012682, 8013956, 8016357, 11712462, 11717754, 11718762, 11722640], [60, 3080118, 3083149, 3084603, 4316493, 4317074, 5702997, 5704432, 5708233, 5709638, 5710032, 7404128, 8174018, 9560163, 11100074, 11101397, 12641250, 14027355, 14643264, 14643684, 15721558], [6, 154146, 1540069, 1541539, 1548665, 1549491, 1550667, 4630744, 4634335, 5712426, 6174328, 7714440, 8484384, 8485560], [11, 616125, 620332, 1236409, 1236962, 1237683, 1242793, 2320863, 2321722, 3245843, 4477757, 4478884, 4940816, 7712933, 9252823, 9253649, 9254993, 13259049, 13262486], [39, 902, 1078818, 1079784, 1233756, 5853824, 6931712, 6932148, 8318050, 8319030, 8780995, 8782437, 9706379, 9707809, 9710238, 9711839, 10943778, 17565708], [67, 1525, 1233399, 1695476, 1696162, 2774295, 4006197, 4007079, 9552073, 9553529, 10785422, 13095543, 14635452, 14636733, 14639554, 16333554], [74, 1665, 5571, 1853676, 2931599, 2932726, 2935309, 2936765, 4168688, 9866770, 11252674, 11253661, 11255740, 14027831, 14951712, 16491712], [53, 1222, 1387140, 1388400, 1389247, 2159317, 2160344, 2161060, 3238983, 3240145, 4472068, 4473335, 4781272, 4781958, 4783099, 5245197, 5247276, 7557353, 7559607, 7560762, 8638657, 8639194, 9101168, 9102638], [18, 447, 5914, 7230, 1393160, 1394756, 1398674, 1399656, 1861586, 3863649, 4171565, 4941663, 4943406], [46, 1077, 1540951, 1541476, 1695448, 1696748, 2774692, 2776241, 2777620, 2779223, 2783745, 12476918, 13862792, 15248855, 15250360, 15251366, 16329242], [18, 412, 2323, 464463, 470476, 1394553, 1396072, 1397367, 2321290, 2322298, 3400235, 3401649, 3402963, 4943021, 4943560], [25, 573, 3429, 4255, 5109, 5690, 11883, 12473, 1552389, 1553831, 2477745, 2478580, 2940482, 4480559, 4482022], [32, 2618132, 2622031, 4778122, 4781713, 4781972, 4785248, 6017372, 7095260, 7095703, 8635605, 8636739, 9252662, 9253327, 9254965, 11411084, 12797007, 12798330], [32, 706, 1609, 3072, 8819, 3088880, 3550784, 4782903, 5706826, 5707855, 7247708, 8941820, 8946216, 8947182, 8947714], [11, 300, 1386202, 4928244, 4929273, 4930141, 4934796, 4935209, 4938940, 6171073, 6174958, 7869091, 7874488], [32, 2002146, 3388062, 3389343, 3391730, 6317807, 6320628, 7398705, 7400084, 7401680, 8479589, 8480464, 8485252, 10025385, 11257301, 11258330], [25, 924111, 1540062, 1541329, 1542526, 1543835, 2775742, 2776745, 2780791, 3704875, 3706324, 4938422, 4940641, 4940893, 5556842, 5558111, 5559560], [39, 2926146, 2932012, 4472096, 4472649, 6474761, 6479269, 8943395, 10483304, 16181248], [25, 573, 616468, 1232608, 2618538, 2620106, 2622381, 2623816, 2627407, 2627631, 2628786, 3860898, 3864391, 3865714], [11, 462118, 1232048, 5236118, 6006020, 7854083, 7854972, 7855957, 8471882, 8472568, 8475123, 8475998, 9861886, 9862614, 9868396, 9870004, 11255929, 11257378, 12335252, 13875329, 16799866], [53, 1187, 3723, 2159779, 2160794, 2161214, 3239102, 4471235, 6011109, 8321179, 8322509, 10632551, 10634028, 12174133, 13098042, 15870014], [74, 1658, 4178, 4612, 1390521, 7088563, 7396491, 8936598, 10014521, 10015690, 11401578, 11402250, 11402997, 11404462, 12790329, 13560455, 14792322, 15716322], [32, 713, 1924, 3513, 7125, 8007, 1547909, 1549064, 2626987, 7247041, 7862973, 10327078, 11712994, 11714254, 11715115, 11715654, 11718207, 11719070, 12797007, 12798330], [11, 770097, 771392, 2311469, 2312358, 2313324, 2314024, 4316136, 5394073, 9706157, 9713563, 10483675, 11407556, 12639668, 12642832, 12643714], [18, 440, 1078384, 1079980, 2157903, 2159058, 3236974, 3237940, 3238997, 3240446, 4318320, 5396411, 5398021, 5860091, 5861421, 7401512, 7404051, 9714137, 10638079, 10639495, 10640510, 13258566, 13259007, 13260330], [39, 2002146, 3388069, 3389476, 3390330, 4776421, 4778836, 4780122, 5550019, 6474131, 6477932, 13099946, 13253925, 18797862], [11, 237, 370, 1623, 1749, 2911, 8035, 1856119, 2472063, 2473204, 3243092, 4783197, 4785407, 5247507, 5250200, 5250895, 5866825, 5867560]]
\ No newline at end of file
@@ -3,19 +3,31 @@ import random
 TRACE_SOL = 'tests/play.sol'
 TEST_SEED = 1337
 NUM_TESTS = 1000
+GOAL = 100  # Random strategies decide for every state below this score
 
-def make_random_strat():
-    """Makes a random pure strategy."""
-    seed = random.randrange(0, 2 ** 31)
+_ROLLS = bytes(b % 11 for b in range(256))
+_BIASED = bytes(range(256 - 256 % 11, 256))
+
+def make_random_strat(seed=None):
+    """Makes a random pure strategy from SEED, or from a seed drawn from the
+    global random generator if SEED is None.
+
+    The strategy's decisions for every state are drawn once, from a private
+    generator seeded with an integer, so they do not depend on the hash seed
+    of the process, and strategy calls don't impact dice rolls.
+    """
+    if seed is None:
+        seed = random.randrange(0, 2 ** 31)
+    rng = random.Random(seed)
+    size, table = GOAL * GOAL, b''
+    while len(table) < size:
+        # Map random bytes to 0-10, dropping those that would bias the result
+        table += rng.getrandbits(8 * size).to_bytes(size, 'little') \
+                    .translate(_ROLLS, _BIASED)
+    table = table[:size]
 
     def random_strat(score, opponent_score):
-        # Save the state of the random generator, so strategy calls don't
-        # impact dice rolls.
-        state = random.getstate()
-        random.seed(hash((score, opponent_score, seed)))
-        roll = random.randrange(0, 11)
-        random.setstate(state)
-        return roll
+        return table[score * GOAL + opponent_score]
     return random_strat
 
 
@@ -80,7 +92,10 @@ class GameState(object):
         return str(self.rolls)[1:-1]
 
     def __hash__(self):
-        return hash((self.score0, self.score1, self.who, self.num_rolls, self.dice_sides))
+        # Built from integers alone, so that the value does not change
+        # between Python versions, unlike the hash of a tuple.
+        return (((self.score0 * 1000 + self.score1) * 2 + self.who) * 11 +
+                self.num_rolls) * 7 + self.dice_sides
 
 
 def make_traced(s0, s1, six_sided, four_sided):
@@ -159,7 +174,7 @@ def make_solution_traces(hog):
     sol_traces = []
     for i in range(NUM_TESTS):
         strat0, strat1 = make_random_strat(), make_random_strat()
-        trace = play_traced(hog, strat0, strat1, hog.six_sided, hog.four_sided)
+        trace = play_traced(hog, strat0, strat1)
         sol_traces.append([hash(state) for state in trace])
     return sol_traces
 
@@ -217,3 +232,9 @@ def load_traces_from_file(path):
 def write_traces_to_file(path, traces):
     with open(path, 'w') as f:
         f.write(str(traces))
+
+
+if __name__ == '__main__':
+    # Regenerate the solution traces from hog.py: python3 -m tests.play_utils
+    import hog
+    write_traces_to_file(TRACE_SOL, make_solution_traces(hog))
@@ -1,10 +1,12 @@
-"""The UCB module contains functions specific to 61A projects at UC Berkeley."""
+"""The UCB module contains functions specific to 61A projects at UC Berkeley.
 
-import code
+Every program that uses @main imports this module, so modules that are only
+needed for interactive debugging (code, inspect, re and signal) are imported
+by the functions that use them.
+"""
+
+import collections
 import functools
-import inspect
-import re
-import signal
 import sys
 
 
@@ -19,7 +21,8 @@ def main(fn):
 
     Use this instead of the typical __name__ == "__main__" predicate.
     """
-    if inspect.stack()[1][0].f_locals['__name__'] == '__main__':
+    # Only the caller's frame is needed, so avoid building inspect.stack().
+    if sys._getframe(1).f_globals.get('__name__') == '__main__':
         args = sys.argv[1:] # Discard the script name from command line
         fn(*args) # Call the main function
     return fn
@@ -53,8 +56,70 @@ def trace(fn):
     return wrapped
 
 
+TRACE_BUFFER = collections.deque(maxlen=1000)  # Records kept by trace_sampled
+
+def trace_sampled(every=1, when=None):
+    """A decorator like trace that is cheap enough for long experiments.
+
+    Only every EVERY-th call for which WHEN(*args, **kwds) is true (or every
+    EVERY-th call, if WHEN is None) is recorded. Arguments are formatted only
+    for recorded calls, and records are kept in the ring buffer TRACE_BUFFER
+    instead of being printed. Call dump_trace to print them; they are also
+    printed when the traced function raises an exception. For example,
+
+    @trace_sampled(every=100, when=lambda score, opponent_score: score > 90)
+    def strategy(score, opponent_score):
+        # function body
+
+    >>> square = trace_sampled(every=2)(lambda x: x * x)
+    >>> [square(x) for x in range(5)]
+    [0, 1, 4, 9, 16]
+    >>> dump_trace()
+    <lambda>(1) -> 1
+    <lambda>(3) -> 9
+    """
+    def decorator(fn):
+        calls = 0
+        @functools.wraps(fn)
+        def wrapped(*args, **kwds):
+            nonlocal calls
+            if when is not None and not when(*args, **kwds):
+                sampled = False
+            else:
+                calls += 1
+                sampled = calls % every == 0
+            try:
+                result = fn(*args, **kwds)
+            except Exception as e:
+                TRACE_BUFFER.append(_format_call(fn, args, kwds) +
+                                    ' exited via exception')
+                if not getattr(e, '_ucb_trace_dumped', False):
+                    dump_trace()
+                    e._ucb_trace_dumped = True
+                raise
+            if sampled:
+                TRACE_BUFFER.append('{0} -> {1}'.format(
+                    _format_call(fn, args, kwds), result))
+            return result
+        return wrapped
+    return decorator
+
+
+def _format_call(fn, args, kwds):
+    reprs = [repr(e) for e in args]
+    reprs += [repr(k) + '=' + repr(v) for k, v in kwds.items()]
+    return '{0}({1})'.format(fn.__name__, ', '.join(reprs))
+
+
+def dump_trace(file=None):
+    """Print and clear the records collected by trace_sampled."""
+    while TRACE_BUFFER:
+        print(TRACE_BUFFER.popleft(), file=file)
+
+
 def log(message):
     """Print an indented message (used with trace)."""
+    import re
     if type(message) is not str:
         message = str(message)
     print(_PREFIX + re.sub('\n', '\n' + _PREFIX, message))
@@ -62,6 +127,7 @@ def log(message):
 
 def log_current_line():
     """Print information about the current line of code."""
+    import inspect
     frame = inspect.stack()[1]
     log('Current line: File "{f[1]}", line {f[2]}, in {f[3]}'.format(f=frame))
 
@@ -75,6 +141,10 @@ def interact(msg=None):
       <Control>-Z <Enter> exists the interactive session and returns to normal
       execution.
     """
+    import code
+    import inspect
+    import signal
+
     # use exception trick to pick up the current frame
     try:
         raise None